@@ -0,0 +1,341 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Headless batch evaluation of fits. EFT, DNA and XML fits are read from files (or
+standard input), calculated in a pool of worker processes and their stats are
+written as JSON lines, in the order fits were read. Only eos is used, nothing is
+stored into saveddata.
+
+    python -m eos.batch [options] [file ...]
+"""
+
+import json
+import logging
+import multiprocessing
+import re
+import sys
+import xml.dom.minidom
+from optparse import OptionParser
+
+from eos.gamedata import getItem, loadRequiredSkills
+from eos.saveddata.booster import Booster
+from eos.saveddata.character import Character
+from eos.saveddata.citadel import Citadel
+from eos.saveddata.damagePattern import DamagePattern
+from eos.saveddata.drone import Drone
+from eos.saveddata.fit import Fit
+from eos.saveddata.implant import Implant
+from eos.saveddata.module import Module, State
+from eos.saveddata.ship import Ship
+
+logger = logging.getLogger(__name__)
+
+dnaPattern = re.compile(r"^\d+:[\d;:_]*$")
+eftHeaderPattern = re.compile(r"^\[.*,.*\]$")
+eftOfflineSuffix = " /OFFLINE"
+
+# Per worker process state, set up by initWorker()
+character = None
+damagePattern = None
+targetRadius = None
+activeDrones = False
+
+
+def splitFits(text):
+    """Split text into separate fits, yields (format, fit text) pairs"""
+    if text.lstrip().startswith("<"):
+        doc = xml.dom.minidom.parseString(text)
+        for fitting in doc.getElementsByTagName("fitting"):
+            yield "XML", fitting.toxml().encode("utf-8")
+        return
+
+    block = []
+    for line in re.split("[\n\r]+", text):
+        line = line.strip()
+        if dnaPattern.match(line):
+            if block:
+                yield "EFT", "\n".join(block)
+                block = []
+            yield "DNA", line
+        elif eftHeaderPattern.match(line):
+            if block:
+                yield "EFT", "\n".join(block)
+            block = [line]
+        elif line and block:
+            block.append(line)
+
+    if block:
+        yield "EFT", "\n".join(block)
+
+
+def getCharacter(profile):
+    """
+    Character for profile, which is either skill level applied to all skills or
+    path to JSON file mapping skill names to levels (other skills are at 0)
+    """
+    if profile.isdigit():
+        return Character("Batch", int(profile))
+
+    with open(profile) as f:
+        levels = json.load(f)
+    char = Character("Batch", 0)
+    for skillName, level in levels.iteritems():
+        char.getSkill(skillName).level = level
+
+    return char
+
+
+def initWorker(profile, radius, drones):
+    """Load gamedata needed for every fit once per worker process"""
+    global character, damagePattern, targetRadius, activeDrones
+    loadRequiredSkills()
+    character = getCharacter(profile)
+    damagePattern = DamagePattern()
+    targetRadius = radius
+    activeDrones = drones
+
+
+def findItem(lookfor):
+    try:
+        return getItem(lookfor, eager="group.category")
+    except Exception:
+        return None
+
+
+def buildFit(shipItem, name, modules, drones, implants):
+    """
+    Compose and calculate fit. Modules are (item, charge, offline) tuples, drones
+    map items to amounts, implants also take boosters
+    """
+    fit = Fit(name=name)
+    try:
+        fit.ship = Ship(shipItem)
+    except ValueError:
+        fit.ship = Citadel(shipItem)
+    fit.character = character
+    fit.damagePattern = damagePattern
+
+    moduleList = []
+    for item, charge, offline in modules:
+        try:
+            m = Module(item)
+        except ValueError:
+            continue
+        m.owner = fit
+        # Add subsystems before modules to make sure T3 cruisers have subsystems installed
+        if item.category.name == "Subsystem":
+            if m.fits(fit):
+                fit.modules.append(m)
+            continue
+        if charge is not None and m.isValidCharge(charge):
+            m.charge = charge
+        if offline and m.isValidState(State.OFFLINE):
+            m.state = State.OFFLINE
+        elif m.isValidState(State.ACTIVE):
+            m.state = State.ACTIVE
+        moduleList.append(m)
+
+    # Calculate to get slot numbers correct for T3 cruisers
+    fit.calculateModifiedAttributes()
+
+    for m in moduleList:
+        if m.fits(fit):
+            fit.modules.append(m)
+
+    for item, amount in drones.iteritems():
+        d = Drone(item)
+        d.amount = amount
+        if activeDrones:
+            d.amountActive = amount
+        fit.drones.append(d)
+
+    for item in implants:
+        if item.group.name == "Booster":
+            fit.boosters.append(Booster(item))
+        else:
+            fit.implants.append(Implant(item))
+
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    return fit
+
+
+def parseEft(text):
+    lines = text.split("\n")
+    info = lines[0][1:-1].split(",", 1)
+    shipItem = findItem(info[0].strip())
+    if shipItem is None:
+        return None
+
+    modules = []
+    drones = {}
+    implants = []
+    for line in lines[1:]:
+        offline = line.endswith(eftOfflineSuffix)
+        if offline:
+            line = line[:-len(eftOfflineSuffix)]
+        modAmmo = line.split(",")
+        modExtra = modAmmo[0].split(" x")
+        item = findItem(modExtra[0].strip())
+        if item is None:
+            continue
+
+        if item.category.name == "Drone":
+            amount = int(modExtra[1]) if len(modExtra) == 2 else 1
+            drones[item] = drones.get(item, 0) + amount
+        elif len(modExtra) == 2:
+            # Cargo doesn't change stats
+            continue
+        elif item.category.name == "Implant":
+            implants.append(item)
+        else:
+            charge = findItem(modAmmo[1].strip()) if len(modAmmo) == 2 else None
+            modules.append((item, charge, offline))
+
+    return buildFit(shipItem, info[1].strip() if len(info) == 2 else shipItem.name, modules, drones, implants)
+
+
+def parseDna(text):
+    info = text.split(":")
+    shipItem = findItem(int(info[0]))
+    if shipItem is None:
+        return None
+
+    modules = []
+    drones = {}
+    for itemInfo in info[1:]:
+        if not itemInfo:
+            continue
+        itemID, amount = itemInfo.split(";")
+        item = findItem(int(itemID.rstrip("_")))
+        if item is None:
+            continue
+        if item.category.name == "Drone":
+            drones[item] = drones.get(item, 0) + int(amount)
+        elif item.category.name != "Charge":
+            modules.extend((item, None, False) for _ in xrange(int(amount)))
+
+    return buildFit(shipItem, "%s - DNA" % shipItem.name, modules, drones, ())
+
+
+def parseXml(text):
+    fitting = xml.dom.minidom.parseString(text).documentElement
+    shipItem = findItem(fitting.getElementsByTagName("shipType").item(0).getAttribute("value"))
+    if shipItem is None:
+        return None
+
+    modules = []
+    drones = {}
+    for hardware in fitting.getElementsByTagName("hardware"):
+        item = findItem(hardware.getAttribute("type"))
+        if item is None or hardware.getAttribute("slot").lower() == "cargo":
+            continue
+        if item.category.name == "Drone":
+            drones[item] = drones.get(item, 0) + int(hardware.getAttribute("qty") or 1)
+        else:
+            modules.append((item, None, False))
+
+    return buildFit(shipItem, fitting.getAttribute("name"), modules, drones, ())
+
+
+parsers = {
+    "EFT": parseEft,
+    "DNA": parseDna,
+    "XML": parseXml,
+}
+
+
+def getStats(fit):
+    return {
+        "name": fit.name,
+        "ship": fit.ship.item.name,
+        "dps": fit.totalDPS,
+        "volley": fit.totalVolley,
+        "ehp": sum(fit.ehp.itervalues()),
+        "capStable": fit.capStable,
+        "capState": fit.capState,
+        "maxSpeed": fit.maxSpeed,
+        "alignTime": fit.alignTime,
+        "lockTime": fit.calculateLockTime(targetRadius),
+    }
+
+
+def evaluate(job):
+    """Calculate single fit, returns its stats (or error) as JSON line"""
+    index, fitFormat, text = job
+    result = {"index": index, "format": fitFormat}
+    try:
+        fit = parsers[fitFormat](text)
+        if fit is None:
+            result["error"] = "Unknown ship"
+        else:
+            result.update(getStats(fit))
+    except Exception as e:
+        logger.debug("Failed to evaluate fit %d", index, exc_info=True)
+        result["error"] = "%s: %s" % (type(e).__name__, e)
+
+    return json.dumps(result, sort_keys=True)
+
+
+def iterJobs(paths):
+    index = 0
+    for path in paths:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, "rb") as f:
+                text = f.read()
+        for fitFormat, fitText in splitFits(text):
+            yield index, fitFormat, fitText
+            index += 1
+
+
+def main(argv=None):
+    usage = "usage: %prog [options] [file ...]"
+    parser = OptionParser(usage=usage)
+    parser.add_option("-c", "--character", help="skill level for all skills, or path to JSON file mapping "
+                      "skill names to levels, 5 by default", type="string", default="5")
+    parser.add_option("-j", "--jobs", help="number of worker processes, CPU count by default",
+                      type="int", default=None)
+    parser.add_option("-r", "--radius", help="signature radius of target used for lock time, 150 by default",
+                      type="float", default=150.0)
+    parser.add_option("-d", "--active-drones", help="count drones as launched", action="store_true",
+                      dest="activeDrones", default=False)
+    parser.add_option("-o", "--output", help="file to write results to, standard output by default",
+                      type="string", default=None)
+    (options, args) = parser.parse_args(argv)
+
+    output = open(options.output, "w") if options.output else sys.stdout
+    pool = multiprocessing.Pool(options.jobs, initWorker, (options.character, options.radius, options.activeDrones))
+    try:
+        for line in pool.imap(evaluate, iterJobs(args or ["-"]), chunksize=16):
+            output.write(line + "\n")
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,17 @@
 import heapq
+import multiprocessing
+import threading
 import time
 from math import sqrt, exp
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    from utils.compat import OrderedDict
+
 DAY = 24 * 60 * 60 * 1000
+# time it takes to reload a module, in ms
+RELOAD_TIME = 10000
 
 
 def lcm(a, b):
@@ -40,6 +49,27 @@ class CapSimulator(object):
         # relevant decimal digits of capacitor for LCM period optimization
         self.stability_precision = 1
 
+        # check for setups which are clearly stable before simulating, and only
+        # simulate them until capacitor levels out?
+        self.analytical = False
+
+        # capacitor left (as fraction of capacity) after all modules activate at
+        # once at the stable level, for a setup to count as clearly stable
+        self.stability_margin = 0.2
+
+        # how long clearly stable setups are simulated, in capacitor recharge
+        # times, before one more period is simulated to catch the lowest levels.
+        # capacitor levels out with time constant of 1/5 recharge time; stable
+        # levels end up within 0.01% of capacity of the full simulation
+        self.settle_time = 8
+
+        # incoming drains simulated on top of modules, as
+        # {(duration, capNeed, clipSize, disableStagger): amount}
+        self.incoming = {}
+
+        # modules grouped by group(), with settings they were grouped with
+        self.grouped = None
+
     def scale_activation(self, duration, capNeed):
         for res in self.scale_resolutions:
             mod = duration % res
@@ -62,37 +92,58 @@ class CapSimulator(object):
          expected, with clipSize 0 if the module has infinite ammo.
             """
         self.modules = modules
+        self.incoming = {}
+        self.grouped = None
+
+    def normalize(self, duration, capNeed, clipSize, disableStagger):
+        """Module properties the way they're simulated"""
+        if self.scale:
+            duration, capNeed = self.scale_activation(duration, capNeed)
+
+        # set clipSize to infinite if reloads are disabled unless it's
+        # a cap booster module.
+        if not self.reload and capNeed > 0:
+            clipSize = 0
+
+        return duration, capNeed, clipSize, disableStagger
+
+    def group(self):
+        """
+        Group modules with the same properties, returns {(duration, capNeed, clipSize, disableStagger): amount}.
+        Modules are only grouped again when settings change, incoming drains are added on top
+        """
+        settings = (self.scale, self.scale_resolutions, self.reload)
+        if self.grouped is None or self.grouped[0] != settings:
+            mods = {}
+
+            # Loop over modules, clearing clipSize if applicable, and group modules based on attributes
+            for module in self.modules:
+                key = self.normalize(*module)
+                mods[key] = mods.get(key, 0) + 1
+
+            self.grouped = settings, mods
+
+        mods = self.grouped[1]
+        if self.incoming:
+            mods = dict(mods)
+            for drain, amount in self.incoming.iteritems():
+                key = self.normalize(*drain)
+                mods[key] = mods.get(key, 0) + amount
+
+        return mods
 
     def reset(self):
         """Reset the simulator state"""
         self.state = []
-        mods = {}
         period = 1
-        disable_period = False
-
-        # Loop over modules, clearing clipSize if applicable, and group modules based on attributes
-        for (duration, capNeed, clipSize, disableStagger) in self.modules:
-            if self.scale:
-                duration, capNeed = self.scale_activation(duration, capNeed)
-
-            # set clipSize to infinite if reloads are disabled unless it's
-            # a cap booster module.
-            if not self.reload and capNeed > 0:
-                clipSize = 0
-
-            # Group modules based on their properties
-            if (duration, capNeed, clipSize, disableStagger) in mods:
-                mods[(duration, capNeed, clipSize, disableStagger)] += 1
-            else:
-                mods[(duration, capNeed, clipSize, disableStagger)] = 1
 
         # Loop over grouped modules, configure staggering and push to the simulation state
-        for (duration, capNeed, clipSize, disableStagger), amount in mods.iteritems():
+        for (duration, capNeed, clipSize, disableStagger), amount in self.group().iteritems():
             if self.stagger and not disableStagger:
                 if clipSize == 0:
                     duration = int(duration / amount)
                 else:
-                    stagger_amount = (duration * clipSize + 10000) / (amount * clipSize)
+                    stagger_amount = (duration * clipSize + RELOAD_TIME) / (amount * clipSize)
                     for i in range(1, amount):
                         heapq.heappush(self.state,
                                        [i * stagger_amount, duration,
@@ -100,18 +151,41 @@ class CapSimulator(object):
             else:
                 capNeed *= amount
 
-            period = lcm(period, duration)
-
-            # period optimization doesn't work when reloads are active.
+            # modules which reload only repeat themselves after the whole clip
+            # and the reload
             if clipSize:
-                disable_period = True
+                period = lcm(period, duration * clipSize + RELOAD_TIME)
+            else:
+                period = lcm(period, duration)
 
             heapq.heappush(self.state, [0, duration, capNeed, 0, clipSize])
 
-        if disable_period:
-            self.period = self.t_max
-        else:
-            self.period = period
+        self.period = period
+
+    def clearly_stable(self):
+        """
+        Tell whether the setup is stable without simulating it. Drain of every
+        module firing without pause (reloads ignored, cap injectors left out) is
+        an upper bound of what capacitor has to sustain; it's compared against
+        peak recharge rate, the same bound cap_stable_eve uses. If capacitor
+        stays well above empty even when all modules activate at once at the
+        level it settles on, the setup can't run dry.
+        """
+        capCapacity = self.capacitorCapacity
+        tau = self.capacitorRecharge / 5.0
+
+        maxDrain = 0.0
+        burst = 0.0
+        for (duration, capNeed, clipSize, disableStagger), amount in self.group().iteritems():
+            if capNeed > 0:
+                maxDrain += float(capNeed) * amount / duration
+                burst += capNeed * amount
+
+        if 2.0 * maxDrain * tau > capCapacity:
+            return False
+
+        stable = 0.25 * (1.0 + sqrt(1.0 - 2.0 * maxDrain * tau / capCapacity)) ** 2
+        return stable * capCapacity - burst >= self.stability_margin * capCapacity
 
     def run(self):
         """Run the simulation"""
@@ -140,6 +214,10 @@ class CapSimulator(object):
 
         t_last = 0
         t_max = self.t_max
+        if self.analytical and self.clearly_stable():
+            # can't run out of capacitor, only its stable levels are needed. they
+            # are taken over a whole period once capacitor levelled out
+            t_max = min(t_max, self.settle_time * self.capacitorRecharge + period)
 
         while 1:
             activation = pop(state)
@@ -179,7 +257,7 @@ class CapSimulator(object):
             if clipSize:
                 if shot % clipSize == 0:
                     shot = 0
-                    t_now += 10000  # include reload time
+                    t_now += RELOAD_TIME  # include reload time
             activation[0] = t_now
             activation[3] = shot
 
@@ -206,3 +284,217 @@ class CapSimulator(object):
                 self.cap_stable_high = 0.0
 
         self.runtime = time.time() - start
+
+    def timeline(self, resolution=1000):
+        """
+        Generate (time, capacitor) samples every resolution ms up to t_max, only
+        current state of the simulation is kept. Generation stops early when
+        capacitor runs out (last sample is 0), or once a whole period leaves
+        capacitor where it was, as from then on the timeline repeats itself
+        every period ms; steady_state tells if that happened. t is the time
+        simulation stopped at, in steady state the end of the repeated period.
+        """
+        self.reset()
+        self.steady_state = False
+
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        state = self.state
+        stability_precision = self.stability_precision
+        period = self.period
+
+        capCapacity = self.capacitorCapacity
+        tau = self.capacitorRecharge / 5.0
+
+        def recharge(cap, t):
+            return ((1.0 + (sqrt(cap / capCapacity) - 1.0) * exp(-t / tau)) ** 2) * capCapacity
+
+        cap_wrap = round(capCapacity, stability_precision)  # cap value at last period
+        cap = capCapacity  # current cap value
+        t_wrap = period  # point in time of next period
+        t_sample = 0  # point in time of next sample
+
+        t_last = 0
+        t_max = self.t_max
+
+        while 1:
+            activation = pop(state)
+            t_now, duration, capNeed, shot, clipSize = activation
+
+            # capacitor only recharges until the next activation
+            while t_sample < min(t_now, t_max):
+                yield t_sample, recharge(cap, t_sample - t_last)
+                t_sample += resolution
+
+            if t_now >= t_max:
+                break
+
+            cap = recharge(cap, t_now - t_last)
+
+            if t_now != t_last and t_now == t_wrap:
+                if round(cap, stability_precision) == cap_wrap:
+                    self.steady_state = True
+                    t_last = t_now
+                    break
+                cap_wrap = round(cap, stability_precision)
+                t_wrap += period
+
+            cap -= capNeed
+            if cap > capCapacity:
+                cap = capCapacity
+
+            t_last = t_now
+
+            if cap < 0.0:
+                yield t_now, 0.0
+                break
+
+            # queue the next activation of this module
+            t_now += duration
+            shot += 1
+            if clipSize:
+                if shot % clipSize == 0:
+                    shot = 0
+                    t_now += RELOAD_TIME  # include reload time
+            activation[0] = t_now
+            activation[3] = shot
+
+            push(state, activation)
+        push(state, activation)
+
+        self.t = t_last
+
+
+class SimulationCache(object):
+    """
+    Results of recent simulations, keyed by everything they depend on. Least
+    recently used results are dropped once there are more than size of them
+    """
+
+    # simulation results copied to and from the simulator
+    RESULTS = ("t", "iterations", "cap_stable_eve", "cap_stable_low", "cap_stable_high")
+
+    def __init__(self, size=256):
+        self.size = size
+        self.results = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(sim):
+        # modules are grouped by their properties, so their order doesn't matter
+        return (tuple(sorted(sim.modules)), tuple(sorted(sim.incoming.iteritems())), sim.capacitorCapacity, sim.capacitorRecharge, sim.t_max,
+                sim.reload, sim.stagger, sim.scale, sim.scale_resolutions, sim.stability_precision,
+                sim.analytical, sim.stability_margin, sim.settle_time)
+
+    def run(self, sim):
+        """Run the simulation, unless results of the same one are cached"""
+        key = self.get_key(sim)
+        with self.lock:
+            result = self.results.pop(key, None)
+            if result is not None:
+                self.hits += 1
+                self.results[key] = result
+
+        if result is None:
+            sim.run()
+            result = tuple(getattr(sim, attr) for attr in self.RESULTS)
+            with self.lock:
+                self.misses += 1
+                self.results[key] = result
+                while len(self.results) > self.size:
+                    self.results.popitem(last=False)
+        else:
+            for attr, value in zip(self.RESULTS, result):
+                setattr(sim, attr, value)
+            sim.runtime = 0
+
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self):
+        """Cache hits, misses and number of cached results"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.results)}
+
+
+cache = SimulationCache()
+
+
+def is_stable(sim):
+    """Run the simulation, tell if capacitor lasts"""
+    if not sim.group():
+        return True
+
+    sim.run()
+    return sim.cap_stable_low + sim.cap_stable_high > 0
+
+
+def find_threshold(sim, drain, max_amount=64):
+    """
+    Smallest number of incoming drains (duration, capNeed, clipSize, disableStagger)
+    which makes setup of the simulator unstable. 0 if it is unstable already, None
+    if it lasts even with max_amount of them. The number is found by doubling it
+    until setup breaks, then bisecting; modules are grouped only once
+    """
+    incoming = sim.incoming
+
+    def stable(amount):
+        sim.incoming = dict(incoming)
+        if amount:
+            sim.incoming[drain] = sim.incoming.get(drain, 0) + amount
+        return is_stable(sim)
+
+    try:
+        if not stable(0):
+            return 0
+
+        # stable with low, unstable with high
+        low, high = 0, 1
+        while stable(high):
+            if high >= max_amount:
+                return None
+            low, high = high, min(2 * high, max_amount)
+
+        while high - low > 1:
+            middle = (low + high) / 2
+            if stable(middle):
+                low = middle
+            else:
+                high = middle
+
+        return high
+    finally:
+        sim.incoming = incoming
+
+
+def _find_threshold(point):
+    return find_threshold(*point)
+
+
+def sweep(points, processes=None):
+    """
+    Find thresholds of many independent (simulator, drain, max_amount) points, in
+    a pool of processes if there's more than one. Thresholds are returned in the
+    same order
+    """
+    points = list(points)
+    if len(points) < 2 or processes == 1:
+        return map(_find_threshold, points)
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        thresholds = pool.map(_find_threshold, points)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    return thresholds
@@ -0,0 +1,90 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+from collections import namedtuple
+
+from eos.overlay import copyItem
+from eos.saveddata.module import State, Hardpoint
+
+
+class ChargeStats(namedtuple("ChargeStats", ("charge", "volley", "dps", "optimal", "falloff", "tracking",
+                                             "explosionRadius", "explosionVelocity", "damageReductionFactor",
+                                             "module", "fit"))):
+    """
+    Stats of module with single charge loaded. Module is calculated overlay copy of
+    the original one and fit is the overlay it was calculated on, they can be used
+    to get anything else (e.g. DPS at range, see eos.graph.fitDps.AmmoDpsGraph)
+    """
+    __slots__ = ()
+
+
+def getProbe(mod, charge):
+    probe = copyItem(mod)
+    probe.charge = charge
+    if probe.state < State.ACTIVE and probe.isValidState(State.ACTIVE):
+        probe.state = State.ACTIVE
+    return probe
+
+
+def getChargeStats(fit, probe):
+    dps, volley = probe.damageStats(fit.targetResists)
+    return ChargeStats(
+        probe.charge,
+        volley,
+        dps,
+        probe.maxRange,
+        probe.falloff,
+        probe.getModifiedItemAttr("trackingSpeed"),
+        probe.getModifiedChargeAttr("aoeCloudSize"),
+        probe.getModifiedChargeAttr("aoeVelocity"),
+        probe.getModifiedChargeAttr("aoeDamageReductionFactor"),
+        probe,
+        fit,
+    )
+
+
+def getChargeMatrix(fit, mod, charges=None):
+    """
+    Stats of module of fit with each of the charges loaded (all valid charges by
+    default), in the same order. They're calculated on copy-on-write overlays of
+    the fit (see Fit.overlay), the fit itself isn't touched.
+
+    Weapon charges only change the weapon itself, so copies of the weapon with
+    every charge are added to single overlay of the fit and calculated together:
+    the fit is run once, and only the copies get calculated per charge. Charges of
+    other modules (scripts, cap booster charges) may affect the whole fit, each of
+    them is calculated on its own overlay
+    """
+    if charges is None:
+        charges = sorted(mod.getValidCharges(), key=lambda charge: charge.name)
+    charges = list(charges)
+
+    if mod.hardpoint not in (Hardpoint.TURRET, Hardpoint.MISSILE):
+        matrix = []
+        for charge in charges:
+            overlay = fit.overlay({mod.position: getProbe(mod, charge)})
+            overlay.calculateModifiedAttributes()
+            matrix.append(getChargeStats(overlay, overlay.modules[mod.position]))
+        return matrix
+
+    # Overlay calculates copies of the probes, they're appended after modules of the fit
+    overlay = fit.overlay(addedModules=[getProbe(mod, charge) for charge in charges])
+    overlay.calculateModifiedAttributes()
+
+    return [getChargeStats(overlay, added) for added in overlay.modules[len(fit.modules):]]
@@ -0,0 +1,11 @@
+"""
+Migration 20
+
+- Creates fitStats table, caching stats of fits by their content fingerprint
+"""
+
+from eos.db.saveddata.mapper import FitStats
+
+
+def upgrade(saveddata_engine):
+    FitStats.__table__.create(saveddata_engine, checkfirst=True)
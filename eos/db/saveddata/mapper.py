@@ -268,6 +268,13 @@ class Prices(Base):
     failed = Column(Integer)
 
 
+class FitStats(Base):
+    __tablename__ = 'fitStats'
+    fingerprint = Column(String, primary_key=True)
+    stats = Column(String, nullable=False)
+    time = Column(Integer, nullable=False, index=True)
+
+
 class CharacterSkills(Base):
     __tablename__ = 'characterSkills'
     characterID = Column(ForeignKey("characters.ID"), primary_key=True, index=True)
@@ -21,85 +21,200 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# gamedata imports saveddata, which imports this module; bound on first use
+getSkillID = None
+
+
+class Selector(object):
+    """
+    Declarative filter for effect targets. Unlike plain filter functions, selectors
+    are resolved through index of HandledList, touching only the matching elements
+    """
+    # Which thing of element is checked ("item" or "charge") and what property of it
+    thing = None
+    kind = None
+
+    def __init__(self, *values):
+        self.values = values
+
+    def keys(self):
+        for value in self.values:
+            yield self.thing, self.kind, value
+
+    def __call__(self, element):
+        # Fallback for selectors used as regular filter functions
+        return any(key in HandledList.indexKeys(element) for key in self.keys())
+
+
+class SkillSelector(Selector):
+    kind = "skill"
+    __keys = None
+
+    def keys(self):
+        # Skills are indexed by ID only, they may be passed by name, item or
+        # character skill as well. Resolved once per selector
+        keys = self.__keys
+        if keys is None:
+            global getSkillID
+            if getSkillID is None:
+                from eos.gamedata import getSkillID
+            keys = self.__keys = [(self.thing, self.kind, getSkillID(value)) for value in self.values]
+        return keys
+
+
+class ItemSkill(SkillSelector):
+    """Elements whose item requires any of given skills"""
+    thing = "item"
+
+
+class ChargeSkill(SkillSelector):
+    """Elements whose charge requires any of given skills"""
+    thing = "charge"
+
+
+class ItemGroup(Selector):
+    """Elements whose item belongs to any of given groups"""
+    thing = "item"
+    kind = "group"
+
+
+class ChargeGroup(Selector):
+    """Elements whose charge belongs to any of given groups"""
+    thing = "charge"
+    kind = "group"
+
+
+class ItemCategory(Selector):
+    """Elements whose item belongs to any of given categories"""
+    thing = "item"
+    kind = "category"
+
 
 class HandledList(list):
-    def filteredItemPreAssign(self, filter, *args, **kwargs):
+    # Maps selector keys to list of matching elements, built on demand and dropped
+    # whenever contents of the list change
+    __index = None
+
+    @staticmethod
+    def indexKeys(element):
+        keys = set()
+        for thingName in ("item", "charge"):
+            thing = getattr(element, thingName, None)
+            if thing is None:
+                continue
+            group = getattr(thing, "group", None)
+            if group is not None:
+                keys.add((thingName, "group", group.name))
+                keys.add((thingName, "group", group.ID))
+                if group.category is not None:
+                    keys.add((thingName, "category", group.category.name))
+                    keys.add((thingName, "category", group.category.ID))
+            for skillID in getattr(thing, "requiredSkillIDs", ()):
+                keys.add((thingName, "skill", skillID))
+        return keys
+
+    def resetIndex(self):
+        self.__index = None
+
+    def select(self, selector):
+        """Return elements matching given selector, in list order"""
+        index = self.__index
+        if index is None:
+            index = self.__index = {}
+            for element in self:
+                for key in self.indexKeys(element):
+                    index.setdefault(key, []).append(element)
+
+        keys = list(selector.keys())
+        if len(keys) == 1:
+            return index.get(keys[0], ())
+
+        # Element may match several keys, keep every element only once
+        matched = set()
+        for key in keys:
+            matched.update(id(element) for element in index.get(key, ()))
+        return [element for element in self if id(element) in matched]
+
+    def __targets(self, filter):
+        if isinstance(filter, Selector):
+            for element in self.select(filter):
+                yield element
+            return
+
         for element in self:
             try:
                 if filter(element):
-                    element.preAssignItemAttr(*args, **kwargs)
+                    yield element
+            except AttributeError:
+                pass
+
+    def filteredItemPreAssign(self, filter, *args, **kwargs):
+        for element in self.__targets(filter):
+            try:
+                element.preAssignItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemIncrease(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.increaseItemAttr(*args, **kwargs)
+                element.increaseItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemMultiply(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.multiplyItemAttr(*args, **kwargs)
+                element.multiplyItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemBoost(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.boostItemAttr(*args, **kwargs)
+                element.boostItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemForce(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.forceItemAttr(*args, **kwargs)
+                element.forceItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargePreAssign(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.preAssignChargeAttr(*args, **kwargs)
+                element.preAssignChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeIncrease(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.increaseChargeAttr(*args, **kwargs)
+                element.increaseChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeMultiply(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.multiplyChargeAttr(*args, **kwargs)
+                element.multiplyChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeBoost(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.boostChargeAttr(*args, **kwargs)
+                element.boostChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeForce(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__targets(filter):
             try:
-                if filter(element):
-                    element.forceChargeAttr(*args, **kwargs)
+                element.forceChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
@@ -109,8 +224,46 @@ class HandledList(list):
         # flag_modified(thing, "itemID")
         if thing.isInvalid:  # see GH issue #324
             thing.itemID = 0
+        self.__index = None
         list.remove(self, thing)
 
+    # All other ways of changing the list have to drop the index as well
+    def append(self, thing):
+        self.__index = None
+        list.append(self, thing)
+
+    def insert(self, index, thing):
+        self.__index = None
+        list.insert(self, index, thing)
+
+    def extend(self, things):
+        self.__index = None
+        list.extend(self, things)
+
+    def pop(self, *args):
+        self.__index = None
+        return list.pop(self, *args)
+
+    def __setitem__(self, index, thing):
+        self.__index = None
+        list.__setitem__(self, index, thing)
+
+    def __delitem__(self, index):
+        self.__index = None
+        list.__delitem__(self, index)
+
+    def __setslice__(self, i, j, things):
+        self.__index = None
+        list.__setslice__(self, i, j, things)
+
+    def __delslice__(self, i, j):
+        self.__index = None
+        list.__delslice__(self, i, j)
+
+    def __iadd__(self, things):
+        self.extend(things)
+        return self
+
 
 class HandledModuleList(HandledList):
     def append(self, mod):
@@ -0,0 +1,156 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Registry of effect handler modules. Code of all modules in eos.effects is
+compiled into single marshalled file per gamedata build, so that effects can be
+loaded from it instead of importing each of them separately.
+"""
+
+import hashlib
+import imp
+import logging
+import marshal
+import os
+import sys
+import threading
+
+import eos.effects
+
+logger = logging.getLogger(__name__)
+
+# Bump when layout of registry file changes
+registryVersion = 1
+
+# Handler name -> code object of effect module, None until registry is loaded
+codes = None
+# Lock guarding loading of registry and execution of effect modules
+lock = threading.RLock()
+
+
+def getRegistryFile(path, build):
+    return os.path.join(path, "effects-%s.cache" % build)
+
+
+def getSourceFingerprint():
+    """Tell apart different versions of effect sources shipped with the same gamedata"""
+    fingerprint = []
+    effectsPath = os.path.dirname(eos.effects.__file__)
+    for fileName in sorted(os.listdir(effectsPath)):
+        if fileName.endswith(".py") and fileName != "__init__.py":
+            stat = os.stat(os.path.join(effectsPath, fileName))
+            fingerprint.append((fileName, int(stat.st_mtime), stat.st_size))
+
+    return hashlib.md5(repr(fingerprint)).hexdigest()
+
+
+def compileRegistry():
+    compiled = {}
+    effectsPath = os.path.dirname(eos.effects.__file__)
+    for fileName in os.listdir(effectsPath):
+        if not fileName.endswith(".py") or fileName == "__init__.py":
+            continue
+        fullPath = os.path.join(effectsPath, fileName)
+        with open(fullPath, "rU") as f:
+            source = f.read()
+        compiled[fileName[:-3]] = compile(source, fullPath, "exec")
+
+    return compiled
+
+
+def loadRegistry(path, build):
+    """
+    Load registry for given gamedata build from path, compiling and storing it
+    there first if it's missing or outdated
+    """
+    global codes
+
+    with lock:
+        if codes is not None:
+            return
+
+        header = (registryVersion, imp.get_magic(), build, getSourceFingerprint())
+        registryFile = getRegistryFile(path, build)
+        loaded = None
+        if os.path.exists(registryFile):
+            try:
+                with open(registryFile, "rb") as f:
+                    if marshal.load(f) == header:
+                        loaded = marshal.load(f)
+            except (EOFError, ValueError, TypeError, IOError):
+                logger.warning("Effect registry %s is corrupted, compiling it again", registryFile)
+
+        if loaded is None:
+            logger.debug("Compiling effect registry for build %s", build)
+            loaded = compileRegistry()
+            try:
+                with open(registryFile, "wb") as f:
+                    marshal.dump(header, f)
+                    marshal.dump(loaded, f)
+            except IOError:
+                logger.warning("Couldn't store effect registry to %s", registryFile)
+
+        codes = loaded
+
+
+def getEffectModule(handlerName):
+    """Get module of effect handler from registry, None if it's not there"""
+    fullName = "eos.effects." + handlerName
+    with lock:
+        module = sys.modules.get(fullName)
+        if module is not None:
+            return module
+        if codes is None or handlerName not in codes:
+            return None
+
+        code = codes[handlerName]
+        module = imp.new_module(fullName)
+        module.__file__ = code.co_filename
+        sys.modules[fullName] = module
+        try:
+            exec(code, module.__dict__)
+        except:
+            del sys.modules[fullName]
+            raise
+        setattr(eos.effects, handlerName, module)
+
+    return module
+
+
+def warmUp(path, build):
+    """Load registry and all effect modules in background thread"""
+    def run():
+        try:
+            loadRegistry(path, build)
+        except Exception:
+            logger.exception("Failed to load effect registry")
+            return
+
+        for handlerName in list(codes):
+            try:
+                getEffectModule(handlerName)
+            except Exception:
+                # Broken effects are reported when they're first used
+                pass
+        logger.debug("Effect registry is warmed up")
+
+    thread = threading.Thread(target=run, name="EffectRegistryWarmUp")
+    thread.daemon = True
+    thread.start()
+    return thread
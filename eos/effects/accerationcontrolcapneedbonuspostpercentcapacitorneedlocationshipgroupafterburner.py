@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules named like: Dynamic Fuel Valve (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Propulsion Module",
+    fit.modules.filteredItemBoost(ItemGroup("Propulsion Module"),
                                   "capacitorNeed", container.getModifiedItemAttr("capNeedBonus"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Eifyr and Co. 'Rogue' Acceleration Control AC (6 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Propulsion Module",
+    fit.modules.filteredItemBoost(ItemGroup("Propulsion Module"),
                                   "speedFactor", implant.getModifiedItemAttr("speedFBonus"))
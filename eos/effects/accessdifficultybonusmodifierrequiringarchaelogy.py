@@ -4,10 +4,12 @@
 # Modules named like: Emission Scope Sharpener (8 of 8)
 # Implant: Poteque 'Prospector' Archaeology AC-905
 # Implant: Poteque 'Prospector' Environmental Analysis EY-1005
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredItemIncrease(lambda module: module.item.requiresSkill("Archaeology"),
+    fit.modules.filteredItemIncrease(ItemSkill("Archaeology"),
                                      "accessDifficultyBonus",
                                      container.getModifiedItemAttr("accessDifficultyBonusModifier"), position="post")
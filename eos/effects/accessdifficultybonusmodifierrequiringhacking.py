@@ -4,10 +4,12 @@
 # Modules named like: Memetic Algorithm Bank (8 of 8)
 # Implant: Poteque 'Prospector' Environmental Analysis EY-1005
 # Implant: Poteque 'Prospector' Hacking HC-905
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredItemIncrease(lambda c: c.item.requiresSkill("Hacking"),
+    fit.modules.filteredItemIncrease(ItemSkill("Hacking"),
                                      "accessDifficultyBonus",
                                      container.getModifiedItemAttr("accessDifficultyBonusModifier"), position="post")
@@ -5,10 +5,12 @@
 # Implant: Poteque 'Prospector' Archaeology AC-905
 # Implant: Poteque 'Prospector' Environmental Analysis EY-1005
 # Skill: Archaeology
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Archaeology"),
+    fit.modules.filteredItemIncrease(ItemSkill("Archaeology"),
                                      "virusCoherence", container.getModifiedItemAttr("virusCoherenceBonus") * level)
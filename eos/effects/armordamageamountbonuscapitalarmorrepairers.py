@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Auxiliary Nano Pump (8 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Repair Systems"),
                                   "armorDamageAmount", implant.getModifiedItemAttr("repairBonus"),
                                   stackingPenalties=True)
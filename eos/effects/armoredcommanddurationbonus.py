@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Armored Command
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Armored Command"), "buffDuration", src.getModifiedItemAttr("durationBonus") * lvl)
+    fit.modules.filteredItemBoost(ItemSkill("Armored Command"), "buffDuration", src.getModifiedItemAttr("durationBonus") * lvl)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Grade Asklepian (15 of 16)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "armorDamageAmount", src.getModifiedItemAttr("armorRepairBonus"))
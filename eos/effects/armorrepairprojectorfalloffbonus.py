@@ -6,11 +6,13 @@
 # Ship: Deacon
 # Ship: Exequror
 # Ship: Inquisitor
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Armor Repairer", "falloffEffectiveness",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Armor Repairer"), "falloffEffectiveness",
                                   src.getModifiedItemAttr("falloffBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Ancillary Remote Armor Repairer",
+    fit.modules.filteredItemBoost(ItemGroup("Ancillary Remote Armor Repairer"),
                                   "falloffEffectiveness", src.getModifiedItemAttr("falloffBonus"))
@@ -6,11 +6,13 @@
 # Ship: Deacon
 # Ship: Exequror
 # Ship: Inquisitor
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Armor Repairer", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Armor Repairer"), "maxRange",
                                   src.getModifiedItemAttr("maxRangeBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Ancillary Remote Armor Repairer", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("Ancillary Remote Armor Repairer"), "maxRange",
                                   src.getModifiedItemAttr("maxRangeBonus"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Armor Layering
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Armor Reinforcer",
+    fit.modules.filteredItemBoost(ItemGroup("Armor Reinforcer"),
                                   "massAddition", container.getModifiedItemAttr("massPenaltyReduction") * level)
@@ -5,10 +5,12 @@
 # Implant: Michi's Excavation Augmentor
 # Skill: Astrogeology
 # Skill: Mining
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining"),
                                   "miningAmount", container.getModifiedItemAttr("miningAmountBonus") * level)
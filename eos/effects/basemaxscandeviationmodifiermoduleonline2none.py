@@ -2,11 +2,13 @@
 #
 # Used by:
 # Variations of module: Scan Pinpointing Array I (2 of 2)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Astrometrics"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Astrometrics"),
                                     "baseMaxScanDeviation",
                                     module.getModifiedItemAttr("maxScanDeviationModifierModule"),
                                     stackingPenalties=True)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Variations of module: Scan Rangefinding Array I (2 of 2)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Astrometrics"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Astrometrics"),
                                     "baseSensorStrength", module.getModifiedItemAttr("scanStrengthBonusModule"),
                                     stackingPenalties=True)
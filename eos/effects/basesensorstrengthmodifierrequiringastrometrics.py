@@ -7,12 +7,14 @@
 # Modules named like: Gravity Capacitor Upgrade (8 of 8)
 # Skill: Astrometric Rangefinding
 # Skill: Astrometrics
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
     penalized = False if "skill" in context or "implant" in context else True
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Astrometrics"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Astrometrics"),
                                     "baseSensorStrength", container.getModifiedItemAttr("scanStrengthBonus") * level,
                                     stackingPenalties=penalized)
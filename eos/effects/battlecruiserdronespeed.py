@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Myrmidon
 # Ship: Prophecy
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "maxVelocity", ship.getModifiedItemAttr("roleBonusCBC"))
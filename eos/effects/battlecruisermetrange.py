@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ships named like: Harbinger (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "maxRange", ship.getModifiedItemAttr("roleBonusCBC"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "falloff", ship.getModifiedItemAttr("roleBonusCBC"))
@@ -3,11 +3,13 @@
 # Used by:
 # Ships named like: Brutix (2 of 2)
 # Ship: Ferox
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "maxRange", ship.getModifiedItemAttr("roleBonusCBC"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "falloff", ship.getModifiedItemAttr("roleBonusCBC"))
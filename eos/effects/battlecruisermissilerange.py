@@ -3,9 +3,11 @@
 # Used by:
 # Ships named like: Drake (2 of 2)
 # Ship: Cyclone
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "maxVelocity", skill.getModifiedItemAttr("roleBonusCBC"))
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ships named like: Hurricane (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "maxRange", ship.getModifiedItemAttr("roleBonusCBC"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "falloff", ship.getModifiedItemAttr("roleBonusCBC"))
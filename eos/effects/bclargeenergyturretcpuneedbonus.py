@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Oracle
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Large Energy Turret"),
+    fit.modules.filteredItemMultiply(ItemSkill("Large Energy Turret"),
                                      "cpu", ship.getModifiedItemAttr("bcLargeTurretCPU"))
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Naga
 # Ship: Talos
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Large Hybrid Turret"),
+    fit.modules.filteredItemMultiply(ItemSkill("Large Hybrid Turret"),
                                      "capacitorNeed", ship.getModifiedItemAttr("bcLargeTurretCap"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Tornado
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Large Projectile Turret"),
+    fit.modules.filteredItemMultiply(ItemSkill("Large Projectile Turret"),
                                      "cpu", ship.getModifiedItemAttr("bcLargeTurretCPU"))
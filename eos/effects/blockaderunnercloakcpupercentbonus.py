@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ships from group: Blockade Runner (4 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Cloaking Device",
+    fit.modules.filteredItemBoost(ItemGroup("Cloaking Device"),
                                   "cpu", ship.getModifiedItemAttr("eliteIndustrialCovertCloakBonus"),
                                   skill="Transport Ships")
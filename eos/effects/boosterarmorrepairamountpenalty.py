@@ -4,10 +4,12 @@
 # Implants named like: Drop Booster (3 of 4)
 # Implants named like: Mindflood Booster (3 of 4)
 # Implants named like: Sooth Sayer Booster (3 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "boosterSideEffect"
 activeByDefault = False
 
 
 def handler(fit, booster, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Armor Repair Unit",
+    fit.modules.filteredItemBoost(ItemGroup("Armor Repair Unit"),
                                   "armorDamageAmount", booster.getModifiedItemAttr("boosterArmorRepairAmountPenalty"))
@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Exile Booster (3 of 4)
 # Implants named like: Mindflood Booster (3 of 4)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "boosterSideEffect"
 activeByDefault = False
 
 
 def handler(fit, booster, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "aoeCloudSize", booster.getModifiedItemAttr("boosterMissileAOECloudPenalty"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Implants named like: Blue Pill Booster (3 of 5)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "boosterSideEffect"
 activeByDefault = False
 
 
 def handler(fit, booster, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "aoeVelocity", booster.getModifiedItemAttr("boosterAOEVelocityPenalty"))
@@ -4,10 +4,12 @@
 # Implants named like: Blue Pill Booster (3 of 5)
 # Implants named like: Mindflood Booster (3 of 4)
 # Implants named like: Sooth Sayer Booster (3 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "boosterSideEffect"
 activeByDefault = False
 
 
 def handler(fit, booster, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "maxRange", booster.getModifiedItemAttr("boosterTurretOptimalRange"))
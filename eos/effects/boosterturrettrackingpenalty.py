@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Exile Booster (3 of 4)
 # Implants named like: Frentix Booster (3 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "boosterSideEffect"
 activeByDefault = False
 
 
 def handler(fit, booster, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "trackingSpeed", booster.getModifiedItemAttr("boosterTurretTrackingPenalty"))
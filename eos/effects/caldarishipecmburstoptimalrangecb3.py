@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Scorpion
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Burst Jammer",
+    fit.modules.filteredItemBoost(ItemGroup("Burst Jammer"),
                                   "ecmBurstRange", ship.getModifiedItemAttr("shipBonusCB3"), skill="Caldari Battleship")
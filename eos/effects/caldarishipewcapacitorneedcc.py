@@ -4,9 +4,11 @@
 # Ship: Chameleon
 # Ship: Falcon
 # Ship: Rook
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "capacitorNeed", ship.getModifiedItemAttr("shipBonusCC"), skill="Caldari Cruiser")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Griffin
 # Ship: Kitsune
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "capacitorNeed", ship.getModifiedItemAttr("shipBonusCF2"), skill="Caldari Frigate")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Scorpion
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "falloffEffectiveness", ship.getModifiedItemAttr("shipBonusCB3"),
                                   skill="Caldari Battleship")
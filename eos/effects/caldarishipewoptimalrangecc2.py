@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Blackbird
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusCC2"), skill="Caldari Cruiser")
@@ -4,10 +4,12 @@
 # Implants named like: Inherent Implants 'Squire' Capacitor Emission Systems ES (6 of 6)
 # Modules named like: Egress Port Maximizer (8 of 8)
 # Skill: Capacitor Emission Systems
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capacitor Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capacitor Emission Systems"),
                                   "capacitorNeed", container.getModifiedItemAttr("capNeedBonus") * level)
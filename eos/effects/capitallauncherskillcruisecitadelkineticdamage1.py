@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: XL Cruise Missiles
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"),
                                     "kineticDamage", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
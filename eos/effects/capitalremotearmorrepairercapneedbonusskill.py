@@ -3,10 +3,12 @@
 # Used by:
 # Variations of module: Capital Remote Repair Augmentor I (2 of 2)
 # Skill: Capital Remote Armor Repair Systems
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Remote Armor Repair Systems"),
                                   "capacitorNeed", container.getModifiedItemAttr("capNeedBonus") * level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Capital Capacitor Emission Systems
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Capacitor Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Capacitor Emission Systems"),
                                   "capacitorNeed", skill.getModifiedItemAttr("capNeedBonus") * skill.level)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Capital Shield Emission Systems
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Emission Systems"),
                                   "capacitorNeed", container.getModifiedItemAttr("capNeedBonus") * level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Capital Hybrid Turret
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Hybrid Turret"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Capital Energy Turret
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Energy Turret"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
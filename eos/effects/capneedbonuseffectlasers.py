@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules named like: Energy Discharge Elutriation (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Weapon",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Weapon"),
                                   "capacitorNeed", module.getModifiedItemAttr("capNeedBonus"))
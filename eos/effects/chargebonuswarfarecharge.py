@@ -2,6 +2,7 @@
 #
 # Used by:
 # Items from market group: Ammunition & Charges > Command Burst Charges (15 of 15)
+from eos.effectHandlerHelpers import ItemGroup, ItemSkill
 
 
 '''
@@ -27,8 +28,8 @@ def handler(fit, module, context, **kwargs):
                 fit.ship.boostItemAttr("shield%sDamageResonance" % damageType, value, stackingPenalties=True)
 
         if id == 11:  # Shield Burst: Active Shielding: Repair Duration/Capacitor
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation") or mod.item.requiresSkill("Shield Emission Systems"), "capacitorNeed", value)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation") or mod.item.requiresSkill("Shield Emission Systems"), "duration", value)
+            fit.modules.filteredItemBoost(ItemSkill("Shield Operation", "Shield Emission Systems"), "capacitorNeed", value)
+            fit.modules.filteredItemBoost(ItemSkill("Shield Operation", "Shield Emission Systems"), "duration", value)
 
         if id == 12:  # Shield Burst: Shield Extension: Shield HP
             fit.ship.boostItemAttr("shieldCapacity", value, stackingPenalties=True)
@@ -38,8 +39,8 @@ def handler(fit, module, context, **kwargs):
                 fit.ship.boostItemAttr("armor%sDamageResonance" % damageType, value, stackingPenalties=True)
 
         if id == 14:  # Armor Burst: Rapid Repair: Repair Duration/Capacitor
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or mod.item.requiresSkill("Repair Systems"), "capacitorNeed", value)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or mod.item.requiresSkill("Repair Systems"), "duration", value)
+            fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems", "Repair Systems"), "capacitorNeed", value)
+            fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems", "Repair Systems"), "duration", value)
 
         if id == 15:  # Armor Burst: Armor Reinforcement: Armor HP
             fit.ship.boostItemAttr("armorHP", value, stackingPenalties=True)
@@ -57,10 +58,10 @@ def handler(fit, module, context, **kwargs):
 
             for attr in ("missileVelocityBonus", "explosionDelayBonus", "aoeVelocityBonus", "falloffBonus",
                          "maxRangeBonus", "aoeCloudSizeBonus", "trackingSpeedBonus"):
-                fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Weapon Disruptor", attr, value)
+                fit.modules.filteredItemBoost(ItemGroup("Weapon Disruptor"), attr, value)
 
             for attr in ("maxTargetRangeBonus", "scanResolutionBonus"):
-                fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener", attr, value)
+                fit.modules.filteredItemBoost(ItemGroup("Sensor Dampener"), attr, value)
 
             fit.modules.filteredItemBoost(lambda mod: mod.item.gorup.name == "Target Painter", "signatureRadiusBonus", value, stackingPenalties=True)
 
@@ -83,18 +84,18 @@ def handler(fit, module, context, **kwargs):
             fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value, stackingPenalties=True)
 
         if id == 22:  # Skirmish Burst: Rapid Deployment: AB/MWD Speed Increase
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner") or mod.item.requiresSkill("High Speed Maneuvering"), "speedFactor", value, stackingPenalties=True)
+            fit.modules.filteredItemBoost(ItemSkill("Afterburner", "High Speed Maneuvering"), "speedFactor", value, stackingPenalties=True)
 
         if id == 23:  # Mining Burst: Mining Laser Field Enhancement: Mining/Survey Range
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or mod.item.requiresSkill("Ice Harvesting") or mod.item.requiresSkill("Gas Cloud Harvesting"), "maxRange", value, stackingPenalties=True)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("CPU Management"), "surveyScanRange", value, stackingPenalties=True)
+            fit.modules.filteredItemBoost(ItemSkill("Mining", "Ice Harvesting", "Gas Cloud Harvesting"), "maxRange", value, stackingPenalties=True)
+            fit.modules.filteredItemBoost(ItemSkill("CPU Management"), "surveyScanRange", value, stackingPenalties=True)
 
         if id == 24:  # Mining Burst: Mining Laser Optimization: Mining Capacitor/Duration
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or mod.item.requiresSkill("Ice Harvesting") or mod.item.requiresSkill("Gas Cloud Harvesting"), "capacitorNeed", value, stackingPenalties=True)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or mod.item.requiresSkill("Ice Harvesting") or mod.item.requiresSkill("Gas Cloud Harvesting"), "duration", value, stackingPenalties=True)
+            fit.modules.filteredItemBoost(ItemSkill("Mining", "Ice Harvesting", "Gas Cloud Harvesting"), "capacitorNeed", value, stackingPenalties=True)
+            fit.modules.filteredItemBoost(ItemSkill("Mining", "Ice Harvesting", "Gas Cloud Harvesting"), "duration", value, stackingPenalties=True)
 
         if id == 25:  # Mining Burst: Mining Equipment Preservation: Crystal Volatility
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"), "crystalVolatilityChance", value, stackingPenalties=True)
+            fit.modules.filteredItemBoost(ItemSkill("Mining"), "crystalVolatilityChance", value, stackingPenalties=True)
 
     for x in xrange(1, 4):
         if module.getModifiedChargeAttr("warfareBuff{}ID".format(x)):
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules named like: Targeting Systems Stabilizer (8 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill("Cloaking"),
+    fit.modules.filteredItemBoost(ItemSkill("Cloaking"),
                                   "cloakingTargetingDelay", module.getModifiedItemAttr("cloakingTargetingDelayBonus"))
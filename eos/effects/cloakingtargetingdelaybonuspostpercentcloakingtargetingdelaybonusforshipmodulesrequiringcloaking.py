@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Cloaking
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Cloaking"),
+    fit.modules.filteredItemBoost(ItemSkill("Cloaking"),
                                   "cloakingTargetingDelay",
                                   skill.getModifiedItemAttr("cloakingTargetingDelayBonus") * skill.level)
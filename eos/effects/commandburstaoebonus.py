@@ -4,10 +4,12 @@
 # Skill: Fleet Command
 # Skill: Leadership
 # Skill: Wing Command
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Leadership"),
+    fit.modules.filteredItemBoost(ItemSkill("Leadership"),
                                   "maxRange",
                                   src.getModifiedItemAttr("areaOfEffectBonus") * src.level)
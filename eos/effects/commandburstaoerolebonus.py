@@ -10,8 +10,10 @@
 # Subsystems named like: Defensive Warfare Processor (4 of 4)
 # Ship: Orca
 # Ship: Rorqual
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Leadership"), "maxRange", src.getModifiedItemAttr("roleBonusCommandBurstAoERange"))
+    fit.modules.filteredItemBoost(ItemSkill("Leadership"), "maxRange", src.getModifiedItemAttr("roleBonusCommandBurstAoERange"))
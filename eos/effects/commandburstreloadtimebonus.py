@@ -2,11 +2,13 @@
 #
 # Used by:
 # Skill: Command Burst Specialist
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Leadership"),
+    fit.modules.filteredItemBoost(ItemSkill("Leadership"),
                                   "reloadTime",
                                   src.getModifiedItemAttr("reloadTimeBonus") * lvl)
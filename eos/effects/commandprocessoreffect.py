@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules named like: Command Processor I (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Leadership"), "maxGroupActive", src.getModifiedItemAttr("maxGangModules"))
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Leadership"), "maxGroupOnline", src.getModifiedItemAttr("maxGangModules"))
+    fit.modules.filteredItemIncrease(ItemSkill("Leadership"), "maxGroupActive", src.getModifiedItemAttr("maxGangModules"))
+    fit.modules.filteredItemIncrease(ItemSkill("Leadership"), "maxGroupOnline", src.getModifiedItemAttr("maxGangModules"))
@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Inherent Implants 'Lancer' Controlled Bursts CB (6 of 6)
 # Skill: Controlled Bursts
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "capacitorNeed", container.getModifiedItemAttr("capNeedBonus") * level)
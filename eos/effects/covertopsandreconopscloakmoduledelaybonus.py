@@ -10,10 +10,12 @@
 # Ships named like: Stratios (2 of 2)
 # Subsystems named like: Offensive Covert Reconfiguration (4 of 4)
 # Ship: Astero
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredItemForce(lambda mod: mod.item.requiresSkill("Cloaking"),
+    fit.modules.filteredItemForce(ItemSkill("Cloaking"),
                                   "moduleReactivationDelay",
                                   container.getModifiedItemAttr("covertOpsAndReconOpsCloakModuleDelay"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Subsystems from group: Offensive Systems (12 of 16)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Cloaking"),
+    fit.modules.filteredItemIncrease(ItemSkill("Cloaking"),
                                      "covertCloakCPUAdd", module.getModifiedItemAttr("covertCloakCPUPenalty"))
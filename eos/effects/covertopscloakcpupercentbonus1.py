@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ships from group: Covert Ops (5 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Cloaking"),
+    fit.modules.filteredItemBoost(ItemSkill("Cloaking"),
                                   "cpu", ship.getModifiedItemAttr("eliteBonusCoverOps1"), skill="Covert Ops")
@@ -4,10 +4,12 @@
 # Ships from group: Expedition Frigate (2 of 2)
 # Ship: Astero
 # Ship: Victorieux Luxury Yacht
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Cloaking"),
+    fit.modules.filteredItemBoost(ItemSkill("Cloaking"),
                                   "cpu", ship.getModifiedItemAttr("shipBonusPirateFaction"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Stealth Bomber (4 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Missile Launcher Torpedo",
+    fit.modules.filteredItemMultiply(ItemGroup("Missile Launcher Torpedo"),
                                      "power", ship.getModifiedItemAttr("stealthBomberLauncherPower"))
@@ -8,10 +8,12 @@
 # Ship: Endurance
 # Ship: Etana
 # Ship: Rabisu
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemForce(lambda mod: mod.item.group.name == "Cloaking Device",
+    fit.modules.filteredItemForce(ItemGroup("Cloaking Device"),
                                   "cloakingTargetingDelay",
                                   ship.getModifiedItemAttr("covertOpsStealthBomberTargettingDelay"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Force Recon Ship (5 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Cynosural Field",
+    fit.modules.filteredItemBoost(ItemGroup("Cynosural Field"),
                                   "duration", ship.getModifiedItemAttr("durationBonus"))
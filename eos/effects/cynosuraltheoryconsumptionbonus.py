@@ -3,11 +3,13 @@
 # Used by:
 # Ships from group: Force Recon Ship (5 of 6)
 # Skill: Cynosural Field Theory
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Cynosural Field",
+    fit.modules.filteredItemBoost(ItemGroup("Cynosural Field"),
                                   "consumptionQuantity",
                                   container.getModifiedItemAttr("consumptionQuantityBonusPercentage") * level)
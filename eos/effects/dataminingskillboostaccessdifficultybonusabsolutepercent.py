@@ -4,9 +4,11 @@
 # Skill: Archaeology
 # Skill: Hacking
 # Skill: Salvaging
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill(skill), "accessDifficultyBonus",
+    fit.modules.filteredItemMultiply(ItemSkill(skill), "accessDifficultyBonus",
                                      skill.getModifiedItemAttr("accessDifficultyBonusAbsolutePercent") * skill.level)
@@ -3,9 +3,11 @@
 # Used by:
 # Variations of module: Capital Auxiliary Nano Pump I (2 of 2)
 # Variations of module: Capital Nanobot Accelerator I (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Repair Systems"),
                                   "power", module.getModifiedItemAttr("drawback"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules from group: Rig Launcher (48 of 48)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Missile Launcher Operation"),
                                   "cpu", module.getModifiedItemAttr("drawback"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules from group: Rig Hybrid Weapon (56 of 56)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Hybrid Weapon",
+    fit.modules.filteredItemBoost(ItemGroup("Hybrid Weapon"),
                                   "power", module.getModifiedItemAttr("drawback"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules from group: Rig Projectile Weapon (40 of 40)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Projectile Weapon",
+    fit.modules.filteredItemBoost(ItemGroup("Projectile Weapon"),
                                   "power", module.getModifiedItemAttr("drawback"))
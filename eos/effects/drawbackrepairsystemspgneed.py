@@ -3,9 +3,11 @@
 # Used by:
 # Modules named like: Auxiliary Nano Pump (6 of 8)
 # Modules named like: Nanobot Accelerator (6 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "power", module.getModifiedItemAttr("drawback"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skills from group: Drones (8 of 26)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill(skill),
+    fit.drones.filteredItemBoost(ItemSkill(skill),
                                  "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
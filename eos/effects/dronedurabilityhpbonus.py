@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Drone Durability Enhancer (6 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "hp", container.getModifiedItemAttr("hullHpBonus") * level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules named like: Drone Durability Enhancer (6 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "shieldCapacity", module.getModifiedItemAttr("hullHpBonus"))
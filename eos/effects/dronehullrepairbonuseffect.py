@@ -4,9 +4,11 @@
 # Ships from group: Logistics (5 of 6)
 # Ship: Exequror
 # Ship: Scythe
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == "Logistic Drone", "structureDamageAmount",
+    fit.drones.filteredItemBoost(ItemGroup("Logistic Drone"), "structureDamageAmount",
                                  src.getModifiedItemAttr("droneArmorDamageAmountBonus"))
@@ -2,13 +2,15 @@
 #
 # Used by:
 # Modules named like: Drone Scope Chip (6 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
     stacking = False if "skill" in context else True
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "maxRange",
                                  container.getModifiedItemAttr("rangeSkillBonus") * level,
                                  stackingPenalties=stacking)
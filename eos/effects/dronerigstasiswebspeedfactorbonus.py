@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules named like: Stasis Drone Augmentor (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == "Stasis Webifying Drone",
+    fit.drones.filteredItemBoost(ItemGroup("Stasis Webifying Drone"),
                                  "speedFactor", module.getModifiedItemAttr("webSpeedFactorBonus"))
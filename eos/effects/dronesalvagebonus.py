@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Salvage Drone Operation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.drones.filteredItemIncrease(lambda drone: drone.item.requiresSkill("Salvage Drone Operation"),
+    fit.drones.filteredItemIncrease(ItemSkill("Salvage Drone Operation"),
                                     "accessDifficultyBonus",
                                     container.getModifiedItemAttr("accessDifficultyBonus") * container.level)
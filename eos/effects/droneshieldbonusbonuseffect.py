@@ -4,11 +4,13 @@
 # Ships from group: Logistics (5 of 6)
 # Ship: Exequror
 # Ship: Scythe
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     # This is actually level-less bonus, anyway you have to train cruisers 5
     # and will get 100% (20%/lvl as stated by description)
-    fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == "Logistic Drone",
+    fit.drones.filteredItemBoost(ItemGroup("Logistic Drone"),
                                  "shieldBonus", ship.getModifiedItemAttr("droneShieldBonusBonus"))
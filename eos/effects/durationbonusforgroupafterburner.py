@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules named like: Engine Thermal Shielding (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Propulsion Module",
+    fit.modules.filteredItemBoost(ItemGroup("Propulsion Module"),
                                   "duration", module.getModifiedItemAttr("durationBonus"))
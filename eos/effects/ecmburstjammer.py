@@ -10,4 +10,4 @@ def handler(fit, module, context):
         # jam formula: 1 - (1- (jammer str/ship str))^(# of jam mods with same str))
         strModifier = 1 - module.getModifiedItemAttr("scan{0}StrengthBonus".format(fit.scanType)) / fit.scanStrength
 
-        fit.ecmProjectedStr *= strModifier
+        fit.addJam(strModifier)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules from group: ECM Stabilizer (6 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "scanLadarStrengthBonus", module.getModifiedItemAttr("ecmStrengthBonusPercent"),
                                   stackingPenalties=True)
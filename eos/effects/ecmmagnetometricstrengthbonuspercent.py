@@ -2,11 +2,13 @@
 #
 # Used by:
 # Modules from group: ECM Stabilizer (6 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "scanMagnetometricStrengthBonus",
                                   module.getModifiedItemAttr("ecmStrengthBonusPercent"),
                                   stackingPenalties=True)
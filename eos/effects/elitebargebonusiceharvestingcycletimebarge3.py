@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Exhumer (3 of 3)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Ice Harvesting"),
+    fit.modules.filteredItemBoost(ItemSkill("Ice Harvesting"),
                                   "duration", ship.getModifiedItemAttr("eliteBonusBarge2"), skill="Exhumers")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Cambion
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Light",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Light"),
                                   "speed", ship.getModifiedItemAttr("eliteBonusGunship1"), skill="Assault Frigates")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Cambion
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Rocket",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Rocket"),
                                   "speed", ship.getModifiedItemAttr("eliteBonusGunship1"), skill="Assault Frigates")
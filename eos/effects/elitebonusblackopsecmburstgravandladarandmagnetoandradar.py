@@ -2,12 +2,14 @@
 #
 # Used by:
 # Ship: Widow
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     sensorTypes = ("Gravimetric", "Ladar", "Magnetometric", "Radar")
     for type in sensorTypes:
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Burst Jammer",
+        fit.modules.filteredItemBoost(ItemGroup("Burst Jammer"),
                                       "scan{0}StrengthBonus".format(type),
                                       ship.getModifiedItemAttr("eliteBonusBlackOps1"), skill="Black Ops")
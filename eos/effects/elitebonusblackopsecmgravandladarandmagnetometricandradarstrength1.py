@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Widow
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     sensorTypes = ("Gravimetric", "Ladar", "Magnetometric", "Radar")
     for type in sensorTypes:
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM", "scan{0}StrengthBonus".format(type),
+        fit.modules.filteredItemBoost(ItemGroup("ECM"), "scan{0}StrengthBonus".format(type),
                                       ship.getModifiedItemAttr("eliteBonusBlackOps1"), skill="Black Ops")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Command Destroyer (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Micro Jump Drive Operation"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Micro Jump Drive Operation"), "duration",
                                   src.getModifiedItemAttr("eliteBonusCommandDestroyer2"), skill="Command Destroyers")
@@ -2,12 +2,14 @@
 #
 # Used by:
 # Ship: Damnation
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     damageTypes = ("em", "explosive", "kinetic", "thermal")
     for damageType in damageTypes:
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Assault Missiles"),
+        fit.modules.filteredChargeBoost(ChargeSkill("Heavy Assault Missiles"),
                                         "{0}Damage".format(damageType),
                                         ship.getModifiedItemAttr("eliteBonusCommandShips2"), skill="Command Ships")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Eos
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Heavy Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Heavy Drone Operation"),
                                  "maxVelocity", ship.getModifiedItemAttr("eliteBonusCommandShips2"),
                                  skill="Command Ships")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Claymore
 # Ship: Nighthawk
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Heavy",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Heavy"),
                                   "speed", ship.getModifiedItemAttr("eliteBonusCommandShips1"), skill="Command Ships")
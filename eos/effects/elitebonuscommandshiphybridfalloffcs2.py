@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Astarte
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "falloff", ship.getModifiedItemAttr("eliteBonusCommandShips2"), skill="Command Ships")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Vulture
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusCommandShips1"),
                                   skill="Command Ships")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Absolution
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "speed", ship.getModifiedItemAttr("eliteBonusCommandShips2"), skill="Command Ships")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Astarte
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "speed", ship.getModifiedItemAttr("eliteBonusCommandShips1"), skill="Command Ships")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Sleipnir
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "falloff", ship.getModifiedItemAttr("eliteBonusCommandShips2"), skill="Command Ships")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Claymore
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Missiles"),
                                     "aoeVelocity", ship.getModifiedItemAttr("eliteBonusCommandShips2"),
                                     skill="Command Ships")
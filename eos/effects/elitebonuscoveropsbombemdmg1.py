@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Purifier
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Bomb Deployment"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Bomb Deployment"),
                                     "emDamage", ship.getModifiedItemAttr("eliteBonusCoverOps1"), skill="Covert Ops")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Nemesis
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Bomb Deployment"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Bomb Deployment"),
                                     "thermalDamage", ship.getModifiedItemAttr("eliteBonusCoverOps1"),
                                     skill="Covert Ops")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ships from group: Covert Ops (6 of 6)
+from eos.effectHandlerHelpers import ChargeGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == "Scanner Probe",
+    fit.modules.filteredChargeBoost(ChargeGroup("Scanner Probe"),
                                     "baseSensorStrength", ship.getModifiedItemAttr("eliteBonusCoverOps2"),
                                     skill="Covert Ops")
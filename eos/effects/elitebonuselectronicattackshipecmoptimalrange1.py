@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Kitsune
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusElectronicAttackShip1"),
                                   skill="Electronic Attack Ships")
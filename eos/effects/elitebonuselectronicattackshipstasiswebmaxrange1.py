@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Hyena
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusElectronicAttackShip1"),
                                   skill="Electronic Attack Ships")
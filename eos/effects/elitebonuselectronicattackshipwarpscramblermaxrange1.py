@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Keres
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Warp Scrambler",
+    fit.modules.filteredItemBoost(ItemGroup("Warp Scrambler"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusElectronicAttackShip1"),
                                   skill="Electronic Attack Ships")
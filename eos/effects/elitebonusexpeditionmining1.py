@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Prospect
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining"),
                                   "miningAmount", module.getModifiedItemAttr("eliteBonusExpedition1"),
                                   skill="Expedition Frigates")
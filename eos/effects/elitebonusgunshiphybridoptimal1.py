@@ -4,9 +4,11 @@
 # Ship: Enyo
 # Ship: Harpy
 # Ship: Ishkur
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusGunship1"), skill="Assault Frigates")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Retribution
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Energy Turret"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusGunship1"), skill="Assault Frigates")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Jaguar
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Projectile Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("eliteBonusGunship2"),
                                   skill="Assault Frigates")
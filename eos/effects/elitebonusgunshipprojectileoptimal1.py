@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Jaguar
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Projectile Turret"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusGunship1"), skill="Assault Frigates")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Hawk
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "shieldBonus", ship.getModifiedItemAttr("eliteBonusGunship2"),
                                   skill="Assault Frigates")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Cerberus
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Assault Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Assault Missiles"),
                                     "explosionDelay", ship.getModifiedItemAttr("eliteBonusHeavyGunship1"),
                                     skill="Heavy Assault Cruisers")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Cerberus
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Rapid Light",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Rapid Light"),
                                   "speed", ship.getModifiedItemAttr("eliteBonusHeavyGunship2"),
                                   skill="Heavy Assault Cruisers")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Cerberus
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Heavy Assault",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Heavy Assault"),
                                   "speed", ship.getModifiedItemAttr("eliteBonusHeavyGunship2"),
                                   skill="Heavy Assault Cruisers")
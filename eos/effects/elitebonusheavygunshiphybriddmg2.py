@@ -3,10 +3,12 @@
 # Used by:
 # Ship: Deimos
 # Ship: Eagle
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("eliteBonusHeavyGunship2"),
                                   skill="Heavy Assault Cruisers")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Eagle
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusHeavyGunship1"),
                                   skill="Heavy Assault Cruisers")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Zealot
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("eliteBonusHeavyGunship2"),
                                   skill="Heavy Assault Cruisers")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Vagabond
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "falloff", ship.getModifiedItemAttr("eliteBonusHeavyGunship1"),
                                   skill="Heavy Assault Cruisers")
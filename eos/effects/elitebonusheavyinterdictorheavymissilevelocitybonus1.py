@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Onyx
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Missiles"),
                                     "maxVelocity", ship.getModifiedItemAttr("eliteBonusHeavyInterdictors1"),
                                     skill="Heavy Interdiction Cruisers")
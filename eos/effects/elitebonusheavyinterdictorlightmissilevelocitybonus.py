@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Onyx
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Light Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Light Missiles"),
                                     "maxVelocity", ship.getModifiedItemAttr("eliteBonusHeavyInterdictors1"),
                                     skill="Heavy Interdiction Cruisers")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Phobos
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusHeavyInterdictors1"),
                                   skill="Heavy Interdiction Cruisers")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Broadsword
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "falloff", ship.getModifiedItemAttr("eliteBonusHeavyInterdictors1"),
                                   skill="Heavy Interdiction Cruisers")
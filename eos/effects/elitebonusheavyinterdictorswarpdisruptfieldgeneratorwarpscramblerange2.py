@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ships from group: Heavy Interdiction Cruiser (5 of 5)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Warp Disrupt Field Generator",
+    fit.modules.filteredItemBoost(ItemGroup("Warp Disrupt Field Generator"),
                                   "warpScrambleRange", ship.getModifiedItemAttr("eliteBonusHeavyInterdictors2"),
                                   skill="Heavy Interdiction Cruisers")
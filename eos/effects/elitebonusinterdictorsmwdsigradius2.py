@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ships from group: Interdictor (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("High Speed Maneuvering"),
+    fit.modules.filteredItemBoost(ItemSkill("High Speed Maneuvering"),
                                   "signatureRadiusBonus", ship.getModifiedItemAttr("eliteBonusInterdictors2"),
                                   skill="Interdictors")
@@ -3,11 +3,13 @@
 # Used by:
 # Ship: Kirin
 # Ship: Scalpel
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"), "duration",
                                   src.getModifiedItemAttr("eliteBonusLogiFrig1"), skill="Logistics Frigates")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"), "capacitorNeed",
                                   src.getModifiedItemAttr("eliteBonusLogiFrig1"), skill="Logistics Frigates")
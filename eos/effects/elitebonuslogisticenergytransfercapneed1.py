@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Guardian
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Capacitor Transmitter",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Capacitor Transmitter"),
                                   "capacitorNeed", ship.getModifiedItemAttr("eliteBonusLogistics1"),
                                   skill="Logistics Cruisers")
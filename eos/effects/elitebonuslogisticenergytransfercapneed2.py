@@ -3,10 +3,12 @@
 # Used by:
 # Ship: Basilisk
 # Ship: Etana
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Capacitor Transmitter",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Capacitor Transmitter"),
                                   "capacitorNeed", ship.getModifiedItemAttr("eliteBonusLogistics2"),
                                   skill="Logistics Cruisers")
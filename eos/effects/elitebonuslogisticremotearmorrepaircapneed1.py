@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Oneiros
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"), "capacitorNeed",
                                   src.getModifiedItemAttr("eliteBonusLogistics1"), skill="Logistics Cruisers")
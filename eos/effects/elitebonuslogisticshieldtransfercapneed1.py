@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Basilisk
 # Ship: Etana
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"), "capacitorNeed",
                                   src.getModifiedItemAttr("eliteBonusLogistics1"), skill="Logistics Cruisers")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Scimitar
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Tracking Computer",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Tracking Computer"),
                                   "trackingSpeedBonus", ship.getModifiedItemAttr("eliteBonusLogistics1"),
                                   skill="Logistics Cruisers")
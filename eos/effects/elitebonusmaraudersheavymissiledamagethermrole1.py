@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Golem
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Missiles"),
                                     "thermalDamage", ship.getModifiedItemAttr("eliteBonusViolatorsRole1"))
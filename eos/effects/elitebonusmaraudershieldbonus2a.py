@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Golem
 # Ship: Vargur
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "shieldBonus", ship.getModifiedItemAttr("eliteBonusViolators2"), skill="Marauders")
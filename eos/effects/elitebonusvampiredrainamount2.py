@@ -3,10 +3,12 @@
 # Used by:
 # Ship: Curse
 # Ship: Pilgrim
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"),
                                   "powerTransferAmount", ship.getModifiedItemAttr("eliteBonusReconShip2"),
                                   skill="Recon Ships")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Golem
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
+    fit.modules.filteredItemBoost(ItemGroup("Target Painter"),
                                   "signatureRadiusBonus", ship.getModifiedItemAttr("eliteBonusViolators1"),
                                   skill="Marauders")
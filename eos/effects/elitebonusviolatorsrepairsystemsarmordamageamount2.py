@@ -3,10 +3,12 @@
 # Used by:
 # Ship: Kronos
 # Ship: Paladin
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "armorDamageAmount", ship.getModifiedItemAttr("eliteBonusViolators2"),
                                   skill="Marauders")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Marauder (4 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Tractor Beam",
+    fit.modules.filteredItemBoost(ItemGroup("Tractor Beam"),
                                   "maxTractorVelocity", ship.getModifiedItemAttr("eliteBonusViolatorsRole3"))
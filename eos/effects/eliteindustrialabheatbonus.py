@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Deep Space Transport (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner"),
+    fit.modules.filteredItemBoost(ItemSkill("Afterburner"),
                                   "overloadSpeedFactorBonus", ship.getModifiedItemAttr("roleBonusOverheatDST"))
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ships from group: Deep Space Transport (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "overloadArmorDamageAmount", ship.getModifiedItemAttr("roleBonusOverheatDST"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "overloadSelfDurationBonus", ship.getModifiedItemAttr("roleBonusOverheatDST"))
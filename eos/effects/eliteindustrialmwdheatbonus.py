@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Deep Space Transport (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("High Speed Maneuvering"),
+    fit.modules.filteredItemBoost(ItemSkill("High Speed Maneuvering"),
                                   "overloadSpeedFactorBonus", ship.getModifiedItemAttr("roleBonusOverheatDST"))
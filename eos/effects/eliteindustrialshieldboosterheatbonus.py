@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ships from group: Deep Space Transport (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "overloadShieldBonus", ship.getModifiedItemAttr("roleBonusOverheatDST"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "overloadSelfDurationBonus", ship.getModifiedItemAttr("roleBonusOverheatDST"))
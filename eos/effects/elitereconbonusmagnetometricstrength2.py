@@ -4,10 +4,12 @@
 # Ship: Chameleon
 # Ship: Falcon
 # Ship: Rook
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "scanMagnetometricStrengthBonus", ship.getModifiedItemAttr("eliteBonusReconShip2"),
                                   skill="Recon Ships")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Lachesis
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusReconShip1"), skill="Recon Ships")
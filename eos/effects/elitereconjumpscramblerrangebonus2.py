@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Arazu
 # Ship: Lachesis
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Warp Scrambler",
+    fit.modules.filteredItemBoost(ItemGroup("Warp Scrambler"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusReconShip2"), skill="Recon Ships")
@@ -4,9 +4,11 @@
 # Ship: Huginn
 # Ship: Moracha
 # Ship: Rapier
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusReconShip2"), skill="Recon Ships")
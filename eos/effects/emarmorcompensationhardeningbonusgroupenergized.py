@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: EM Armor Compensation
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Armor Plating Energized",
+    fit.modules.filteredItemBoost(ItemGroup("Armor Plating Energized"),
                                   "emDamageResistanceBonus", skill.getModifiedItemAttr("hardeningBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: EM Shield Compensation
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Shield Resistance Amplifier",
+    fit.modules.filteredItemBoost(ItemGroup("Shield Resistance Amplifier"),
                                   "emDamageResistanceBonus", skill.getModifiedItemAttr("hardeningBonus") * skill.level)
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Augoror
 # Ship: Osprey
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Capacitor Transmitter",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Capacitor Transmitter"),
                                   "powerTransferAmount", ship.getModifiedItemAttr("energyTransferAmountBonus"))
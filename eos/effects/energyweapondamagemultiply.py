@@ -4,10 +4,12 @@
 # Modules from group: Heat Sink (17 of 17)
 # Modules named like: QA Multiship Module Players (4 of 4)
 # Module: QA Damage Module
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Energy Weapon",
+    fit.modules.filteredItemMultiply(ItemGroup("Energy Weapon"),
                                      "damageMultiplier", module.getModifiedItemAttr("damageMultiplier"),
                                      stackingPenalties=True)
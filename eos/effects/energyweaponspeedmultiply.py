@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules from group: Heat Sink (17 of 17)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Energy Weapon",
+    fit.modules.filteredItemMultiply(ItemGroup("Energy Weapon"),
                                      "speed", module.getModifiedItemAttr("speedMultiplier"),
                                      stackingPenalties=True)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Interceptor (10 of 10)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Infomorph Psychology"),
+    fit.modules.filteredItemIncrease(ItemSkill("Infomorph Psychology"),
                                      "entosisCPUAdd", ship.getModifiedItemAttr("entosisCPUPenalty"))
@@ -7,9 +7,11 @@
 # Ships from group: Supercarrier (6 of 6)
 # Ships from group: Titan (5 of 5)
 # Ship: Rorqual
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Infomorph Psychology"),
+    fit.modules.filteredItemMultiply(ItemSkill("Infomorph Psychology"),
                                      "duration", ship.getModifiedItemAttr("entosisDurationMultiplier") or 1)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: grade Centurion (10 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Burst Projectors",
+    fit.modules.filteredItemBoost(ItemGroup("Burst Projectors"),
                                   "maxRange", implant.getModifiedItemAttr("rangeSkillBonus"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: grade Centurion (10 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
+    fit.modules.filteredItemBoost(ItemGroup("Target Painter"),
                                   "maxRange", implant.getModifiedItemAttr("rangeSkillBonus"))
@@ -3,11 +3,13 @@
 # Used by:
 # Modules named like: Particle Dispersion Projector (8 of 8)
 # Skill: Long Distance Jamming
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Burst Jammer",
+    fit.modules.filteredItemBoost(ItemGroup("Burst Jammer"),
                                   "ecmBurstRange", container.getModifiedItemAttr("rangeSkillBonus") * level,
                                   stackingPenalties=False if "skill" in context else True)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Frequency Modulation
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "falloffEffectiveness", skill.getModifiedItemAttr("falloffBonus") * skill.level)
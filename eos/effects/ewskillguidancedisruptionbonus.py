@@ -3,6 +3,8 @@
 # Used by:
 # Modules named like: Tracking Diagnostic Subroutines (8 of 8)
 # Skill: Weapon Destabilization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
@@ -14,5 +16,5 @@ def handler(fit, src, context):
             "aoeCloudSizeBonus",
             "missileVelocityBonus"
     ):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"),
+        fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"),
                                       attr, src.getModifiedItemAttr("scanSkillEwStrengthBonus") * level)
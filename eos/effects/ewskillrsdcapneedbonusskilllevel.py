@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Zainou 'Gypsy' Sensor Linking SL (6 of 6)
 # Skill: Sensor Linking
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Sensor Linking"),
+    fit.modules.filteredItemBoost(ItemSkill("Sensor Linking"),
                                   "capacitorNeed", container.getModifiedItemAttr("capNeedBonus") * level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Frequency Modulation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Sensor Linking"),
+    fit.modules.filteredItemBoost(ItemSkill("Sensor Linking"),
                                   "falloffEffectiveness", skill.getModifiedItemAttr("falloffBonus") * skill.level)
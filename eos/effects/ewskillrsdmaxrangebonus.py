@@ -3,11 +3,13 @@
 # Used by:
 # Modules named like: Particle Dispersion Projector (8 of 8)
 # Skill: Long Distance Jamming
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Sensor Linking"),
+    fit.modules.filteredItemBoost(ItemSkill("Sensor Linking"),
                                   "maxRange", container.getModifiedItemAttr("rangeSkillBonus") * level,
                                   stackingPenalties="skill" not in context)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Signature Focusing
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
+    fit.modules.filteredItemBoost(ItemGroup("Target Painter"),
                                   "signatureRadiusBonus",
                                   skill.getModifiedItemAttr("scanSkillTargetPaintStrengthBonus") * skill.level)
@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Zainou 'Gypsy' Weapon Disruption WD (6 of 6)
 # Skill: Weapon Disruption
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"),
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"),
                                   "capacitorNeed", container.getModifiedItemAttr("capNeedBonus") * level)
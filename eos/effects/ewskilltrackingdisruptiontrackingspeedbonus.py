@@ -3,11 +3,13 @@
 # Used by:
 # Modules named like: Tracking Diagnostic Subroutines (8 of 8)
 # Skill: Weapon Destabilization
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Weapon Disruptor",
+    fit.modules.filteredItemBoost(ItemGroup("Weapon Disruptor"),
                                   "trackingSpeedBonus",
                                   container.getModifiedItemAttr("scanSkillEwStrengthBonus") * level)
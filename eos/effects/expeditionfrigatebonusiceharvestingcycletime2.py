@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Endurance
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Ice Harvesting"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Ice Harvesting"), "duration",
                                   src.getModifiedItemAttr("eliteBonusExpedition2"), skill="Expedition Frigates")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Explosive Shield Compensation
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Shield Resistance Amplifier",
+    fit.modules.filteredItemBoost(ItemGroup("Shield Resistance Amplifier"),
                                   "explosiveDamageResistanceBonus",
                                   skill.getModifiedItemAttr("hardeningBonus") * skill.level)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Energy Ambit Extension (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Weapon",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Weapon"),
                                   "falloff", module.getModifiedItemAttr("falloffBonus"),
                                   stackingPenalties=True)
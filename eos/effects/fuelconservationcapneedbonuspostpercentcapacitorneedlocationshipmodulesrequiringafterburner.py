@@ -3,9 +3,11 @@
 # Used by:
 # Skill: Afterburner
 # Skill: Fuel Conservation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner"),
+    fit.modules.filteredItemBoost(ItemSkill("Afterburner"),
                                   "capacitorNeed", skill.getModifiedItemAttr("capNeedBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Gas Cloud Harvesting
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == "Gas Cloud Harvester",
+    fit.modules.filteredItemIncrease(ItemGroup("Gas Cloud Harvester"),
                                      "maxGroupActive", skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: grade Harvest (10 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Gas Cloud Harvester",
+    fit.modules.filteredItemBoost(ItemGroup("Gas Cloud Harvester"),
                                   "maxRange", implant.getModifiedItemAttr("maxRangeBonus"))
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Prospect
 # Ship: Venture
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Gas Cloud Harvester",
+    fit.modules.filteredItemMultiply(ItemGroup("Gas Cloud Harvester"),
                                      "miningAmount", module.getModifiedItemAttr("miningAmountMultiplier"))
@@ -3,10 +3,12 @@
 # Used by:
 # Modules from group: Tracking Enhancer (10 of 10)
 # Module: QA Damage Module
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "falloff", module.getModifiedItemAttr("falloffBonus"),
                                   stackingPenalties=True)
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Modules from group: Tracking Computer (11 of 11)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "active"
 
 
 def handler(fit, module, context):
     for attr in ("maxRange", "falloff", "trackingSpeed"):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+        fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                       attr, module.getModifiedItemAttr("%sBonus" % attr),
                                       stackingPenalties=True)
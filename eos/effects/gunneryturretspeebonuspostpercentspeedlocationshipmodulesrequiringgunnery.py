@@ -4,10 +4,12 @@
 # Implants named like: Inherent Implants 'Lancer' Gunnery RF (6 of 6)
 # Implant: Pashan's Turret Customization Mindlink
 # Skill: Gunnery
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "speed", container.getModifiedItemAttr("turretSpeeBonus") * level)
@@ -5,10 +5,12 @@
 # Implant: Poteque 'Prospector' Environmental Analysis EY-1005
 # Implant: Poteque 'Prospector' Hacking HC-905
 # Skill: Hacking
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Hacking"),
+    fit.modules.filteredItemIncrease(ItemSkill("Hacking"),
                                      "virusCoherence", container.getModifiedItemAttr("virusCoherenceBonus") * level)
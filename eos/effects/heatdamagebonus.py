@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules from group: Shield Boost Amplifier (25 of 25)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "heatDamage", module.getModifiedItemAttr("heatDamageBonus"))
@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Eifyr and Co. 'Rogue' High Speed Maneuvering HS (6 of 6)
 # Skill: High Speed Maneuvering
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("High Speed Maneuvering"),
+    fit.modules.filteredItemBoost(ItemSkill("High Speed Maneuvering"),
                                   "capacitorNeed", container.getModifiedItemAttr("capacitorNeedMultiplier") * level)
@@ -4,10 +4,12 @@
 # Modules from group: Magnetic Field Stabilizer (12 of 12)
 # Modules named like: QA Multiship Module Players (4 of 4)
 # Module: QA Damage Module
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Hybrid Weapon",
+    fit.modules.filteredItemMultiply(ItemGroup("Hybrid Weapon"),
                                      "damageMultiplier", module.getModifiedItemAttr("damageMultiplier"),
                                      stackingPenalties=True)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Hybrid Collision Accelerator (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Hybrid Weapon",
+    fit.modules.filteredItemMultiply(ItemGroup("Hybrid Weapon"),
                                      "damageMultiplier", module.getModifiedItemAttr("damageMultiplier"),
                                      stackingPenalties=True)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules from group: Magnetic Field Stabilizer (12 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Hybrid Weapon",
+    fit.modules.filteredItemMultiply(ItemGroup("Hybrid Weapon"),
                                      "speed", module.getModifiedItemAttr("speedMultiplier"),
                                      stackingPenalties=True)
@@ -4,10 +4,12 @@
 # Implants named like: Inherent Implants 'Yeti' Ice Harvesting IH (3 of 3)
 # Module: Medium Ice Harvester Accelerator I
 # Skill: Ice Harvesting
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Ice Harvesting"),
+    fit.modules.filteredItemBoost(ItemSkill("Ice Harvesting"),
                                   "duration", container.getModifiedItemAttr("iceHarvestCycleBonus") * level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of module: Ice Harvester Upgrade I (5 of 5)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Ice Harvesting"),
+    fit.modules.filteredItemBoost(ItemSkill("Ice Harvesting"),
                                   "duration", module.getModifiedItemAttr("iceHarvestCycleBonus"))
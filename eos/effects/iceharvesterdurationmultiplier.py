@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Endurance
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Ice Harvesting"),
+    fit.modules.filteredItemMultiply(ItemSkill("Ice Harvesting"),
                                      "duration", ship.getModifiedItemAttr("iceHarvestCycleBonus"))
@@ -3,8 +3,10 @@
 # Used by:
 # Modules named like: Drone Mining Augmentor (8 of 8)
 # Skill: Ice Harvesting Drone Operation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Ice Harvesting Drone Operation"), "duration", src.getModifiedItemAttr("rofBonus"))
+    fit.drones.filteredItemBoost(ItemSkill("Ice Harvesting Drone Operation"), "duration", src.getModifiedItemAttr("rofBonus"))
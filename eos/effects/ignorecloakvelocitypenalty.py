@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Endurance
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemForce(lambda mod: mod.item.group.name == "Cloaking Device",
+    fit.modules.filteredItemForce(ItemGroup("Cloaking Device"),
                                   "maxVelocityModifier", src.getModifiedItemAttr("velocityPenaltyReduction"))
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Implants named like: High grade Grail (6 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, implant, context):
-    fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill("Cybernetics"),
+    fit.appliedImplants.filteredItemMultiply(ItemSkill("Cybernetics"),
                                              "scanRadarStrengthPercent",
                                              implant.getModifiedItemAttr("implantSetImperialNavy"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Eifyr and Co. 'Rogue' Fuel Conservation FC (6 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner"),
+    fit.modules.filteredItemBoost(ItemSkill("Afterburner"),
                                   "capacitorNeed", implant.getModifiedItemAttr("capNeedBonus"))
@@ -9,10 +9,12 @@
 # Ships from group: Mining Barge (3 of 3)
 # Variations of ship: Venture (3 of 3)
 # Ship: Rorqual
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "damageMultiplier",
                                  src.getModifiedItemAttr("industrialBonusDroneDamage"))
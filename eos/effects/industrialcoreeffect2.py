@@ -2,6 +2,8 @@
 #
 # Used by:
 # Variations of module: Industrial Core I (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "active"
 runTime = "early"
 
@@ -15,92 +17,92 @@ def handler(fit, src, context):
                               stackingPenalties=True)
 
     #  Remote Shield Repper Bonuses
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Emission Systems"),
                                   "duration",
                                   src.getModifiedItemAttr("industrialCoreRemoteLogisticsDurationBonus"),
                                   )
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Emission Systems"),
                                   "maxRange",
                                   src.getModifiedItemAttr("industrialCoreRemoteLogisticsRangeBonus"),
                                   stackingPenalties=True
                                   )
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Emission Systems"),
                                   "capacitorNeed",
                                   src.getModifiedItemAttr("industrialCoreRemoteLogisticsDurationBonus")
                                   )
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Emission Systems"),
                                   "falloffEffectiveness",
                                   src.getModifiedItemAttr("industrialCoreRemoteLogisticsRangeBonus"),
                                   stackingPenalties=True
                                   )
 
     #  Local Shield Repper Bonuses
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Operation"),
                                   "duration",
                                   src.getModifiedItemAttr("industrialCoreLocalLogisticsDurationBonus"),
                                   )
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Operation"),
                                   "shieldBonus",
                                   src.getModifiedItemAttr("industrialCoreLocalLogisticsAmountBonus"),
                                   stackingPenalties=True
                                   )
 
     # Mining Burst Bonuses
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining Foreman"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining Foreman"),
                                   "warfareBuff1Value",
                                   src.getModifiedItemAttr("industrialCoreBonusMiningBurstStrength"),
                                   )
 
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining Foreman"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining Foreman"),
                                   "warfareBuff2Value",
                                   src.getModifiedItemAttr("industrialCoreBonusMiningBurstStrength"),
                                   )
 
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining Foreman"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining Foreman"),
                                   "warfareBuff3Value",
                                   src.getModifiedItemAttr("industrialCoreBonusMiningBurstStrength"),
                                   )
 
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining Foreman"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining Foreman"),
                                   "warfareBuff4Value",
                                   src.getModifiedItemAttr("industrialCoreBonusMiningBurstStrength"),
                                   )
 
     #  Command Burst Range Bonus
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Leadership"),
+    fit.modules.filteredItemBoost(ItemSkill("Leadership"),
                                   "maxRange",
                                   src.getModifiedItemAttr("industrialCoreBonusCommandBurstRange"),
                                   stackingPenalties=True
                                   )
 
     # Drone Bonuses
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Ice Harvesting Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Ice Harvesting Drone Operation"),
                                  "duration",
                                  src.getModifiedItemAttr("industrialCoreBonusDroneIceHarvesting"),
                                  )
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Mining Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Mining Drone Operation"),
                                  "miningAmount",
                                  src.getModifiedItemAttr("industrialCoreBonusDroneMining"),
                                  )
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "maxVelocity",
                                  src.getModifiedItemAttr("industrialCoreBonusDroneVelocity"),
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "damageMultiplier",
                                  src.getModifiedItemAttr("industrialCoreBonusDroneDamageHP"),
                                  stackingPenalties=True
                                  )
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "shieldCapacity",
                                  src.getModifiedItemAttr("industrialCoreBonusDroneDamageHP"),
                                  )
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "armorHP",
                                  src.getModifiedItemAttr("industrialCoreBonusDroneDamageHP"),
                                  )
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "hp",
                                  src.getModifiedItemAttr("industrialCoreBonusDroneDamageHP"),
                                  )
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Taranis
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("eliteBonusInterceptor2"),
                                   skill="Interceptors")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Interceptor (6 of 10)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Warp Scrambler",
+    fit.modules.filteredItemBoost(ItemGroup("Warp Scrambler"),
                                   "maxRange", ship.getModifiedItemAttr("eliteBonusInterceptor2"), skill="Interceptors")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Jump Portal Generation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), "consumptionQuantity",
+    fit.modules.filteredItemBoost(ItemSkill(skill), "consumptionQuantity",
                                   skill.getModifiedItemAttr("consumptionQuantityBonusPercent") * skill.level)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Kinetic Armor Compensation
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Armor Coating",
+    fit.modules.filteredItemBoost(ItemGroup("Armor Coating"),
                                   "kineticDamageResistanceBonus",
                                   skill.getModifiedItemAttr("hardeningBonus") * skill.level)
@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Zainou 'Deadeye' Large Hybrid Turret LH (6 of 6)
 # Skill: Large Hybrid Turret
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Hybrid Turret"),
                                   "damageMultiplier", container.getModifiedItemAttr("damageMultiplierBonus") * level)
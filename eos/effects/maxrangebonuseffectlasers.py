@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Energy Locus Coordinator (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Weapon",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Weapon"),
                                   "maxRange", module.getModifiedItemAttr("maxRangeBonus"),
                                   stackingPenalties=True)
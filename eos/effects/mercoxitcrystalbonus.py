@@ -2,11 +2,13 @@
 #
 # Used by:
 # Module: Medium Mercoxit Mining Crystal Optimization I
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Mercoxit Processing"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Mercoxit Processing"),
                                     "specialisationAsteroidYieldMultiplier",
                                     module.getModifiedItemAttr("miningAmountBonus"))
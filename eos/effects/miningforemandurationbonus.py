@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Mining Foreman
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining Foreman"), "buffDuration", src.getModifiedItemAttr("durationBonus") * lvl)
+    fit.modules.filteredItemBoost(ItemSkill("Mining Foreman"), "buffDuration", src.getModifiedItemAttr("durationBonus") * lvl)
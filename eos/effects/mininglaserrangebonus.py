@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: grade Harvest (10 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Mining Laser",
+    fit.modules.filteredItemBoost(ItemGroup("Mining Laser"),
                                   "maxRange", implant.getModifiedItemAttr("maxRangeBonus"))
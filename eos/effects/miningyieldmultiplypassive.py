@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of ship: Venture (3 of 3)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Mining"),
+    fit.modules.filteredItemMultiply(ItemSkill("Mining"),
                                      "miningAmount", module.getModifiedItemAttr("miningAmountMultiplier"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of module: Mining Laser Upgrade I (5 of 5)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining"),
                                   "miningAmount", module.getModifiedItemAttr("miningAmountBonus"))
@@ -3,10 +3,12 @@
 # Used by:
 # Ship: Hyena
 # Ship: Vigil
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
+    fit.modules.filteredItemBoost(ItemGroup("Target Painter"),
                                   "signatureRadiusBonus", ship.getModifiedItemAttr("shipBonusMF2"),
                                   skill="Minmatar Frigate")
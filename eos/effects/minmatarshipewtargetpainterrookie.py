@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Reaper
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
+    fit.modules.filteredItemBoost(ItemGroup("Target Painter"),
                                   "signatureRadiusBonus", ship.getModifiedItemAttr("rookieTargetPainterStrengthBonus"))
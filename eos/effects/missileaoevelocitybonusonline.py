@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules from group: Missile Guidance Enhancer (3 of 3)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "aoeVelocity", module.getModifiedItemAttr("aoeVelocityBonus"),
                                     stackingPenalties=True)
@@ -3,12 +3,14 @@
 # Used by:
 # Modules from group: Ballistic Control system (17 of 17)
 # Modules named like: QA Multiship Module Players (4 of 4)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     for dmgType in ("em", "kinetic", "explosive", "thermal"):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+        fit.modules.filteredChargeMultiply(ChargeSkill("Missile Launcher Operation"),
                                            "%sDamage" % dmgType,
                                            container.getModifiedItemAttr("missileDamageMultiplierBonus"),
                                            stackingPenalties=True)
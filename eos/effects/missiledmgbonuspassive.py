@@ -2,12 +2,14 @@
 #
 # Used by:
 # Modules named like: Warhead Calefaction Catalyst (8 of 8)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     for dmgType in ("em", "kinetic", "explosive", "thermal"):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+        fit.modules.filteredChargeMultiply(ChargeSkill("Missile Launcher Operation"),
                                            "%sDamage" % dmgType,
                                            container.getModifiedItemAttr("missileDamageMultiplierBonus"),
                                            stackingPenalties=True)
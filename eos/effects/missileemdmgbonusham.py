@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Zainou 'Snapshot' Heavy Assault Missiles AM (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Assault Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Assault Missiles"),
                                     "emDamage", implant.getModifiedItemAttr("damageMultiplierBonus"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Zainou 'Snapshot' Heavy Missiles HM (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Missiles"),
                                     "emDamage", implant.getModifiedItemAttr("damageMultiplierBonus"))
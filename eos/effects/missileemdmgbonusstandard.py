@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Zainou 'Snapshot' Light Missiles LM (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Light Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Light Missiles"),
                                     "emDamage", implant.getModifiedItemAttr("damageMultiplierBonus"))
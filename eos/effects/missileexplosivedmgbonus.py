@@ -4,9 +4,11 @@
 # Skills named like: Missiles (5 of 7)
 # Skill: Rockets
 # Skill: Torpedoes
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+    fit.modules.filteredChargeBoost(ChargeSkill(skill),
                                     "explosiveDamage", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,6 +2,8 @@
 #
 # Used by:
 # Modules from group: Missile Guidance Computer (3 of 3)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "active"
 
 
@@ -12,6 +14,6 @@ def handler(fit, container, context):
             ("missileVelocityBonus", "maxVelocity"),
             ("explosionDelayBonus", "explosionDelay"),
     ):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+        fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                         tgtAttr, container.getModifiedItemAttr(srcAttr),
                                         stackingPenalties=True)
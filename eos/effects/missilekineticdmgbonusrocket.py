@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Zainou 'Snapshot' Rockets RD (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"),
                                     "kineticDamage", container.getModifiedItemAttr("damageMultiplierBonus"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules from group: Ballistic Control system (17 of 17)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredItemMultiply(ItemSkill("Missile Launcher Operation"),
                                      "speed", module.getModifiedItemAttr("speedMultiplier"),
                                      stackingPenalties=True)
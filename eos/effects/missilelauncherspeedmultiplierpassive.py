@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Bay Loading Accelerator (8 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredItemMultiply(ItemSkill("Missile Launcher Operation"),
                                      "speed", module.getModifiedItemAttr("speedMultiplier"),
                                      stackingPenalties=True)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Crash Booster (4 of 4)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "aoeCloudSize", implant.getModifiedItemAttr("aoeCloudSizeBonus"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Implants named like: Zainou 'Snapshot' FOF Explosion Radius FR (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("FoF Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("FoF Missiles"),
                                     "aoeCloudSize", container.getModifiedItemAttr("aoeCloudSizeBonus") * level)
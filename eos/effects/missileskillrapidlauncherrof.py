@@ -6,10 +6,12 @@
 # Implant: Whelan Machorin's Ballistic Smartlink
 # Skill: Missile Launcher Operation
 # Skill: Rapid Launch
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Missile Launcher Operation"),
                                   "speed", container.getModifiedItemAttr("rofBonus") * level)
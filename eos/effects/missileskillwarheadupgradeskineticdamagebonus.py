@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Warhead Upgrades
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "kineticDamage", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
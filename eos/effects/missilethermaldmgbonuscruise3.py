@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Zainou 'Snapshot' Cruise Missiles CM (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Cruise Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Cruise Missiles"),
                                     "thermalDamage", container.getModifiedItemAttr("damageMultiplierBonus"))
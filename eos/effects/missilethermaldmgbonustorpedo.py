@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Zainou 'Snapshot' Torpedoes TD (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"),
                                     "thermalDamage", container.getModifiedItemAttr("damageMultiplierBonus"))
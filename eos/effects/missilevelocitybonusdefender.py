@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: Zainou 'Snapshot' Defender Missiles DM (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill("Defender Missiles"),
+    fit.modules.filteredChargeMultiply(ChargeSkill("Defender Missiles"),
                                        "maxVelocity", container.getModifiedItemAttr("missileVelocityBonus"))
@@ -2,6 +2,8 @@
 #
 # Used by:
 # Module: Bastion Module I
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "active"
 runTime = "early"
 
@@ -36,10 +38,10 @@ def handler(fit, src, context):
                                     "maxVelocity", src.getModifiedItemAttr("missileVelocityBonus"))
 
     # Tanking
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "armorDamageAmount", src.getModifiedItemAttr("armorDamageAmountBonus"),
                                   stackingPenalties=True)
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "shieldBonus", src.getModifiedItemAttr("shieldBoostMultiplier"),
                                   stackingPenalties=True)
 
@@ -62,7 +64,7 @@ def handler(fit, src, context):
     fit.ship.boostItemAttr("remoteRepairImpedance", src.getModifiedItemAttr("remoteRepairImpedanceBonus"))
     fit.ship.boostItemAttr("remoteAssistanceImpedance", src.getModifiedItemAttr("remoteAssistanceImpedanceBonus"))
     fit.ship.boostItemAttr("sensorDampenerResistance", src.getModifiedItemAttr("sensorDampenerResistanceBonus"))
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Micro Jump Drive Operation"),
+    fit.modules.filteredItemIncrease(ItemSkill("Micro Jump Drive Operation"),
                                      "activationBlocked", src.getModifiedItemAttr("activationBlockedStrenght"))
     fit.ship.boostItemAttr("targetPainterResistance", src.getModifiedItemAttr("targetPainterResistanceBonus"))
     fit.ship.boostItemAttr("weaponDisruptionResistance", src.getModifiedItemAttr("weaponDisruptionResistanceBonus"))
@@ -2,16 +2,18 @@
 #
 # Used by:
 # Variations of module: Capital Drone Durability Enhancer I (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "armorHP",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "armorHP",
                                  src.getModifiedItemAttr("hullHpBonus"))
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "hp",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "hp",
                                  src.getModifiedItemAttr("hullHpBonus"))
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "shieldCapacity",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "shieldCapacity",
                                  src.getModifiedItemAttr("hullHpBonus"))
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "shieldCapacity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "shieldCapacity",
                                    src.getModifiedItemAttr("hullHpBonus"))
     fit.ship.boostItemAttr("cpuOutput", src.getModifiedItemAttr("drawback"))
@@ -2,18 +2,20 @@
 #
 # Used by:
 # Variations of module: Capital Drone Scope Chip I (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "maxRange",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "maxRange",
                                  src.getModifiedItemAttr("rangeSkillBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "fighterAbilityMissilesRange",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "fighterAbilityMissilesRange",
                                    src.getModifiedItemAttr("rangeSkillBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretRangeOptimal", src.getModifiedItemAttr("rangeSkillBonus"),
                                    stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileRangeOptimal",
                                    src.getModifiedItemAttr("rangeSkillBonus"), stackingPenalties=True)
     fit.ship.boostItemAttr("cpuOutput", src.getModifiedItemAttr("drawback"))
@@ -2,18 +2,20 @@
 #
 # Used by:
 # Modules from group: Drone Damage Modules (11 of 11)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesDamageMultiplier",
                                    src.getModifiedItemAttr("droneDamageBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretDamageMultiplier",
                                    src.getModifiedItemAttr("droneDamageBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileDamageMultiplier",
                                    src.getModifiedItemAttr("droneDamageBonus"), stackingPenalties=True)
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "damageMultiplier",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "damageMultiplier",
                                  src.getModifiedItemAttr("droneDamageBonus"), stackingPenalties=True)
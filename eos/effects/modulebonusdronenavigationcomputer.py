@@ -2,11 +2,13 @@
 #
 # Used by:
 # Modules from group: Drone Navigation Computer (8 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "maxVelocity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "maxVelocity",
                                    src.getModifiedItemAttr("speedFactor"), stackingPenalties=True)
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "maxVelocity",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "maxVelocity",
                                  src.getModifiedItemAttr("speedFactor"), stackingPenalties=True)
@@ -2,20 +2,22 @@
 #
 # Used by:
 # Modules from group: Fighter Support Unit (8 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "shieldCapacity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "shieldCapacity",
                                    src.getModifiedItemAttr("fighterBonusShieldCapacityPercent"))
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "maxVelocity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "maxVelocity",
                                    src.getModifiedItemAttr("fighterBonusVelocityPercent"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileDuration",
                                    src.getModifiedItemAttr("fighterBonusROFPercent"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "fighterAbilityAttackTurretDuration",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "fighterAbilityAttackTurretDuration",
                                    src.getModifiedItemAttr("fighterBonusROFPercent"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "fighterAbilityMissilesDuration",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "fighterAbilityMissilesDuration",
                                    src.getModifiedItemAttr("fighterBonusROFPercent"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "shieldRechargeRate",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "shieldRechargeRate",
                                    src.getModifiedItemAttr("fighterBonusShieldRechargePercent"))
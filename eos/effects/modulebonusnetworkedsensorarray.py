@@ -2,6 +2,8 @@
 #
 # Used by:
 # Module: Networked Sensor Array
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "active"
 
 
@@ -12,7 +14,7 @@ def handler(fit, src, context):
         attr = "scan{}Strength".format(scanType)
         bonus = src.getModifiedItemAttr("scan{}StrengthPercent".format(scanType))
         fit.ship.boostItemAttr(attr, bonus, stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), attr, bonus,
+        fit.fighters.filteredItemBoost(ItemSkill("Fighters"), attr, bonus,
                                        stackingPenalties=True)
 
     # EW cap need increase
@@ -2,42 +2,44 @@
 #
 # Used by:
 # Modules from group: Drone Tracking Enhancer (10 of 10)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileExplosionRadius",
                                    src.getModifiedItemAttr("aoeCloudSizeBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileRangeOptimal", src.getModifiedItemAttr("maxRangeBonus"),
                                    stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretRangeFalloff", src.getModifiedItemAttr("falloffBonus"),
                                    stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesExplosionRadius",
                                    src.getModifiedItemAttr("aoeCloudSizeBonus"), stackingPenalties=True)
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "falloff",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "falloff",
                                  src.getModifiedItemAttr("falloffBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileRangeFalloff", src.getModifiedItemAttr("falloffBonus"),
                                    stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretTrackingSpeed",
                                    src.getModifiedItemAttr("trackingSpeedBonus"), stackingPenalties=True)
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "maxRange",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "maxRange",
                                  src.getModifiedItemAttr("maxRangeBonus"), stackingPenalties=True)
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "trackingSpeed",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "trackingSpeed",
                                  src.getModifiedItemAttr("trackingSpeedBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretRangeOptimal", src.getModifiedItemAttr("maxRangeBonus"),
                                    stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesExplosionVelocity",
                                    src.getModifiedItemAttr("aoeVelocityBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileExplosionVelocity",
                                    src.getModifiedItemAttr("aoeVelocityBonus"), stackingPenalties=True)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "fighterAbilityMissilesRange",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "fighterAbilityMissilesRange",
                                    src.getModifiedItemAttr("maxRangeBonus"), stackingPenalties=True)
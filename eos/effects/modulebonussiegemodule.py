@@ -2,6 +2,8 @@
 #
 # Used by:
 # Variations of module: Siege Module I (2 of 2)
+from eos.effectHandlerHelpers import ChargeSkill, ItemSkill
+
 type = "active"
 runTime = "early"
 
@@ -25,11 +27,11 @@ def handler(fit, src, context):
                                                mod.item.requiresSkill("Capital Repair Systems")),
                                   "duration", src.getModifiedItemAttr("siegeLocalLogisticsDurationBonus"))
 
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Operation"),
                                   "shieldBonus", src.getModifiedItemAttr("siegeLocalLogisticsAmountBonus"),
                                   stackingPenalties=True)
 
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Repair Systems"),
                                   "armorDamageAmount", src.getModifiedItemAttr("siegeLocalLogisticsAmountBonus"),
                                   stackingPenalties=True)
 
@@ -51,7 +53,7 @@ def handler(fit, src, context):
         fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == group, "speed",
                                       src.getModifiedItemAttr("siegeLauncherROFBonus"))
 
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "maxVelocity",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "maxVelocity",
                                     src.getModifiedItemAttr("siegeTorpedoVelocityBonus"), stackingPenalties=True)
 
     fit.ship.increaseItemAttr("warpScrambleStatus", src.getModifiedItemAttr("siegeModeWarpStatus"))
@@ -2,6 +2,8 @@
 #
 # Used by:
 # Variations of module: Triage Module I (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "active"
 runTime = "early"
 
@@ -13,23 +15,23 @@ def handler(fit, src, context):
             ("Capital Shield Emission Systems", "shieldBonus", True),
             ("Capital Capacitor Emission Systems", "powerTransferAmount", False),
             ("Capital Remote Hull Repair Systems", "structureDamageAmount", False)):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), "duration",
+        fit.modules.filteredItemBoost(ItemSkill(skill), "duration",
                                       src.getModifiedItemAttr("siegeRemoteLogisticsDurationBonus"))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+        fit.modules.filteredItemBoost(ItemSkill(skill), amtAttr,
                                       src.getModifiedItemAttr("siegeRemoteLogisticsAmountBonus"),
                                       stackingPenalties=stack)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), "maxRange",
+        fit.modules.filteredItemBoost(ItemSkill(skill), "maxRange",
                                       src.getModifiedItemAttr("siegeRemoteLogisticsRangeBonus"), stackingPenalties=True)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), "falloffEffectiveness",
+        fit.modules.filteredItemBoost(ItemSkill(skill), "falloffEffectiveness",
                                       src.getModifiedItemAttr("siegeRemoteLogisticsRangeBonus"), stackingPenalties=True)
 
     # Local armor/shield rep effects (duration / amoutn)
     for skill, amtAttr in (
             ("Capital Shield Operation", "shieldBonus"),
             ("Capital Repair Systems", "armorDamageAmount")):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), "duration",
+        fit.modules.filteredItemBoost(ItemSkill(skill), "duration",
                                       src.getModifiedItemAttr("siegeLocalLogisticsDurationBonus"))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+        fit.modules.filteredItemBoost(ItemSkill(skill), amtAttr,
                                       src.getModifiedItemAttr("siegeLocalLogisticsAmountBonus"))
 
     # Speed bonus
@@ -64,7 +66,7 @@ def handler(fit, src, context):
     fit.ship.forceItemAttr("disallowAssistance", src.getModifiedItemAttr("disallowAssistance"))
 
     # new in April 2016 release
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "damageMultiplier",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "damageMultiplier",
                                  src.getModifiedItemAttr("droneDamageBonus"), stackingPenalties=True)
 
     fit.ship.increaseItemAttr("warpScrambleStatus", src.getModifiedItemAttr("siegeModeWarpStatus"))
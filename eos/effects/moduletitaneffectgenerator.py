@@ -2,6 +2,8 @@
 #
 # Used by:
 # Modules from group: Titan Phenomena Generator (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 
 type = "active", "gang"
 
@@ -55,10 +57,10 @@ def handler(fit, module, context, **kwargs):
             fit.ship.boostItemAttr("maxVelocity", value, stackingPenalties=True)
 
         if id == 52:  # Erebus Effect Generator : Shield RR penalty
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "shieldBonus", value, stackingPenalties=True)
+            fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"), "shieldBonus", value, stackingPenalties=True)
 
         if id == 53:  # Leviathan Effect Generator : Armor RR penalty
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"), "armorDamageAmount", value, stackingPenalties=True)
+            fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"), "armorDamageAmount", value, stackingPenalties=True)
 
         if id == 54:  # Ragnarok Effect Generator : Laser and Hybrid Optimal penalty
             groups = ("Energy Weapon", "Hybrid Weapon")
@@ -2,8 +2,10 @@
 #
 # Used by:
 # Ship: Rabisu
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu", "cpu", src.getModifiedItemAttr("nosferatuCpuNeedBonus"))
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"), "cpu", src.getModifiedItemAttr("nosferatuCpuNeedBonus"))
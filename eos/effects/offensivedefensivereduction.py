@@ -3,6 +3,8 @@
 # Used by:
 # Celestials named like: Drifter Incursion (6 of 6)
 # Celestials named like: Incursion ship attributes effects (3 of 3)
+from eos.effectHandlerHelpers import ChargeSkill, ItemGroup, ItemSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
@@ -11,11 +13,11 @@ def handler(fit, beacon, context):
     damages = ("em", "thermal", "kinetic", "explosive")
     for damage in damages:
         # Nerf missile damage
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+        fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                         "{0}Damage".format(damage),
                                         beacon.getModifiedItemAttr("systemEffectDamageReduction"))
         # Nerf smartbomb damage
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Smart Bomb",
+        fit.modules.filteredItemBoost(ItemGroup("Smart Bomb"),
                                       "{0}Damage".format(damage),
                                       beacon.getModifiedItemAttr("systemEffectDamageReduction"))
         # Nerf armor resistances
@@ -28,5 +30,5 @@ def handler(fit, beacon, context):
     fit.drones.filteredItemBoost(lambda drone: True,
                                  "damageMultiplier", beacon.getModifiedItemAttr("systemEffectDamageReduction"))
     # Nerf turret damage output
-    fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "damageMultiplier", beacon.getModifiedItemAttr("systemEffectDamageReduction"))
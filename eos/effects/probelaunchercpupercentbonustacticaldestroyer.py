@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Tactical Destroyer (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Astrometrics"),
+    fit.modules.filteredItemBoost(ItemSkill("Astrometrics"),
                                   "cpu", ship.getModifiedItemAttr("roleBonusTacticalDestroyer1"))
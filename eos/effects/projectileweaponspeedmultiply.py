@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules from group: Gyrostabilizer (12 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Projectile Weapon",
+    fit.modules.filteredItemMultiply(ItemGroup("Projectile Weapon"),
                                      "speed", module.getModifiedItemAttr("speedMultiplier"),
                                      stackingPenalties=True)
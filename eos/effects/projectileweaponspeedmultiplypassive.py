@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Projectile Burst Aerator (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Projectile Weapon",
+    fit.modules.filteredItemMultiply(ItemGroup("Projectile Weapon"),
                                      "speed", module.getModifiedItemAttr("speedMultiplier"),
                                      stackingPenalties=True)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Rapid Firing
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "speed", skill.getModifiedItemAttr("rofBonus") * skill.level)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ships from group: Force Recon Ship (6 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Cloaking Device",
+    fit.modules.filteredItemBoost(ItemGroup("Cloaking Device"),
                                   "cpu", ship.getModifiedItemAttr("eliteBonusReconShip1"), skill="Recon Ships")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Logistics (3 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"), "power",
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"), "power",
                                   src.getModifiedItemAttr("remoteArmorPowerNeedBonus"))
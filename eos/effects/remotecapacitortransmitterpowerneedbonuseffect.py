@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Logistics (3 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Capacitor Transmitter",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Capacitor Transmitter"),
                                   "power", ship.getModifiedItemAttr("powerTransferPowerNeedBonus"))
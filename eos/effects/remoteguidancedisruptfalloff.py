@@ -2,6 +2,8 @@
 #
 # Used by:
 # Variations of module: Guidance Disruptor I (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "active", "projected"
 
 
@@ -13,6 +15,6 @@ def handler(fit, module, context):
                 ("missileVelocityBonus", "maxVelocity"),
                 ("explosionDelayBonus", "explosionDelay"),
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+            fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                             tgtAttr, module.getModifiedItemAttr(srcAttr),
                                             stackingPenalties=True, remoteResists=True)
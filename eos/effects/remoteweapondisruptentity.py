@@ -2,17 +2,19 @@
 #
 # Used by:
 # Drones named like: TD (3 of 3)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "projected", "active"
 
 
 def handler(fit, module, context):
     if "projected" in context:
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+        fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                       "trackingSpeed", module.getModifiedItemAttr("trackingSpeedBonus"),
                                       stackingPenalties=True, remoteResists=True)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+        fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                       "maxRange", module.getModifiedItemAttr("maxRangeBonus"),
                                       stackingPenalties=True, remoteResists=True)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+        fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                       "falloff", module.getModifiedItemAttr("falloffBonus"),
                                       stackingPenalties=True, remoteResists=True)
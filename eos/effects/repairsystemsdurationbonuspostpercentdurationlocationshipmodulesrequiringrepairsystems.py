@@ -5,10 +5,12 @@
 # Modules named like: Nanobot Accelerator (8 of 8)
 # Implant: Numon Family Heirloom
 # Skill: Repair Systems
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "duration", container.getModifiedItemAttr("durationSkillBonus") * level)
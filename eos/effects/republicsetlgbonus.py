@@ -2,11 +2,13 @@
 #
 # Used by:
 # Implants named like: Low grade Jackal (6 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill("Cybernetics"),
+    fit.appliedImplants.filteredItemMultiply(ItemSkill("Cybernetics"),
                                              "scanLadarStrengthModifier",
                                              implant.getModifiedItemAttr("implantSetLGRepublicFleet"))
@@ -2,12 +2,14 @@
 #
 # Used by:
 # Skill: Armor Rigging
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Armor", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Armor"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Resource Processing", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Resource Processing"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
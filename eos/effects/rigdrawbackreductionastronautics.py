@@ -2,12 +2,14 @@
 #
 # Used by:
 # Skill: Astronautics Rigging
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Navigation", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Navigation"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Anchor", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Anchor"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Drones Rigging
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Drones", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Drones"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
@@ -2,14 +2,16 @@
 #
 # Used by:
 # Skill: Electronic Superiority Rigging
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Electronic Systems", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Electronic Systems"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Scanning", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Scanning"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Targeting", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Targeting"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
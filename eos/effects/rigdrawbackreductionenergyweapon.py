@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Energy Weapon Rigging
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Energy Weapon", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Energy Weapon"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Hybrid Weapon Rigging
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Hybrid Weapon", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Hybrid Weapon"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
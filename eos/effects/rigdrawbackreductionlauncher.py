@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Launcher Rigging
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Launcher", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Launcher"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
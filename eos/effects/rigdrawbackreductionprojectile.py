@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Projectile Weapon Rigging
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Rig Projectile Weapon", "drawback",
+    fit.modules.filteredItemBoost(ItemGroup("Rig Projectile Weapon"), "drawback",
                                   src.getModifiedItemAttr("rigDrawbackBonus") * lvl)
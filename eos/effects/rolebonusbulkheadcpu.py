@@ -3,9 +3,11 @@
 # Used by:
 # Ships from group: Freighter (4 of 5)
 # Ships from group: Jump Freighter (4 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Reinforced Bulkhead",
+    fit.modules.filteredItemBoost(ItemGroup("Reinforced Bulkhead"),
                                   "cpu", ship.getModifiedItemAttr("cpuNeedBonus"))
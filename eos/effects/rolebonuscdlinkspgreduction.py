@@ -3,9 +3,11 @@
 # Used by:
 # Ships from group: Command Destroyer (4 of 4)
 # Ship: Porpoise
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Leadership"), "power",
+    fit.modules.filteredItemBoost(ItemSkill("Leadership"), "power",
                                   src.getModifiedItemAttr("roleBonusCD"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Griffin Navy Issue
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM", "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"), "capacitorNeed",
                                   src.getModifiedItemAttr("roleBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM", "cpu", src.getModifiedItemAttr("roleBonus"))
+    fit.modules.filteredItemBoost(ItemGroup("ECM"), "cpu", src.getModifiedItemAttr("roleBonus"))
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Griffin Navy Issue
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM", "falloffEffectiveness",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"), "falloffEffectiveness",
                                   src.getModifiedItemAttr("roleBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"), "maxRange",
                                   src.getModifiedItemAttr("roleBonus"))
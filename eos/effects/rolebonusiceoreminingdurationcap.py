@@ -2,15 +2,17 @@
 #
 # Used by:
 # Variations of ship: Covetor (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Mining"), "capacitorNeed",
                                   src.getModifiedItemAttr("miningDurationRoleBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Mining"), "duration",
                                   src.getModifiedItemAttr("miningDurationRoleBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Ice Harvesting"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Ice Harvesting"), "duration",
                                   src.getModifiedItemAttr("miningDurationRoleBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Ice Harvesting"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Ice Harvesting"), "capacitorNeed",
                                   src.getModifiedItemAttr("miningDurationRoleBonus"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Maulus Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Navigation"),
+    fit.modules.filteredItemIncrease(ItemSkill("Navigation"),
                                      "warpScrambleStrength", ship.getModifiedItemAttr("roleBonus"))
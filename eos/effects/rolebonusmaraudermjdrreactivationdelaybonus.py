@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Marauder (4 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Micro Jump Drive",
+    fit.modules.filteredItemBoost(ItemGroup("Micro Jump Drive"),
                                   "moduleReactivationDelay", ship.getModifiedItemAttr("roleBonusMarauder"))
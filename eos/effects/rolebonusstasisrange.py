@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vigil Fleet Issue
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"), "maxRange",
                                   src.getModifiedItemAttr("roleBonus"))
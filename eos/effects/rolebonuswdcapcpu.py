@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Crucifier Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "cpu",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "cpu",
                                   src.getModifiedItemAttr("roleBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "capacitorNeed",
                                   src.getModifiedItemAttr("roleBonus"))
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Crucifier Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "falloff",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "falloff",
                                   src.getModifiedItemAttr("roleBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "maxRange",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "maxRange",
                                   src.getModifiedItemAttr("roleBonus"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Rorqual
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Cargo Scanner",
+    fit.modules.filteredItemBoost(ItemGroup("Cargo Scanner"),
                                   "cargoScanRange", ship.getModifiedItemAttr("cargoScannerRangeBonus"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Rorqual
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Survey Scanner",
+    fit.modules.filteredItemBoost(ItemGroup("Survey Scanner"),
                                   "surveyScanRange", ship.getModifiedItemAttr("surveyScannerRangeBonus"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implant: Poteque 'Prospector' Environmental Analysis EY-1005
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Salvager",
+    fit.modules.filteredItemBoost(ItemGroup("Salvager"),
                                   "duration", implant.getModifiedItemAttr("durationBonus"))
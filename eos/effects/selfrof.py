@@ -4,9 +4,11 @@
 # Skills named like: Missile Specialization (4 of 5)
 # Skill: Rocket Specialization
 # Skill: Torpedo Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill),
+    fit.modules.filteredItemBoost(ItemSkill(skill),
                                   "speed", skill.getModifiedItemAttr("rofBonus") * skill.level)
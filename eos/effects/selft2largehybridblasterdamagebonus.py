@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Large Blaster Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Blaster Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Blaster Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Large Beam Laser Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Beam Laser Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Beam Laser Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
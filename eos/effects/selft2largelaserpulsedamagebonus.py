@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Large Pulse Laser Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Pulse Laser Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Pulse Laser Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Large Artillery Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Artillery Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Artillery Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Medium Blaster Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Blaster Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Blaster Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Medium Pulse Laser Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Pulse Laser Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Pulse Laser Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Medium Artillery Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Artillery Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Artillery Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Small Beam Laser Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Beam Laser Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Beam Laser Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Small Artillery Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Artillery Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Artillery Specialization"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
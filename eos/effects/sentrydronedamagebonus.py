@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Sentry Damage Augmentor (8 of 8)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Sentry Drone Interfacing"),
+    fit.drones.filteredItemBoost(ItemSkill("Sentry Drone Interfacing"),
                                  "damageMultiplier", module.getModifiedItemAttr("damageMultiplierBonus"),
                                  stackingPenalties=True)
@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Asklepian Omega (3 of 3)
 # Implants named like: Grade Asklepian (16 of 16)
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Cybernetics"),
+    fit.appliedImplants.filteredItemMultiply(ItemSkill("Cybernetics"),
                                              "armorRepairBonus", src.getModifiedItemAttr("implantSetSerpentis2"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: grade Talisman (15 of 18)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capacitor Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capacitor Emission Systems"),
                                   "duration", implant.getModifiedItemAttr("durationBonus"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Implants named like: Genolution Core Augmentation CA (4 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 runTime = "early"
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == "Special Edition Implant",
+    fit.appliedImplants.filteredItemMultiply(ItemGroup("Special Edition Implant"),
                                              "implantBonusVelocity", implant.getModifiedItemAttr("implantSetChristmas"))
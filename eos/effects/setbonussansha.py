@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: grade Slave (18 of 18)
 # Implant: High-grade Halo Omega
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill("Cybernetics"),
+    fit.appliedImplants.filteredItemMultiply(ItemSkill("Cybernetics"),
                                              "armorHpBonus", implant.getModifiedItemAttr("implantSetSansha") or 1)
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Implants named like: grade Edge (12 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 runTime = "early"
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == "Cyberimplant",
+    fit.appliedImplants.filteredItemMultiply(ItemGroup("Cyberimplant"),
                                              "boosterAttributeModifier",
                                              implant.getModifiedItemAttr("implantSetSyndicate"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Implants named like: grade Nomad (12 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 runTime = "early"
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == "Cyberimplant",
+    fit.appliedImplants.filteredItemMultiply(ItemGroup("Cyberimplant"),
                                              "agilityBonus", implant.getModifiedItemAttr("implantSetThukker"))
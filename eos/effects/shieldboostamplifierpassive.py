@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: grade Crystal (15 of 18)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "shieldBonus", container.getModifiedItemAttr("shieldBoostMultiplier"))
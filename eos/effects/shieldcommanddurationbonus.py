@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Shield Command
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Command"), "buffDuration", src.getModifiedItemAttr("durationBonus") * lvl)
+    fit.modules.filteredItemBoost(ItemSkill("Shield Command"), "buffDuration", src.getModifiedItemAttr("durationBonus") * lvl)
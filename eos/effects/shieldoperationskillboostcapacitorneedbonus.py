@@ -3,10 +3,12 @@
 # Used by:
 # Modules named like: Core Defense Capacitor Safeguard (8 of 8)
 # Skill: Shield Compensation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "capacitorNeed", container.getModifiedItemAttr("shieldBoostCapacitorBonus") * level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Logistics (3 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "cpu",
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"), "cpu",
                                   src.getModifiedItemAttr("shieldTransportCpuNeedBonus"))
@@ -5,11 +5,13 @@
 # Variations of ship: Burst (2 of 2)
 # Ship: Osprey
 # Ship: Scythe
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Shield Booster", "falloffEffectiveness",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Shield Booster"), "falloffEffectiveness",
                                   src.getModifiedItemAttr("falloffBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Ancillary Remote Shield Booster",
+    fit.modules.filteredItemBoost(ItemGroup("Ancillary Remote Shield Booster"),
                                   "falloffEffectiveness", src.getModifiedItemAttr("falloffBonus"))
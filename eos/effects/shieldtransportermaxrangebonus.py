@@ -5,11 +5,13 @@
 # Ship: Osprey
 # Ship: Rorqual
 # Ship: Scythe
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Shield Booster", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Shield Booster"), "maxRange",
                                   ship.getModifiedItemAttr("maxRangeBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Ancillary Remote Shield Booster", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("Ancillary Remote Shield Booster"), "maxRange",
                                   ship.getModifiedItemAttr("maxRangeBonus"))
@@ -4,10 +4,12 @@
 # Variations of ship: Myrmidon (2 of 2)
 # Ship: Astarte
 # Ship: Brutix
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "armorDamageAmount", ship.getModifiedItemAttr("shipBonusGBC2"),
                                   skill="Gallente Battlecruiser")
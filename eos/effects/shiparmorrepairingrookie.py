@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Velator
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "armorDamageAmount", ship.getModifiedItemAttr("rookieArmorRepBonus"))
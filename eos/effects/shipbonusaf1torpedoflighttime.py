@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Purifier
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"),
                                     "explosionDelay", ship.getModifiedItemAttr("shipBonusAF"), skill="Amarr Frigate")
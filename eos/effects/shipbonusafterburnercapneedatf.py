@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Freki
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Propulsion Module",
+    fit.modules.filteredItemBoost(ItemGroup("Propulsion Module"),
                                   "capacitorNeed", ship.getModifiedItemAttr("shipBonusATF1"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Nightmare
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner"),
+    fit.modules.filteredItemBoost(ItemSkill("Afterburner"),
                                   "speedFactor", module.getModifiedItemAttr("shipBonus2CB"), skill="Caldari Battleship")
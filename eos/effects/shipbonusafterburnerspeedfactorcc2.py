@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Fiend
 # Ship: Phantasm
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner"),
+    fit.modules.filteredItemBoost(ItemSkill("Afterburner"),
                                   "speedFactor", module.getModifiedItemAttr("shipBonusCC2"), skill="Caldari Cruiser")
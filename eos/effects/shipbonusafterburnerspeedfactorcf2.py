@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Imp
 # Ship: Succubus
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner"),
+    fit.modules.filteredItemBoost(ItemSkill("Afterburner"),
                                   "speedFactor", module.getModifiedItemAttr("shipBonusCF2"), skill="Caldari Frigate")
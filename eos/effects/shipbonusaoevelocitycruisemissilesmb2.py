@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Typhoon
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Cruise Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Cruise Missiles"),
                                     "aoeVelocity", ship.getModifiedItemAttr("shipBonusMB2"),
                                     skill="Minmatar Battleship")
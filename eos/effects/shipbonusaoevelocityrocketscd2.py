@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Corax
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"),
                                     "aoeVelocity", ship.getModifiedItemAttr("shipBonusCD2"), skill="Caldari Destroyer")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vigil Fleet Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"), "aoeVelocity",
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"), "aoeVelocity",
                                     src.getModifiedItemAttr("shipBonusMF"), skill="Minmatar Frigate")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Impel
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "armorDamageAmount", ship.getModifiedItemAttr("shipBonusAI2"),
                                   skill="Amarr Industrial")
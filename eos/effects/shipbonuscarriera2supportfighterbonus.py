@@ -2,12 +2,14 @@
 #
 # Used by:
 # Ship: Archon
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Support Fighters"), "fighterSquadronOrbitRange",
+    fit.fighters.filteredItemBoost(ItemSkill("Support Fighters"), "fighterSquadronOrbitRange",
                                    src.getModifiedItemAttr("shipBonusCarrierA2"), skill="Amarr Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Support Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Support Fighters"),
                                    "fighterAbilityEnergyNeutralizerOptimalRange",
                                    src.getModifiedItemAttr("shipBonusCarrierA2"), skill="Amarr Carrier")
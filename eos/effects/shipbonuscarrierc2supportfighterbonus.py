@@ -2,12 +2,14 @@
 #
 # Used by:
 # Ship: Chimera
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Support Fighters"), "fighterSquadronOrbitRange",
+    fit.fighters.filteredItemBoost(ItemSkill("Support Fighters"), "fighterSquadronOrbitRange",
                                    src.getModifiedItemAttr("shipBonusCarrierC2"), skill="Caldari Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Support Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Support Fighters"),
                                    "fighterAbilityECMRangeOptimal", src.getModifiedItemAttr("shipBonusCarrierC2"),
                                    skill="Caldari Carrier")
@@ -2,16 +2,18 @@
 #
 # Used by:
 # Ship: Thanatos
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusCarrierG1"), skill="Gallente Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusCarrierG1"), skill="Gallente Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusCarrierG1"), skill="Gallente Carrier")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Thanatos
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "shieldCapacity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "shieldCapacity",
                                    src.getModifiedItemAttr("shipBonusCarrierG3"), skill="Gallente Carrier")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Nidhoggur
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "maxVelocity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "maxVelocity",
                                    src.getModifiedItemAttr("shipBonusCarrierM3"), skill="Minmatar Carrier")
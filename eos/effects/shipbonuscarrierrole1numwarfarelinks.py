@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Carrier (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Leadership"), "maxGroupActive",
+    fit.modules.filteredItemIncrease(ItemSkill("Leadership"), "maxGroupActive",
                                      src.getModifiedItemAttr("shipBonusRole1"))
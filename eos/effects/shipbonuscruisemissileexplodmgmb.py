@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Typhoon Fleet Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Cruise Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Cruise Missiles"),
                                     "explosiveDamage", ship.getModifiedItemAttr("shipBonusMB"),
                                     skill="Minmatar Battleship")
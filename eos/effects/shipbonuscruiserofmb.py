@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Typhoon
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Cruise",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Cruise"),
                                   "speed", ship.getModifiedItemAttr("shipBonusMB"), skill="Minmatar Battleship")
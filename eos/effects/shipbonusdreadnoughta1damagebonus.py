@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Revelation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Energy Turret"), "damageMultiplier",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Energy Turret"), "damageMultiplier",
                                   src.getModifiedItemAttr("shipBonusDreadnoughtA1"), skill="Amarr Dreadnought")
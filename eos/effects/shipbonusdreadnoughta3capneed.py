@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Revelation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Energy Turret"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Energy Turret"), "capacitorNeed",
                                   src.getModifiedItemAttr("shipBonusDreadnoughtA3"), skill="Amarr Dreadnought")
@@ -2,31 +2,33 @@
 #
 # Used by:
 # Ship: Phoenix
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Torpedoes"), "thermalDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Torpedoes"), "thermalDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "emDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "emDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "explosiveDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "explosiveDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"), "explosiveDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"), "explosiveDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"), "thermalDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"), "thermalDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "thermalDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "thermalDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Torpedoes"), "emDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Torpedoes"), "emDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Torpedoes"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Torpedoes"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Torpedoes"), "explosiveDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Torpedoes"), "explosiveDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"), "emDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"), "emDamage",
                                     src.getModifiedItemAttr("shipBonusDreadnoughtC1"), skill="Caldari Dreadnought")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Phoenix
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Missile Launcher Operation"), "reloadTime",
+    fit.modules.filteredItemBoost(ItemSkill("Missile Launcher Operation"), "reloadTime",
                                   src.getModifiedItemAttr("shipBonusDreadnoughtC3"), skill="Caldari Dreadnought")
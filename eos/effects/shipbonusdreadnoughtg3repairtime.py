@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Moros
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Repair Systems"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Repair Systems"), "duration",
                                   src.getModifiedItemAttr("shipBonusDreadnoughtG3"), skill="Gallente Dreadnought")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vehement
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web", "speedFactor",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"), "speedFactor",
                                   src.getModifiedItemAttr("shipBonusDreadnoughtM1"), skill="Minmatar Dreadnought")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Naglfar
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Operation"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Operation"), "duration",
                                   src.getModifiedItemAttr("shipBonusDreadnoughtM2"), skill="Minmatar Dreadnought")
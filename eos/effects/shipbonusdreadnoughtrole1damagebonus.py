@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vehement
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Hybrid Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusRole1"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Prophecy
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "damageMultiplier", ship.getModifiedItemAttr("shipBonusABC2"),
                                  skill="Amarr Battlecruiser")
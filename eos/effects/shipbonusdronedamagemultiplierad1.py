@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of ship: Dragoon (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "damageMultiplier",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "damageMultiplier",
                                  src.getModifiedItemAttr("shipBonusAD1"), skill="Amarr Destroyer")
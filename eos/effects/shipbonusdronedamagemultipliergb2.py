@@ -3,10 +3,12 @@
 # Used by:
 # Variations of ship: Dominix (3 of 3)
 # Ship: Nestor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "damageMultiplier", ship.getModifiedItemAttr("shipBonusGB2"),
                                  skill="Gallente Battleship")
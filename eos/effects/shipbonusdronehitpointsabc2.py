@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Prophecy
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for layer in ("shieldCapacity", "armorHP", "hp"):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+        fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                      layer, ship.getModifiedItemAttr("shipBonusABC2"), skill="Amarr Battlecruiser")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Variations of ship: Myrmidon (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for layer in ("shieldCapacity", "armorHP", "hp"):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+        fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                      layer, ship.getModifiedItemAttr("shipBonusGBC1"), skill="Gallente Battlecruiser")
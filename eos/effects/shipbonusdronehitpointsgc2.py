@@ -4,10 +4,12 @@
 # Ships named like: Stratios (2 of 2)
 # Ship: Vexor
 # Ship: Vexor Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for type in ("shieldCapacity", "armorHP", "hp"):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+        fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                      type, ship.getModifiedItemAttr("shipBonusGC2"), skill="Gallente Cruiser")
@@ -2,13 +2,15 @@
 #
 # Used by:
 # Variations of ship: Algos (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "shieldCapacity",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "shieldCapacity",
                                  src.getModifiedItemAttr("shipBonusGD1"), skill="Gallente Destroyer")
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "armorHP",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "armorHP",
                                  src.getModifiedItemAttr("shipBonusGD1"), skill="Gallente Destroyer")
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "hp",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "hp",
                                  src.getModifiedItemAttr("shipBonusGD1"), skill="Gallente Destroyer")
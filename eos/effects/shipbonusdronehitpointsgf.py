@@ -4,10 +4,12 @@
 # Ship: Astero
 # Ship: Maulus Navy Issue
 # Ship: Tristan
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for layer in ("shieldCapacity", "armorHP", "hp"):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+        fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                      layer, ship.getModifiedItemAttr("shipBonusGF"), skill="Gallente Frigate")
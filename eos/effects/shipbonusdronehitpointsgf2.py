@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Ishkur
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "hp", ship.getModifiedItemAttr("shipBonusGF2"), skill="Gallente Frigate")
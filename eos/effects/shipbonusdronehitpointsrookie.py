@@ -6,10 +6,12 @@
 # Ship: Sunesis
 # Ship: Taipan
 # Ship: Velator
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for type in ("shieldCapacity", "armorHP", "hp"):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+        fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                      type, ship.getModifiedItemAttr("rookieDroneBonus"))
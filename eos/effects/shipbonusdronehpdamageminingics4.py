@@ -2,35 +2,37 @@
 #
 # Used by:
 # Ships from group: Industrial Command Ship (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "damageMultiplier",
                                  src.getModifiedItemAttr("shipBonusICS4"),
                                  skill="Industrial Command Ships"
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "shieldCapacity",
                                  src.getModifiedItemAttr("shipBonusICS4"),
                                  skill="Industrial Command Ships"
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "armorHP",
                                  src.getModifiedItemAttr("shipBonusICS4"),
                                  skill="Industrial Command Ships"
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "hp",
                                  src.getModifiedItemAttr("shipBonusICS4"),
                                  skill="Industrial Command Ships"
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Mining Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Mining Drone Operation"),
                                  "miningAmount",
                                  src.getModifiedItemAttr("shipBonusICS4"),
                                  skill="Industrial Command Ships"
@@ -2,35 +2,37 @@
 #
 # Used by:
 # Ship: Rorqual
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "damageMultiplier",
                                  src.getModifiedItemAttr("shipBonusORECapital4"),
                                  skill="Capital Industrial Ships"
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "shieldCapacity",
                                  src.getModifiedItemAttr("shipBonusORECapital4"),
                                  skill="Capital Industrial Ships"
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "armorHP",
                                  src.getModifiedItemAttr("shipBonusORECapital4"),
                                  skill="Capital Industrial Ships"
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "hp",
                                  src.getModifiedItemAttr("shipBonusORECapital4"),
                                  skill="Capital Industrial Ships"
                                  )
 
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Mining Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Mining Drone Operation"),
                                  "miningAmount",
                                  src.getModifiedItemAttr("shipBonusORECapital4"),
                                  skill="Capital Industrial Ships"
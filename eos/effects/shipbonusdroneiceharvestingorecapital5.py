@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Rorqual
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Ice Harvesting Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Ice Harvesting Drone Operation"),
                                  "duration",
                                  src.getModifiedItemAttr("shipBonusORECapital5"),
                                  skill="Capital Industrial Ships"
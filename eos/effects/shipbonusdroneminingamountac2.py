@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Arbitrator
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == "Mining Drone",
+    fit.drones.filteredItemBoost(ItemGroup("Mining Drone"),
                                  "miningAmount", ship.getModifiedItemAttr("shipBonusAC2"), skill="Amarr Cruiser")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Vexor
 # Ship: Vexor Navy Issue
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == "Mining Drone",
+    fit.drones.filteredItemBoost(ItemGroup("Mining Drone"),
                                  "miningAmount", ship.getModifiedItemAttr("shipBonusGC2"), skill="Gallente Cruiser")
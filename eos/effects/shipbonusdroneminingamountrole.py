@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ships from group: Industrial Command Ship (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Mining Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Mining Drone Operation"),
                                  "miningAmount",
                                  src.getModifiedItemAttr("roleBonusDroneMiningYield"),
                                  )
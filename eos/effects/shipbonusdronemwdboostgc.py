@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vexor Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "maxVelocity", ship.getModifiedItemAttr("shipBonusGC"), skill="Gallente Cruiser")
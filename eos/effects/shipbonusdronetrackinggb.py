@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Dominix
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "trackingSpeed", ship.getModifiedItemAttr("shipBonusGB"), skill="Gallente Battleship")
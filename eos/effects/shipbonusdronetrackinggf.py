@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Maulus Navy Issue
 # Ship: Tristan
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "trackingSpeed", ship.getModifiedItemAttr("shipBonusGF"), skill="Gallente Frigate")
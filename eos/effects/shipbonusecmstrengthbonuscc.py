@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Blackbird
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for type in ("Gravimetric", "Magnetometric", "Ladar", "Radar"):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+        fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                       "scan{0}StrengthBonus".format(type), ship.getModifiedItemAttr("shipBonusCC"),
                                       skill="Caldari Cruiser")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Hound
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"),
                                     "explosiveDamage", ship.getModifiedItemAttr("eliteBonusCoverOps2"),
                                     skill="Covert Ops")
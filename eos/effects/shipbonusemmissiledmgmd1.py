@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Bifrost
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"), "emDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"), "emDamage",
                                     src.getModifiedItemAttr("shipBonusMD1"), skill="Minmatar Destroyer")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Dragoon
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Neutralizer", "falloffEffectiveness",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Neutralizer"), "falloffEffectiveness",
                                   src.getModifiedItemAttr("shipBonusAD1"), skill="Amarr Destroyer")
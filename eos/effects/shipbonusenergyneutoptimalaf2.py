@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Malice
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Neutralizer", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Neutralizer"), "maxRange",
                                   src.getModifiedItemAttr("shipBonus2AF"), skill="Amarr Frigate")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vangel
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu", "falloffEffectiveness",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"), "falloffEffectiveness",
                                   src.getModifiedItemAttr("shipBonusAC3"), skill="Amarr Cruiser")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Sentinel
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu", "falloffEffectiveness",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"), "falloffEffectiveness",
                                   src.getModifiedItemAttr("eliteBonusElectronicAttackShip3"),
                                   skill="Electronic Attack Ships")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Dragoon
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"), "maxRange",
                                   src.getModifiedItemAttr("shipBonusAD2"), skill="Amarr Destroyer")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Sentinel
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu", "maxRange",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"), "maxRange",
                                   src.getModifiedItemAttr("eliteBonusElectronicAttackShip1"),
                                   skill="Electronic Attack Ships")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Celestis
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
+    fit.modules.filteredItemBoost(ItemGroup("Sensor Dampener"),
                                   "falloffEffectiveness", ship.getModifiedItemAttr("shipBonusGC"),
                                   skill="Gallente Cruiser")
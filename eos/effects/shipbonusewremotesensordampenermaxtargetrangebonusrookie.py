@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Velator
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
+    fit.modules.filteredItemBoost(ItemGroup("Sensor Dampener"),
                                   "maxTargetRangeBonus", ship.getModifiedItemAttr("rookieDampStrengthBonus"))
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Variations of ship: Celestis (3 of 3)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
+    fit.modules.filteredItemBoost(ItemGroup("Sensor Dampener"),
                                   "scanResolutionBonus", ship.getModifiedItemAttr("shipBonusGC2"),
                                   skill="Gallente Cruiser")
@@ -3,10 +3,12 @@
 # Used by:
 # Ship: Keres
 # Ship: Maulus
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
+    fit.modules.filteredItemBoost(ItemGroup("Sensor Dampener"),
                                   "scanResolutionBonus", ship.getModifiedItemAttr("shipBonusGF2"),
                                   skill="Gallente Frigate")
@@ -2,21 +2,23 @@
 #
 # Used by:
 # Variations of ship: Arbitrator (3 of 3)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "missileVelocityBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "missileVelocityBonus",
                                   src.getModifiedItemAttr("shipBonusAC"), skill="Amarr Cruiser")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "aoeVelocityBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "aoeVelocityBonus",
                                   src.getModifiedItemAttr("shipBonusAC"), skill="Amarr Cruiser")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "maxRangeBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "maxRangeBonus",
                                   src.getModifiedItemAttr("shipBonusAC"), skill="Amarr Cruiser")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "explosionDelayBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "explosionDelayBonus",
                                   src.getModifiedItemAttr("shipBonusAC"), skill="Amarr Cruiser")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "aoeCloudSizeBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "aoeCloudSizeBonus",
                                   src.getModifiedItemAttr("shipBonusAC"), skill="Amarr Cruiser")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "trackingSpeedBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "trackingSpeedBonus",
                                   src.getModifiedItemAttr("shipBonusAC"), skill="Amarr Cruiser")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"), "falloffBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"), "falloffBonus",
                                   src.getModifiedItemAttr("shipBonusAC"), skill="Amarr Cruiser")
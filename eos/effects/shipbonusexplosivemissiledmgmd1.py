@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Bifrost
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "explosiveDamage", src.getModifiedItemAttr("shipBonusMD1"),
                                     skill="Minmatar Destroyer")
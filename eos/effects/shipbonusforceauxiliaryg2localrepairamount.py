@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Ninazu
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"), "armorDamageAmount",
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"), "armorDamageAmount",
                                   src.getModifiedItemAttr("shipBonusForceAuxiliaryG2"), skill="Gallente Carrier")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Repair Systems"), "armorDamageAmount",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Repair Systems"), "armorDamageAmount",
                                   src.getModifiedItemAttr("shipBonusForceAuxiliaryG2"), skill="Gallente Carrier")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Ninazu
+from eos.effectHandlerHelpers import ChargeGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == "Capacitor Booster Charge", "capacitorBonus",
+    fit.modules.filteredChargeBoost(ChargeGroup("Capacitor Booster Charge"), "capacitorBonus",
                                     src.getModifiedItemAttr("shipBonusForceAuxiliaryG3"), skill="Gallente Carrier")
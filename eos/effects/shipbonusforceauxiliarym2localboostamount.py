@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Lif
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Shield Operation"), "shieldBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Shield Operation"), "shieldBonus",
                                   src.getModifiedItemAttr("shipBonusForceAuxiliaryM2"), skill="Minmatar Carrier")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"), "shieldBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"), "shieldBonus",
                                   src.getModifiedItemAttr("shipBonusForceAuxiliaryM2"), skill="Minmatar Carrier")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Lif
+from eos.effectHandlerHelpers import ChargeGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == "Capacitor Booster Charge", "capacitorBonus",
+    fit.modules.filteredChargeBoost(ChargeGroup("Capacitor Booster Charge"), "capacitorBonus",
                                     src.getModifiedItemAttr("shipBonusForceAuxiliaryM3"), skill="Minmatar Carrier")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships from group: Force Auxiliary (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Leadership"), "cpu",
+    fit.modules.filteredItemBoost(ItemSkill("Leadership"), "cpu",
                                   src.getModifiedItemAttr("shipBonusRole1"))
@@ -2,13 +2,15 @@
 #
 # Used by:
 # Ships from group: Force Auxiliary (4 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Drone Operation"), "structureDamageAmount",
+    fit.drones.filteredItemBoost(ItemSkill("Repair Drone Operation"), "structureDamageAmount",
                                  src.getModifiedItemAttr("shipBonusRole2"))
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Drone Operation"), "armorDamageAmount",
+    fit.drones.filteredItemBoost(ItemSkill("Repair Drone Operation"), "armorDamageAmount",
                                  src.getModifiedItemAttr("shipBonusRole2"))
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Drone Operation"), "shieldBonus",
+    fit.drones.filteredItemBoost(ItemSkill("Repair Drone Operation"), "shieldBonus",
                                  src.getModifiedItemAttr("shipBonusRole2"))
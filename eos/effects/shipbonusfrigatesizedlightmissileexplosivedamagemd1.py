@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Talwar
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Light Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Light Missiles"),
                                     "explosiveDamage", ship.getModifiedItemAttr("shipBonusMD1"),
                                     skill="Minmatar Destroyer")
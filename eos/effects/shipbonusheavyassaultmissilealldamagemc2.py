@@ -3,11 +3,13 @@
 # Used by:
 # Ship: Rapier
 # Ship: Scythe Fleet Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for damageType in ("em", "explosive", "kinetic", "thermal"):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Assault Missiles"),
+        fit.modules.filteredChargeBoost(ChargeSkill("Heavy Assault Missiles"),
                                         "{0}Damage".format(damageType), ship.getModifiedItemAttr("shipBonusMC2"),
                                         skill="Minmatar Cruiser")
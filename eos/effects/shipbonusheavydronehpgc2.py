@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Ishtar
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Heavy Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Heavy Drone Operation"),
                                  "hp", ship.getModifiedItemAttr("shipBonusGC2"), skill="Gallente Cruiser")
@@ -3,10 +3,12 @@
 # Used by:
 # Ship: Drake
 # Ship: Nighthawk
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Missiles"),
                                     "kineticDamage", ship.getModifiedItemAttr("shipBonusCBC1"),
                                     skill="Caldari Battlecruiser")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Adrestia
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("shipBonusATC2"))
@@ -4,9 +4,11 @@
 # Ship: Ares
 # Ship: Federation Navy Comet
 # Ship: Tristan
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("shipBonusGF2"), skill="Gallente Frigate")
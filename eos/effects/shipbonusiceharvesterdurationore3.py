@@ -3,9 +3,11 @@
 # Used by:
 # Ships from group: Exhumer (3 of 3)
 # Ships from group: Mining Barge (3 of 3)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Ice Harvesting"),
+    fit.modules.filteredItemBoost(ItemSkill("Ice Harvesting"),
                                   "duration", container.getModifiedItemAttr("shipBonusORE3"), skill="Mining Barge")
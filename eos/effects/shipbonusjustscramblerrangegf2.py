@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Maulus Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Navigation"), "maxRange",
+    fit.modules.filteredItemBoost(ItemSkill("Navigation"), "maxRange",
                                   src.getModifiedItemAttr("shipBonusGF2"), skill="Gallente Frigate")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Stork
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusCD1"), skill="Caldari Destroyer")
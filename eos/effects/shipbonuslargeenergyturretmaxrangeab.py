@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Paladin
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Energy Turret"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusAB"), skill="Amarr Battleship")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Apocalypse
 # Ship: Apocalypse Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Energy Turret"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusAB2"), skill="Amarr Battleship")
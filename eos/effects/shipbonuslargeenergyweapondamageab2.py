@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Abaddon
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Energy Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusAB2"),
                                   skill="Amarr Battleship")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Whiptail
 # Ship: Worm
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Light Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Light Drone Operation"),
                                  "shieldCapacity", ship.getModifiedItemAttr("shipBonusPirateFaction"))
@@ -3,11 +3,13 @@
 # Used by:
 # Ship: Rapier
 # Ship: Scythe Fleet Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for damageType in ("em", "explosive", "kinetic", "thermal"):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Light Missiles"),
+        fit.modules.filteredChargeBoost(ChargeSkill("Light Missiles"),
                                         "{0}Damage".format(damageType), ship.getModifiedItemAttr("shipBonusMC2"),
                                         skill="Minmatar Cruiser")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Chameleon
 # Ship: Gila
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Medium Drone Operation"),
+    fit.drones.filteredItemBoost(ItemSkill("Medium Drone Operation"),
                                  "damageMultiplier", ship.getModifiedItemAttr("shipBonusPirateFaction"))
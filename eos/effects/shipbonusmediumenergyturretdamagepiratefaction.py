@@ -5,9 +5,11 @@
 # Ship: Fiend
 # Ship: Gnosis
 # Ship: Phantasm
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusPirateFaction"))
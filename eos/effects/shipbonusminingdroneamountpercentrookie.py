@@ -4,10 +4,12 @@
 # Ship: Gnosis
 # Ship: Taipan
 # Ship: Velator
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, container, context):
     # level = container.level if "skill" in context else 1
-    fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == "Mining Drone",
+    fit.drones.filteredItemBoost(ItemGroup("Mining Drone"),
                                  "miningAmount", container.getModifiedItemAttr("rookieDroneBonus"))
@@ -3,9 +3,11 @@
 # Used by:
 # Ships from group: Exhumer (3 of 3)
 # Ships from group: Mining Barge (3 of 3)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining"),
                                   "duration", ship.getModifiedItemAttr("shipBonusORE3"), skill="Mining Barge")
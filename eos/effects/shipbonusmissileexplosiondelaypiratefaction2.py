@@ -4,9 +4,11 @@
 # Ship: Barghest
 # Ship: Garmur
 # Ship: Orthrus
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "explosionDelay", ship.getModifiedItemAttr("shipBonusPirateFaction2"))
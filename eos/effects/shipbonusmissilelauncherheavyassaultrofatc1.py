@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vangel
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Heavy Assault",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Heavy Assault"),
                                   "speed", ship.getModifiedItemAttr("shipBonusATC1"))
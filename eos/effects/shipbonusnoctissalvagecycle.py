@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Noctis
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Salvaging"),
+    fit.modules.filteredItemBoost(ItemSkill("Salvaging"),
                                   "duration", ship.getModifiedItemAttr("shipBonusOreIndustrial1"),
                                   skill="ORE Industrial")
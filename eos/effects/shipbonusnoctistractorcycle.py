@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Noctis
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Tractor Beam",
+    fit.modules.filteredItemBoost(ItemGroup("Tractor Beam"),
                                   "duration", ship.getModifiedItemAttr("shipBonusOreIndustrial1"),
                                   skill="ORE Industrial")
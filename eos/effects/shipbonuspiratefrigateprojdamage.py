@@ -5,9 +5,11 @@
 # Ship: Dramiel
 # Ship: Sunesis
 # Ship: Svipul
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Projectile Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusPirateFaction"))
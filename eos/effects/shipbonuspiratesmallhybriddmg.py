@@ -4,9 +4,11 @@
 # Ship: Daredevil
 # Ship: Hecate
 # Ship: Sunesis
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusPirateFaction"))
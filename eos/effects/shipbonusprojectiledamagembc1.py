@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ships named like: Hurricane (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusMBC1"),
                                   skill="Minmatar Battlecruiser")
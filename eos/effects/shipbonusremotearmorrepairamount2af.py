@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Deacon
 # Ship: Inquisitor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"),
                                   "armorDamageAmount", src.getModifiedItemAttr("shipBonus2AF"), skill="Amarr Frigate")
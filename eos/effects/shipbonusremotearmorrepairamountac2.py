@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Augoror
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"),
                                   "armorDamageAmount", src.getModifiedItemAttr("shipBonusAC2"), skill="Amarr Cruiser")
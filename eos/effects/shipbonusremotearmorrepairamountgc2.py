@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Exequror
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"),
                                   "armorDamageAmount", src.getModifiedItemAttr("shipBonusGC2"),
                                   skill="Gallente Cruiser")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Variations of ship: Navitas (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"),
                                   "armorDamageAmount", src.getModifiedItemAttr("shipBonusGF2"),
                                   skill="Gallente Frigate")
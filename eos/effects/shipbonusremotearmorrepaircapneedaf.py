@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Deacon
 # Ship: Inquisitor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"), "capacitorNeed",
                                   src.getModifiedItemAttr("shipBonusAF"), skill="Amarr Frigate")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Nestor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"),
                                   "armorDamageAmount", ship.getModifiedItemAttr("shipBonusPirateFaction"))
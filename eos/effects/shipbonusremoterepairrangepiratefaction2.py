@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Nestor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusPirateFaction2"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"),
                                   "falloffEffectiveness", ship.getModifiedItemAttr("shipBonusPirateFaction2"))
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Raven
 # Ship: Widow
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Rapid Heavy",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Rapid Heavy"),
                                   "speed", ship.getModifiedItemAttr("shipBonus2CB"), skill="Caldari Battleship")
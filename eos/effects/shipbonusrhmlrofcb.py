@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Scorpion Navy Issue
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Rapid Heavy",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Rapid Heavy"),
                                   "speed", ship.getModifiedItemAttr("shipBonusCB"), skill="Caldari Battleship")
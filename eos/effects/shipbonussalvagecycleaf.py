@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Magnate
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Salvaging"),
+    fit.modules.filteredItemBoost(ItemSkill("Salvaging"),
                                   "duration", ship.getModifiedItemAttr("shipBonusAF"), skill="Amarr Frigate")
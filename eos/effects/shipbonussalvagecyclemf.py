@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Probe
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Salvaging"),
+    fit.modules.filteredItemBoost(ItemSkill("Salvaging"),
                                   "duration", ship.getModifiedItemAttr("shipBonusMF"), skill="Minmatar Frigate")
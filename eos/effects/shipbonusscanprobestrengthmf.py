@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Probe
+from eos.effectHandlerHelpers import ChargeGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == "Scanner Probe",
+    fit.modules.filteredChargeBoost(ChargeGroup("Scanner Probe"),
                                     "baseSensorStrength", ship.getModifiedItemAttr("shipBonusMF2"),
                                     skill="Minmatar Frigate")
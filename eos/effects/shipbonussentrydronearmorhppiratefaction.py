@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ships named like: Rattlesnake (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Sentry Drone Interfacing"),
+    fit.drones.filteredItemBoost(ItemSkill("Sentry Drone Interfacing"),
                                  "armorHP", ship.getModifiedItemAttr("shipBonusPirateFaction"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Bustard
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "shieldBonus", ship.getModifiedItemAttr("shipBonusCI2"), skill="Caldari Industrial")
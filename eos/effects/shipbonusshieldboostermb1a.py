@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Maelstrom
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "shieldBonus", ship.getModifiedItemAttr("shipBonusMB"), skill="Minmatar Battleship")
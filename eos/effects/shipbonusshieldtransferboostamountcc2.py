@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Osprey
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"),
                                   "shieldBonus", ship.getModifiedItemAttr("shipBonusCC2"), skill="Caldari Cruiser")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of ship: Bantam (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"),
                                   "shieldBonus", ship.getModifiedItemAttr("shipBonusCF2"), skill="Caldari Frigate")
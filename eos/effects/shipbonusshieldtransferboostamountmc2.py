@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Scythe
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"),
                                   "shieldBonus", ship.getModifiedItemAttr("shipBonusMC2"), skill="Minmatar Cruiser")
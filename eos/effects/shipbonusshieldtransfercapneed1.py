@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Osprey
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"), "capacitorNeed",
                                   src.getModifiedItemAttr("shipBonusCC"), skill="Caldari Cruiser")
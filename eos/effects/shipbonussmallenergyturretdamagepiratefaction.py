@@ -7,9 +7,11 @@
 # Ship: Imp
 # Ship: Succubus
 # Ship: Sunesis
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Energy Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusPirateFaction"))
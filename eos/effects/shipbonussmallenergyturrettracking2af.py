@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Imp
 # Ship: Succubus
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Energy Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("shipBonus2AF"), skill="Amarr Frigate")
@@ -4,9 +4,11 @@
 # Ship: Caedes
 # Ship: Cruor
 # Ship: Freki
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusMF2"), skill="Minmatar Frigate")
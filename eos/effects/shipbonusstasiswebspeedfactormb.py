@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vindicator
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"),
                                   "speedFactor", ship.getModifiedItemAttr("shipBonusMB"), skill="Minmatar Battleship")
@@ -3,16 +3,18 @@
 # Used by:
 # Ship: Aeon
 # Ship: Revenant
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusSupercarrierA1"), skill="Amarr Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusSupercarrierA1"), skill="Amarr Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusSupercarrierA1"), skill="Amarr Carrier")
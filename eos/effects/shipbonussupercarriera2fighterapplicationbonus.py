@@ -2,13 +2,15 @@
 #
 # Used by:
 # Ship: Revenant
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesExplosionVelocity",
                                    src.getModifiedItemAttr("shipBonusSupercarrierA2"), skill="Amarr Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileExplosionVelocity",
                                    src.getModifiedItemAttr("shipBonusSupercarrierA2"), skill="Amarr Carrier")
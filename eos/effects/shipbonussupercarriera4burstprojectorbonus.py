@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Aeon
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Burst Projector Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Burst Projector Operation"),
                                   "durationWeaponDisruptionBurstProjector",
                                   src.getModifiedItemAttr("shipBonusSupercarrierA4"), skill="Amarr Carrier")
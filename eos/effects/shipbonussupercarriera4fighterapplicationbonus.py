@@ -2,13 +2,15 @@
 #
 # Used by:
 # Ship: Revenant
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesExplosionRadius",
                                    src.getModifiedItemAttr("shipBonusSupercarrierA4"), skill="Amarr Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileExplosionRadius",
                                    src.getModifiedItemAttr("shipBonusSupercarrierA4"), skill="Amarr Carrier")
@@ -3,16 +3,18 @@
 # Used by:
 # Ship: Revenant
 # Ship: Wyvern
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusSupercarrierC1"), skill="Caldari Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusSupercarrierC1"), skill="Caldari Carrier")
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileDamageMultiplier",
                                    src.getModifiedItemAttr("shipBonusSupercarrierC1"), skill="Caldari Carrier")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Revenant
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner"), "speedFactor",
+    fit.modules.filteredItemBoost(ItemSkill("Afterburner"), "speedFactor",
                                   src.getModifiedItemAttr("shipBonusSupercarrierC2"), skill="Caldari Carrier")
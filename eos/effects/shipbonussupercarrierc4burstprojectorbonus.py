@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Wyvern
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Burst Projector Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Burst Projector Operation"),
                                   "durationECMJammerBurstProjector", src.getModifiedItemAttr("shipBonusSupercarrierC4"),
                                   skill="Caldari Carrier")
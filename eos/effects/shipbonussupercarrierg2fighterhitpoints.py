@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of ship: Nyx (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "shieldCapacity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "shieldCapacity",
                                    src.getModifiedItemAttr("shipBonusSupercarrierG2"), skill="Gallente Carrier")
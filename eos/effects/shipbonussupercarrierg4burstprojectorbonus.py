@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Nyx
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Burst Projector Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Burst Projector Operation"),
                                   "durationSensorDampeningBurstProjector",
                                   src.getModifiedItemAttr("shipBonusSupercarrierG4"), skill="Gallente Carrier")
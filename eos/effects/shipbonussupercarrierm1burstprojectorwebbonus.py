@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Hel
 # Ship: Vendetta
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Burst Projector Operation"), "speedFactor",
+    fit.modules.filteredItemBoost(ItemSkill("Burst Projector Operation"), "speedFactor",
                                   src.getModifiedItemAttr("shipBonusSupercarrierM1"), skill="Minmatar Carrier")
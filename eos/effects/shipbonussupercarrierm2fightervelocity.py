@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Hel
 # Ship: Vendetta
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "maxVelocity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "maxVelocity",
                                    src.getModifiedItemAttr("shipBonusSupercarrierM2"), skill="Minmatar Carrier")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ships from group: Covert Ops (4 of 6)
+from eos.effectHandlerHelpers import ChargeGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == "Survey Probe",
+    fit.modules.filteredChargeBoost(ChargeGroup("Survey Probe"),
                                     "explosionDelay", ship.getModifiedItemAttr("eliteBonusCoverOps3"),
                                     skill="Covert Ops")
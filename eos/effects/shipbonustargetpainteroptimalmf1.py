@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Hyena
 # Ship: Vigil
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Target Painting"),
+    fit.modules.filteredItemBoost(ItemSkill("Target Painting"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusMF"), skill="Minmatar Frigate")
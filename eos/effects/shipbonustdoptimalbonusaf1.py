@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Crucifier
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Weapon Disruption"),
+    fit.modules.filteredItemBoost(ItemSkill("Weapon Disruption"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusAF"), skill="Amarr Frigate")
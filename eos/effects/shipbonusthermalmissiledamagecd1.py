@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Stork
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"), "thermalDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"), "thermalDamage",
                                     src.getModifiedItemAttr("shipBonusCD1"), skill="Caldari Destroyer")
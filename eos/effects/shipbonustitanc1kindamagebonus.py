@@ -2,13 +2,15 @@
 #
 # Used by:
 # Ship: Leviathan
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Torpedoes"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Torpedoes"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC1"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC1"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC1"), skill="Caldari Titan")
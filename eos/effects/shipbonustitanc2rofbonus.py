@@ -2,13 +2,15 @@
 #
 # Used by:
 # Ship: Leviathan
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher XL Cruise", "speed",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher XL Cruise"), "speed",
                                   src.getModifiedItemAttr("shipBonusTitanC2"), skill="Caldari Titan")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Rapid Torpedo", "speed",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Rapid Torpedo"), "speed",
                                   src.getModifiedItemAttr("shipBonusTitanC2"), skill="Caldari Titan")
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher XL Torpedo", "speed",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher XL Torpedo"), "speed",
                                   src.getModifiedItemAttr("shipBonusTitanC2"), skill="Caldari Titan")
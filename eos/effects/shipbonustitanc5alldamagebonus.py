@@ -2,25 +2,27 @@
 #
 # Used by:
 # Ship: Leviathan
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "emDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "emDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "explosiveDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "explosiveDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "thermalDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "thermalDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"), "explosiveDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"), "explosiveDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"), "thermalDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"), "thermalDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Cruise Missiles"), "emDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Cruise Missiles"), "emDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Torpedoes"), "thermalDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Torpedoes"), "thermalDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Torpedoes"), "emDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Torpedoes"), "emDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("XL Torpedoes"), "explosiveDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("XL Torpedoes"), "explosiveDamage",
                                     src.getModifiedItemAttr("shipBonusTitanC5"), skill="Caldari Titan")
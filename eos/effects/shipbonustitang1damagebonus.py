@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Erebus
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Hybrid Turret"), "damageMultiplier",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Hybrid Turret"), "damageMultiplier",
                                   src.getModifiedItemAttr("shipBonusTitanG1"), skill="Gallente Titan")
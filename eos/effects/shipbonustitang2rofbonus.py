@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of ship: Erebus (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Hybrid Turret"), "speed",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Hybrid Turret"), "speed",
                                   src.getModifiedItemAttr("shipBonusTitanG2"), skill="Gallente Titan")
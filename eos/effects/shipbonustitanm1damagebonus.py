@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Ragnarok
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Projectile Turret"), "damageMultiplier",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Projectile Turret"), "damageMultiplier",
                                   src.getModifiedItemAttr("shipBonusTitanM1"), skill="Minmatar Titan")
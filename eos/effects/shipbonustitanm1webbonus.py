@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vanquisher
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web", "speedFactor",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"), "speedFactor",
                                   src.getModifiedItemAttr("shipBonusTitanM1"), skill="Minmatar Titan")
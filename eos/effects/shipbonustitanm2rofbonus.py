@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Ragnarok
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Projectile Turret"), "speed",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Projectile Turret"), "speed",
                                   src.getModifiedItemAttr("shipBonusTitanM2"), skill="Minmatar Titan")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ships from group: Titan (5 of 5)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Hull Upgrades"), "armorHPBonusAdd",
+    fit.modules.filteredItemBoost(ItemSkill("Hull Upgrades"), "armorHPBonusAdd",
                                   src.getModifiedItemAttr("shipBonusRole2"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Upgrades"), "capacityBonus",
+    fit.modules.filteredItemBoost(ItemSkill("Shield Upgrades"), "capacityBonus",
                                   src.getModifiedItemAttr("shipBonusRole2"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vanquisher
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Hybrid Turret"), "damageMultiplier",
+    fit.modules.filteredItemBoost(ItemSkill("Capital Hybrid Turret"), "damageMultiplier",
                                   src.getModifiedItemAttr("shipBonusRole3"))
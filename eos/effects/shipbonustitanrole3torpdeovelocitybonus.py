@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Leviathan
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"), "maxVelocity",
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"), "maxVelocity",
                                     src.getModifiedItemAttr("shipBonusRole3"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Hound
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"),
                                     "maxVelocity", ship.getModifiedItemAttr("shipBonusMF2"), skill="Minmatar Frigate")
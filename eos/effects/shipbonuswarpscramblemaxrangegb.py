@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Barghest
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Warp Scrambler",
+    fit.modules.filteredItemBoost(ItemGroup("Warp Scrambler"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusGB"), skill="Gallente Battleship")
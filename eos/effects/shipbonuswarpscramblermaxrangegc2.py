@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Adrestia
 # Ship: Orthrus
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Warp Scrambler",
+    fit.modules.filteredItemBoost(ItemGroup("Warp Scrambler"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusGC2"), skill="Gallente Cruiser")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Garmur
 # Ship: Utu
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Warp Scrambler",
+    fit.modules.filteredItemBoost(ItemGroup("Warp Scrambler"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusGF2"), skill="Gallente Frigate")
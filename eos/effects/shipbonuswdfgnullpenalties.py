@@ -2,14 +2,16 @@
 #
 # Used by:
 # Ship: Fiend
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Propulsion Jamming"),
+    fit.modules.filteredItemBoost(ItemSkill("Propulsion Jamming"),
                                   "speedFactorBonus", ship.getModifiedItemAttr("shipBonusAT"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Propulsion Jamming"),
+    fit.modules.filteredItemBoost(ItemSkill("Propulsion Jamming"),
                                   "speedBoostFactorBonus", ship.getModifiedItemAttr("shipBonusAT"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Propulsion Jamming"),
+    fit.modules.filteredItemBoost(ItemSkill("Propulsion Jamming"),
                                   "massBonusPercentage", ship.getModifiedItemAttr("shipBonusAT"))
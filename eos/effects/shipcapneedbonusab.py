@@ -3,9 +3,11 @@
 # Used by:
 # Variations of ship: Armageddon (3 of 5)
 # Ship: Apocalypse Imperial Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Energy Turret"),
                                   "capacitorNeed", ship.getModifiedItemAttr("shipBonusAB"), skill="Amarr Battleship")
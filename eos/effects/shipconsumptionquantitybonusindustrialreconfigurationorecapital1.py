@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Rorqual
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Industrial Reconfiguration"),
+    fit.modules.filteredItemBoost(ItemSkill("Industrial Reconfiguration"),
                                   "consumptionQuantity", ship.getModifiedItemAttr("shipBonusORECapital1"),
                                   skill="Capital Industrial Ships")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Raven
 # Ship: Raven State Issue
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Cruise",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Cruise"),
                                   "speed", ship.getModifiedItemAttr("shipBonus2CB"), skill="Caldari Battleship")
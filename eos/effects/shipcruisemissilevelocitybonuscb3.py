@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of ship: Raven (3 of 4)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Cruise Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Cruise Missiles"),
                                     "maxVelocity", ship.getModifiedItemAttr("shipBonusCB3"), skill="Caldari Battleship")
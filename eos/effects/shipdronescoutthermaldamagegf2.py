@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Helios
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drone Avionics"),
+    fit.drones.filteredItemBoost(ItemSkill("Drone Avionics"),
                                  "thermalDamage", ship.getModifiedItemAttr("shipBonusGF2"), skill="Gallente Frigate")
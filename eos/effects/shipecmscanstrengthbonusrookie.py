@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Ibis
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
     for type in ("Gravimetric", "Ladar", "Radar", "Magnetometric"):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+        fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                       "scan{0}StrengthBonus".format(type),
                                       ship.getModifiedItemAttr("rookieECMStrengthBonus"))
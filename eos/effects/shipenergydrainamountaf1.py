@@ -4,9 +4,11 @@
 # Ship: Caedes
 # Ship: Cruor
 # Ship: Sentinel
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"),
                                   "powerTransferAmount", ship.getModifiedItemAttr("shipBonusAF"), skill="Amarr Frigate")
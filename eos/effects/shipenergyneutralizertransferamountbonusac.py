@@ -3,10 +3,12 @@
 # Used by:
 # Ship: Ashimmu
 # Ship: Vangel
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Neutralizer",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Neutralizer"),
                                   "energyNeutralizerAmount", ship.getModifiedItemAttr("shipBonusAC"),
                                   skill="Amarr Cruiser")
@@ -4,10 +4,12 @@
 # Ship: Caedes
 # Ship: Cruor
 # Ship: Sentinel
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Neutralizer",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Neutralizer"),
                                   "energyNeutralizerAmount", ship.getModifiedItemAttr("shipBonusAF"),
                                   skill="Amarr Frigate")
@@ -8,9 +8,11 @@
 # Ship: Retribution
 # Ship: Silver Magnate
 # Ship: Tormentor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Energy Turret"),
                                   "capacitorNeed", ship.getModifiedItemAttr("shipBonus2AF"), skill="Amarr Frigate")
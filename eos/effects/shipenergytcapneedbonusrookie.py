@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Hematos
 # Ship: Impairor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Energy Turret"),
                                   "capacitorNeed", ship.getModifiedItemAttr("rookieSETCapBonus"))
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Ship: Harbinger Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("shipBonusABC1"),
                                   skill="Amarr Battlecruiser")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Basilisk
 # Ship: Etana
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Remote Capacitor Transmitter",
+    fit.modules.filteredItemBoost(ItemGroup("Remote Capacitor Transmitter"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusCC2"), skill="Caldari Cruiser")
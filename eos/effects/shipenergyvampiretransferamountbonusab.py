@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Bhaalgorn
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"),
                                   "powerTransferAmount", ship.getModifiedItemAttr("shipBonusAB"),
                                   skill="Amarr Battleship")
@@ -4,9 +4,11 @@
 # Ship: Crucifier Navy Issue
 # Ship: Crusader
 # Ship: Imperial Navy Slicer
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Energy Turret"), "damageMultiplier",
+    fit.modules.filteredItemBoost(ItemSkill("Small Energy Turret"), "damageMultiplier",
                                   src.getModifiedItemAttr("shipBonusAF"), skill="Amarr Frigate")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of ship: Armageddon (3 of 5)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Energy Turret"),
                                   "speed", ship.getModifiedItemAttr("shipBonusAB2"), skill="Amarr Battleship")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Atron
 # Ship: Daredevil
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "falloff", ship.getModifiedItemAttr("shipBonusGF2"), skill="Gallente Frigate")
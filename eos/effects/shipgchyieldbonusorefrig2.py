@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Prospect
 # Ship: Venture
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Gas Cloud Harvester",
+    fit.modules.filteredItemBoost(ItemGroup("Gas Cloud Harvester"),
                                   "duration", module.getModifiedItemAttr("shipBonusOREfrig2"), skill="Mining Frigate")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Gnosis
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Assault Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Assault Missiles"),
                                     "thermalDamage", ship.getModifiedItemAttr("shipBonusPirateFaction"))
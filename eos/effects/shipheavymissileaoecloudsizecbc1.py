@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Drake Navy Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Missiles"),
                                     "aoeCloudSize", ship.getModifiedItemAttr("shipBonusCBC1"),
                                     skill="Caldari Battlecruiser")
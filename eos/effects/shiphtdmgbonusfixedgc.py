@@ -8,9 +8,11 @@
 # Ship: Guardian-Vexor
 # Ship: Thorax
 # Ship: Vexor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusGC"), skill="Gallente Cruiser")
@@ -6,10 +6,12 @@
 # Ship: Kronos
 # Ship: Megathron Federate Issue
 # Ship: Sin
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Hybrid Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusGB"),
                                   skill="Gallente Battleship")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vindicator
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Hybrid Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("shipBonusGB"), skill="Gallente Battleship")
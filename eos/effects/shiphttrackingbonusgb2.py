@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ships named like: Megathron (3 of 3)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Hybrid Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("shipBonusGB2"),
                                   skill="Gallente Battleship")
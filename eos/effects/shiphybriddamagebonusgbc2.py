@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Talos
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Hybrid Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusGBC2"),
                                   skill="Gallente Battlecruiser")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Harpy
 # Ship: Raptor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusCF2"), skill="Caldari Frigate")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Brutix Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("shipBonusGBC2"),
                                   skill="Gallente Battlecruiser")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Exequror Navy Issue
 # Ship: Phobos
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "speed", ship.getModifiedItemAttr("shipBonusGC2"), skill="Gallente Cruiser")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Megathron
 # Ship: Megathron Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Hybrid Turret"),
                                   "speed", ship.getModifiedItemAttr("shipBonusGB"), skill="Gallente Battleship")
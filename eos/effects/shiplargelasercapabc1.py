@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Oracle
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Energy Turret"),
                                   "capacitorNeed", ship.getModifiedItemAttr("shipBonusABC1"),
                                   skill="Amarr Battlecruiser")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Oracle
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Energy Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusABC2"),
                                   skill="Amarr Battlecruiser")
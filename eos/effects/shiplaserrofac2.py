@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Omen
 # Ship: Zealot
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "speed", ship.getModifiedItemAttr("shipBonusAC2"), skill="Amarr Cruiser")
@@ -4,9 +4,11 @@
 # Ship: Augoror Navy Issue
 # Ship: Maller
 # Ship: Omen Navy Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusAC"), skill="Amarr Cruiser")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Variations of ship: Venture (3 of 3)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"),
+    fit.modules.filteredItemBoost(ItemSkill("Mining"),
                                   "miningAmount", module.getModifiedItemAttr("shipBonusOREfrig1"),
                                   skill="Mining Frigate")
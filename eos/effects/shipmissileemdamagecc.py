@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Orthrus
 # Ship: Osprey Navy Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "emDamage", ship.getModifiedItemAttr("shipBonusCC"), skill="Caldari Cruiser")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Garmur
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "explosiveDamage", ship.getModifiedItemAttr("shipBonusCF2"),
                                     skill="Caldari Frigate")
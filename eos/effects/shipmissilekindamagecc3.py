@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Osprey Navy Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusCC3"), skill="Caldari Cruiser")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Heretic
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Missile Launcher Operation"),
                                   "speed", ship.getModifiedItemAttr("shipBonusAD1"), skill="Amarr Destroyer")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Jackdaw
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Missile Launcher Operation"),
                                   "reloadTime", ship.getModifiedItemAttr("shipBonusTacticalDestroyerCaldari2"),
                                   skill="Caldari Tactical Destroyer")
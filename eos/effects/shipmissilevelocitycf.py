@@ -4,9 +4,11 @@
 # Ship: Caldari Navy Hookbill
 # Ship: Crow
 # Ship: Kestrel
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "maxVelocity", ship.getModifiedItemAttr("shipBonusCF"), skill="Caldari Frigate")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Corax
 # Ship: Talwar
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Light Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Light Missiles"),
                                     "maxVelocity", ship.getModifiedItemAttr("shipBonusPirateFaction"))
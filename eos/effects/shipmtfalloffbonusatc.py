@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Mimir
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "falloff", ship.getModifiedItemAttr("shipBonusATC2"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Freki
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Projectile Turret"),
                                   "falloff", ship.getModifiedItemAttr("shipBonusATF2"))
@@ -4,10 +4,12 @@
 # Variations of ship: Rupture (3 of 3)
 # Ship: Cynabal
 # Ship: Moracha
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusMC2"),
                                   skill="Minmatar Cruiser")
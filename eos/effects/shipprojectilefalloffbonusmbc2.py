@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Tornado
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Projectile Turret"),
                                   "falloff", ship.getModifiedItemAttr("shipBonusMBC2"), skill="Minmatar Battlecruiser")
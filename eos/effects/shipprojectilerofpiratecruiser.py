@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Cynabal
 # Ship: Moracha
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "speed", ship.getModifiedItemAttr("shipBonusPirateFaction"))
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Chremoas
 # Ship: Dramiel
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Projectile Turret"),
                                   "trackingSpeed", ship.getModifiedItemAttr("shipBonusGF"), skill="Gallente Frigate")
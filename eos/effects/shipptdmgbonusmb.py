@@ -4,10 +4,12 @@
 # Variations of ship: Tempest (3 of 4)
 # Ship: Machariel
 # Ship: Panther
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Projectile Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusMB"),
                                   skill="Minmatar Battleship")
@@ -5,9 +5,11 @@
 # Ship: Maelstrom
 # Ship: Panther
 # Ship: Typhoon Fleet Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Projectile Turret"),
                                   "speed", ship.getModifiedItemAttr("shipBonusMB2"), skill="Minmatar Battleship")
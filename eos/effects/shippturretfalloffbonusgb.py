@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Machariel
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Large Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Large Projectile Turret"),
                                   "falloff", ship.getModifiedItemAttr("shipBonusGB"), skill="Gallente Battleship")
@@ -5,9 +5,11 @@
 # Variations of ship: Stabber (3 of 3)
 # Ship: Huginn
 # Ship: Scythe Fleet Issue
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "speed", ship.getModifiedItemAttr("shipBonusMC"), skill="Minmatar Cruiser")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Guardian
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"), "maxRange",
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"), "maxRange",
                                   src.getModifiedItemAttr("shipBonusAC2"), skill="Amarr Cruiser")
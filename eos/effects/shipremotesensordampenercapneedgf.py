@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Keres
 # Ship: Maulus
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
+    fit.modules.filteredItemBoost(ItemGroup("Sensor Dampener"),
                                   "capacitorNeed", ship.getModifiedItemAttr("shipBonusGF"), skill="Gallente Frigate")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Anathema
 # Ship: Vengeance
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"),
                                     "emDamage", ship.getModifiedItemAttr("shipBonusAF"), skill="Amarr Frigate")
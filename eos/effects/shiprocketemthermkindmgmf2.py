@@ -2,13 +2,15 @@
 #
 # Used by:
 # Ship: Vigil Fleet Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"), "emDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"), "emDamage",
                                     src.getModifiedItemAttr("shipBonusMF2"), skill="Minmatar Frigate")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"), "thermalDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"), "thermalDamage",
                                     src.getModifiedItemAttr("shipBonusMF2"), skill="Minmatar Frigate")
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"), "kineticDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"), "kineticDamage",
                                     src.getModifiedItemAttr("shipBonusMF2"), skill="Minmatar Frigate")
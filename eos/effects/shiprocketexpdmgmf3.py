@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Vigil Fleet Issue
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"), "explosiveDamage",
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"), "explosiveDamage",
                                     src.getModifiedItemAttr("shipBonus3MF"), skill="Minmatar Frigate")
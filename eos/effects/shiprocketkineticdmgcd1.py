@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Corax
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"),
                                     "kineticDamage", ship.getModifiedItemAttr("shipBonusCD1"),
                                     skill="Caldari Destroyer")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Taipan
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Rockets"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Rockets"),
                                     "maxVelocity", ship.getModifiedItemAttr("rookieRocketVelocity"))
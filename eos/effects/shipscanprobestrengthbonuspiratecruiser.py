@@ -5,9 +5,11 @@
 # Ship: Astero
 # Ship: Gnosis
 # Ship: Sunesis
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Astrometrics"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Astrometrics"),
                                     "baseSensorStrength", container.getModifiedItemAttr("shipBonusPirateFaction2"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Nestor
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Astrometrics"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Astrometrics"),
                                     "baseSensorStrength", ship.getModifiedItemAttr("shipBonusPirateFaction"))
@@ -5,9 +5,11 @@
 # Ship: Gold Magnate
 # Ship: Silver Magnate
 # Ship: Tormentor
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Energy Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusAF"), skill="Amarr Frigate")
@@ -3,10 +3,12 @@
 # Used by:
 # Variations of ship: Cyclone (2 of 2)
 # Ship: Sleipnir
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "shieldBonus", ship.getModifiedItemAttr("shipBonusMBC1"),
                                   skill="Minmatar Battlecruiser")
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Scimitar
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "maxRange",
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"), "maxRange",
                                   src.getModifiedItemAttr("shipBonusMC2"), skill="Minmatar Cruiser")
@@ -6,9 +6,11 @@
 # Ship: Federation Navy Comet
 # Ship: Helios
 # Ship: Taranis
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "damageMultiplier", ship.getModifiedItemAttr("shipBonusGF"), skill="Gallente Frigate")
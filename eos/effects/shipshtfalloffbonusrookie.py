@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Violator
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "falloff", ship.getModifiedItemAttr("rookieSHTFalloff"))
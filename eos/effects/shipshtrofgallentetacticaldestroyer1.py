@@ -2,10 +2,12 @@
 #
 # Used by:
 # Ship: Hecate
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Hybrid Turret"),
                                   "speed", ship.getModifiedItemAttr("shipBonusTacticalDestroyerGallente1"),
                                   skill="Gallente Tactical Destroyer")
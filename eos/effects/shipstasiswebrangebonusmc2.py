@@ -2,9 +2,11 @@
 #
 # Used by:
 # Ship: Ashimmu
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"),
                                   "maxRange", ship.getModifiedItemAttr("shipBonusMC2"), skill="Minmatar Cruiser")
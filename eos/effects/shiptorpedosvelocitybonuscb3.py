@@ -2,9 +2,11 @@
 #
 # Used by:
 # Variations of ship: Raven (3 of 4)
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Torpedoes"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Torpedoes"),
                                     "maxVelocity", ship.getModifiedItemAttr("shipBonusCB3"), skill="Caldari Battleship")
@@ -3,9 +3,11 @@
 # Used by:
 # Ship: Hematos
 # Ship: Violator
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"),
                                   "speedFactor", ship.getModifiedItemAttr("rookieWebAmount"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Advanced Weapon Upgrades
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Bomb Deployment"),
+    fit.modules.filteredItemBoost(ItemSkill("Bomb Deployment"),
                                   "power", skill.getModifiedItemAttr("powerNeedBonus") * skill.level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Bomb Deployment
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Bomb",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Bomb"),
                                   "moduleReactivationDelay", skill.getModifiedItemAttr("rofBonus") * skill.level)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Capital Artillery Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Artillery Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Artillery Specialization"),
                                   "damageMultiplier", src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
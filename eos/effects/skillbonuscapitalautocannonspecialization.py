@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Capital Autocannon Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Autocannon Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Autocannon Specialization"),
                                   "damageMultiplier", src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
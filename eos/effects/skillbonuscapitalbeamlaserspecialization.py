@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Capital Beam Laser Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Beam Laser Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Beam Laser Specialization"),
                                   "damageMultiplier", src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
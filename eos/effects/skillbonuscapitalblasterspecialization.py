@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Capital Blaster Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Blaster Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Blaster Specialization"),
                                   "damageMultiplier", src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
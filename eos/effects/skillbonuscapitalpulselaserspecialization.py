@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Capital Pulse Laser Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Pulse Laser Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Pulse Laser Specialization"),
                                   "damageMultiplier", src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
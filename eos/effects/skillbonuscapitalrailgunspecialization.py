@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Capital Railgun Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Railgun Specialization"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Railgun Specialization"),
                                   "damageMultiplier", src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
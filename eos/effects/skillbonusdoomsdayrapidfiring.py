@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Doomsday Rapid Firing
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Doomsday Operation"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Doomsday Operation"), "duration",
                                   src.getModifiedItemAttr("rofBonus") * lvl)
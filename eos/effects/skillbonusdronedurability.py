@@ -2,16 +2,18 @@
 #
 # Used by:
 # Skill: Drone Durability
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "hp",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "hp",
                                  src.getModifiedItemAttr("hullHpBonus") * lvl)
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "armorHP",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "armorHP",
                                  src.getModifiedItemAttr("armorHpBonus") * lvl)
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "shieldCapacity",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "shieldCapacity",
                                  src.getModifiedItemAttr("shieldCapacityBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "shieldCapacity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "shieldCapacity",
                                    src.getModifiedItemAttr("shieldCapacityBonus") * lvl)
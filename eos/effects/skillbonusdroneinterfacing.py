@@ -2,21 +2,23 @@
 #
 # Used by:
 # Skill: Drone Interfacing
+from eos.effectHandlerHelpers import ItemGroup, ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "damageMultiplier",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "damageMultiplier",
                                  src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileDamageMultiplier",
                                    src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretDamageMultiplier",
                                    src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityMissilesDamageMultiplier",
                                    src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
-    fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == "Mining Drone", "miningDroneAmountPercent",
+    fit.drones.filteredItemBoost(ItemGroup("Mining Drone"), "miningDroneAmountPercent",
                                  src.getModifiedItemAttr("miningAmountBonus") * lvl)
@@ -2,12 +2,14 @@
 #
 # Used by:
 # Skill: Drone Navigation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "maxVelocity",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "maxVelocity",
                                  src.getModifiedItemAttr("maxVelocityBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "maxVelocity",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "maxVelocity",
                                    src.getModifiedItemAttr("maxVelocityBonus") * lvl)
@@ -2,18 +2,20 @@
 #
 # Used by:
 # Skill: Drone Sharpshooting
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill("Drones"), "maxRange",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "maxRange",
                                  src.getModifiedItemAttr("rangeSkillBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"), "fighterAbilityMissilesRange",
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"), "fighterAbilityMissilesRange",
                                    src.getModifiedItemAttr("rangeSkillBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackTurretRangeOptimal",
                                    src.getModifiedItemAttr("rangeSkillBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Fighters"),
                                    "fighterAbilityAttackMissileRangeOptimal",
                                    src.getModifiedItemAttr("rangeSkillBonus") * lvl)
@@ -2,17 +2,19 @@
 #
 # Used by:
 # Skill: Heavy Fighters
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Heavy Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Heavy Fighters"),
                                    "fighterAbilityMissilesDamageMultiplier",
                                    src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Heavy Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Heavy Fighters"),
                                    "fighterAbilityAttackMissileDamageMultiplier",
                                    src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Heavy Fighters"),
+    fit.fighters.filteredItemBoost(ItemSkill("Heavy Fighters"),
                                    "fighterAbilityAttackTurretDamageMultiplier",
                                    src.getModifiedItemAttr("damageMultiplierBonus") * lvl)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Light Fighters
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Light Fighters"), "maxVelocity",
+    fit.fighters.filteredItemBoost(ItemSkill("Light Fighters"), "maxVelocity",
                                    src.getModifiedItemAttr("maxVelocityBonus") * lvl)
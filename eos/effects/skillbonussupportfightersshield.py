@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Support Fighters
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill("Support Fighters"), "shieldCapacity",
+    fit.fighters.filteredItemBoost(ItemSkill("Support Fighters"), "shieldCapacity",
                                    src.getModifiedItemAttr("shieldBonus") * lvl)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: XL Cruise Missile Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("XL Cruise Missile Specialization"), "speed",
+    fit.modules.filteredItemBoost(ItemSkill("XL Cruise Missile Specialization"), "speed",
                                   src.getModifiedItemAttr("rofBonus") * lvl)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: XL Torpedo Specialization
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("XL Torpedo Specialization"), "speed",
+    fit.modules.filteredItemBoost(ItemSkill("XL Torpedo Specialization"), "speed",
                                   src.getModifiedItemAttr("rofBonus") * lvl)
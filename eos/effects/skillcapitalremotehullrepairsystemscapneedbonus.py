@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Capital Remote Hull Repair Systems
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Capital Remote Hull Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Capital Remote Hull Repair Systems"),
                                   "capacitorNeed", skill.getModifiedItemAttr("capNeedBonus") * skill.level)
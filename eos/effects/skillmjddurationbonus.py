@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Micro Jump Drive Operation
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Micro Jump Drive Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Micro Jump Drive Operation"),
                                   "duration", skill.getModifiedItemAttr("durationBonus") * skill.level)
@@ -2,12 +2,14 @@
 #
 # Used by:
 # Skill: Resistance Phasing
+from eos.effectHandlerHelpers import ItemGroup, ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Armor Resistance Shift Hardener", "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemGroup("Armor Resistance Shift Hardener"), "capacitorNeed",
                                   src.getModifiedItemAttr("capNeedBonus") * lvl)
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Resistance Phasing"), "capacitorNeed",
+    fit.modules.filteredItemBoost(ItemSkill("Resistance Phasing"), "capacitorNeed",
                                   src.getModifiedItemAttr("capNeedBonus") * lvl)
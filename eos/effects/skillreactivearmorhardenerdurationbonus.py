@@ -2,12 +2,14 @@
 #
 # Used by:
 # Skill: Resistance Phasing
+from eos.effectHandlerHelpers import ItemGroup, ItemSkill
+
 type = "passive"
 
 
 def handler(fit, src, context):
     lvl = src.level
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Armor Resistance Shift Hardener", "duration",
+    fit.modules.filteredItemBoost(ItemGroup("Armor Resistance Shift Hardener"), "duration",
                                   src.getModifiedItemAttr("durationBonus") * lvl)
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Resistance Phasing"), "duration",
+    fit.modules.filteredItemBoost(ItemSkill("Resistance Phasing"), "duration",
                                   src.getModifiedItemAttr("durationBonus") * lvl)
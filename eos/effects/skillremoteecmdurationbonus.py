@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Burst Projector Operation
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Burst Projectors",
+    fit.modules.filteredItemBoost(ItemGroup("Burst Projectors"),
                                   "duration", skill.getModifiedItemAttr("projECMDurationBonus") * skill.level)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Tactical Weapon Reconfiguration
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
     amount = -skill.getModifiedItemAttr("consumptionQuantityBonus")
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+    fit.modules.filteredItemIncrease(ItemSkill(skill),
                                      "consumptionQuantity", amount * skill.level)
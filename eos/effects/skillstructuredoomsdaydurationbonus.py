@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Structure Doomsday Operation
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive", "structure"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Structure Doomsday Weapon",
+    fit.modules.filteredItemBoost(ItemGroup("Structure Doomsday Weapon"),
                                   "duration", src.getModifiedItemAttr("durationBonus"),
                                   skill="Structure Doomsday Operation")
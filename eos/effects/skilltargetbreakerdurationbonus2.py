@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Target Breaker Amplification
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Breaker",
+    fit.modules.filteredItemBoost(ItemGroup("Target Breaker"),
                                   "duration", skill.getModifiedItemAttr("durationBonus") * skill.level)
@@ -4,9 +4,11 @@
 # Ship: Coercer
 # Ship: Gold Magnate
 # Ship: Silver Magnate
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Small Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Small Energy Turret"),
                                   "maxRange", ship.getModifiedItemAttr("maxRangeBonus"))
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Defender Missiles
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Defender Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Defender Missiles"),
                                     "maxVelocity", skill.getModifiedItemAttr("missileVelocityBonus") * skill.level)
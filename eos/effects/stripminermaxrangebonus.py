@@ -2,9 +2,11 @@
 #
 # Used by:
 # Implants named like: grade Harvest (10 of 12)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Strip Miner",
+    fit.modules.filteredItemBoost(ItemGroup("Strip Miner"),
                                   "maxRange", implant.getModifiedItemAttr("maxRangeBonus"))
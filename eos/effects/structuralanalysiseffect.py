@@ -5,11 +5,13 @@
 # Modules named like: Auxiliary Nano Pump (8 of 8)
 # Modules named like: QA Multiship Module Players (4 of 4)
 # Implant: Imperial Navy Modified 'Noble' Implant
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     penalized = "implant" not in context
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "armorDamageAmount", container.getModifiedItemAttr("repairBonus"),
                                   stackingPenalties=penalized)
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Subsystem: Legion Defensive - Adaptive Augmenter
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Remote Armor Repair Systems"),
                                   "armorDamageAmount", module.getModifiedItemAttr("subsystemBonusAmarrDefensive2"),
                                   skill="Amarr Defensive Systems")
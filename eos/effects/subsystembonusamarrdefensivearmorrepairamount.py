@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Legion Defensive - Nanobot Injector
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Repair Systems"),
                                   "armorDamageAmount", module.getModifiedItemAttr("subsystemBonusAmarrDefensive"),
                                   skill="Amarr Defensive Systems")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Subsystem: Legion Electronics - Energy Parasitic Complex
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Neutralizer",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Neutralizer"),
                                   "energyNeutralizerAmount",
                                   module.getModifiedItemAttr("subsystemBonusAmarrElectronic"),
                                   skill="Amarr Electronic Systems")
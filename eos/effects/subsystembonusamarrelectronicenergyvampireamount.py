@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Legion Electronics - Energy Parasitic Complex
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Energy Nosferatu",
+    fit.modules.filteredItemBoost(ItemGroup("Energy Nosferatu"),
                                   "powerTransferAmount", module.getModifiedItemAttr("subsystemBonusAmarrElectronic"),
                                   skill="Amarr Electronic Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Legion Electronics - Emergent Locus Analyzer
+from eos.effectHandlerHelpers import ChargeGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == "Scanner Probe",
+    fit.modules.filteredChargeBoost(ChargeGroup("Scanner Probe"),
                                     "baseSensorStrength", module.getModifiedItemAttr("subsystemBonusAmarrElectronic"),
                                     skill="Amarr Electronic Systems")
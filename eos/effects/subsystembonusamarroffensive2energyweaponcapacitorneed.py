@@ -3,10 +3,12 @@
 # Used by:
 # Subsystem: Legion Offensive - Drone Synthesis Projector
 # Subsystem: Legion Offensive - Liquid Crystal Magnifiers
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "capacitorNeed", module.getModifiedItemAttr("subsystemBonusAmarrOffensive2"),
                                   skill="Amarr Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Legion Offensive - Assault Optimization
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Assault Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Assault Missiles"),
                                     "emDamage", module.getModifiedItemAttr("subsystemBonusAmarrOffensive2"),
                                     skill="Amarr Offensive Systems")
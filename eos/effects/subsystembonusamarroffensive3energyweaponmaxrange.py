@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Legion Offensive - Liquid Crystal Magnifiers
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Energy Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Energy Turret"),
                                   "maxRange", module.getModifiedItemAttr("subsystemBonusAmarrOffensive3"),
                                   skill="Amarr Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Legion Offensive - Assault Optimization
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Rapid Light",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Rapid Light"),
                                   "speed", module.getModifiedItemAttr("subsystemBonusAmarrOffensive"),
                                   skill="Amarr Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Legion Propulsion - Fuel Catalyst
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner"),
+    fit.modules.filteredItemBoost(ItemSkill("Afterburner"),
                                   "speedFactor", module.getModifiedItemAttr("subsystemBonusAmarrPropulsion"),
                                   skill="Amarr Propulsion Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Legion Propulsion - Wake Limiter
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("High Speed Maneuvering"),
+    fit.modules.filteredItemBoost(ItemSkill("High Speed Maneuvering"),
                                   "signatureRadiusBonus", module.getModifiedItemAttr("subsystemBonusAmarrPropulsion"),
                                   skill="Amarr Propulsion Systems")
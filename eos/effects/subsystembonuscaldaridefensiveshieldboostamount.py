@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Tengu Defensive - Amplification Node
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Operation"),
                                   "shieldBonus", module.getModifiedItemAttr("subsystemBonusCaldariDefensive"),
                                   skill="Caldari Defensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Tengu Electronics - Obfuscation Manifold
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "maxRange", module.getModifiedItemAttr("subsystemBonusCaldariElectronic"),
                                   skill="Caldari Electronic Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Tengu Offensive - Magnetic Infusion Basin
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "damageMultiplier", module.getModifiedItemAttr("subsystemBonusCaldariOffensive2"),
                                   skill="Caldari Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Tengu Offensive - Accelerated Ejection Bay
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Missile Launcher Operation"),
                                     "kineticDamage", module.getModifiedItemAttr("subsystemBonusCaldariOffensive2"),
                                     skill="Caldari Offensive Systems")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Subsystem: Tengu Offensive - Rifling Launcher Pattern
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+    fit.modules.filteredItemBoost(ItemGroup("ECM"),
                                   "scanRadarStrengthBonus",
                                   module.getModifiedItemAttr("subsystemBonusCaldariOffensive3"),
                                   skill="Caldari Offensive Systems")
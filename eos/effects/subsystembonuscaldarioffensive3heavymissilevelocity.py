@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Tengu Offensive - Accelerated Ejection Bay
+from eos.effectHandlerHelpers import ChargeSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill("Heavy Missiles"),
+    fit.modules.filteredChargeBoost(ChargeSkill("Heavy Missiles"),
                                     "maxVelocity", module.getModifiedItemAttr("subsystemBonusCaldariOffensive3"),
                                     skill="Caldari Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Variations of subsystem: Tengu Offensive - Accelerated Ejection Bay (3 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Heavy",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Heavy"),
                                   "speed", module.getModifiedItemAttr("subsystemBonusCaldariOffensive"),
                                   skill="Caldari Offensive Systems")
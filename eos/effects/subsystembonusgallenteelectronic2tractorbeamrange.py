@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Proteus Electronics - Emergent Locus Analyzer
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Tractor Beam",
+    fit.modules.filteredItemBoost(ItemGroup("Tractor Beam"),
                                   "maxRange", module.getModifiedItemAttr("subsystemBonusGallenteElectronic2"),
                                   skill="Gallente Electronic Systems")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Subsystem: Proteus Electronics - Emergent Locus Analyzer
+from eos.effectHandlerHelpers import ChargeGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == "Scanner Probe",
+    fit.modules.filteredChargeBoost(ChargeGroup("Scanner Probe"),
                                     "baseSensorStrength",
                                     module.getModifiedItemAttr("subsystemBonusGallenteElectronic"),
                                     skill="Gallente Electronic Systems")
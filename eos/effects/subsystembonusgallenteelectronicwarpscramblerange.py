@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Proteus Electronics - Friction Extension Processor
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Warp Scrambler",
+    fit.modules.filteredItemBoost(ItemGroup("Warp Scrambler"),
                                   "maxRange", module.getModifiedItemAttr("subsystemBonusGallenteElectronic"),
                                   skill="Gallente Electronic Systems")
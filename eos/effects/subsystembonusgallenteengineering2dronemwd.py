@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Proteus Engineering - Augmented Capacitor Reservoir
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"), "maxVelocity",
+    fit.drones.filteredItemBoost(ItemSkill("Drones"), "maxVelocity",
                                  module.getModifiedItemAttr("subsystemBonusGallenteEngineering2"),
                                  skill="Gallente Engineering Systems")
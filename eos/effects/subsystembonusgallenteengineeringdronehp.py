@@ -2,11 +2,13 @@
 #
 # Used by:
 # Subsystem: Proteus Engineering - Augmented Capacitor Reservoir
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
     for layer in ("shieldCapacity", "armorHP", "hp"):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"), layer,
+        fit.drones.filteredItemBoost(ItemSkill("Drones"), layer,
                                      module.getModifiedItemAttr("subsystemBonusGallenteEngineering"),
                                      skill="Gallente Engineering Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Variations of subsystem: Proteus Offensive - Dissonic Encoding Platform (3 of 4)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "damageMultiplier", module.getModifiedItemAttr("subsystemBonusGallenteOffensive2"),
                                   skill="Gallente Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Proteus Offensive - Drone Synthesis Projector
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemBoost(ItemSkill("Drones"),
                                  "damageMultiplier", module.getModifiedItemAttr("subsystemBonusGallenteOffensive3"),
                                  skill="Gallente Offensive Systems")
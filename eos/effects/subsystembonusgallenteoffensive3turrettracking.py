@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Proteus Offensive - Dissonic Encoding Platform
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "trackingSpeed", module.getModifiedItemAttr("subsystemBonusGallenteOffensive3"),
                                   skill="Gallente Offensive Systems")
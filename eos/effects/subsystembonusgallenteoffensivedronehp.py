@@ -2,11 +2,13 @@
 #
 # Used by:
 # Subsystem: Proteus Offensive - Drone Synthesis Projector
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
     for layer in ("shieldCapacity", "armorHP", "hp"):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill("Drones"), layer,
+        fit.drones.filteredItemBoost(ItemSkill("Drones"), layer,
                                      module.getModifiedItemAttr("subsystemBonusGallenteOffensive"),
                                      skill="Gallente Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Proteus Offensive - Covert Reconfiguration
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "damageMultiplier", module.getModifiedItemAttr("subsystemBonusGallenteOffensive"),
                                   skill="Gallente Offensive Systems")
@@ -3,10 +3,12 @@
 # Used by:
 # Subsystem: Proteus Offensive - Dissonic Encoding Platform
 # Subsystem: Proteus Offensive - Hybrid Propulsion Armature
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Hybrid Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Hybrid Turret"),
                                   "falloff", module.getModifiedItemAttr("subsystemBonusGallenteOffensive"),
                                   skill="Gallente Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Proteus Propulsion - Localized Injectors
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Propulsion Module",
+    fit.modules.filteredItemBoost(ItemGroup("Propulsion Module"),
                                   "capacitorNeed", module.getModifiedItemAttr("subsystemBonusGallentePropulsion"),
                                   skill="Gallente Propulsion Systems")
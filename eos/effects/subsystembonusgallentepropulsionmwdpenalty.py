@@ -2,11 +2,13 @@
 #
 # Used by:
 # Subsystem: Proteus Propulsion - Wake Limiter
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("High Speed Maneuvering"),
+    fit.modules.filteredItemBoost(ItemSkill("High Speed Maneuvering"),
                                   "signatureRadiusBonus",
                                   module.getModifiedItemAttr("subsystemBonusGallentePropulsion"),
                                   skill="Gallente Propulsion Systems")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Subsystem: Loki Defensive - Adaptive Shielding
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 runTime = "early"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"),
+    fit.modules.filteredItemBoost(ItemSkill("Shield Emission Systems"),
                                   "shieldBonus", module.getModifiedItemAttr("subsystemBonusMinmatarDefensive2"),
                                   skill="Minmatar Defensive Systems")
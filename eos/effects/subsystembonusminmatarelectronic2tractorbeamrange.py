@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Loki Electronics - Emergent Locus Analyzer
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Tractor Beam",
+    fit.modules.filteredItemBoost(ItemGroup("Tractor Beam"),
                                   "maxRange", module.getModifiedItemAttr("subsystemBonusMinmatarElectronic2"),
                                   skill="Minmatar Electronic Systems")
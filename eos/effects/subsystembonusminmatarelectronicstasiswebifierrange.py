@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Loki Electronics - Immobility Drivers
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Stasis Web",
+    fit.modules.filteredItemBoost(ItemGroup("Stasis Web"),
                                   "maxRange", module.getModifiedItemAttr("subsystemBonusMinmatarElectronic"),
                                   skill="Minmatar Electronic Systems")
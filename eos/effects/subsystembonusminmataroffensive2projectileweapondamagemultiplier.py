@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Loki Offensive - Turret Concurrence Registry
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "damageMultiplier", module.getModifiedItemAttr("subsystemBonusMinmatarOffensive2"),
                                   skill="Minmatar Offensive Systems")
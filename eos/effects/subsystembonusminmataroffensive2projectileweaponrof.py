@@ -3,10 +3,12 @@
 # Used by:
 # Subsystem: Loki Offensive - Hardpoint Efficiency Configuration
 # Subsystem: Loki Offensive - Projectile Scoping Array
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Medium Projectile Turret"),
+    fit.modules.filteredItemBoost(ItemSkill("Medium Projectile Turret"),
                                   "speed", module.getModifiedItemAttr("subsystemBonusMinmatarOffensive2"),
                                   skill="Minmatar Offensive Systems")
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Subsystem: Loki Offensive - Hardpoint Efficiency Configuration
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Missile Launcher Heavy Assault",
+    fit.modules.filteredItemBoost(ItemGroup("Missile Launcher Heavy Assault"),
                                   "speed", module.getModifiedItemAttr("subsystemBonusMinmatarOffensive"),
                                   skill="Minmatar Offensive Systems")
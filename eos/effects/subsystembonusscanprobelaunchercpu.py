@@ -2,9 +2,11 @@
 #
 # Used by:
 # Subsystems named like: Electronics Emergent Locus Analyzer (4 of 4)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Scan Probe Launcher",
+    fit.modules.filteredItemBoost(ItemGroup("Scan Probe Launcher"),
                                   "cpu", module.getModifiedItemAttr("cpuNeedBonus"))
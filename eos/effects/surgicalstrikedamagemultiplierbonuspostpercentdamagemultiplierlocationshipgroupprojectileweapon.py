@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Surgical Strike
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Projectile Weapon",
+    fit.modules.filteredItemBoost(ItemGroup("Projectile Weapon"),
                                   "damageMultiplier", skill.getModifiedItemAttr("damageMultiplierBonus") * skill.level)
@@ -3,9 +3,11 @@
 # Used by:
 # Implants named like: Eifyr and Co. 'Gunslinger' Surgical Strike SS (6 of 6)
 # Implant: Standard Cerebral Accelerator
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, implant, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "damageMultiplier", implant.getModifiedItemAttr("damageMultiplierBonus"))
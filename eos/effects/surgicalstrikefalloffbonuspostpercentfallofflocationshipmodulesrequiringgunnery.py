@@ -4,10 +4,12 @@
 # Implants named like: Sooth Sayer Booster (4 of 4)
 # Implants named like: Zainou 'Deadeye' Trajectory Analysis TA (6 of 6)
 # Skill: Trajectory Analysis
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "falloff", container.getModifiedItemAttr("falloffBonus") * level)
@@ -3,10 +3,12 @@
 # Used by:
 # Modules named like: Signal Focusing Kit (8 of 8)
 # Skill: Survey
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("CPU Management"),
+    fit.modules.filteredItemBoost(ItemSkill("CPU Management"),
                                   "duration", container.getModifiedItemAttr("scanspeedBonus") * level)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Celestials named like: Magnetar Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, beacon, context):
-    fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill("Missile Launcher Operation"),
+    fit.modules.filteredChargeMultiply(ChargeSkill("Missile Launcher Operation"),
                                        "aoeCloudSize", beacon.getModifiedItemAttr("aoeCloudSizeMultiplier"))
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Celestials named like: Magnetar Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, beacon, context):
-    fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill("Drones"),
+    fit.drones.filteredItemMultiply(ItemSkill("Drones"),
                                     "damageMultiplier", beacon.getModifiedItemAttr("damageMultiplierMultiplier"),
                                     stackingPenalties=True, penaltyGroup="postMul")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Celestials named like: Red Giant Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, beacon, context):
-    fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill("Bomb Deployment"),
+    fit.modules.filteredChargeMultiply(ChargeSkill("Bomb Deployment"),
                                        "emDamage", beacon.getModifiedItemAttr("smartbombDamageMultiplier"),
                                        stackingPenalties=True, penaltyGroup="postMul")
@@ -2,12 +2,14 @@
 #
 # Used by:
 # Celestials named like: Pulsar Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, beacon, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Energy Nosferatu",
+    fit.modules.filteredItemMultiply(ItemGroup("Energy Nosferatu"),
                                      "powerTransferAmount",
                                      beacon.getModifiedItemAttr("energyWarfareStrengthMultiplier"),
                                      stackingPenalties=True, penaltyGroup="postMul")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Celestials named like: Cataclysmic Variable Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, beacon, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Remote Capacitor Transmitter",
+    fit.modules.filteredItemMultiply(ItemGroup("Remote Capacitor Transmitter"),
                                      "powerTransferAmount", beacon.getModifiedItemAttr("energyTransferAmountBonus"),
                                      stackingPenalties=True, penaltyGroup="postMul")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Celestials named like: Wolf Rayet Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ChargeSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, beacon, context):
-    fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill("Rockets"),
+    fit.modules.filteredChargeMultiply(ChargeSkill("Rockets"),
                                        "explosiveDamage", beacon.getModifiedItemAttr("smallWeaponDamageMultiplier"),
                                        stackingPenalties=True, penaltyGroup="postMul")
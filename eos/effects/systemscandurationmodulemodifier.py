@@ -2,9 +2,11 @@
 #
 # Used by:
 # Modules from group: Scanning Upgrade Time (2 of 2)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Astrometrics"),
+    fit.modules.filteredItemBoost(ItemSkill("Astrometrics"),
                                   "duration", module.getModifiedItemAttr("scanDurationBonus"))
@@ -4,10 +4,12 @@
 # Implants named like: Poteque 'Prospector' Astrometric Acquisition AQ (3 of 3)
 # Skill: Astrometric Acquisition
 # Skill: Astrometrics
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Astrometrics"),
+    fit.modules.filteredItemBoost(ItemSkill("Astrometrics"),
                                   "duration", container.getModifiedItemAttr("durationBonus") * level)
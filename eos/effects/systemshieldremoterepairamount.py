@@ -2,11 +2,13 @@
 #
 # Used by:
 # Celestials named like: Cataclysmic Variable Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Shield Emission Systems"),
+    fit.modules.filteredItemMultiply(ItemSkill("Shield Emission Systems"),
                                      "shieldBonus", module.getModifiedItemAttr("shieldBonusMultiplierRemote"),
                                      stackingPenalties=True, penaltyGroup="postMul")
@@ -2,11 +2,13 @@
 #
 # Used by:
 # Celestials named like: Wolf Rayet Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Small Energy Turret"),
+    fit.modules.filteredItemMultiply(ItemSkill("Small Energy Turret"),
                                      "damageMultiplier", module.getModifiedItemAttr("smallWeaponDamageMultiplier"),
                                      stackingPenalties=True)
@@ -2,10 +2,12 @@
 #
 # Used by:
 # Celestials named like: Red Giant Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Smart Bomb",
+    fit.modules.filteredItemMultiply(ItemGroup("Smart Bomb"),
                                      "explosiveDamage", module.getModifiedItemAttr("smartbombDamageMultiplier"))
@@ -2,12 +2,14 @@
 #
 # Used by:
 # Celestials named like: Magnetar Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, beacon, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Target Painting"),
+    fit.modules.filteredItemMultiply(ItemSkill("Target Painting"),
                                      "signatureRadiusBonus",
                                      beacon.getModifiedItemAttr("targetPainterStrengthMultiplier"),
                                      stackingPenalties=True, penaltyGroup="postMul")
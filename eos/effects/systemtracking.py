@@ -2,11 +2,13 @@
 #
 # Used by:
 # Celestials named like: Magnetar Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemSkill
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemMultiply(ItemSkill("Gunnery"),
                                      "trackingSpeed", module.getModifiedItemAttr("trackingSpeedMultiplier"),
                                      stackingPenalties=True, penaltyGroup="postMul")
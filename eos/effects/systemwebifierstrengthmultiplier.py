@@ -2,11 +2,13 @@
 #
 # Used by:
 # Celestials named like: Black Hole Effect Beacon Class (6 of 6)
+from eos.effectHandlerHelpers import ItemGroup
+
 runTime = "early"
 type = ("projected", "passive")
 
 
 def handler(fit, beacon, context):
-    fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == "Stasis Web",
+    fit.modules.filteredItemMultiply(ItemGroup("Stasis Web"),
                                      "speedFactor", beacon.getModifiedItemAttr("stasisWebStrengthMultiplier"),
                                      stackingPenalties=True, penaltyGroup="postMul")
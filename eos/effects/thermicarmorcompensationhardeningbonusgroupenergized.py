@@ -2,10 +2,12 @@
 #
 # Used by:
 # Skill: Thermal Armor Compensation
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Armor Plating Energized",
+    fit.modules.filteredItemBoost(ItemGroup("Armor Plating Energized"),
                                   "thermalDamageResistanceBonus",
                                   skill.getModifiedItemAttr("hardeningBonus") * skill.level)
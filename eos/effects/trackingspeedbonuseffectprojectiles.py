@@ -2,10 +2,12 @@
 #
 # Used by:
 # Modules named like: Projectile Metastasis Adjuster (8 of 8)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Projectile Weapon",
+    fit.modules.filteredItemBoost(ItemGroup("Projectile Weapon"),
                                   "trackingSpeed", module.getModifiedItemAttr("trackingSpeedBonus"),
                                   stackingPenalties=True)
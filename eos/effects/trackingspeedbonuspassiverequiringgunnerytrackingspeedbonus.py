@@ -6,10 +6,12 @@
 # Implant: Antipharmakon Iokira
 # Implant: Ogdin's Eye Coordination Enhancer
 # Skill: Motion Prediction
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "trackingSpeed", container.getModifiedItemAttr("trackingSpeedBonus") * level)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Subsystems from group: Defensive Systems (12 of 16)
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, module, context):
-    fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill("Leadership"),
+    fit.modules.filteredItemIncrease(ItemSkill("Leadership"),
                                      "warfareLinkCPUAdd", module.getModifiedItemAttr("warfareLinkCPUPenalty"))
@@ -2,6 +2,8 @@
 #
 # Used by:
 # Modules from group: Warp Disrupt Field Generator (7 of 7)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "active"
 runTime = "early"
 
@@ -9,8 +11,8 @@ runTime = "early"
 def handler(fit, module, context):
     fit.ship.boostItemAttr("mass", module.getModifiedItemAttr("massBonusPercentage"))
     fit.ship.boostItemAttr("signatureRadius", module.getModifiedItemAttr("signatureRadiusBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Propulsion Module",
+    fit.modules.filteredItemBoost(ItemGroup("Propulsion Module"),
                                   "speedBoostFactor", module.getModifiedItemAttr("speedBoostFactorBonus"))
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Propulsion Module",
+    fit.modules.filteredItemBoost(ItemGroup("Propulsion Module"),
                                   "speedFactor", module.getModifiedItemAttr("speedFactorBonus"))
     fit.ship.forceItemAttr("disallowAssistance", 1)
@@ -2,9 +2,11 @@
 #
 # Used by:
 # Skill: Weapon Upgrades
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, skill, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Energy Pulse Weapons"),
+    fit.modules.filteredItemBoost(ItemSkill("Energy Pulse Weapons"),
                                   "cpu", skill.getModifiedItemAttr("cpuNeedBonus") * skill.level)
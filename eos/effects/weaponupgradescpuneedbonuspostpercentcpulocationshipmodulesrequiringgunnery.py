@@ -3,10 +3,12 @@
 # Used by:
 # Implants named like: Zainou 'Gnome' Weapon Upgrades WU (6 of 6)
 # Skill: Weapon Upgrades
+from eos.effectHandlerHelpers import ItemSkill
+
 type = "passive"
 
 
 def handler(fit, container, context):
     level = container.level if "skill" in context else 1
-    fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+    fit.modules.filteredItemBoost(ItemSkill("Gunnery"),
                                   "cpu", container.getModifiedItemAttr("cpuNeedBonus") * level)
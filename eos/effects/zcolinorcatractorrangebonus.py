@@ -2,8 +2,10 @@
 #
 # Used by:
 # Ships from group: Industrial Command Ship (2 of 2)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, src, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Tractor Beam", "maxRange", src.getModifiedItemAttr("roleBonusTractorBeamRange"))
+    fit.modules.filteredItemBoost(ItemGroup("Tractor Beam"), "maxRange", src.getModifiedItemAttr("roleBonusTractorBeamRange"))
@@ -2,8 +2,10 @@
 #
 # Used by:
 # Ships from group: Industrial Command Ship (2 of 2)
+from eos.effectHandlerHelpers import ItemGroup
+
 type = "passive"
 
 
 def handler(fit, ship, context):
-    fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Tractor Beam", "maxTractorVelocity", ship.getModifiedItemAttr("roleBonusTractorBeamVelocity"))
+    fit.modules.filteredItemBoost(ItemGroup("Tractor Beam"), "maxTractorVelocity", ship.getModifiedItemAttr("roleBonusTractorBeamVelocity"))
@@ -17,8 +17,10 @@
 # along with eos.  If not, see <http://www.gnu.org/licenses/>.
 # ===============================================================================
 
+import dis
 import re
 import traceback
+from itertools import chain
 
 from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, Table
 from sqlalchemy import Float
@@ -33,6 +35,7 @@ from eos.db.sqlAlchemy import sqlAlchemy
 from eos.db.gamedata.cache import cachedQuery
 from eos.db.saveddata import queries as eds_queries
 from eos.db.util import processEager, processWhere, sqlizeString
+from eos.effectRegistry import getEffectModule
 from eos.eqBase import EqBase
 
 try:
@@ -54,6 +57,8 @@ class Effect(EqBase):
     """
     # Filter to change names of effects to valid python method names
     nameFilter = re.compile("[^A-Za-z0-9]")
+    # Fit element lists which can be reported as effect targets, see fitTargets
+    fitElementLists = frozenset(("modules", "drones", "fighters", "appliedImplants", "implants", "boosters"))
 
     @reconstructor
     def init(self):
@@ -62,6 +67,7 @@ class Effect(EqBase):
         """
         self.__generated = False
         self.__effectModule = None
+        self.__fitTargets = False
         self.handlerName = re.sub(self.nameFilter, "", self.name).lower()
 
     @property
@@ -159,13 +165,33 @@ class Effect(EqBase):
         """
         return self.type is not None and type in self.type
 
+    @property
+    def fitTargets(self):
+        """
+        Names of fit element lists (modules, drones, ...) the handler accesses on
+        the fit. None if it uses the fit in any other way (ship, character, drains,
+        passing it around...), in which case it may affect anything
+        """
+        if self.__fitTargets is False:
+            attrs = getFitAttributes(getattr(self.handler, "func_code", None))
+            if attrs is not None and attrs.issubset(self.fitElementLists):
+                self.__fitTargets = frozenset(attrs)
+            else:
+                self.__fitTargets = None
+
+        return self.__fitTargets
+
     def __generateHandler(self):
         """
         Grab the handler, type and runTime from the effect code if it exists,
         if it doesn't, set dummy values and add a dummy handler
         """
         try:
-            self.__effectModule = effectModule = __import__('eos.effects.' + self.handlerName, fromlist=True)
+            # Registry has the module ready if it was loaded, see eos.effectRegistry
+            effectModule = getEffectModule(self.handlerName)
+            if effectModule is None:
+                effectModule = __import__('eos.effects.' + self.handlerName, fromlist=True)
+            self.__effectModule = effectModule
             try:
                 self.__handler = getattr(effectModule, "handler")
             except AttributeError:
@@ -210,6 +236,41 @@ def effectDummy(*args, **kwargs):
     pass
 
 
+def getFitAttributes(code):
+    """
+    Get names of attributes loaded directly on the first argument (the fit) of
+    handler code. Returns None if the argument is used in any other way
+    """
+    if code is None or code.co_argcount < 1:
+        return None
+    # Closures over the fit can't be followed
+    if code.co_varnames[0] in code.co_cellvars:
+        return None
+
+    attrs = set()
+    bytecode = bytearray(code.co_code)
+    fitLoaded = False
+    i = 0
+    while i < len(bytecode):
+        op = bytecode[i]
+        if op >= dis.HAVE_ARGUMENT:
+            arg = bytecode[i + 1] | (bytecode[i + 2] << 8)
+            i += 3
+        else:
+            arg = None
+            i += 1
+
+        if fitLoaded:
+            if op != dis.opmap["LOAD_ATTR"]:
+                return None
+            attrs.add(code.co_names[arg])
+        elif op == dis.opmap["STORE_FAST"] and arg == 0:
+            return None
+        fitLoaded = op == dis.opmap["LOAD_FAST"] and arg == 0
+
+    return attrs
+
+
 class Item(EqBase):
     MOVE_ATTRS = (4,  # Mass
                   38,  # Capacity
@@ -245,6 +306,7 @@ class Item(EqBase):
         self.__offensive = None
         self.__assistive = None
         self.__overrides = None
+        self.__effectTable = None
 
     @property
     def attributes(self):
@@ -264,6 +326,29 @@ class Item(EqBase):
 
         return False
 
+    def getEffects(self, runTime, type=None, includeInactive=False):
+        """
+        Get implemented effects of the item, enabled by default, which run at given
+        runTime and are of given type (all types when None). Effects are looked up
+        in dispatch table, which is built on first use. Whether effect is enabled
+        may be toggled at any time, so it is checked on each lookup
+        """
+        if self.__effectTable is None:
+            table = {}
+            for effect in self.effects.itervalues():
+                if not effect.isImplemented:
+                    continue
+                # Effects of several types are listed under each of them
+                for effectType in (None,) + (effect.type or ()):
+                    table.setdefault((effect.runTime, effectType), []).append(effect)
+            self.__effectTable = dict((key, tuple(effects)) for key, effects in table.iteritems())
+
+        effects = self.__effectTable.get((runTime, type), ())
+        if includeInactive:
+            return effects
+
+        return tuple(effect for effect in effects if effect.activeByDefault)
+
     # TODO: Import refactor
     # Cannot call overrides from here, cyclical import
     '''
@@ -297,33 +382,17 @@ class Item(EqBase):
     @property
     def requiredSkills(self):
         if self.__requiredSkills is None:
-            # TODO: Import refactor.  Figure out how to get rid of this.
-            # This import should be here to make sure it's fully initialized
             requiredSkills = OrderedDict()
             self.__requiredSkills = requiredSkills
-            # Map containing attribute IDs we may need for required skills
-            # { requiredSkillX : requiredSkillXLevel }
-            srqIDMap = {182: 277, 183: 278, 184: 279, 1285: 1286, 1289: 1287, 1290: 1288}
-            combinedAttrIDs = set(srqIDMap.iterkeys()).union(set(srqIDMap.itervalues()))
-            # Map containing result of the request
-            # { attributeID : attributeValue }
-            skillAttrs = {}
-            # Get relevant attribute values from db (required skill IDs and levels) for our item
-            for attrInfo in directAttributeRequest((self.ID,), tuple(combinedAttrIDs)):
-                attrID = attrInfo[1]
-                attrVal = attrInfo[2]
-                skillAttrs[attrID] = attrVal
-            # Go through all attributeID pairs
-            for srqIDAtrr, srqLvlAttr in srqIDMap.iteritems():
-                # Check if we have both in returned result
-                if srqIDAtrr in skillAttrs and srqLvlAttr in skillAttrs:
-                    skillID = int(skillAttrs[srqIDAtrr])
-                    skillLvl = skillAttrs[srqLvlAttr]
-                    # Fetch item from database and fill map
-                    item = getItem(skillID)
-                    requiredSkills[item] = skillLvl
+            for skillID, skillLvl in getRequiredSkillLevels(self.ID):
+                # Fetch item from database and fill map
+                requiredSkills[getItem(skillID)] = skillLvl
         return self.__requiredSkills
 
+    @property
+    def requiredSkillIDs(self):
+        return getRequiredSkillIDs(self.ID)
+
     factionMap = {
         500001: "caldari",
         500002: "minmatar",
@@ -415,22 +484,11 @@ class Item(EqBase):
         return self.__offensive
 
     def requiresSkill(self, skill, level=None):
-        for s, l in self.requiredSkills.iteritems():
-            if isinstance(skill, basestring):
-                if s.name == skill and (level is None or l == level):
-                    return True
-
-            elif isinstance(skill, int) and (level is None or l == level):
-                if s.ID == skill:
-                    return True
+        skillID = getSkillID(skill)
+        if level is None:
+            return skillID in getRequiredSkillIDs(self.ID)
 
-            elif skill == s and (level is None or l == level):
-                return True
-
-            elif hasattr(skill, "item") and skill.item == s and (level is None or l == level):
-                return True
-
-        return False
+        return (skillID, level) in getRequiredSkillLevels(self.ID)
 
     def __repr__(self):
         return "Item(ID={}, name={}) at {}".format(
@@ -707,6 +765,74 @@ def directAttributeRequest(itemIDs, attrIDs):
     return result
 
 
+# Attribute IDs of required skills, mapped to attribute IDs of their levels
+# ( (requiredSkillX, requiredSkillXLevel), ... )
+requiredSkillAttrIDs = ((182, 277), (183, 278), (184, 279), (1285, 1286), (1289, 1287), (1290, 1288))
+# Required skills of all items, loaded in bulk on first use
+# { itemID : ((skillID, skillLevel), ...) }
+requiredSkillLevelsMap = {}
+# { itemID : frozenset(skillIDs) }
+requiredSkillIDsMap = {}
+# { skillName : skillID }
+skillNameMap = {}
+requiredSkillsLoaded = False
+
+
+def loadRequiredSkills():
+    global requiredSkillsLoaded
+    if requiredSkillsLoaded:
+        return
+
+    combinedAttrIDs = set(chain.from_iterable(requiredSkillAttrIDs))
+    # { itemID : { attributeID : attributeValue } }
+    skillAttrs = {}
+    q = select((Attribute.typeID, Attribute.attributeID, Attribute.value),
+               Attribute.attributeID.in_(combinedAttrIDs))
+    for itemID, attrID, attrVal in sqlAlchemy.gamedata_session.execute(q):
+        skillAttrs.setdefault(itemID, {})[attrID] = attrVal
+
+    allSkillIDs = set()
+    for itemID, attrs in skillAttrs.iteritems():
+        skills = []
+        for srqIDAttr, srqLvlAttr in requiredSkillAttrIDs:
+            # Check if we have both skill and its level
+            if srqIDAttr in attrs and srqLvlAttr in attrs:
+                skills.append((int(attrs[srqIDAttr]), attrs[srqLvlAttr]))
+        if skills:
+            requiredSkillLevelsMap[itemID] = tuple(skills)
+            requiredSkillIDsMap[itemID] = frozenset(skillID for skillID, _ in skills)
+            allSkillIDs.update(requiredSkillIDsMap[itemID])
+
+    if allSkillIDs:
+        q = select((Item.typeID, Item.typeName), Item.typeID.in_(allSkillIDs))
+        for skillID, skillName in sqlAlchemy.gamedata_session.execute(q):
+            skillNameMap[skillName] = skillID
+
+    requiredSkillsLoaded = True
+
+
+def getRequiredSkillLevels(itemID):
+    loadRequiredSkills()
+    return requiredSkillLevelsMap.get(itemID, ())
+
+
+def getRequiredSkillIDs(itemID):
+    loadRequiredSkills()
+    return requiredSkillIDsMap.get(itemID, frozenset())
+
+
+def getSkillID(skill):
+    """Get type ID of skill passed by name, ID, item or character skill"""
+    if isinstance(skill, basestring):
+        loadRequiredSkills()
+        return skillNameMap.get(skill)
+    if isinstance(skill, (int, long)):
+        return skill
+    if hasattr(skill, "item"):
+        skill = skill.item
+    return getattr(skill, "ID", None)
+
+
 class Mapper:
     Effect.name = association_proxy("info", "name")
     Effect.description = association_proxy("info", "description")
@@ -18,10 +18,19 @@
 # ===============================================================================
 
 import itertools
+from math import hypot
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Graph(object):
-    def __init__(self, fit, function, data=None):
+    # Whether single ranges are sampled by getAdaptivePoints()
+    adaptive = False
+
+    def __init__(self, fit, function, data=None, columnFunction=None):
         self.fit = fit
         self.data = {}
         if data is not None:
@@ -29,6 +38,9 @@ class Graph(object):
                 self.setData(Data(name, d))
 
         self.function = function
+        # Optional function calculating all points at once, from dict of NumPy
+        # arrays (see getColumns()) to array of values
+        self.columnFunction = columnFunction
 
     def clearData(self):
         self.data.clear()
@@ -53,6 +65,130 @@ class Graph(object):
 
             yield point, self.function(point)
 
+    def getColumns(self):
+        """
+        All points getIterator() goes through, in the same order, as dict of NumPy
+        arrays of their values. Data without any value (None) is left as None
+        """
+        columns = {}
+        names = []
+        values = []
+        for data in self.data.itervalues():
+            dataValues = list(data)
+            if all(value is None for value in dataValues):
+                columns[data.name] = None
+                continue
+            if any(value is None for value in dataValues):
+                raise ValueError("Data %s can't be partially empty" % data.name)
+            names.append(data.name)
+            values.append(numpy.array(dataValues, dtype=float))
+
+        for name, grid in zip(names, numpy.meshgrid(*values, indexing="ij")):
+            columns[name] = grid.ravel()
+
+        return columns
+
+    def getArrays(self):
+        """
+        Points and their values as (columns, values) NumPy arrays, calculated all at
+        once. None if graph can't do that or NumPy isn't available
+        """
+        if numpy is None or self.columnFunction is None:
+            return None
+
+        columns = self.getColumns()
+        return columns, self.columnFunction(dict(columns))
+
+    def getBreakpoints(self, name):
+        """
+        Values of data name at which function of the graph changes abruptly (e.g.
+        weapon ranges), getAdaptivePoints() samples both sides of them
+        """
+        return ()
+
+    def getAdaptivePoints(self, name, budget=50):
+        """
+        Sample function along data name, the only one which isn't constant, with at
+        most budget evaluations: range is sampled evenly first, together with the
+        breakpoints, then intervals where function changes the most are split
+        until the budget is used. Both sides of every breakpoint are always
+        sampled, even past the budget. Returns (x values, y values), or None if
+        graph isn't adaptive or data isn't a single range without fixed step.
+        """
+        data = self.data[name]
+        if not self.adaptive or len(data.data) != 1 or not isinstance(data.data[0], Range) or data.step is not None:
+            return None
+        constants = {}
+        for other in self.data.itervalues():
+            if other is not data:
+                if not other.isConstant():
+                    return None
+                constants[other.name] = next(iter(other))
+
+        start = data.data[0].start
+        span = data.data[0].end - start
+        if span <= 0:
+            return None
+        # Intervals narrower than this aren't split, both sides of breakpoints are this far apart
+        minWidth = span / (budget * 20.0)
+
+        def evaluate(xs):
+            if numpy is not None and self.columnFunction is not None:
+                columns = {name: numpy.array(xs, dtype=float)}
+                for constantName, value in constants.iteritems():
+                    columns[constantName] = None if value is None else numpy.full(len(xs), value, dtype=float)
+                return self.columnFunction(columns).tolist()
+
+            values = []
+            for x in xs:
+                point = dict(constants)
+                point[name] = x
+                values.append(self.function(point))
+            return values
+
+        end = start + span
+        breakpoints = set(breakpoint for breakpoint in self.getBreakpoints(name) if start < breakpoint < end)
+        # Like Range, start itself isn't sampled. Breakpoints take precedence
+        # over even steps, end is the point right of breakpoints close to it
+        steps = max(2, min(budget / 3, budget - 1 - 2 * len(breakpoints)))
+        xs = set(start + span * i / float(steps) for i in xrange(1, steps + 1))
+        xs.add(start + minWidth)
+        for breakpoint in breakpoints:
+            xs.add(breakpoint)
+            if breakpoint + minWidth < end:
+                xs.add(breakpoint + minWidth)
+        xs = sorted(xs)
+        points = dict(zip(xs, evaluate(xs)))
+
+        while len(points) < budget:
+            xs = sorted(points)
+            ys = [points[x] for x in xs]
+            finite = [y for y in ys if y == y]
+            ySpan = (max(finite) - min(finite) if finite else 0) or 1
+
+            intervals = []
+            for i in xrange(len(xs) - 1):
+                width = xs[i + 1] - xs[i]
+                if width < 2 * minWidth:
+                    continue
+                change = ys[i + 1] - ys[i]
+                if change != change:
+                    change = 0
+                # Length of the line between both points, as plotted
+                intervals.append((hypot(width / span, change / ySpan), (xs[i] + xs[i + 1]) / 2.0))
+
+            if not intervals:
+                break
+
+            # Split the worst quarter of intervals at once, so columns are calculated in batches
+            intervals.sort(reverse=True)
+            count = min(budget - len(points), max(1, len(intervals) / 4))
+            xs = [x for _, x in intervals[:count]]
+            points.update(zip(xs, evaluate(xs)))
+
+        xs = sorted(points)
+        return xs, [points[x] for x in xs]
+
 
 class Data(object):
     def __init__(self, name, dataString, step=None):
@@ -0,0 +1,84 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+from eos.graph import Graph
+
+
+class FitCapacitorGraph(Graph):
+    """
+    Capacitor of calculated fit over time (in seconds), with drains of its own
+    modules and the incoming ones (neuts, remote cap transfers) added with
+    Fit.addDrain. Timeline is simulated only as far as asked for; once it
+    becomes periodic, later points are taken from the last period. Points
+    between samples are interpolated
+    """
+    defaults = {"time": 0}
+
+    def __init__(self, fit, data=None, resolution=1000):
+        Graph.__init__(self, fit, self.calcCapacitor, data if data is not None else self.defaults)
+        self.fit = fit
+        self.resolution = resolution
+        self.sim = None
+        self.timeline = None
+        self.samples = []
+
+    def clearTimeline(self):
+        """Start the timeline over, needed after fit is recalculated"""
+        self.sim = None
+        self.timeline = None
+        self.samples = []
+
+    def calcCapacitor(self, data):
+        t = data["time"] * 1000
+        if self.sim is None:
+            self.sim = self.fit.getCapSimulator()
+            self.timeline = self.sim.timeline(self.resolution)
+
+        if not self.sim.modules:
+            return self.sim.capacitorCapacity
+
+        # Samples on both sides of t are needed
+        index = int(t // self.resolution)
+        while self.timeline is not None and len(self.samples) <= index + 1:
+            try:
+                self.samples.append(next(self.timeline)[1])
+            except StopIteration:
+                self.timeline = None
+
+        if self.sim.steady_state and t > (len(self.samples) - 1) * self.resolution:
+            # Capacitor is the same as a whole number of periods before, period
+            # doesn't have to be a multiple of resolution
+            start = self.sim.t - self.sim.period
+            return self.getSample(start + (t - start) % self.sim.period)
+
+        if index < len(self.samples):
+            return self.getSample(t)
+
+        # Capacitor ran out, or timeline is over
+        return self.samples[-1]
+
+    def getSample(self, t):
+        """Capacitor at time t (in ms) from the samples around it"""
+        index = int(t // self.resolution)
+        value = self.samples[index]
+        if index + 1 < len(self.samples):
+            fraction = (t - index * self.resolution) / float(self.resolution)
+            value += (self.samples[index + 1] - value) * fraction
+
+        return value
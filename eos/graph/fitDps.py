@@ -19,6 +19,11 @@
 
 from math import log, sin, radians, exp
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from eos.graph import Graph
 from eos.saveddata.module import State as State, Hardpoint as Hardpoint
 
@@ -29,15 +34,68 @@ class FitDpsGraph(Graph):
                 "signatureRadius": None,
                 "velocity": 0}
 
+    adaptive = True
+
     def __init__(self, fit, data=None):
-        Graph.__init__(self, fit, self.calcDps, data if data is not None else self.defaults)
+        Graph.__init__(self, fit, self.calcDps, data if data is not None else self.defaults, self.calcDpsColumns)
         self.fit = fit
 
     def calcDps(self, data):
-        ew = {'signatureRadius': [], 'velocity': []}
         fit = self.fit
         total = 0
         distance = data["distance"] * 1000
+        self.applyEwar(data)
+
+        for mod in fit.modules:
+            total += self.calculateModuleDps(mod, data)
+
+        if distance <= fit.extraAttributes["droneControlRange"]:
+            for drone in fit.drones:
+                multiplier = 1 if drone.getModifiedItemAttr("maxVelocity") > 1 else self.calculateTurretMultiplier(
+                    drone, data)
+                dps, _ = drone.damageStats(fit.targetResists)
+                total += dps * multiplier
+
+        # this is janky as fuck
+        for fighter in fit.fighters:
+            for ability in fighter.abilities:
+                if ability.dealsDamage and ability.active:
+                    multiplier = self.calculateFighterMissileMultiplier(ability, data)
+                    dps, _ = ability.damageStats(fit.targetResists)
+                    total += dps * multiplier
+
+        return total
+
+    def getBreakpoints(self, name):
+        if name != "distance":
+            return ()
+
+        fit = self.fit
+        breakpoints = []
+        if fit.drones:
+            breakpoints.append(fit.extraAttributes["droneControlRange"])
+        for mod in fit.modules:
+            breakpoints.extend(self.getModuleBreakpoints(mod))
+
+        return [breakpoint / 1000.0 for breakpoint in breakpoints if breakpoint]
+
+    @staticmethod
+    def getModuleBreakpoints(mod):
+        """Distances at which damage of module, or its effect on target, changes abruptly"""
+        if mod.isEmpty or mod.state < State.ACTIVE:
+            return ()
+        if mod.hardpoint == Hardpoint.TURRET:
+            # Falloff starts after optimal
+            return mod.maxRange, mod.maxRange + mod.falloff
+        if mod.hardpoint == Hardpoint.MISSILE or "remoteWebifierFalloff" in mod.item.effects:
+            return mod.maxRange,
+        return ()
+
+    def applyEwar(self, data):
+        """Apply webs and target painters of the fit onto target in data"""
+        ew = {'signatureRadius': [], 'velocity': []}
+        fit = self.fit
+        distance = data["distance"] * 1000
         abssort = lambda val: -abs(val - 1)
 
         for mod in fit.modules:
@@ -68,32 +126,17 @@ class FitDpsGraph(Graph):
             except:
                 pass
 
-        for mod in fit.modules:
-            dps, _ = mod.damageStats(fit.targetResists)
-            if mod.hardpoint == Hardpoint.TURRET:
-                if mod.state >= State.ACTIVE:
-                    total += dps * self.calculateTurretMultiplier(mod, data)
-
-            elif mod.hardpoint == Hardpoint.MISSILE:
-                if mod.state >= State.ACTIVE and mod.maxRange >= distance:
-                    total += dps * self.calculateMissileMultiplier(mod, data)
-
-        if distance <= fit.extraAttributes["droneControlRange"]:
-            for drone in fit.drones:
-                multiplier = 1 if drone.getModifiedItemAttr("maxVelocity") > 1 else self.calculateTurretMultiplier(
-                    drone, data)
-                dps, _ = drone.damageStats(fit.targetResists)
-                total += dps * multiplier
+    def calculateModuleDps(self, mod, data):
+        dps, _ = mod.damageStats(self.fit.targetResists)
+        if mod.hardpoint == Hardpoint.TURRET:
+            if mod.state >= State.ACTIVE:
+                return dps * self.calculateTurretMultiplier(mod, data)
 
-        # this is janky as fuck
-        for fighter in fit.fighters:
-            for ability in fighter.abilities:
-                if ability.dealsDamage and ability.active:
-                    multiplier = self.calculateFighterMissileMultiplier(ability, data)
-                    dps, _ = ability.damageStats(fit.targetResists)
-                    total += dps * multiplier
+        elif mod.hardpoint == Hardpoint.MISSILE:
+            if mod.state >= State.ACTIVE and mod.maxRange >= data["distance"] * 1000:
+                return dps * self.calculateMissileMultiplier(mod, data)
 
-        return total
+        return 0
 
     def calculateMissileMultiplier(self, mod, data):
         targetSigRad = data["signatureRadius"]
@@ -180,3 +223,185 @@ class FitDpsGraph(Graph):
         rangeEq = ((max(0, distance - turretOptimal)) / turretFalloff) ** 2
 
         return 0.5 ** (rangeEq)
+
+    # Columnar versions of the above, calculating all points at once over NumPy
+    # arrays. Attributes of every module are only read once per call
+
+    def calcDpsColumns(self, columns):
+        fit = self.fit
+        columns = self.applyEwarColumns(columns)
+        distance = columns["distance"] * 1000
+        total = numpy.zeros(distance.shape)
+
+        for mod in fit.modules:
+            total += self.calculateModuleDpsColumns(mod, columns)
+
+        inControlRange = distance <= fit.extraAttributes["droneControlRange"]
+        for drone in fit.drones:
+            dps, _ = drone.damageStats(fit.targetResists)
+            if not dps:
+                continue
+            if drone.getModifiedItemAttr("maxVelocity") > 1:
+                multiplier = 1
+            else:
+                multiplier = self.calculateTurretMultiplierColumns(drone, columns)
+            total += numpy.where(inControlRange, dps * multiplier, 0)
+
+        for fighter in fit.fighters:
+            for ability in fighter.abilities:
+                if ability.dealsDamage and ability.active:
+                    dps, _ = ability.damageStats(fit.targetResists)
+                    total += dps * self.calculateFighterMissileMultiplierColumns(ability, columns)
+
+        return total
+
+    def applyEwarColumns(self, columns):
+        """Columns with webs and target painters of the fit applied onto target"""
+        ew = {'signatureRadius': [], 'velocity': []}
+        fit = self.fit
+        columns = dict(columns)
+        distance = columns["distance"] * 1000
+
+        for mod in fit.modules:
+            if not mod.isEmpty and mod.state >= State.ACTIVE:
+                if "remoteTargetPaintFalloff" in mod.item.effects:
+                    ew['signatureRadius'].append(
+                        1 + (mod.getModifiedItemAttr("signatureRadiusBonus") / 100) *
+                        self.calculateModuleMultiplierColumns(mod, columns))
+                if "remoteWebifierFalloff" in mod.item.effects:
+                    speedFactor = mod.getModifiedItemAttr("speedFactor") / 100
+                    if mod.getModifiedItemAttr("falloffEffectiveness") > 0:
+                        # I am affected by falloff
+                        outside = 1 + speedFactor * self.calculateModuleMultiplierColumns(mod, columns)
+                    else:
+                        # Bonus of 1 is sorted last, same as if it wasn't there
+                        outside = 1
+                    ew['velocity'].append(numpy.where(distance <= mod.getModifiedItemAttr("maxRange"),
+                                                      1 + speedFactor, outside))
+
+        for attr, values in ew.iteritems():
+            if not values or columns[attr] is None:
+                continue
+            bonuses = numpy.array(numpy.broadcast_arrays(distance, *values)[1:], dtype=float)
+            # Strongest bonus of every point first, stable like sort() in applyEwar
+            order = numpy.argsort(-abs(bonuses - 1), axis=0, kind="mergesort")
+            bonuses = bonuses[order, numpy.arange(bonuses.shape[1])]
+            penalties = numpy.exp(-numpy.arange(len(values)) ** 2 / 7.1289)[:, numpy.newaxis]
+            columns[attr] = columns[attr] * numpy.prod(1 + (bonuses - 1) * penalties, axis=0)
+
+        return columns
+
+    def calculateModuleDpsColumns(self, mod, columns):
+        dps, _ = mod.damageStats(self.fit.targetResists)
+        if not dps or mod.state < State.ACTIVE:
+            return 0
+
+        if mod.hardpoint == Hardpoint.TURRET:
+            return dps * self.calculateTurretMultiplierColumns(mod, columns)
+
+        elif mod.hardpoint == Hardpoint.MISSILE:
+            return numpy.where(mod.maxRange >= columns["distance"] * 1000,
+                               dps * self.calculateMissileMultiplierColumns(mod, columns), 0)
+
+        return 0
+
+    def calculateMissileMultiplierColumns(self, mod, columns):
+        targetSigRad = columns["signatureRadius"]
+        targetVelocity = columns["velocity"]
+        explosionRadius = mod.getModifiedChargeAttr("aoeCloudSize")
+        targetSigRad = explosionRadius if targetSigRad is None else targetSigRad
+        explosionVelocity = mod.getModifiedChargeAttr("aoeVelocity")
+        damageReductionFactor = mod.getModifiedChargeAttr("aoeDamageReductionFactor")
+
+        sigRadiusFactor = targetSigRad / explosionRadius
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            velocityFactor = numpy.where(
+                targetVelocity != 0,
+                (explosionVelocity / explosionRadius * targetSigRad / targetVelocity) ** damageReductionFactor, 1)
+
+        return numpy.minimum(numpy.minimum(sigRadiusFactor, velocityFactor), 1)
+
+    def calculateTurretMultiplierColumns(self, mod, columns):
+        chanceToHit = self.calculateTurretChanceToHitColumns(mod, columns)
+        # Wrecking hits below 1% chance to hit, see calculateTurretMultiplier()
+        multiplier = numpy.where(chanceToHit > 0.01, (chanceToHit ** 2 + chanceToHit + 0.0499) / 2, chanceToHit * 3)
+        dmgScaling = mod.getModifiedItemAttr("turretDamageScalingRadius")
+        if dmgScaling:
+            multiplier = numpy.minimum(1, (columns["signatureRadius"] / dmgScaling) ** 2)
+        return multiplier
+
+    def calculateFighterMissileMultiplierColumns(self, ability, columns):
+        prefix = ability.attrPrefix
+
+        targetSigRad = columns["signatureRadius"]
+        targetVelocity = columns["velocity"]
+        explosionRadius = ability.fighter.getModifiedItemAttr("{}ExplosionRadius".format(prefix))
+        explosionVelocity = ability.fighter.getModifiedItemAttr("{}ExplosionVelocity".format(prefix))
+        damageReductionFactor = ability.fighter.getModifiedItemAttr("{}ReductionFactor".format(prefix))
+        if damageReductionFactor is None:
+            damageReductionFactor = ability.fighter.getModifiedItemAttr("{}DamageReductionFactor".format(prefix))
+
+        damageReductionSensitivity = ability.fighter.getModifiedItemAttr("{}ReductionSensitivity".format(prefix))
+        if damageReductionSensitivity is None:
+            damageReductionSensitivity = ability.fighter.getModifiedItemAttr(
+                "{}DamageReductionSensitivity".format(prefix))
+
+        targetSigRad = explosionRadius if targetSigRad is None else targetSigRad
+        sigRadiusFactor = targetSigRad / explosionRadius
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            velocityFactor = numpy.where(
+                targetVelocity != 0,
+                (explosionVelocity / explosionRadius * targetSigRad / targetVelocity) ** (
+                    log(damageReductionFactor) / log(damageReductionSensitivity)), 1)
+
+        return numpy.minimum(numpy.minimum(sigRadiusFactor, velocityFactor), 1)
+
+    def calculateTurretChanceToHitColumns(self, mod, columns):
+        distance = columns["distance"] * 1000
+        tracking = mod.getModifiedItemAttr("trackingSpeed")
+        turretOptimal = mod.maxRange
+        turretFalloff = mod.falloff
+        turretSigRes = mod.getModifiedItemAttr("optimalSigRadius")
+        targetSigRad = columns["signatureRadius"]
+        targetSigRad = turretSigRes if targetSigRad is None else targetSigRad
+        transversal = numpy.sin(numpy.radians(columns["angle"])) * columns["velocity"]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            trackingEq = (((transversal / (distance * tracking)) *
+                           (turretSigRes / targetSigRad)) ** 2)
+        rangeEq = ((numpy.maximum(0, distance - turretOptimal)) / turretFalloff) ** 2
+
+        return 0.5 ** (trackingEq + rangeEq)
+
+    def calculateModuleMultiplierColumns(self, mod, columns):
+        distance = columns["distance"] * 1000
+        rangeEq = ((numpy.maximum(0, distance - mod.maxRange)) / mod.falloff) ** 2
+
+        return 0.5 ** rangeEq
+
+
+class AmmoDpsGraph(FitDpsGraph):
+    """
+    DPS of weapons of one type with single charge loaded, drawn from row of
+    charge matrix (see eos.chargeMatrix), so the weapons aren't calculated again
+    """
+
+    def __init__(self, chargeStats, count=1, data=None):
+        FitDpsGraph.__init__(self, chargeStats.fit, data)
+        self.module = chargeStats.module
+        self.count = count
+
+    def calcDps(self, data):
+        self.applyEwar(data)
+        return self.count * self.calculateModuleDps(self.module, data)
+
+    def getBreakpoints(self, name):
+        if name != "distance":
+            return ()
+
+        return [breakpoint / 1000.0 for breakpoint in self.getModuleBreakpoints(self.module) if breakpoint]
+
+    def calcDpsColumns(self, columns):
+        columns = self.applyEwarColumns(columns)
+        return self.count * (numpy.zeros(columns["distance"].shape) +
+                             self.calculateModuleDpsColumns(self.module, columns))
@@ -25,9 +25,56 @@ from eos.gamedata import getAttributeInfo
 defaultValuesCache = {}
 cappingAttrKeyCache = {}
 
+# Stacking penalty of n-th most significant multiplier is:
+# 1 + (multiplier - 1) * math.exp(- math.pow(n, 2) / 7.1289)
+# Coefficients beyond the table are too small to make any difference
+penaltyCoefficients = tuple(exp(- i ** 2 / 7.1289) for i in xrange(32))
+
+
+class PenalizedMultipliers(object):
+    """
+    Stacking penalized multipliers of single penalty group. Bonuses and penalties
+    are penalized separately, so they're kept apart as they are added
+    """
+
+    def __init__(self):
+        self.bonuses = []
+        self.penalties = []
+
+    def append(self, multiplier, count=1):
+        if multiplier > 1:
+            self.bonuses.extend((multiplier,) * count)
+        elif multiplier < 1:
+            self.penalties.extend((multiplier,) * count)
+
+    def apply(self, val):
+        # The most significant bonuses take the smallest penalty, the first one
+        # isn't penalized at all
+        coefficients = penaltyCoefficients
+        for multipliers in (sorted(self.bonuses, reverse=True), sorted(self.penalties)):
+            for i in xrange(min(len(multipliers), len(coefficients))):
+                val *= 1 + (multipliers[i] - 1) * coefficients[i]
+        return val
+
+
+class FrozenAttributes(dict):
+    """
+    Read-only flat mapping of final attribute values of an item, as produced by
+    ModifiedAttributeDict.freeze(). It never changes, so it's safe to share it
+    with other threads
+    """
+
+    def __readOnly(self, *args, **kwargs):
+        raise TypeError("Frozen attributes are read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __readOnly
+
 
 class ItemAttrShortcut(object):
     def getModifiedItemAttr(self, key):
+        frozen = self.itemModifiedAttributes.frozen
+        if frozen is not None:
+            return frozen.get(key)
         if key in self.itemModifiedAttributes:
             return self.itemModifiedAttributes[key]
         else:
@@ -36,14 +83,179 @@ class ItemAttrShortcut(object):
 
 class ChargeAttrShortcut(object):
     def getModifiedChargeAttr(self, key):
+        frozen = self.chargeModifiedAttributes.frozen
+        if frozen is not None:
+            return frozen.get(key)
         if key in self.chargeModifiedAttributes:
             return self.chargeModifiedAttributes[key]
         else:
             return None
 
 
+class CalculationTracker(object):
+    """
+    Records which calculation sources (character, ship, modules, drones, ...)
+    wrote and read which modified attributes during a fit calculation. With
+    that information, a state change of a few sources can be recalculated by
+    re-running only the sources depending on them, see Fit.recalculate()
+    """
+
+    def __init__(self):
+        # Source whose effects are currently being run
+        self.source = None
+        # When set, the source is re-run only to restore its share of the
+        # invalidated attributes, all other writes are dropped
+        self.restricted = False
+        # Set when a source did something we cannot track (e.g. changed state
+        # of other modules), incremental recalculation is impossible then
+        self.disabled = False
+        self.__dicts = {}
+        self.__writers = {}
+        self.__readers = {}
+        self.__writes = {}
+        self.__reads = {}
+        self.__impure = set()
+        self.__dirtySources = set()
+        self.__dirtyKeys = set()
+        self.__restoreSources = set()
+        self.__newWrites = set()
+        # Dicts written to during recalculation, by id
+        self.__written = None
+
+    def read(self, attrDict, key):
+        source = self.source
+        if source is None or self.restricted:
+            return
+        attr = (id(attrDict), key)
+        sourceID = id(source)
+        self.__readers.setdefault(attr, set()).add(sourceID)
+        self.__reads.setdefault(sourceID, set()).add(attr)
+
+    def write(self, attrDict, key):
+        """Record write of attribute, returns False if the write has to be dropped"""
+        source = self.source
+        if source is None:
+            return True
+        attr = (id(attrDict), key)
+        if self.restricted and attr not in self.__dirtyKeys:
+            return False
+        if self.__written is not None:
+            self.__written[attr[0]] = attrDict
+        if self.restricted:
+            return True
+        sourceID = id(source)
+        self.__dicts[attr[0]] = attrDict
+        writers = self.__writers.setdefault(attr, set())
+        if sourceID not in writers:
+            writers.add(sourceID)
+            self.__writes.setdefault(sourceID, set()).add(attr)
+            if attr not in self.__dirtyKeys:
+                self.__newWrites.add(attr)
+        return True
+
+    def markImpure(self):
+        """Current source has side effects outside of modified attributes"""
+        if self.source is not None:
+            self.__impure.add(id(self.source))
+
+    def invalidate(self, changed):
+        """
+        Find everything depending on the changed sources and drop it, so it
+        can be recalculated. Returns False if it cannot be done incrementally
+        """
+        if self.disabled:
+            return False
+        dirtySources = set(id(source) for source in changed)
+        dirtyKeys = set()
+        pending = list(dirtySources)
+        while pending:
+            sourceID = pending.pop()
+            for attr in self.__writes.get(sourceID, ()):
+                if attr in dirtyKeys:
+                    continue
+                dirtyKeys.add(attr)
+                for readerID in self.__readers.get(attr, ()):
+                    if readerID not in dirtySources:
+                        dirtySources.add(readerID)
+                        pending.append(readerID)
+
+        restoreSources = set()
+        for attr in dirtyKeys:
+            restoreSources.update(self.__writers[attr])
+        restoreSources -= dirtySources
+
+        if not self.__impure.isdisjoint(dirtySources) or not self.__impure.isdisjoint(restoreSources):
+            return False
+
+        # Dirty sources are run again from scratch and re-record everything
+        for sourceID in dirtySources:
+            for attr in self.__writes.pop(sourceID, ()):
+                self.__writers[attr].discard(sourceID)
+            for attr in self.__reads.pop(sourceID, ()):
+                self.__readers[attr].discard(sourceID)
+
+        touched = set()
+        for dictID, key in dirtyKeys:
+            attrDict = self.__dicts[dictID]
+            attrDict.clearAttribute(key)
+            touched.add(dictID)
+        # Values capped by invalidated attributes have to be recalculated too
+        for dictID in touched:
+            self.__dicts[dictID].resetCalculated()
+
+        self.__dirtySources = dirtySources
+        self.__dirtyKeys = dirtyKeys
+        self.__restoreSources = restoreSources
+        self.__newWrites = set()
+        self.__written = {}
+        return True
+
+    def prepare(self, source):
+        """
+        Set up tracking for given source during recalculation. Returns False
+        if the source has to be skipped entirely
+        """
+        sourceID = id(source)
+        self.source = source
+        if sourceID in self.__dirtySources:
+            self.restricted = False
+            return True
+        self.restricted = sourceID in self.__restoreSources
+        return self.restricted
+
+    def settle(self):
+        """
+        Finish recalculation. Returns False if dirty sources started to modify
+        attributes which were already read by sources that were not re-run
+        """
+        self.source = None
+        self.restricted = False
+        # Values capped by attributes the re-run sources wrote may be cached in
+        # dicts which had nothing invalidated
+        for attrDict in (self.__written or {}).itervalues():
+            attrDict.resetCalculated()
+        self.__written = None
+        for attr in self.__newWrites:
+            readers = self.__readers.get(attr)
+            if readers and not readers.issubset(self.__dirtySources):
+                self.disabled = True
+        self.__dirtySources = set()
+        self.__dirtyKeys = set()
+        self.__restoreSources = set()
+        self.__newWrites = set()
+        return not self.disabled
+
+
 class ModifiedAttributeDict(collections.MutableMapping):
     OVERRIDES = False
+    # When switched off, 'Affected by' data is not recorded during calculation,
+    # see Fit.calculateAfflictions()
+    AFFLICTIONS = True
+    # Set by the fit while it runs a tracked calculation
+    tracker = None
+    # Number of identical sources running effect stands for, every modification
+    # is recorded as if the effect was run that many times
+    multiplicity = 1
 
     class CalculationPlaceholder():
         def __init__(self):
@@ -69,8 +281,11 @@ class ModifiedAttributeDict(collections.MutableMapping):
         self.__multipliers = {}
         self.__penalizedMultipliers = {}
         self.__postIncreases = {}
+        # Final values of all attributes, set by freeze() until anything changes
+        self.__frozen = None
 
     def clear(self):
+        self.__frozen = None
         self.__intermediary.clear()
         self.__modified.clear()
         self.__affectedBy.clear()
@@ -81,6 +296,55 @@ class ModifiedAttributeDict(collections.MutableMapping):
         self.__penalizedMultipliers.clear()
         self.__postIncreases.clear()
 
+    def clearAttribute(self, key):
+        """Drop all modifications of given attribute"""
+        self.__frozen = None
+        for tbl in (self.__intermediary, self.__modified, self.__affectedBy, self.__forced, self.__preAssigns,
+                    self.__preIncreases, self.__multipliers, self.__penalizedMultipliers, self.__postIncreases):
+            if key in tbl:
+                del tbl[key]
+
+    def freeze(self):
+        """
+        Calculate all attributes and materialise them into flat read-only mapping,
+        which is then used for reads until the dict is modified again
+        """
+        frozen = self.__frozen
+        if frozen is None:
+            self.calculateAll()
+            values = {}
+            if self.__original is not None:
+                for key in self.__original:
+                    values[key] = self.getOriginal(key)
+            values.update(self.__intermediary)
+            values.update(self.__modified)
+            frozen = FrozenAttributes(values)
+            # Overridden values depend on OVERRIDES switch, which may be flipped
+            # at any time, so such items keep reading through regular path
+            if not self.__overrides:
+                self.__frozen = frozen
+
+        return frozen
+
+    @property
+    def frozen(self):
+        # Reads have to go through the regular path while calculation is tracked
+        return self.__frozen if self.tracker is None else None
+
+    def calculateAll(self):
+        """Calculate values of all attributes still waiting for calculation"""
+        modified = self.__modified
+        for key, val in modified.items():
+            if val == self.CalculationPlaceholder:
+                modified[key] = self.__calculateValue(key)
+
+    def resetCalculated(self):
+        """Turn calculated values back into placeholders, so they're recalculated on next access"""
+        self.__frozen = None
+        modified = self.__modified
+        for key in modified:
+            modified[key] = self.CalculationPlaceholder
+
     @property
     def original(self):
         return self.__original
@@ -89,6 +353,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
     def original(self, val):
         self.__original = val
         self.__modified.clear()
+        self.__frozen = None
 
     @property
     def overrides(self):
@@ -97,8 +362,13 @@ class ModifiedAttributeDict(collections.MutableMapping):
     @overrides.setter
     def overrides(self, val):
         self.__overrides = val
+        self.__frozen = None
 
     def __getitem__(self, key):
+        if self.tracker is not None:
+            self.tracker.read(self, key)
+        if self.__frozen is not None:
+            return self.__frozen.get(key)
         # Check if we have final calculated value
         if key in self.__modified:
             if self.__modified[key] == self.CalculationPlaceholder:
@@ -112,6 +382,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
             return self.getOriginal(key)
 
     def __delitem__(self, key):
+        self.__frozen = None
         if key in self.__modified:
             del self.__modified[key]
         if key in self.__intermediary:
@@ -127,6 +398,9 @@ class ModifiedAttributeDict(collections.MutableMapping):
         return val.value if hasattr(val, "value") else val
 
     def __setitem__(self, key, val):
+        if self.tracker is not None and not self.tracker.write(self, key):
+            return
+        self.__frozen = None
         self.__intermediary[key] = val
 
     def __iter__(self):
@@ -134,10 +408,15 @@ class ModifiedAttributeDict(collections.MutableMapping):
         return (key for key in all)
 
     def __contains__(self, key):
+        if self.tracker is not None:
+            self.tracker.read(self, key)
+        if self.__frozen is not None:
+            return key in self.__frozen
         return (self.__original is not None and key in self.__original) or key in self.__modified or key in self.__intermediary
 
     def __placehold(self, key):
         """Create calculation placeholder in item's modified attribute dict"""
+        self.__frozen = None
         self.__modified[key] = self.CalculationPlaceholder
 
     def __len__(self):
@@ -147,7 +426,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
         keys.update(self.__intermediary.iterkeys())
         return len(keys)
 
-    def __calculateValue(self, key):
+    def __getCappingValue(self, key):
         # It's possible that various attributes are capped by other attributes,
         # it's defined by reference maxAttributeID
         try:
@@ -175,19 +454,9 @@ class ModifiedAttributeDict(collections.MutableMapping):
         else:
             cappingValue = None
 
-        # If value is forced, we don't have to calculate anything,
-        # just return forced value instead
-        force = self.__forced[key] if key in self.__forced else None
-        if force is not None:
-            if cappingValue is not None:
-                force = min(force, cappingValue)
-            return force
-        # Grab our values if they're there, otherwise we'll take default values
-        preIncrease = self.__preIncreases[key] if key in self.__preIncreases else 0
-        multiplier = self.__multipliers[key] if key in self.__multipliers else 1
-        penalizedMultiplierGroups = self.__penalizedMultipliers[key] if key in self.__penalizedMultipliers else {}
-        postIncrease = self.__postIncreases[key] if key in self.__postIncreases else 0
+        return cappingValue
 
+    def __getBaseValue(self, key):
         # Grab initial value, priorities are:
         # Results of ongoing calculation > preAssign > original > 0
         try:
@@ -199,9 +468,27 @@ class ModifiedAttributeDict(collections.MutableMapping):
             else:
                 dv = attrInfo.defaultValue
                 default = defaultValuesCache[key] = dv if dv is not None else 0.0
-        val = self.__intermediary[key] if key in self.__intermediary else self.__preAssigns[
+        return self.__intermediary[key] if key in self.__intermediary else self.__preAssigns[
             key] if key in self.__preAssigns else self.getOriginal(key) if key in self.__original else default
 
+    def __calculateValue(self, key):
+        cappingValue = self.__getCappingValue(key)
+
+        # If value is forced, we don't have to calculate anything,
+        # just return forced value instead
+        force = self.__forced[key] if key in self.__forced else None
+        if force is not None:
+            if cappingValue is not None:
+                force = min(force, cappingValue)
+            return force
+        # Grab our values if they're there, otherwise we'll take default values
+        preIncrease = self.__preIncreases[key] if key in self.__preIncreases else 0
+        multiplier = self.__multipliers[key] if key in self.__multipliers else 1
+        penalizedMultiplierGroups = self.__penalizedMultipliers[key] if key in self.__penalizedMultipliers else {}
+        postIncrease = self.__postIncreases[key] if key in self.__postIncreases else 0
+
+        val = self.__getBaseValue(key)
+
         # We'll do stuff in the following order:
         # preIncrease > multiplier > stacking penalized multipliers > postIncrease
         val += preIncrease
@@ -209,22 +496,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
         # Each group is penalized independently
         # Things in different groups will not be stack penalized between each other
         for penalizedMultipliers in penalizedMultiplierGroups.itervalues():
-            # A quick explanation of how this works:
-            # 1: Bonuses and penalties are calculated seperately, so we'll have to filter each of them
-            l1 = filter(lambda val: val > 1, penalizedMultipliers)
-            l2 = filter(lambda val: val < 1, penalizedMultipliers)
-            # 2: The most significant bonuses take the smallest penalty,
-            # This means we'll have to sort
-            abssort = lambda val: -abs(val - 1)
-            l1.sort(key=abssort)
-            l2.sort(key=abssort)
-            # 3: The first module doesn't get penalized at all
-            # Any module after the first takes penalties according to:
-            # 1 + (multiplier - 1) * math.exp(- math.pow(i, 2) / 7.1289)
-            for l in (l1, l2):
-                for i in xrange(len(l)):
-                    bonus = l[i]
-                    val *= 1 + (bonus - 1) * exp(- i ** 2 / 7.1289)
+            val = penalizedMultipliers.apply(val)
         val += postIncrease
 
         # Cap value if we have cap defined
@@ -233,6 +505,31 @@ class ModifiedAttributeDict(collections.MutableMapping):
 
         return val
 
+    def getStages(self, key):
+        """
+        Modifications of attribute, as they're applied when its value is calculated:
+        (base, forced, preIncrease, multiplier, penalized, postIncrease, cappingValue).
+        Penalized multipliers come as (bonuses, penalties) pair per penalty group.
+        Attributes which aren't modified only have base value, used as it is
+        """
+        if key not in self.__modified:
+            if key in self.__intermediary:
+                base = self.__intermediary[key]
+            else:
+                base = self.getOriginal(key) if self.__original is not None else None
+            return base, None, 0, 1, (), 0, None
+
+        penalizedMultiplierGroups = self.__penalizedMultipliers[key] if key in self.__penalizedMultipliers else {}
+        return (
+            self.__getBaseValue(key),
+            self.__forced[key] if key in self.__forced else None,
+            self.__preIncreases[key] if key in self.__preIncreases else 0,
+            self.__multipliers[key] if key in self.__multipliers else 1,
+            tuple((group.bonuses, group.penalties) for group in penalizedMultiplierGroups.itervalues()),
+            self.__postIncreases[key] if key in self.__postIncreases else 0,
+            self.__getCappingValue(key),
+        )
+
     def __handleSkill(self, skillName):
         """
         Since ship skill bonuses do not directly modify the attributes, it does
@@ -260,8 +557,8 @@ class ModifiedAttributeDict(collections.MutableMapping):
 
     def __afflict(self, attributeName, operation, bonus, used=True):
         """Add modifier to list of things affecting current item"""
-        # Do nothing if no fit is assigned
-        if self.fit is None:
+        # Do nothing if no fit is assigned or we're running lean calculation
+        if self.fit is None or not self.AFFLICTIONS:
             return
         # Create dictionary for given attribute and give it alias
         if attributeName not in self.__affectedBy:
@@ -277,11 +574,13 @@ class ModifiedAttributeDict(collections.MutableMapping):
         # Get modifier which helps to compose 'Affected by' map
         modifier = self.fit.getModifier()
 
-        # Add current affliction to list
-        affs.append((modifier, operation, bonus, used))
+        # Add current affliction to list, once per source
+        affs.extend(((modifier, operation, bonus, used),) * self.multiplicity)
 
     def preAssign(self, attributeName, value):
         """Overwrites original value of the entity with given one, allowing further modification"""
+        if self.tracker is not None and not self.tracker.write(self, attributeName):
+            return
         self.__preAssigns[attributeName] = value
         self.__placehold(attributeName)
         self.__afflict(attributeName, "=", value, value != self.getOriginal(attributeName))
@@ -291,6 +590,9 @@ class ModifiedAttributeDict(collections.MutableMapping):
         if skill:
             increase *= self.__handleSkill(skill)
 
+        if self.tracker is not None and not self.tracker.write(self, attributeName):
+            return
+
         # Increases applied before multiplications and after them are
         # written in separate maps
         if position == "pre":
@@ -301,7 +603,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
             raise ValueError("position should be either pre or post")
         if attributeName not in tbl:
             tbl[attributeName] = 0
-        tbl[attributeName] += increase
+        tbl[attributeName] += increase * self.multiplicity
         self.__placehold(attributeName)
         self.__afflict(attributeName, "+", increase, increase != 0)
 
@@ -313,20 +615,23 @@ class ModifiedAttributeDict(collections.MutableMapping):
         if skill:
             multiplier *= self.__handleSkill(skill)
 
+        if self.tracker is not None and not self.tracker.write(self, attributeName):
+            return
+
         # If we're asked to do stacking penalized multiplication, append values
         # to per penalty group lists
         if stackingPenalties:
             if attributeName not in self.__penalizedMultipliers:
                 self.__penalizedMultipliers[attributeName] = {}
             if penaltyGroup not in self.__penalizedMultipliers[attributeName]:
-                self.__penalizedMultipliers[attributeName][penaltyGroup] = []
+                self.__penalizedMultipliers[attributeName][penaltyGroup] = PenalizedMultipliers()
             tbl = self.__penalizedMultipliers[attributeName][penaltyGroup]
-            tbl.append(multiplier)
+            tbl.append(multiplier, self.multiplicity)
         # Non-penalized multiplication factors go to the single list
         else:
             if attributeName not in self.__multipliers:
                 self.__multipliers[attributeName] = 1
-            self.__multipliers[attributeName] *= multiplier
+            self.__multipliers[attributeName] *= multiplier ** self.multiplicity
 
         self.__placehold(attributeName)
         self.__afflict(attributeName, "%s*" % ("s" if stackingPenalties else ""), multiplier, multiplier != 1)
@@ -353,6 +658,8 @@ class ModifiedAttributeDict(collections.MutableMapping):
 
     def force(self, attributeName, value):
         """Force value to attribute and prohibit any changes to it"""
+        if self.tracker is not None and not self.tracker.write(self, attributeName):
+            return
         self.__forced[attributeName] = value
         self.__placehold(attributeName)
         self.__afflict(attributeName, u"\u2263", value)
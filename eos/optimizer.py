@@ -0,0 +1,468 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Search for the best combination of modules and rigs for a hull. Fits are
+calculated in a pool of worker processes; the search itself only works with
+numbers the workers report back:
+
+ 1. Every candidate is fitted alone onto the hull, which gives its slot,
+    hardpoint and resource usage (with skills applied) and its standalone gain.
+ 2. Greedy fill of all slots gives reference fit and the first solution.
+ 3. Every candidate is swapped into the reference fit, so its gain is also
+    known next to other modules (e.g. damage mods next to guns).
+ 4. Branch-and-bound goes through slot assignments, best candidates first.
+    Slots, hardpoints, calibration, CPU and powergrid are tracked on the way,
+    and the bound of a branch is the sum of the best gains its remaining slots
+    can still get. Complete assignments which can beat the best solution are
+    calculated in full and checked against the fit's own numbers.
+
+Every improving solution is reported as soon as it's found, and the search
+stops when time budget runs out.
+
+Results are approximate. The bound assumes gains of modules add up, which
+stacking penalties (and modules helping each other) break, so it may prune
+branches holding better fits. Candidates without any gain of their own, e.g.
+CPU upgrades, are left out. The best solution found is therefore not proven
+to be the best one possible.
+"""
+
+import logging
+import multiprocessing
+import time
+from itertools import islice
+
+from eos.gamedata import getItem, loadRequiredSkills
+from eos.graph.fitDps import FitDpsGraph
+from eos.saveddata.character import Character
+from eos.saveddata.citadel import Citadel
+from eos.saveddata.fit import Fit
+from eos.saveddata.module import Module, Slot, State, Hardpoint
+from eos.saveddata.ship import Ship
+
+logger = logging.getLogger(__name__)
+
+# Slots search fills, in order
+searchSlots = (Slot.HIGH, Slot.MED, Slot.LOW, Slot.RIG)
+damageAttributes = ("emDamage", "thermalDamage", "kineticDamage", "explosiveDamage")
+# Tolerance of resource checks
+epsilon = 1e-6
+
+# Per worker process state, set up by initWorker()
+shipItem = None
+fixedItems = ()
+character = None
+objective = None
+requireCapStable = False
+
+
+def getDps(fit, distance=0):
+    data = dict(FitDpsGraph.defaults)
+    data["distance"] = distance
+    return FitDpsGraph(fit).calcDps(data)
+
+
+def getEhp(fit):
+    return sum(fit.ehp.itervalues())
+
+
+def getCapScore(fit):
+    # Stable fits are ranked by stable level, others by time they last
+    if fit.capStable:
+        return 1 + fit.capState / 100.0
+    return fit.capState / (fit.capState + 600.0)
+
+
+objectives = {
+    "dps": getDps,
+    "ehp": getEhp,
+    "cap": getCapScore,
+}
+
+
+def initWorker(shipID, fixedIDs, skills, objectiveSpec, capStable):
+    """Load gamedata needed for every fit once per worker process"""
+    global shipItem, fixedItems, character, objective, requireCapStable
+    loadRequiredSkills()
+    shipItem = getItem(shipID)
+    fixedItems = tuple(getItem(itemID) for itemID in fixedIDs)
+    character = Character("Optimizer", 0)
+    for skillID, level in skills.iteritems():
+        character.getSkill(skillID).level = level
+    name, params = objectiveSpec
+    function = objectives[name]
+    objective = lambda fit: function(fit, **params)
+    requireCapStable = capStable
+
+
+def checkFixedModules(fixedIDs):
+    """Raise ValueError unless all of fixedIDs are IDs of modules"""
+    for itemID in fixedIDs:
+        item = getItem(itemID)
+        if item is None:
+            raise ValueError("Item %r doesn't exist" % itemID)
+        try:
+            Module(item)
+        except ValueError:
+            raise ValueError("Item %r (%s) is not a module" % (itemID, item.name))
+
+
+def getBestCharge(mod):
+    """Charge dealing the most raw damage, if module takes any"""
+    best = None
+    bestDamage = 0
+    for charge in mod.getValidCharges():
+        damage = sum(charge.getAttribute(attr) or 0 for attr in damageAttributes)
+        if best is None or damage > bestDamage:
+            best = charge
+            bestDamage = damage
+
+    return best
+
+
+def makeModule(itemID, chargeID=None):
+    try:
+        mod = Module(getItem(itemID, eager=("attributes", "group.category")))
+    except ValueError:
+        return None
+    if chargeID is not None:
+        mod.charge = getItem(chargeID)
+    if mod.isValidState(State.ACTIVE):
+        mod.state = State.ACTIVE
+
+    return mod
+
+
+def buildFit(modules):
+    """Calculated fit with given (itemID, chargeID) modules, None if some don't fit"""
+    fit = Fit(name="Optimizer")
+    try:
+        fit.ship = Ship(shipItem)
+    except ValueError:
+        fit.ship = Citadel(shipItem)
+    fit.character = character
+    for item in fixedItems:
+        mod = Module(item)
+        mod.owner = fit
+        fit.modules.append(mod)
+
+    # Calculate to get slot numbers correct for T3 cruisers
+    fit.calculateModifiedAttributes()
+
+    for itemID, chargeID in modules:
+        mod = makeModule(itemID, chargeID)
+        if mod is None or not mod.fits(fit):
+            return None
+        mod.owner = fit
+        fit.modules.append(mod)
+
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    return fit
+
+
+def isFeasible(fit):
+    ship = fit.ship
+    if fit.cpuUsed > (ship.getModifiedItemAttr("cpuOutput") or 0) + epsilon:
+        return False
+    if fit.pgUsed > (ship.getModifiedItemAttr("powerOutput") or 0) + epsilon:
+        return False
+    if fit.calibrationUsed > (ship.getModifiedItemAttr("upgradeCapacity") or 0) + epsilon:
+        return False
+    if fit.getHardpointsUsed(Hardpoint.TURRET) > (ship.getModifiedItemAttr("turretSlotsLeft") or 0):
+        return False
+    if fit.getHardpointsUsed(Hardpoint.MISSILE) > (ship.getModifiedItemAttr("launcherSlotsLeft") or 0):
+        return False
+    if requireCapStable and not fit.capStable:
+        return False
+
+    return True
+
+
+def getResources(fit):
+    ship = fit.ship
+    return {
+        "cpuOutput": ship.getModifiedItemAttr("cpuOutput") or 0,
+        "powerOutput": ship.getModifiedItemAttr("powerOutput") or 0,
+        "upgradeCapacity": ship.getModifiedItemAttr("upgradeCapacity") or 0,
+        "turrets": int(ship.getModifiedItemAttr("turretSlotsLeft") or 0),
+        "launchers": int(ship.getModifiedItemAttr("launcherSlotsLeft") or 0),
+        "slots": dict((slot, fit.getSlotsFree(slot)) for slot in searchSlots),
+    }
+
+
+def describeHull():
+    fit = buildFit(())
+    info = getResources(fit)
+    info["score"] = objective(fit)
+    return info
+
+
+def profileModule(itemID):
+    """Fit module alone onto the hull, None if it can't be fitted at all"""
+    mod = makeModule(itemID)
+    if mod is None or mod.slot not in searchSlots:
+        return None
+    charge = getBestCharge(mod)
+    chargeID = charge.ID if charge is not None else None
+
+    fit = buildFit(((itemID, chargeID),))
+    if fit is None:
+        return None
+    mod = fit.modules[-1]
+    info = getResources(fit)
+    info.update({
+        "itemID": itemID,
+        "chargeID": chargeID,
+        "slot": mod.slot,
+        "hardpoint": mod.hardpoint,
+        "groupID": mod.item.groupID,
+        "maxGroupFitted": mod.getModifiedItemAttr("maxGroupFitted"),
+        "cpu": mod.getModifiedItemAttr("cpu") or 0,
+        "power": mod.getModifiedItemAttr("power") or 0,
+        "upgradeCost": mod.getModifiedItemAttr("upgradeCost") or 0,
+        "score": objective(fit),
+    })
+    return info
+
+
+def evaluateModules(modules):
+    """Score and feasibility of fit with given (itemID, chargeID) modules"""
+    try:
+        fit = buildFit(modules)
+        if fit is None:
+            return None, False
+        return objective(fit), isFeasible(fit)
+    except Exception:
+        logger.debug("Failed to evaluate %r", modules, exc_info=True)
+        return None, False
+
+
+class Search(object):
+    """Branch-and-bound over slot assignments, see module docstring"""
+
+    def __init__(self, hull, candidates, gains):
+        self.hull = hull
+        self.candidates = candidates
+        self.gains = gains
+        self.bestScore = None
+        # Positions to fill, with candidates for each of them ordered by gain
+        self.positions = []
+        self.options = {}
+        for slot in searchSlots:
+            options = [c for c in xrange(len(candidates)) if candidates[c]["slot"] == slot and gains[c] > 0]
+            options.sort(key=lambda c: -gains[c])
+            self.options[slot] = options
+            self.positions.extend((slot,) * max(0, hull["slots"][slot]))
+
+        # What the remaining positions can add at most, to gain and to outputs
+        count = len(self.positions)
+        self.gainLeft = [0] * (count + 1)
+        self.cpuLeft = [0] * (count + 1)
+        self.powerLeft = [0] * (count + 1)
+        for p in xrange(count - 1, -1, -1):
+            options = self.options[self.positions[p]]
+            self.gainLeft[p] = self.gainLeft[p + 1] + max([gains[c] for c in options] or [0])
+            self.cpuLeft[p] = self.cpuLeft[p + 1] + max([self.getOutputDelta(c, "cpuOutput") for c in options] or [0])
+            self.powerLeft[p] = self.powerLeft[p + 1] + max(
+                [self.getOutputDelta(c, "powerOutput") for c in options] or [0])
+
+    def getOutputDelta(self, c, key):
+        return max(0, self.candidates[c][key] - self.hull[key])
+
+    def iterAssignments(self):
+        """Complete assignments which may beat the best solution, as candidate index lists"""
+        state = {
+            "cpu": 0, "power": 0, "upgradeCost": 0, "cpuOutput": self.hull["cpuOutput"],
+            "powerOutput": self.hull["powerOutput"], "turrets": 0, "launchers": 0, "groups": {},
+        }
+        return self.__iterBranch(0, [], 0, state)
+
+    def __iterBranch(self, p, chosen, gain, state):
+        if self.bestScore is not None and self.hull["score"] + gain + self.gainLeft[p] <= self.bestScore:
+            return
+        if p == len(self.positions):
+            yield list(chosen)
+            return
+
+        slot = self.positions[p]
+        options = self.options[slot]
+        # Assignments are multisets per slot type, positions of the same type
+        # take candidates in non-increasing order of gain
+        start = 0
+        if p > 0 and self.positions[p - 1] == slot and chosen[-1] is not None:
+            start = options.index(chosen[-1])
+        elif p > 0 and self.positions[p - 1] == slot:
+            start = len(options)
+
+        for c in options[start:]:
+            if self.__take(c, p, state):
+                chosen.append(c)
+                for assignment in self.__iterBranch(p + 1, chosen, gain + self.gains[c], state):
+                    yield assignment
+                chosen.pop()
+                self.__release(c, state)
+
+        chosen.append(None)
+        for assignment in self.__iterBranch(p + 1, chosen, gain, state):
+            yield assignment
+        chosen.pop()
+
+    def __take(self, c, p, state):
+        candidate = self.candidates[c]
+        groups = state["groups"]
+        maxGroupFitted = candidate["maxGroupFitted"]
+        if maxGroupFitted and groups.get(candidate["groupID"], 0) >= maxGroupFitted:
+            return False
+        if candidate["hardpoint"] == Hardpoint.TURRET and state["turrets"] >= self.hull["turrets"]:
+            return False
+        if candidate["hardpoint"] == Hardpoint.MISSILE and state["launchers"] >= self.hull["launchers"]:
+            return False
+        if state["upgradeCost"] + candidate["upgradeCost"] > self.hull["upgradeCapacity"] + epsilon:
+            return False
+        cpuOutput = state["cpuOutput"] + self.getOutputDelta(c, "cpuOutput")
+        if state["cpu"] + candidate["cpu"] > cpuOutput + self.cpuLeft[p + 1] + epsilon:
+            return False
+        powerOutput = state["powerOutput"] + self.getOutputDelta(c, "powerOutput")
+        if state["power"] + candidate["power"] > powerOutput + self.powerLeft[p + 1] + epsilon:
+            return False
+
+        state["cpu"] += candidate["cpu"]
+        state["power"] += candidate["power"]
+        state["upgradeCost"] += candidate["upgradeCost"]
+        state["cpuOutput"] = cpuOutput
+        state["powerOutput"] = powerOutput
+        state["turrets"] += candidate["hardpoint"] == Hardpoint.TURRET
+        state["launchers"] += candidate["hardpoint"] == Hardpoint.MISSILE
+        groups[candidate["groupID"]] = groups.get(candidate["groupID"], 0) + 1
+        return True
+
+    def __release(self, c, state):
+        candidate = self.candidates[c]
+        state["cpu"] -= candidate["cpu"]
+        state["power"] -= candidate["power"]
+        state["upgradeCost"] -= candidate["upgradeCost"]
+        state["cpuOutput"] -= self.getOutputDelta(c, "cpuOutput")
+        state["powerOutput"] -= self.getOutputDelta(c, "powerOutput")
+        state["turrets"] -= candidate["hardpoint"] == Hardpoint.TURRET
+        state["launchers"] -= candidate["hardpoint"] == Hardpoint.MISSILE
+        state["groups"][candidate["groupID"]] -= 1
+
+
+def getGreedyAssignment(search):
+    """First assignment branch-and-bound finds, without any bound set"""
+    for assignment in search.iterAssignments():
+        return assignment
+    return [None] * len(search.positions)
+
+
+def getResults(pool, func, args, deadline):
+    """Results of func applied to args in pool, TimeoutError is raised past deadline"""
+    return pool.map_async(func, args).get(max(0, deadline - time.time()))
+
+
+def optimize(shipID, skills, candidateIDs, objectiveSpec, fixedIDs=(), capStable=False, timeBudget=60,
+             jobs=None, batchSize=None, callback=None):
+    """
+    Find the best modules for hull. Skills map skill IDs to levels, objective is
+    given as (name, params) pair, e.g. ("dps", {"distance": 20}). Callback is
+    called with (score, modules) of every improving solution, modules are
+    (itemID, chargeID) pairs. Returns the best solution found, or None. Solution
+    is not guaranteed to be the best possible, see module docstring. Raises
+    ValueError if some of fixedIDs aren't modules
+    """
+    checkFixedModules(fixedIDs)
+    deadline = time.time() + timeBudget
+    pool = multiprocessing.Pool(jobs, initWorker, (shipID, tuple(fixedIDs), skills, objectiveSpec, capStable))
+    batchSize = batchSize or 4 * (jobs or multiprocessing.cpu_count())
+    best = None
+    try:
+        hull = pool.apply_async(describeHull).get(max(0, deadline - time.time()))
+        candidates = [info for info in getResults(pool, profileModule, candidateIDs, deadline) if info is not None]
+        standalone = [info["score"] - hull["score"] for info in candidates]
+
+        search = Search(hull, candidates, standalone)
+        reference = getGreedyAssignment(search)
+
+        def toModules(assignment):
+            return tuple((candidates[c]["itemID"], candidates[c]["chargeID"])
+                         for c in assignment if c is not None)
+
+        # Gain of each candidate next to modules of reference fit, at the
+        # position of its slot type where reference has its weakest module
+        swapJobs = []
+        emptied = {}
+        swapped = []
+        for slot in searchSlots:
+            positions = [p for p in xrange(len(search.positions)) if search.positions[p] == slot]
+            if not positions:
+                continue
+            p = positions[-1]
+            emptied[slot] = len(swapJobs)
+            swapJobs.append(toModules(reference[:p] + [None] + reference[p + 1:]))
+            for c in xrange(len(candidates)):
+                if candidates[c]["slot"] == slot:
+                    swapped.append((c, slot, len(swapJobs)))
+                    swapJobs.append(toModules(reference[:p] + [c] + reference[p + 1:]))
+        results = getResults(pool, evaluateModules, [toModules(reference)] + swapJobs, deadline)
+        referenceResult, results = results[0], results[1:]
+
+        gains = list(standalone)
+        for c, slot, j in swapped:
+            score, emptyScore = results[j][0], results[emptied[slot]][0]
+            if score is not None and emptyScore is not None:
+                gains[c] = max(gains[c], score - emptyScore)
+
+        def report(score, assignment):
+            solution = (score, toModules(assignment))
+            search.bestScore = score
+            if callback is not None:
+                callback(*solution)
+            return solution
+
+        if referenceResult[1]:
+            best = report(referenceResult[0], reference)
+
+        search = Search(hull, candidates, gains)
+        if best is not None:
+            search.bestScore = best[0]
+        assignments = search.iterAssignments()
+        while time.time() < deadline:
+            batch = list(islice(assignments, batchSize))
+            if not batch:
+                break
+            results = getResults(pool, evaluateModules, map(toModules, batch), deadline)
+            for assignment, (score, feasible) in zip(batch, results):
+                if feasible and (best is None or score > best[0]):
+                    best = report(score, assignment)
+        else:
+            logger.debug("Optimizer ran out of time")
+
+        pool.close()
+    except multiprocessing.TimeoutError:
+        # Workers may be in the middle of calculating something, best solution so far is kept
+        logger.debug("Optimizer ran out of time")
+        pool.terminate()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    return best
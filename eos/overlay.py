@@ -0,0 +1,79 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+from sqlalchemy.ext.associationproxy import AssociationProxy
+from sqlalchemy.orm.attributes import QueryableAttribute
+
+# Class -> (overlay class, number of attributes of class when it was shadowed)
+overlayClasses = {}
+
+
+def getOverlayClass(cls):
+    """
+    Plain subclass of (possibly mapped) class. Instrumented attributes of the
+    class are shadowed by ordinary ones, so its instances are never seen by the
+    ORM: nothing set on them fires events or gets into database session
+    """
+    if "overlayBase" in vars(cls):
+        return cls
+
+    overlayCls, size = overlayClasses.get(cls, (None, None))
+    if overlayCls is None:
+        # Same name, contexts of effects are built from it
+        overlayCls = type(cls.__name__, (cls,), {"__module__": cls.__module__, "overlayBase": cls})
+    # Classes get mapped when they're first used, which adds instrumented
+    # attributes to them
+    if size != len(vars(cls)):
+        for klass in cls.__mro__:
+            for name, value in vars(klass).items():
+                if isinstance(value, (QueryableAttribute, AssociationProxy)) and name not in vars(overlayCls):
+                    setattr(overlayCls, name, None)
+        overlayClasses[cls] = (overlayCls, len(vars(cls)))
+    return overlayCls
+
+
+def copyItem(thing, **attrs):
+    """
+    Overlay copy of fit item (module, drone, fighter ability...), with given
+    attributes set. It shares its item and charge with the original, and gets
+    fresh modified attributes and stats from build()
+    """
+    cls = getOverlayClass(type(thing))
+    copy = cls.__new__(cls)
+    copy.__dict__.update((name, value) for name, value in vars(thing).iteritems() if name != "_sa_instance_state")
+    copy.__dict__.update(attrs)
+    copy.build()
+    return copy
+
+
+def newItem(cls, item, **attrs):
+    """
+    Overlay instance of cls (Module, Drone) holding item, set up the way its
+    constructor does it. Raises ValueError if item can't be held by cls
+    """
+    thing = cls.__new__(getOverlayClass(cls))
+    thing.__dict__["_%s__item" % cls.__name__] = item
+    thing.__dict__["_%s__charge" % cls.__name__] = None
+    thing.itemID = item.ID if item is not None else None
+    thing.projected = False
+    thing.__dict__.update(attrs)
+    if thing.isInvalid:
+        raise ValueError("Passed item is not a %s" % cls.__name__)
+    thing.build()
+    return thing
@@ -121,11 +121,8 @@ class Booster(HandledItem, ItemAttrShortcut):
             return
         if not self.active:
             return
-        for effect in self.item.effects.itervalues():
-            if effect.runTime == runTime and \
-                    (effect.isType("passive") or effect.isType("boosterSideEffect")) and \
-                    effect.activeByDefault:
-                effect.handler(fit, self, ("booster",))
+        for effect in self.item.getEffects(runTime, "passive") + self.item.getEffects(runTime, "boosterSideEffect"):
+            effect.handler(fit, self, ("booster",))
 
         # Legacy booster code, not fully implemented
         '''
@@ -49,6 +49,9 @@ class Character(object):
     __itemList = None
     __itemIDMap = None
     __itemNameMap = None
+    # Compiled skill profiles shared by character instances
+    # { characterID : (skillLevelsHash, { (runTime, isStructure) : [(skillID, targets), ...] }) }
+    __skillProfiles = {}
 
     @classmethod
     def getSkillList(cls):
@@ -112,6 +115,7 @@ class Character(object):
         self.defaultLevel = defaultLevel
         self.__skills = []
         self.__skillIdMap = {}
+        self.__skillProfile = None
         self.dirtySkills = set()
 
         if initSkills:
@@ -147,11 +151,13 @@ class Character(object):
         self.__skillIdMap = {}
         for skill in self.__skills:
             self.__skillIdMap[skill.itemID] = skill
+        self.__skillProfile = None
         self.dirtySkills = set()
 
     def apiUpdateCharSheet(self, skills):
         del self.__skills[:]
         self.__skillIdMap.clear()
+        self.invalidateSkillProfile()
         for skillRow in skills:
             self.addSkill(Skill(skillRow["typeID"], skillRow["level"]))
 
@@ -190,10 +196,12 @@ class Character(object):
 
         self.__skills.append(skill)
         self.__skillIdMap[skill.itemID] = skill
+        self.invalidateSkillProfile()
 
     def removeSkill(self, skill):
         self.__skills.remove(skill)
         del self.__skillIdMap[skill.itemID]
+        self.invalidateSkillProfile()
 
     def getSkill(self, item):
         if isinstance(item, basestring):
@@ -248,10 +256,67 @@ class Character(object):
             if filter(element):
                 element.boostItemAttr(*args, **kwargs)
 
+    def invalidateSkillProfile(self):
+        self.__skillProfile = None
+
+    def getSkillProfile(self, runTime, structure=False):
+        """
+        Get skills which have to be run at given runTime, as list of (skillID, targets)
+        pairs. Targets are names of fit element lists the skill can affect, or None if
+        it may affect anything. Skills at level 0 or without implemented effects are
+        left out. Effects disabled by default are compiled in as well, skills check
+        that when run. Profiles are shared by all instances of character with same levels
+        """
+        profile = self.__skillProfile
+        if profile is None:
+            levelsHash = hash(tuple((skill.itemID, skill.level) for skill in self.__skills))
+            charID = getattr(self, "ID", None)
+            cached = self.__skillProfiles.get(charID)
+            if cached is not None and cached[0] == levelsHash:
+                profile = cached[1]
+            else:
+                profile = {}
+                self.__skillProfiles[charID] = (levelsHash, profile)
+            self.__skillProfile = profile
+
+        key = (runTime, structure)
+        if key not in profile:
+            profile[key] = self.__compileSkillProfile(runTime, structure)
+
+        return profile[key]
+
+    def __compileSkillProfile(self, runTime, structure):
+        compiled = []
+        # Skills missing from database get removed when their item is fetched
+        for skill in list(self.__skills):
+            if not skill.level or skill.item is None:
+                continue
+
+            targets = set()
+            for effect in skill.item.getEffects(runTime, "passive", includeInactive=True):
+                if not structure or effect.isType("structure"):
+                    if effect.fitTargets is None:
+                        targets = None
+                        break
+                    targets.update(effect.fitTargets)
+
+            if targets is None:
+                compiled.append((skill.itemID, None))
+            elif targets:
+                compiled.append((skill.itemID, frozenset(targets)))
+
+        return compiled
+
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
         if forceProjected:
             return
-        for skill in self.skills:
+        for skillID, targets in self.getSkillProfile(runTime, fit.isStructure):
+            # Skip skills which can only affect things fit doesn't have
+            if targets is not None and not any(getattr(fit, target) for target in targets):
+                continue
+            skill = self.__skillIdMap.get(skillID)
+            if skill is None:
+                continue
             fit.register(skill)
             skill.calculateModifiedAttributes(fit, runTime)
 
@@ -341,6 +406,7 @@ class Skill(HandledItem):
 
         self.activeLevel = level
         self.character.dirtySkills.add(self)
+        self.character.invalidateSkillProfile()
 
         if self.activeLevel == self.__level and self in self.character.dirtySkills:
             self.character.dirtySkills.remove(self)
@@ -369,11 +435,8 @@ class Skill(HandledItem):
         if item is None:
             return
 
-        for effect in item.effects.itervalues():
-            if effect.runTime == runTime and \
-                    effect.isType("passive") and \
-                    (not fit.isStructure or effect.isType("structure")) and \
-                    effect.activeByDefault:
+        for effect in item.getEffects(runTime, "passive"):
+            if not fit.isStructure or effect.isType("structure"):
                 try:
                     effect.handler(fit, self, ("skill",))
                 except AttributeError:
@@ -18,6 +18,8 @@
 # ===============================================================================
 
 import re
+from collections import namedtuple
+
 from sqlalchemy.orm import mapper
 
 from eos.db.sqlAlchemy import sqlAlchemy
@@ -71,6 +73,20 @@ class DamagePattern(object):
 
         return amount / (specificDivider or 1)
 
+    def getDividers(self, resonances):
+        """
+        Same dividers effectivify() uses, for every layer at once. Resonances are
+        the ones returned by getResonances()
+        """
+        totalDamage = float(sum((self.emAmount, self.thermalAmount, self.kineticAmount, self.explosiveAmount)) or 1)
+        weights = [getattr(self, "%sAmount" % damageType) / totalDamage for damageType in self.DAMAGE_TYPES]
+
+        dividers = {}
+        for type, layerResonances in resonances.iteritems():
+            dividers[type] = sum(weight * resonance for weight, resonance in zip(weights, layerResonances)) or 1
+
+        return dividers
+
     importMap = {"em": "em",
                  "therm": "thermal",
                  "kin": "kinetic",
@@ -130,6 +146,54 @@ class DamagePattern(object):
         return p
 
 
+class TankStats(namedtuple("TankStats", ("pattern", "ehp", "effectiveTank", "effectiveSustainableTank"))):
+    """Tank of a fit against single damage pattern, see getTankMatrix()"""
+    __slots__ = ()
+
+
+def getResonances(fit):
+    """Damage resonances of ship's shield, armor and hull, in DamagePattern.DAMAGE_TYPES order"""
+    resonances = {}
+    for type in ("shield", "armor", "hull"):
+        prefix = type if type != "hull" else ""
+        layerResonances = []
+        for damageType in DamagePattern.DAMAGE_TYPES:
+            attrName = "%s%sDamageResonance" % (prefix, damageType.capitalize())
+            layerResonances.append(fit.ship.getModifiedItemAttr(attrName[0].lower() + attrName[1:]))
+        resonances[type] = layerResonances
+
+    return resonances
+
+
+def getTankMatrix(fit, patterns=None):
+    """
+    EHP, effective tank and effective sustainable tank of calculated fit against
+    each of the damage patterns (all stored ones by default), as list of TankStats.
+    Resonances and raw tank are read from the fit only once, not per pattern
+    """
+    if patterns is None:
+        patterns = getDamagePatternList()
+
+    resonances = getResonances(fit)
+    hp = fit.hp
+    tank = fit.tank
+    sustainableTank = fit.sustainableTank
+
+    def effectivify(tankInfo, dividers):
+        ehps = {"passiveShield": tank["passiveShield"] / dividers["shield"]}
+        for type in ("shield", "armor", "hull"):
+            ehps["%sRepair" % type] = tankInfo["%sRepair" % type] / dividers[type]
+        return ehps
+
+    matrix = []
+    for pattern in patterns:
+        dividers = pattern.getDividers(resonances)
+        ehp = dict((type, hp[type] / dividers[type]) for type in hp)
+        matrix.append(TankStats(pattern, ehp, effectivify(tank, dividers), effectivify(sustainableTank, dividers)))
+
+    return matrix
+
+
 def getDamagePatternList(eager=None):
     eager = processEager(eager)
     with sqlAlchemy.sd_lock:
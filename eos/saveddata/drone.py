@@ -67,8 +67,7 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
     def build(self):
         """ Build object. Assumes proper and valid item already set """
         self.__charge = None
-        self.__dps = None
-        self.__volley = None
+        self.__damage = None
         self.__miningyield = None
         self.__itemModifiedAttributes = ModifiedAttributeDict()
         self.__itemModifiedAttributes.original = self.__item.attributes
@@ -121,10 +120,15 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
     def dps(self):
         return self.damageStats()
 
-    def damageStats(self, targetResists=None):
-        if self.__dps is None:
-            self.__volley = 0
-            self.__dps = 0
+    @property
+    def damagePerType(self):
+        """
+        Volley of each damage type of all active drones before any resists are
+        applied, and cycle time (None if drones don't deal damage)
+        """
+        if self.__damage is None:
+            volleys = dict((d, 0) for d in self.DAMAGE_TYPES)
+            cycleTime = None
             if self.dealsDamage is True and self.amountActive > 0:
                 if self.hasAmmo:
                     attr = "missileLaunchDuration"
@@ -135,15 +139,21 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
 
                 cycleTime = self.getModifiedItemAttr(attr)
 
-                volley = sum(
-                    map(lambda d: (getter("%sDamage" % d) or 0) * (1 - getattr(targetResists, "%sAmount" % d, 0)),
-                        self.DAMAGE_TYPES))
-                volley *= self.amountActive
-                volley *= self.getModifiedItemAttr("damageMultiplier") or 1
-                self.__volley = volley
-                self.__dps = volley / (cycleTime / 1000.0)
+                multiplier = self.amountActive * (self.getModifiedItemAttr("damageMultiplier") or 1)
+                for d in self.DAMAGE_TYPES:
+                    volleys[d] = (getter("%sDamage" % d) or 0) * multiplier
+
+            self.__damage = volleys, cycleTime
+
+        return self.__damage
+
+    def damageStats(self, targetResists=None):
+        volleys, cycleTime = self.damagePerType
+        if cycleTime is None:
+            return 0, 0
 
-        return self.__dps, self.__volley
+        volley = sum(volleys[d] * (1 - getattr(targetResists, "%sAmount" % d, 0)) for d in volleys)
+        return volley / (cycleTime / 1000.0), volley
 
     @property
     def miningStats(self):
@@ -199,10 +209,12 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         else:
             return val
 
-    def clear(self):
-        self.__dps = None
-        self.__volley = None
+    def clearStats(self):
+        self.__damage = None
         self.__miningyield = None
+
+    def clear(self):
+        self.clearStats()
         self.itemModifiedAttributes.clear()
         self.chargeModifiedAttributes.clear()
 
@@ -232,24 +244,22 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
             context = ("drone",)
             projected = False
 
-        for effect in self.item.effects.itervalues():
-            if effect.runTime == runTime and \
-                    effect.activeByDefault and \
-                    ((projected is True and effect.isType("projected")) or
-                     projected is False and effect.isType("passive")):
-                # See GH issue #765
-                if effect.getattr('grouped'):
+        for effect in self.item.getEffects(runTime, "projected" if projected else "passive"):
+            # See GH issue #765
+            if effect.getattr('grouped'):
+                effect.handler(fit, self, context)
+            elif self.amountActive > 0:
+                # Active drones are identical, single run is recorded once per drone
+                multiplicity = ModifiedAttributeDict.multiplicity
+                ModifiedAttributeDict.multiplicity = multiplicity * self.amountActive
+                try:
                     effect.handler(fit, self, context)
-                else:
-                    i = 0
-                    while i != self.amountActive:
-                        effect.handler(fit, self, context)
-                        i += 1
+                finally:
+                    ModifiedAttributeDict.multiplicity = multiplicity
 
         if self.charge:
-            for effect in self.charge.effects.itervalues():
-                if effect.runTime == runTime and effect.activeByDefault:
-                    effect.handler(fit, self, ("droneCharge",))
+            for effect in self.charge.getEffects(runTime):
+                effect.handler(fit, self, ("droneCharge",))
 
     def __deepcopy__(self, memo):
         copy = Drone(self.item)
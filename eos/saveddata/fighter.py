@@ -73,8 +73,6 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
     def build(self):
         """ Build object. Assumes proper and valid item already set """
         self.__charge = None
-        self.__dps = None
-        self.__volley = None
         self.__miningyield = None
         self.__itemModifiedAttributes = ModifiedAttributeDict()
         self.__chargeModifiedAttributes = ModifiedAttributeDict()
@@ -154,38 +152,39 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         return self.damageStats()
 
     def damageStats(self, targetResists=None):
-        if self.__dps is None:
-            self.__volley = 0
-            self.__dps = 0
-            if self.active and self.amountActive > 0:
+        # Abilities keep their damage before resists, so this is cheap enough
+        # to be done for every profile asked for
+        totalDps = 0
+        totalVolley = 0
+        if self.active and self.amountActive > 0:
+            for ability in self.abilities:
+                dps, volley = ability.damageStats(targetResists)
+                totalDps += dps
+                totalVolley += volley
+
+            # For forward compatability this assumes a fighter
+            # can have more than 2 damaging abilities and/or
+            # multiple that use charges.
+            if self.owner.factorReload:
+                activeTimes = []
+                reloadTimes = []
+                constantDps = 0
                 for ability in self.abilities:
-                    dps, volley = ability.damageStats(targetResists)
-                    self.__dps += dps
-                    self.__volley += volley
-
-                # For forward compatability this assumes a fighter
-                # can have more than 2 damaging abilities and/or
-                # multiple that use charges.
-                if self.owner.factorReload:
-                    activeTimes = []
-                    reloadTimes = []
-                    constantDps = 0
-                    for ability in self.abilities:
-                        if not ability.active:
-                            continue
-                        if ability.numShots == 0:
-                            dps, volley = ability.damageStats(targetResists)
-                            constantDps += dps
-                            continue
-                        activeTimes.append(ability.numShots * ability.cycleTime)
-                        reloadTimes.append(ability.reloadTime)
-
-                    if len(activeTimes) > 0:
-                        shortestActive = sorted(activeTimes)[0]
-                        longestReload = sorted(reloadTimes, reverse=True)[0]
-                        self.__dps = max(constantDps, self.__dps * shortestActive / (shortestActive + longestReload))
-
-        return self.__dps, self.__volley
+                    if not ability.active:
+                        continue
+                    if ability.numShots == 0:
+                        dps, volley = ability.damageStats(targetResists)
+                        constantDps += dps
+                        continue
+                    activeTimes.append(ability.numShots * ability.cycleTime)
+                    reloadTimes.append(ability.reloadTime)
+
+                if len(activeTimes) > 0:
+                    shortestActive = sorted(activeTimes)[0]
+                    longestReload = sorted(reloadTimes, reverse=True)[0]
+                    totalDps = max(constantDps, totalDps * shortestActive / (shortestActive + longestReload))
+
+        return totalDps, totalVolley
 
     @property
     def maxRange(self):
@@ -226,13 +225,14 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         else:
             return val
 
-    def clear(self):
-        self.__dps = None
-        self.__volley = None
+    def clearStats(self):
         self.__miningyield = None
+        [x.clear() for x in self.abilities]
+
+    def clear(self):
+        self.clearStats()
         self.itemModifiedAttributes.clear()
         self.chargeModifiedAttributes.clear()
-        [x.clear() for x in self.abilities]
 
     def canBeApplied(self, projectedOnto):
         """Check if fighter can engage specific fitting"""
@@ -271,11 +271,14 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
                         ((projected and effect.isType("projected")) or not projected):
                     if ability.grouped:
                         effect.handler(fit, self, context)
-                    else:
-                        i = 0
-                        while i != self.amountActive:
+                    elif self.amountActive > 0:
+                        # Active fighters are identical, single run is recorded once per fighter
+                        multiplicity = ModifiedAttributeDict.multiplicity
+                        ModifiedAttributeDict.multiplicity = multiplicity * self.amountActive
+                        try:
                             effect.handler(fit, self, context)
-                            i += 1
+                        finally:
+                            ModifiedAttributeDict.multiplicity = multiplicity
 
     def __deepcopy__(self, memo):
         copy = Fighter(self.item)
@@ -68,7 +68,7 @@ class FighterAbility(object):
         self.build()
 
     def build(self):
-        pass
+        self.__damage = None
 
     @property
     def effect(self):
@@ -122,31 +122,39 @@ class FighterAbility(object):
 
         return speed
 
-    def damageStats(self, targetResists=None):
-        if self.__dps is None:
-            self.__volley = 0
-            self.__dps = 0
+    @property
+    def damagePerType(self):
+        """
+        Volley of each damage type of the whole squadron before any resists are
+        applied, and cycle time (None if ability doesn't deal damage)
+        """
+        if self.__damage is None:
+            volleys = dict((d, 0) for d in self.DAMAGE_TYPES)
+            cycleTime = None
             if self.dealsDamage and self.active:
                 cycleTime = self.cycleTime
+                multiplier = self.fighter.amountActive * (
+                    self.fighter.getModifiedItemAttr("{}DamageMultiplier".format(self.attrPrefix)) or 1)
+
+                for d2, d in zip(self.DAMAGE_TYPES2, self.DAMAGE_TYPES):
+                    if self.attrPrefix == "fighterAbilityLaunchBomb":
+                        # bomb calcs
+                        damage = self.fighter.getModifiedChargeAttr("%sDamage" % d)
+                    else:
+                        damage = self.fighter.getModifiedItemAttr("{}Damage{}".format(self.attrPrefix, d2))
+                    volleys[d] = (damage or 0) * multiplier
 
-                if self.attrPrefix == "fighterAbilityLaunchBomb":
-                    # bomb calcs
-                    volley = sum(map(lambda attr: (self.fighter.getModifiedChargeAttr("%sDamage" % attr) or 0) * (
-                        1 - getattr(targetResists, "%sAmount" % attr, 0)), self.DAMAGE_TYPES))
-                else:
-                    volley = sum(map(lambda d2, d:
-                                     (self.fighter.getModifiedItemAttr(
-                                         "{}Damage{}".format(self.attrPrefix, d2)) or 0) *
-                                     (1 - getattr(targetResists, "{}Amount".format(d), 0)),
-                                     self.DAMAGE_TYPES2, self.DAMAGE_TYPES))
+            self.__damage = volleys, cycleTime
 
-                volley *= self.fighter.amountActive
-                volley *= self.fighter.getModifiedItemAttr("{}DamageMultiplier".format(self.attrPrefix)) or 1
-                self.__volley += volley
-                self.__dps += volley / (cycleTime / 1000.0)
+        return self.__damage
+
+    def damageStats(self, targetResists=None):
+        volleys, cycleTime = self.damagePerType
+        if cycleTime is None:
+            return 0, 0
 
-        return self.__dps, self.__volley
+        volley = sum(volleys[d] * (1 - getattr(targetResists, "{}Amount".format(d), 0)) for d in volleys)
+        return volley / (cycleTime / 1000.0), volley
 
     def clear(self):
-        self.__dps = None
-        self.__volley = None
+        self.__damage = None
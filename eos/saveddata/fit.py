@@ -17,7 +17,6 @@
 # along with eos.  If not, see <http://www.gnu.org/licenses/>.
 # ===============================================================================
 
-import copy
 import logging
 import time
 from copy import deepcopy
@@ -43,6 +42,9 @@ from eos.effectHandlerHelpers import (
 )
 from eos.enum import Enum
 from eos.gamedata import getItem
+from eos.modifiedAttributeDict import ModifiedAttributeDict, CalculationTracker
+from eos.overlay import copyItem, getOverlayClass
+from eos.snapshot import FitSnapshot, ItemSnapshot, ItemView, emptyAttributes
 from eos.saveddata.citadel import Citadel as Citadel
 from eos.saveddata.module import Slot as Slot, Module as Module, State as State, Hardpoint as Hardpoint
 from eos.saveddata.ship import Ship as Ship
@@ -170,6 +172,10 @@ class Fit(object):
         self.__capUsed = None
         self.__capRecharge = None
         self.__calculatedTargets = []
+        self.__tracker = None
+        # Set once state of some items is recalculated, see recalculate()
+        self.__trackChanges = False
+        self.__afflictionsRecorded = False
         self.factorReload = False
         self.fleet = None
         self.boostsFits = set()
@@ -551,6 +557,26 @@ class Fit(object):
         else:
             return val
 
+    def clearStats(self):
+        """Reset cached stats of fit and its items, leaving modified attributes untouched"""
+        self.__effectiveTank = None
+        self.__weaponDPS = None
+        self.__minerYield = None
+        self.__weaponVolley = None
+        self.__effectiveSustainableTank = None
+        self.__sustainableTank = None
+        self.__droneDPS = None
+        self.__droneVolley = None
+        self.__droneYield = None
+        self.__ehp = None
+        self.__capStable = None
+        self.__capState = None
+        self.__capUsed = None
+        self.__capRecharge = None
+
+        for stuff in chain(self.modules, self.drones, self.fighters):
+            stuff.clearStats()
+
     def clear(self, projected=False):
         self.__effectiveTank = None
         self.__weaponDPS = None
@@ -567,6 +593,8 @@ class Fit(object):
         self.__capState = None
         self.__capUsed = None
         self.__capRecharge = None
+        self.__tracker = None
+        self.__afflictionsRecorded = False
         self.ecmProjectedStr = 1
         self.commandBonuses = {}
 
@@ -592,6 +620,11 @@ class Fit(object):
             if stuff is not None and stuff != self:
                 stuff.clear()
 
+        # Charges may have been changed since selector indices were built
+        for handledList in (self.modules, self.drones, self.fighters, self.boosters, self.implants,
+                            self.projectedDrones, self.projectedModules, self.projectedFighters):
+            handledList.resetIndex()
+
         # If this is the active fit that we are clearing, not a projected fit,
         # then this will run and clear the projected ships and flag the next
         # iteration to skip this part to prevent recursion.
@@ -622,6 +655,9 @@ class Fit(object):
         # (abs is old method, ccp now provides the aggregate function in their data)
         print("Add command bonus: ", warfareBuffID, " - value: ", value)
 
+        if self.__tracker is not None:
+            self.__tracker.disabled = True
+
         if warfareBuffID not in self.commandBonuses or abs(self.commandBonuses[warfareBuffID][0]) < abs(value):
             self.commandBonuses[warfareBuffID] = (runTime, value, module, effect)
 
@@ -666,23 +702,20 @@ class Fit(object):
         timer = Timer(u'Fit: {}, {}'.format(self.ID, self.name), logger)
         logger.debug("Starting fit calculation on: %r, withBoosters: %s", self, withBoosters)
 
-        shadow = False
+        views = None
         if targetFit and not withBoosters:
             logger.debug("Applying projections to target: %r", targetFit)
             projectionInfo = self.getProjectionInfo(targetFit.ID)
             logger.debug("ProjectionInfo: %s", projectionInfo)
             if self == targetFit:
-                copied = self  # original fit
-                shadow = True
-                # Don't inspect this, we genuinely want to reassign self
-                # noinspection PyMethodFirstArgAssignment
-                self = copy.deepcopy(self)
-                self.fleet = copied.fleet
-                logger.debug("Handling self projection - making shadow copy of fit. %r => %r", copied, self)
-                # we delete the fit because when we copy a fit, flush() is
-                # called to properly handle projection updates. However, we do
-                # not want to save this fit to the database, so simply remove it
-                db.saveddata_session.delete(self)
+                if not self.__calculated:
+                    # Self projection is applied as part of regular calculation
+                    self.calculateModifiedAttributes()
+                    return
+                # Project from read-only views of locally calculated items, so
+                # that projected effects don't see modifications they made
+                logger.debug("Handling self projection: %r", self)
+                views = dict((id(item), ItemView(item)) for item in chain(self.modules, self.drones, self.fighters))
 
         if self.commandFits and not withBoosters:
             print("Calculatate command fits and apply to fit")
@@ -736,26 +769,21 @@ class Fit(object):
             logger.debug("Fit has already been calculated and is not projected, returning: %r", self)
             return
 
+        tracker = None
+        states = None
+        if not self.__calculated:
+            # Record attribute dependencies of plain local calculations of fits
+            # whose items get toggled, so that next toggles are recalculated
+            # incrementally
+            if self.__trackChanges and targetFit is self and not withBoosters \
+                    and not self.projectedFits and not self.commandFits:
+                tracker = CalculationTracker()
+                states = [mod.state for mod in self.modules]
+            self.__tracker = tracker
+            self.__afflictionsRecorded = ModifiedAttributeDict.AFFLICTIONS
+
         for runTime in ("early", "normal", "late"):
-            # Items that are unrestricted. These items are run on the local fit
-            # first and then projected onto the target fit it one is designated
-            u = [
-                (self.character, self.ship),
-                self.drones,
-                self.fighters,
-                self.boosters,
-                self.appliedImplants,
-                self.modules
-            ] if not self.isStructure else [
-                # Ensure a restricted set for citadels
-                (self.character, self.ship),
-                self.fighters,
-                self.modules
-            ]
-
-            # Items that are restricted. These items are only run on the local
-            # fit. They are NOT projected onto the target fit. # See issue 354
-            r = [(self.mode,), self.projectedDrones, self.projectedFighters, self.projectedModules]
+            u, r = self.__calculationItems()
 
             # chain unrestricted and restricted into one iterable
             c = chain.from_iterable(u + r)
@@ -771,13 +799,20 @@ class Fit(object):
                     if not self.__calculated:
                         # apply effects locally if this is first time running them on fit
                         self.register(item)
-                        item.calculateModifiedAttributes(self, runTime, False)
-
-                    if projected is True and item not in chain.from_iterable(r):
-                        # apply effects onto target fit
-                        for _ in xrange(projectionInfo.amount):
-                            targetFit.register(item, origin=self)
-                            item.calculateModifiedAttributes(targetFit, runTime, True)
+                        if tracker is None:
+                            item.calculateModifiedAttributes(self, runTime, False)
+                        else:
+                            self.__calculateTracked(item, runTime, tracker)
+
+                    if projected is True and projectionInfo.amount > 0 and item not in chain.from_iterable(r):
+                        source = views.get(id(item), item) if views is not None else item
+                        # apply effects onto target fit, once for all projected copies
+                        targetFit.register(item, origin=self)
+                        ModifiedAttributeDict.multiplicity = projectionInfo.amount
+                        try:
+                            source.calculateModifiedAttributes(targetFit, runTime, True)
+                        finally:
+                            ModifiedAttributeDict.multiplicity = 1
 
                     if targetFit and withBoosters and item in self.modules:
                         # Apply the gang boosts to target fit
@@ -792,6 +827,10 @@ class Fit(object):
 
             timer.checkpoint('Done with runtime: %s' % runTime)
 
+        # Some effects change state of other modules, we can't follow that
+        if states is not None and states != [mod.state for mod in self.modules]:
+            tracker.disabled = True
+
         # Mark fit as calculated
         self.__calculated = True
 
@@ -803,9 +842,156 @@ class Fit(object):
 
         timer.checkpoint('Done with fit calculation')
 
-        if shadow:
-            logger.debug("Delete shadow fit object")
-            del self
+    def __calculationItems(self):
+        # Items that are unrestricted. These items are run on the local fit
+        # first and then projected onto the target fit it one is designated
+        u = [
+            (self.character, self.ship),
+            self.drones,
+            self.fighters,
+            self.boosters,
+            self.appliedImplants,
+            self.modules
+        ] if not self.isStructure else [
+            # Ensure a restricted set for citadels
+            (self.character, self.ship),
+            self.fighters,
+            self.modules
+        ]
+
+        # Items that are restricted. These items are only run on the local
+        # fit. They are NOT projected onto the target fit. # See issue 354
+        r = [(self.mode,), self.projectedDrones, self.projectedFighters, self.projectedModules]
+
+        return u, r
+
+    def __calculateTracked(self, item, runTime, tracker):
+        """Run effects of item on local fit, recording attributes they touch"""
+        ecmProjectedStr = self.ecmProjectedStr
+        tracker.source = item
+        ModifiedAttributeDict.tracker = tracker
+        try:
+            item.calculateModifiedAttributes(self, runTime, False)
+        finally:
+            ModifiedAttributeDict.tracker = None
+
+        if ecmProjectedStr != self.ecmProjectedStr:
+            tracker.markImpure()
+        tracker.source = None
+
+    def recalculate(self, changed=None):
+        """
+        Bring fit up to date after state of the changed items (modules, drones,
+        fighters, implants, boosters) was altered. When possible, only things
+        depending on those items are recalculated, otherwise the whole fit is
+        cleared and calculated again. Dependencies are recorded only from the
+        first such recalculation of fit on, plain calculations don't pay for it
+        """
+        tracker = self.__tracker
+        if changed and self.__calculated and tracker is not None and tracker.invalidate(changed):
+            logger.debug("Recalculating %d changed items on fit: %r", len(changed), self)
+            self.clearStats()
+            self.__afflictionsRecorded = self.__afflictionsRecorded and ModifiedAttributeDict.AFFLICTIONS
+            states = [mod.state for mod in self.modules]
+            u, r = self.__calculationItems()
+            for runTime in ("early", "normal", "late"):
+                for item in chain.from_iterable(u + r):
+                    if item is not None and tracker.prepare(item):
+                        self.register(item)
+                        self.__calculateTracked(item, runTime, tracker)
+
+            if states != [mod.state for mod in self.modules]:
+                tracker.disabled = True
+            if tracker.settle():
+                return
+            logger.debug("Fit cannot be recalculated incrementally, doing full calculation: %r", self)
+
+        if changed:
+            self.__trackChanges = True
+        self.clear()
+        self.calculateModifiedAttributes()
+
+    def calculateAfflictions(self):
+        """
+        Make sure 'Affected by' data is available on items of the fit. If fit was
+        calculated in lean mode (see ModifiedAttributeDict.AFFLICTIONS), it's
+        calculated once again with afflictions being recorded
+        """
+        if self.__calculated and self.__afflictionsRecorded:
+            return
+
+        logger.debug("Calculating afflictions on fit: %r", self)
+        afflictions = ModifiedAttributeDict.AFFLICTIONS
+        ModifiedAttributeDict.AFFLICTIONS = True
+        try:
+            self.clear()
+            self.calculateModifiedAttributes()
+        finally:
+            ModifiedAttributeDict.AFFLICTIONS = afflictions
+        self.freeze()
+
+    def freeze(self):
+        """
+        Materialise final attribute values of all items into flat read-only
+        mappings, which are used for reads until the fit is recalculated
+        """
+        c = chain(
+            (self.ship, self.mode),
+            self.modules,
+            self.drones,
+            self.fighters,
+            self.appliedImplants,
+            self.boosters,
+            self.projectedModules,
+            self.projectedDrones,
+            self.projectedFighters,
+        )
+        for thing in c:
+            if thing is None:
+                continue
+            thing.itemModifiedAttributes.freeze()
+            if getattr(thing, "charge", None) is not None:
+                thing.chargeModifiedAttributes.freeze()
+
+    def snapshot(self):
+        """Immutable copy of calculated state of the fit, safe to share with other threads"""
+        self.freeze()
+
+        def snap(thing, state=None, amount=1, amountActive=1):
+            charge = getattr(thing, "charge", None)
+            return ItemSnapshot(
+                thing.item.ID if thing.item is not None else None,
+                charge.ID if charge is not None else None,
+                state,
+                amount,
+                amountActive,
+                thing.itemModifiedAttributes.freeze(),
+                thing.chargeModifiedAttributes.freeze() if charge is not None else emptyAttributes,
+            )
+
+        def snapModules(modules):
+            return tuple(snap(mod, mod.state, 1, 1 if mod.state >= State.ACTIVE else 0) for mod in modules)
+
+        def snapDrones(drones):
+            return tuple(snap(drone, None, drone.amount, drone.amountActive) for drone in drones)
+
+        def snapFighters(fighters):
+            return tuple(snap(fighter, None, fighter.amount, fighter.amountActive if fighter.active else 0)
+                         for fighter in fighters)
+
+        return FitSnapshot(
+            self.ID,
+            self.name,
+            snap(self.ship) if self.ship is not None else None,
+            snapModules(self.modules),
+            snapDrones(self.drones),
+            snapFighters(self.fighters),
+            tuple(snap(implant, None, 1, int(implant.active)) for implant in self.appliedImplants),
+            tuple(snap(booster, None, 1, int(booster.active)) for booster in self.boosters),
+            snapModules(self.projectedModules),
+            snapDrones(self.projectedDrones),
+            snapFighters(self.projectedFighters),
+        )
 
     def fill(self):
         """
@@ -1071,26 +1257,31 @@ class Fit(object):
                 capUsed = self.capUsed
                 for attr in ("shieldRepair", "armorRepair", "hullRepair"):
                     sustainable[attr] = self.extraAttributes[attr]
-                    dict = self.extraAttributes.getAfflictions(attr)
-                    if self in dict:
-                        for mod, _, amount, used in dict[self]:
-                            if not used:
-                                continue
-                            if mod.projected is False:
-                                usesCap = True
-                                try:
-                                    if mod.capUse:
-                                        capUsed -= mod.capUse
-                                    else:
-                                        usesCap = False
-                                except AttributeError:
-                                    usesCap = False
-                                # Modules which do not use cap are not penalized based on cap use
-                                if usesCap:
-                                    cycleTime = mod.getModifiedItemAttr("duration")
-                                    amount = mod.getModifiedItemAttr(groupAttrMap[mod.item.group.name])
-                                    sustainable[attr] -= amount / (cycleTime / 1000.0)
-                                    repairers.append(mod)
+
+                # Local repairers are looked up on the modules themselves rather
+                # than in 'Affected by' data, which isn't there in lean mode
+                for mod in self.modules:
+                    if mod.isEmpty or mod.projected or mod.state < State.ACTIVE:
+                        continue
+                    groupName = mod.item.group.name
+                    if groupName not in groupStoreMap or groupName.startswith("Remote"):
+                        continue
+                    amount = mod.getModifiedItemAttr(groupAttrMap[groupName])
+                    if not amount:
+                        continue
+                    usesCap = True
+                    try:
+                        if mod.capUse:
+                            capUsed -= mod.capUse
+                        else:
+                            usesCap = False
+                    except AttributeError:
+                        usesCap = False
+                    # Modules which do not use cap are not penalized based on cap use
+                    if usesCap:
+                        cycleTime = mod.getModifiedItemAttr("duration")
+                        sustainable[groupStoreMap[groupName]] -= amount / (cycleTime / 1000.0)
+                        repairers.append(mod)
 
                 # Sort repairers by efficiency. We want to use the most efficient repairers first
                 repairers.sort(key=lambda mod: mod.getModifiedItemAttr(
@@ -1129,18 +1320,30 @@ class Fit(object):
         rechargeRate = self.ship.getModifiedItemAttr("shieldRechargeRate") / 1000.0
         return 10 / rechargeRate * sqrt(percent) * (1 - sqrt(percent)) * capacity
 
-    def addDrain(self, src, cycleTime, capNeed, clipSize=0):
-        """ Used for both cap drains and cap fills (fills have negative capNeed) """
-
-        energyNeutralizerSignatureResolution = src.getModifiedItemAttr("energyNeutralizerSignatureResolution")
+    def getIncomingDrain(self, cycleTime, capNeed, clipSize=0, signatureResolution=None):
+        """ Drain as it affects this fit, with signature reduction and energy warfare resistance applied """
         signatureRadius = self.ship.getModifiedItemAttr("signatureRadius")
 
         # Signature reduction, uses the bomb formula as per CCP Larrikin
-        if energyNeutralizerSignatureResolution:
-            capNeed = capNeed * min(1, signatureRadius / energyNeutralizerSignatureResolution)
+        if signatureResolution:
+            capNeed = capNeed * min(1, signatureRadius / signatureResolution)
 
         resistance = self.ship.getModifiedItemAttr("energyWarfareResistance") or 1 if capNeed > 0 else 1
-        self.__extraDrains.append((cycleTime, capNeed * resistance, clipSize))
+        return cycleTime, capNeed * resistance, clipSize
+
+    def addDrain(self, src, cycleTime, capNeed, clipSize=0):
+        """ Used for both cap drains and cap fills (fills have negative capNeed) """
+        drain = self.getIncomingDrain(cycleTime, capNeed, clipSize,
+                                      src.getModifiedItemAttr("energyNeutralizerSignatureResolution"))
+        self.__extraDrains.extend((drain,) * ModifiedAttributeDict.multiplicity)
+
+        # Drains are not modified attributes, source has to be run each time
+        if self.__tracker is not None:
+            self.__tracker.markImpure()
+
+    def addJam(self, strModifier):
+        """ Used by ECM effects, strModifier is chance of single jammer failing to jam """
+        self.ecmProjectedStr *= strModifier ** ModifiedAttributeDict.multiplicity
 
     def removeDrain(self, i):
         del self.__extraDrains[i]
@@ -1181,19 +1384,38 @@ class Fit(object):
 
         return drains, capUsed, capAdded
 
+    def getCapSimulator(self, drains=None):
+        """Capacitor simulator set up with fit's modules and drains added with addDrain()"""
+        if drains is None:
+            drains = self.__generateDrain()[0]
+
+        sim = capSim.CapSimulator()
+        sim.init(drains)
+        sim.capacitorCapacity = self.ship.getModifiedItemAttr("capacitorCapacity")
+        sim.capacitorRecharge = self.ship.getModifiedItemAttr("rechargeRate")
+        sim.stagger = True
+        sim.scale = False
+        sim.analytical = True
+        sim.t_max = 6 * 60 * 60 * 1000
+        sim.reload = self.factorReload
+        return sim
+
+    def getNeutPoint(self, cycleTime, capNeed, signatureResolution=None, maxAmount=64):
+        """
+        Point for capSim.find_threshold() or capSim.sweep(), asking how many neutralizers
+        draining capNeed every cycleTime ms it takes to make calculated fit cap unstable
+        """
+        cycleTime, capNeed, clipSize = self.getIncomingDrain(cycleTime, capNeed, 0, signatureResolution)
+        # Incoming drains are staggered, as in __generateDrain()
+        return self.getCapSimulator(), (int(cycleTime), capNeed, clipSize, False), maxAmount
+
     def simulateCap(self):
         drains, self.__capUsed, self.__capRecharge = self.__generateDrain()
         self.__capRecharge += self.calculateCapRecharge()
         if len(drains) > 0:
-            sim = capSim.CapSimulator()
-            sim.init(drains)
-            sim.capacitorCapacity = self.ship.getModifiedItemAttr("capacitorCapacity")
-            sim.capacitorRecharge = self.ship.getModifiedItemAttr("rechargeRate")
-            sim.stagger = True
-            sim.scale = False
-            sim.t_max = 6 * 60 * 60 * 1000
-            sim.reload = self.factorReload
-            sim.run()
+            sim = self.getCapSimulator(drains)
+            # Most recalcs don't touch anything capacitor depends on
+            capSim.cache.run(sim)
 
             capState = (sim.cap_stable_low + sim.cap_stable_high) / (2 * sim.capacitorCapacity)
             self.__capStable = capState > 0
@@ -1301,6 +1523,34 @@ class Fit(object):
         self.__droneDPS = droneDPS
         self.__droneVolley = droneVolley
 
+    def getDpsAgainst(self, profiles):
+        """
+        Total DPS of the fit against each of the profiles (target resists or None for
+        no resists). Damage of modules and drones per damage type is summed once,
+        every profile only takes a dot product
+        """
+        for profile in profiles:
+            # Damage patterns hold raw damage, not resists
+            if profile is not None and not isinstance(profile, TargetResists):
+                raise TypeError("Need target resists or None as profile")
+
+        damage = dict((attr, 0) for attr in Module.DAMAGE_TYPES)
+        for item in chain(self.modules, self.drones):
+            volleys, cycleTime = item.damagePerType
+            if cycleTime is None:
+                continue
+            for attr, volley in volleys.iteritems():
+                damage[attr] += volley / (cycleTime / 1000.0)
+
+        totals = []
+        for profile in profiles:
+            dps = sum(damage[attr] * (1 - getattr(profile, "%sAmount" % attr, 0)) for attr in damage)
+            # Fighter DPS with reload factored in isn't linear in damage
+            dps += sum(fighter.damageStats(profile)[0] for fighter in self.fighters)
+            totals.append(dps)
+
+        return totals
+
     @property
     def fits(self):
         for mod in self.modules:
@@ -1344,6 +1594,60 @@ class Fit(object):
 
         return copy
 
+    def overlay(self, modules=None, addedModules=(), addedDrones=()):
+        """
+        Copy-on-write copy of fit for what-if calculations, with modules replaced
+        by modules ({position: module}) and added ones appended. Every item the
+        calculation writes to is copied into plain object the ORM never sees (see
+        eos.overlay), given modules and drones included, so calculating overlay
+        leaves this fit and database session alone. Character, damage profiles,
+        projected and command fits are shared
+        """
+        modules = modules or {}
+        overlay = Fit.__new__(getOverlayClass(Fit))
+        overlay.build()
+        overlay.ID = self.ID
+        overlay.name = self.name
+        overlay.factorReload = self.factorReload
+        overlay.implantLocation = ImplantLocation.FIT
+        overlay.__character = self.__character
+        overlay.__damagePattern = self.__damagePattern
+        overlay.__targetResists = self.__targetResists
+        overlay.__ship = type(self.ship)(self.ship.item, overlay)
+        overlay.__mode = self.ship.validateModeItem(self.mode.item) if self.mode is not None else None
+        overlay.extraAttributes = overlay.__ship.itemModifiedAttributes
+
+        # Fit projected onto (or boosting) itself is replaced by the overlay
+        overlay.projectedOnto = self.projectedOnto
+        overlay.boostedOnto = self.boostedOnto
+        overlay.__projectedFits = dict((fitID, overlay if fit is self else fit)
+                                       for fitID, fit in self.__projectedFits.items())
+        overlay.__commandFits = dict((fitID, overlay if fit is self else fit)
+                                     for fitID, fit in self.__commandFits.items())
+
+        replaced = [modules.get(position, mod) for position, mod in enumerate(self.modules)]
+        overlay.__modules = HandledModuleList(copyItem(mod, owner=overlay, position=position)
+                                              for position, mod in enumerate(chain(replaced, addedModules)))
+        overlay.__projectedModules = HandledProjectedModList(
+            copyItem(mod, owner=overlay) for mod in self.projectedModules)
+        overlay.__drones = HandledDroneCargoList(copyItem(drone) for drone in chain(self.drones, addedDrones))
+        overlay.__fighters = HandledDroneCargoList(self.__copyFighters(self.fighters))
+        overlay.__projectedDrones = HandledProjectedDroneList(copyItem(drone) for drone in self.projectedDrones)
+        overlay.__projectedFighters = HandledProjectedDroneList(self.__copyFighters(self.projectedFighters))
+        overlay.__implants = HandledImplantBoosterList(copyItem(implant) for implant in self.appliedImplants)
+        overlay.__boosters = HandledImplantBoosterList(copyItem(booster) for booster in self.boosters)
+        overlay.__cargo = HandledDroneCargoList()
+
+        return overlay
+
+    @staticmethod
+    def __copyFighters(fighters):
+        for fighter in fighters:
+            copy = copyItem(fighter)
+            # Abilities read attributes of their fighter
+            copy._Fighter__abilities = [copyItem(ability, fighter=copy) for ability in fighter.abilities]
+            yield copy
+
     def __repr__(self):
         return u"Fit(ID={}, ship={}, name={}) at {}".format(
             self.ID, self.ship.item.name, self.name, hex(id(self))
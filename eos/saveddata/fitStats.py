@@ -0,0 +1,191 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import hashlib
+import json
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+import config
+from eos.db.sqlAlchemy import sqlAlchemy
+from eos.db.saveddata.mapper import FitStats
+from eos.modifiedAttributeDict import ModifiedAttributeDict
+
+# Bump when set of stored stats or fingerprint layout changes
+statsVersion = 3
+# Number of entries kept in cache, least recently used ones are evicted first
+maxEntries = 5000
+
+# Cache has session of its own, committing it must not store pending changes
+# made to fits in the main session
+statsSession = None
+
+
+def getStats(fit):
+    """Stats of calculated fit, in form they're stored in cache"""
+    return {
+        "totalDPS": fit.totalDPS,
+        "totalVolley": fit.totalVolley,
+        "weaponDPS": fit.weaponDPS,
+        "droneDPS": fit.droneDPS,
+        "ehp": fit.ehp,
+        "effectiveTank": fit.effectiveTank,
+        "sustainableTank": fit.sustainableTank,
+        "capStable": fit.capStable,
+        "capState": fit.capState,
+        "maxSpeed": fit.maxSpeed,
+        "alignTime": fit.alignTime,
+    }
+
+
+def describeFit(fit, seen=()):
+    """Canonical description of everything stats of the fit depend on"""
+    # Fits may project onto each other (or themselves), describe each only once
+    if fit.ID in seen:
+        return fit.ID
+    seen = set(seen)
+    seen.add(fit.ID)
+
+    def describeModules(modules):
+        return sorted((mod.itemID, mod.charge.ID if mod.charge is not None else None, mod.state)
+                      for mod in modules if not mod.isEmpty)
+
+    def describeDrones(drones):
+        return sorted((drone.itemID, drone.amount, drone.amountActive) for drone in drones)
+
+    def describeFighters(fighters):
+        return sorted((fighter.itemID, fighter.active, fighter.amountActive,
+                       tuple(sorted((ability.effectID, ability.active) for ability in fighter.abilities)))
+                      for fighter in fighters)
+
+    def describeProfile(profile):
+        if profile is None:
+            return None
+        return profile.emAmount, profile.thermalAmount, profile.kineticAmount, profile.explosiveAmount
+
+    character = fit.character
+    projections = []
+    for projected in fit.projectedFits:
+        info = projected.getProjectionInfo(fit.ID)
+        projections.append((describeFit(projected, seen), info.amount, info.active))
+    commands = []
+    for command in fit.commandFits:
+        info = command.getCommandInfo(fit.ID)
+        commands.append((describeFit(command, seen), info.active))
+
+    return (
+        fit.ship.item.ID,
+        fit.mode.item.ID if fit.mode is not None else None,
+        describeModules(fit.modules),
+        describeDrones(fit.drones),
+        describeFighters(fit.fighters),
+        sorted(implant.itemID for implant in fit.appliedImplants if implant.active),
+        sorted(booster.itemID for booster in fit.boosters if booster.active),
+        tuple(sorted((skill.itemID, skill.level) for skill in character.skills)) if character is not None else None,
+        describeProfile(fit.damagePattern),
+        describeProfile(fit.targetResists),
+        fit.factorReload,
+        describeModules(fit.projectedModules),
+        describeDrones(fit.projectedDrones),
+        describeFighters(fit.projectedFighters),
+        sorted(projections),
+        sorted(commands),
+    )
+
+
+def getFitFingerprint(fit):
+    """
+    Fingerprint identifying stats of the fit, or None if they can't be cached
+    (with attribute overrides enabled, they depend on more than the fit itself)
+    """
+    if ModifiedAttributeDict.OVERRIDES or fit.ship is None:
+        return None
+
+    data = (statsVersion, config.gamedata_version, describeFit(fit))
+    return hashlib.sha1(repr(data)).hexdigest()
+
+
+def getStatsSession():
+    global statsSession
+    bind = sqlAlchemy.saveddata_session.get_bind()
+    if statsSession is None or statsSession.bind is not bind:
+        statsSession = sessionmaker(bind=bind, autoflush=False, expire_on_commit=False)()
+    return statsSession
+
+
+def getCachedStats(fingerprint):
+    with sqlAlchemy.sd_lock:
+        entry = getStatsSession().query(FitStats).get(fingerprint)
+        if entry is None:
+            return None
+        # Last use decides what gets evicted, it's stored with the next commit
+        entry.time = int(time.time())
+
+    return json.loads(entry.stats)
+
+
+def storeStats(fingerprint, stats):
+    with sqlAlchemy.sd_lock:
+        session = getStatsSession()
+        entry = session.query(FitStats).get(fingerprint)
+        if entry is None:
+            entry = FitStats(fingerprint=fingerprint)
+            session.add(entry)
+        entry.stats = json.dumps(stats)
+        entry.time = int(time.time())
+        session.flush()
+
+        overflow = session.query(FitStats).count() - maxEntries
+        if overflow > 0:
+            # Entries may share their time, evict exactly as many as there are too many
+            evicted = [row.fingerprint for row in session.query(FitStats.fingerprint)
+                       .filter(FitStats.fingerprint != fingerprint)
+                       .order_by(FitStats.time).limit(overflow)]
+            session.query(FitStats).filter(FitStats.fingerprint.in_(evicted)).delete(synchronize_session=False)
+        session.commit()
+
+
+def getFitStats(fit, calculate):
+    """
+    Get stats of the fit from cache. On miss, calculate(fit) is expected to bring
+    the fit up to date, and its stats are stored
+    """
+    fingerprint = getFitFingerprint(fit)
+    if fingerprint is not None:
+        stats = getCachedStats(fingerprint)
+        if stats is not None:
+            return stats
+
+    calculate(fit)
+    stats = getStats(fit)
+    # Calculation may normalise the fit (e.g. fix invalid module states)
+    fingerprint = getFitFingerprint(fit)
+    if fingerprint is not None:
+        storeStats(fingerprint, stats)
+
+    return stats
+
+
+def clearFitStats():
+    with sqlAlchemy.sd_lock:
+        session = getStatsSession()
+        deleted_rows = session.query(FitStats).delete()
+        session.commit()
+    return deleted_rows
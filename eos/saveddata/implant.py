@@ -99,9 +99,8 @@ class Implant(HandledItem, ItemAttrShortcut):
             return
         if not self.active:
             return
-        for effect in self.item.effects.itervalues():
-            if effect.runTime == runTime and effect.isType("passive") and effect.activeByDefault:
-                effect.handler(fit, self, ("implant",))
+        for effect in self.item.getEffects(runTime, "passive"):
+            effect.handler(fit, self, ("implant",))
 
     @validates("fitID", "itemID", "active")
     def validator(self, key, val):
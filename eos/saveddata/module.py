@@ -112,9 +112,8 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, l
         if self.__charge and self.__charge.category.name != "Charge":
             self.__charge = None
 
-        self.__dps = None
+        self.__damage = None
         self.__miningyield = None
-        self.__volley = None
         self.__reloadTime = None
         self.__reloadForce = None
         self.__chargeCycles = None
@@ -315,10 +314,15 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, l
 
         self.__itemModifiedAttributes.clear()
 
-    def damageStats(self, targetResists):
-        if self.__dps is None:
-            self.__dps = 0
-            self.__volley = 0
+    @property
+    def damagePerType(self):
+        """
+        Volley of each damage type before any resists are applied, and cycle time
+        (None if module doesn't deal damage)
+        """
+        if self.__damage is None:
+            volleys = dict((attr, 0) for attr in self.DAMAGE_TYPES)
+            cycleTime = None
 
             if not self.isEmpty and self.state >= State.ACTIVE:
                 if self.charge:
@@ -326,16 +330,23 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, l
                 else:
                     func = self.getModifiedItemAttr
 
-                volley = sum(map(
-                    lambda attr: (func("%sDamage" % attr) or 0) * (1 - getattr(targetResists, "%sAmount" % attr, 0)),
-                    self.DAMAGE_TYPES))
-                volley *= self.getModifiedItemAttr("damageMultiplier") or 1
-                if volley:
+                multiplier = self.getModifiedItemAttr("damageMultiplier") or 1
+                for attr in self.DAMAGE_TYPES:
+                    volleys[attr] = (func("%sDamage" % attr) or 0) * multiplier
+                if any(volleys.itervalues()):
                     cycleTime = self.cycleTime
-                    self.__volley = volley
-                    self.__dps = volley / (cycleTime / 1000.0)
 
-        return self.__dps, self.__volley
+            self.__damage = volleys, cycleTime
+
+        return self.__damage
+
+    def damageStats(self, targetResists):
+        volleys, cycleTime = self.damagePerType
+        if cycleTime is None:
+            return 0, 0
+
+        volley = sum(volleys[attr] * (1 - getattr(targetResists, "%sAmount" % attr, 0)) for attr in volleys)
+        return volley / (cycleTime / 1000.0), volley
 
     @property
     def miningStats(self):
@@ -590,13 +601,15 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, l
         else:
             return val
 
-    def clear(self):
-        self.__dps = None
+    def clearStats(self):
+        self.__damage = None
         self.__miningyield = None
-        self.__volley = None
+        self.__chargeCycles = None
+
+    def clear(self):
+        self.clearStats()
         self.__reloadTime = None
         self.__reloadForce = None
-        self.__chargeCycles = None
         self.itemModifiedAttributes.clear()
         self.chargeModifiedAttributes.clear()
 
@@ -623,12 +636,8 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, l
         if self.charge is not None:
             # fix for #82 and it's regression #106
             if not projected or (self.projected and not forceProjected) or gang:
-                for effect in self.charge.effects.itervalues():
-                    if effect.runTime == runTime and effect.activeByDefault and \
-                            (effect.isType("offline") or
-                             (effect.isType("passive") and self.state >= State.ONLINE) or
-                             (effect.isType("active") and self.state >= State.ACTIVE)) and \
-                            (not gang or (gang and effect.isType("gang"))):
+                for effect in self.__getStateEffects(self.charge, runTime):
+                    if not gang or effect.isType("gang"):
 
                         chargeContext = ("moduleCharge",)
                         # For gang effects, we pass in the effect itself as an argument. However, to avoid going through
@@ -640,25 +649,25 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut, l
                             effect.handler(fit, self, chargeContext)
 
         if self.item:
-            if self.state >= State.OVERHEATED:
-                for effect in self.item.effects.itervalues():
-                    if effect.runTime == runTime and \
-                            effect.isType("overheat") \
-                            and not forceProjected \
-                            and effect.activeByDefault \
-                            and ((gang and effect.isType("gang")) or not gang):
+            if self.state >= State.OVERHEATED and not forceProjected:
+                for effect in self.item.getEffects(runTime, "overheat"):
+                    if not gang or effect.isType("gang"):
                         effect.handler(fit, self, context)
 
-            for effect in self.item.effects.itervalues():
-                if effect.runTime == runTime and \
-                        effect.activeByDefault and \
-                        (effect.isType("offline") or
-                         (effect.isType("passive") and self.state >= State.ONLINE) or
-                         (effect.isType("active") and self.state >= State.ACTIVE)) \
-                        and ((projected and effect.isType("projected")) or not projected) \
-                        and ((gang and effect.isType("gang")) or not gang):
+            for effect in self.__getStateEffects(self.item, runTime):
+                if (not projected or effect.isType("projected")) and \
+                        (not gang or effect.isType("gang")):
                     effect.handler(fit, self, context)
 
+    def __getStateEffects(self, item, runTime):
+        """Effects of item which can run in current state of the module"""
+        effects = item.getEffects(runTime, "offline")
+        if self.state >= State.ONLINE:
+            effects += item.getEffects(runTime, "passive")
+        if self.state >= State.ACTIVE:
+            effects += item.getEffects(runTime, "active")
+        return effects
+
     @property
     def cycleTime(self):
         reactivation = (self.getModifiedItemAttr("moduleReactivationDelay") or 0)
@@ -109,11 +109,8 @@ class Skill(HandledItem):
         if item is None:
             return
 
-        for effect in item.effects.itervalues():
-            if effect.runTime == runTime and \
-                    effect.isType("passive") and \
-                    (not fit.isStructure or effect.isType("structure")) and \
-                    effect.activeByDefault:
+        for effect in item.getEffects(runTime, "passive"):
+            if not fit.isStructure or effect.isType("structure"):
                 try:
                     effect.handler(fit, self, ("skill",))
                 except AttributeError:
@@ -0,0 +1,84 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+from collections import namedtuple
+
+from eos.modifiedAttributeDict import FrozenAttributes
+
+emptyAttributes = FrozenAttributes()
+
+
+class ItemSnapshot(namedtuple("ItemSnapshot", ("itemID", "chargeID", "state", "amount", "amountActive",
+                                               "itemAttributes", "chargeAttributes"))):
+    """Immutable calculated state of single fit element (ship, module, drone...)"""
+    __slots__ = ()
+
+    def getModifiedItemAttr(self, key):
+        return self.itemAttributes.get(key)
+
+    def getModifiedChargeAttr(self, key):
+        return self.chargeAttributes.get(key)
+
+
+class FitSnapshot(namedtuple("FitSnapshot", ("fitID", "name", "ship", "modules", "drones", "fighters", "implants",
+                                             "boosters", "projectedModules", "projectedDrones",
+                                             "projectedFighters"))):
+    """
+    Immutable calculated state of whole fit, see Fit.snapshot(). Nothing in it is
+    ever changed, so it can be handed over to other threads
+    """
+    __slots__ = ()
+
+    def iterItems(self):
+        if self.ship is not None:
+            yield self.ship
+        for items in self[3:]:
+            for item in items:
+                yield item
+
+
+class ItemView(object):
+    """
+    Read-only view of fit item (module, drone, fighter), which answers attribute
+    reads with values the item had when the view was made, and passes everything
+    else to the item itself. Fit uses it to project onto itself, effects don't see
+    projected modifications of their own source that way
+    """
+    __slots__ = ("__source", "itemModifiedAttributes", "chargeModifiedAttributes")
+
+    def __init__(self, source):
+        self.__source = source
+        self.itemModifiedAttributes = source.itemModifiedAttributes.freeze()
+        if getattr(source, "charge", None) is not None:
+            self.chargeModifiedAttributes = source.chargeModifiedAttributes.freeze()
+        else:
+            self.chargeModifiedAttributes = emptyAttributes
+
+    def __getattr__(self, name):
+        return getattr(self.__source, name)
+
+    def getModifiedItemAttr(self, key):
+        return self.itemModifiedAttributes.get(key)
+
+    def getModifiedChargeAttr(self, key):
+        return self.chargeModifiedAttributes.get(key)
+
+    def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
+        # Run item's own calculation code, but with view passed to effects
+        self.__source.calculateModifiedAttributes.__func__(self, fit, runTime, forceProjected)
@@ -0,0 +1,176 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Vectorized calculation of attribute values for many variants of one base fit
+(e.g. all meta levels of a module, all ammo types). Effects are still run per
+variant, they only record modifications; values of requested attributes of all
+variants are then calculated at once, as array operations over
+items x attributes x variants arrays. Calculation follows the same stages and
+capping rules as ModifiedAttributeDict does, crossCheck() compares the two.
+
+NumPy is optional, enabled tells if it's available.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from eos.modifiedAttributeDict import penaltyCoefficients
+
+enabled = numpy is not None
+
+
+def getAttributeDicts(fit):
+    """
+    Modified attribute dicts of fit's ship, modules with their charges, drones and
+    fighters, in order of their position in the fit
+    """
+    attrDicts = [fit.ship.itemModifiedAttributes]
+    for mod in fit.modules:
+        attrDicts.append(mod.itemModifiedAttributes)
+        attrDicts.append(mod.chargeModifiedAttributes)
+    for drone in fit.drones:
+        attrDicts.append(drone.itemModifiedAttributes)
+        attrDicts.append(drone.chargeModifiedAttributes)
+    for fighter in fit.fighters:
+        attrDicts.append(fighter.itemModifiedAttributes)
+        attrDicts.append(fighter.chargeModifiedAttributes)
+
+    return attrDicts
+
+
+def collectStages(variants, keys):
+    """
+    Gather modifications of given attributes from all variants, which are
+    sequences of modified attribute dicts, same item at the same position
+    """
+    nItems = len(variants[0]) if variants else 0
+    shape = (nItems, len(keys), len(variants))
+    base = numpy.full(shape, numpy.nan)
+    forced = numpy.full(shape, numpy.nan)
+    preIncrease = numpy.zeros(shape)
+    multiplier = numpy.ones(shape)
+    postIncrease = numpy.zeros(shape)
+    cap = numpy.full(shape, numpy.inf)
+    # Cell index -> penalty groups, most cells don't have any
+    penalized = {}
+
+    for v, attrDicts in enumerate(variants):
+        if len(attrDicts) != nItems:
+            raise ValueError("All variants have to consist of the same items")
+        for i, attrDict in enumerate(attrDicts):
+            for k, key in enumerate(keys):
+                stages = attrDict.getStages(key)
+                cell = (i, k, v)
+                if stages[0] is not None:
+                    base[cell] = stages[0]
+                if stages[1] is not None:
+                    forced[cell] = stages[1]
+                preIncrease[cell] = stages[2]
+                multiplier[cell] = stages[3]
+                if stages[4]:
+                    penalized[cell] = stages[4]
+                postIncrease[cell] = stages[5]
+                if stages[6] is not None:
+                    cap[cell] = stages[6]
+
+    multiplier *= getPenalizedFactors(shape, penalized)
+    return base, forced, preIncrease, multiplier, postIncrease, cap
+
+
+def getPenalizedFactors(shape, penalized):
+    """Combined factor of all stacking penalized multipliers for every cell"""
+    factors = numpy.ones(shape)
+    if not penalized:
+        return factors
+
+    cells = list(penalized)
+    groups = [penalized[cell] for cell in cells]
+    maxGroups = max(len(cellGroups) for cellGroups in groups)
+    maxLength = max(max(len(bonuses), len(penalties)) for cellGroups in groups for bonuses, penalties in cellGroups)
+    # Padding multipliers of 1 don't change anything
+    bonuses = numpy.ones((len(cells), maxGroups, maxLength))
+    penalties = numpy.ones((len(cells), maxGroups, maxLength))
+    for c, cellGroups in enumerate(groups):
+        for g, (groupBonuses, groupPenalties) in enumerate(cellGroups):
+            bonuses[c, g, :len(groupBonuses)] = groupBonuses
+            penalties[c, g, :len(groupPenalties)] = groupPenalties
+
+    # The most significant bonuses and penalties take the smallest penalty,
+    # multipliers beyond coefficient table aren't applied
+    bonuses = -numpy.sort(-bonuses, axis=2)[:, :, :len(penaltyCoefficients)]
+    penalties = numpy.sort(penalties, axis=2)[:, :, :len(penaltyCoefficients)]
+    coefficients = numpy.array(penaltyCoefficients[:bonuses.shape[2]])
+    cellFactors = numpy.prod(1 + (bonuses - 1) * coefficients, axis=(1, 2))
+    cellFactors *= numpy.prod(1 + (penalties - 1) * coefficients, axis=(1, 2))
+
+    factors[tuple(numpy.array(cells).T)] = cellFactors
+    return factors
+
+
+def evaluate(variants, keys):
+    """
+    Calculate values of given attributes for all variants. Returns array of
+    items x attributes x variants, attributes items don't have are NaN
+    """
+    if not enabled:
+        raise ImportError("NumPy is required for vectorized attribute calculation")
+
+    base, forced, preIncrease, multiplier, postIncrease, cap = collectStages(variants, keys)
+    # preIncrease > multiplier > stacking penalized multipliers > postIncrease
+    values = (base + preIncrease) * multiplier + postIncrease
+    values = numpy.where(numpy.isnan(forced), values, forced)
+    # NaN of missing attributes has to survive capping
+    with numpy.errstate(invalid="ignore"):
+        return numpy.where(values > cap, cap, values)
+
+
+def evaluateFits(fits, keys):
+    """
+    Calculate values of given attributes for fits, which are variants of the same
+    base fit. Effects of the fits have to be run already (calculateModifiedAttributes),
+    values themselves are calculated lazily, so only those effects read are
+    calculated the regular way
+    """
+    return evaluate([getAttributeDicts(fit) for fit in fits], keys)
+
+
+def crossCheck(variants, keys, values=None, tolerance=1e-9):
+    """
+    Compare vectorized calculation with regular one, returns list of mismatches
+    as (item, attribute, variant, vectorized value, regular value) tuples
+    """
+    if values is None:
+        values = evaluate(variants, keys)
+
+    mismatches = []
+    for v, attrDicts in enumerate(variants):
+        for i, attrDict in enumerate(attrDicts):
+            for k, key in enumerate(keys):
+                expected = attrDict[key] if attrDict.original is not None else None
+                value = values[i, k, v]
+                if expected is None:
+                    if not numpy.isnan(value):
+                        mismatches.append((i, key, v, value, expected))
+                elif not abs(value - expected) <= tolerance * max(1, abs(expected)):
+                    mismatches.append((i, key, v, value, expected))
+
+    return mismatches
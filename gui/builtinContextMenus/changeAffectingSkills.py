@@ -21,6 +21,7 @@ class ChangeAffectingSkills(ContextMenu):
         self.sChar = Character.getInstance()
         self.sFit = Fit.getInstance()
         fit = self.sFit.getFit(self.mainFrame.getActiveFit())
+        fit.calculateAfflictions()
 
         self.charID = fit.character.ID
 
@@ -0,0 +1,64 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+from eos.graph.fitDps import AmmoDpsGraph as AmmoDps
+from eos.saveddata.module import Hardpoint
+from gui.builtinGraphs.fitDps import FitDpsGraph
+from gui_service.fit import Fit
+
+
+class AmmoDpsGraph(FitDpsGraph):
+    """DPS of the first weapon type of fit with each charge it can use, one line per charge"""
+
+    def __init__(self):
+        FitDpsGraph.__init__(self)
+        self.name = "Ammo DPS"
+        # fitID -> (weapon, recalc count, charge matrix)
+        self.chargeMatrices = {}
+
+    def getSeries(self, fit, fields):
+        weapons = [mod for mod in fit.modules
+                   if not mod.isEmpty and mod.hardpoint in (Hardpoint.TURRET, Hardpoint.MISSILE)]
+        if not weapons:
+            return "No weapons in '%s'" % fit.name
+
+        weapon = weapons[0]
+        count = len([mod for mod in weapons if mod.item == weapon.item])
+        series = []
+        for chargeStats in self.getChargeMatrix(fit, weapon):
+            x, y = self.getGraphPoints(AmmoDps(chargeStats, count), fields)
+            if x is False:
+                return y
+            series.append(("%s: %s" % (fit.name, chargeStats.charge.name), x, y))
+
+        return series
+
+    def getChargeMatrix(self, fit, weapon):
+        """Charge matrix of weapon, calculated again only after the fit was recalculated"""
+        sFit = Fit.getInstance()
+        cached = self.chargeMatrices.get(fit.ID)
+        if cached is not None and cached[0] is weapon and cached[1] == sFit.getRecalcCount(fit.ID):
+            return cached[2]
+
+        chargeMatrix = sFit.getChargeMatrix(fit.ID, weapon)
+        self.chargeMatrices[fit.ID] = (weapon, sFit.getRecalcCount(fit.ID), chargeMatrix)
+        return chargeMatrix
+
+
+AmmoDpsGraph.register()
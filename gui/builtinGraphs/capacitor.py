@@ -0,0 +1,49 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+from eos.graph.capacitor import FitCapacitorGraph as FitCapacitor
+from gui.builtinGraphs.fitDps import FitDpsGraph
+from gui.graph import Graph
+
+
+class FitCapacitorGraph(Graph):
+    """Capacitor of fits over the time, with incoming neuts and other drains"""
+
+    propertyLabelMap = {"time": "Time (seconds)"}
+
+    defaults = FitCapacitor.defaults.copy()
+
+    def __init__(self):
+        Graph.__init__(self)
+        self.defaults["time"] = "0-300"
+        self.name = "Capacitor"
+
+    def getFields(self):
+        return self.defaults
+
+    def getLabels(self):
+        return self.propertyLabelMap
+
+    def getPoints(self, fit, fields):
+        # Fit may have been recalculated since the last draw, so the timeline
+        # is simulated again every time
+        return FitDpsGraph.getGraphPoints(FitCapacitor(fit), fields)
+
+
+FitCapacitorGraph.register()
@@ -67,6 +67,10 @@ class FitDpsGraph(Graph):
         if fitDps is None or fitDps.fit != fit:
             fitDps = self.fitDps = FitDps(fit)
 
+        return self.getGraphPoints(fitDps, fields)
+
+    @staticmethod
+    def getGraphPoints(fitDps, fields):
         fitDps.clearData()
         variable = None
         for fieldName, value in fields.iteritems():
@@ -83,6 +87,18 @@ class FitDpsGraph(Graph):
         if variable is None:
             return False, "No variable"
 
+        # Single range is sampled where the graph changes, not at fixed steps
+        points = fitDps.getAdaptivePoints(variable)
+        if points is not None:
+            return points
+
+        # Only stepped or multi-segment ranges get here, they're calculated in
+        # columns when the graph supports it
+        arrays = fitDps.getArrays()
+        if arrays is not None:
+            columns, values = arrays
+            return columns[variable].tolist(), values.tolist()
+
         x = []
         y = []
         for point, val in fitDps.getIterator():
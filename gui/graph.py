@@ -31,5 +31,17 @@ class Graph(object):
     def getFields(self, fit, fields):
         raise NotImplementedError()
 
+    def getSeries(self, fit, fields):
+        """
+        Lines to plot for fit, as list of (label, x values, y values) tuples, or
+        status message if they can't be plotted. Views plotting single line per
+        fit only implement getPoints()
+        """
+        x, y = self.getPoints(fit, fields)
+        if x is False:
+            return y
+
+        return [(fit.name, x, y)]
+
     def getIcons(self):
         return None
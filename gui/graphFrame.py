@@ -205,16 +205,15 @@ class GraphFrame(wx.Frame):
 
         for fit in self.fits:
             try:
-                success, status = view.getPoints(fit, values)
-                if not success:
+                series = view.getSeries(fit, values)
+                if isinstance(series, basestring):
                     # TODO: Add a pwetty statys bar to report errors with
-                    self.SetStatusText(status)
+                    self.SetStatusText(series)
                     return
 
-                x, y = success, status
-
-                self.subplot.plot(x, y)
-                legend.append(fit.name)
+                for label, x, y in series:
+                    self.subplot.plot(x, y)
+                    legend.append(label)
             except:
                 self.SetStatusText("Invalid values in '%s'" % fit.name)
                 self.canvas.draw()
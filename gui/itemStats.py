@@ -42,6 +42,7 @@ from eos.saveddata.ship import Ship as Ship
 from gui.bitmapLoader import BitmapLoader
 from gui.contextMenu import ContextMenu
 from gui.utils.numberFormatter import formatAmount
+from gui_service.fit import Fit as s_Fit
 from gui_service.market import Market
 from gui_service.attribute import Attribute
 
@@ -970,6 +971,7 @@ class ItemAffectedBy(wx.Panel):
     def PopulateTree(self):
         # sheri was here
         del self.treeItems[:]
+        s_Fit.getInstance().calculateAfflictions(self.activeFit)
         root = self.affectedBy.AddRoot("WINPWNZ0R")
         self.affectedBy.SetPyData(root, None)
 
@@ -20,28 +20,35 @@
 
 import copy
 import logging
+from itertools import chain
 
 from gui_service.character import Character
 from gui_service.fleet import Fleet
 from gui_service.market import Market
 from gui_service.settings import SettingsProvider
 
+from eos import capSim
+from eos.chargeMatrix import getChargeMatrix
 from eos.db.sqlAlchemy import sqlAlchemy
 from eos.db.saveddata import queries as eds_queries
 from eos.gamedata import getItem
+from eos.modifiedAttributeDict import ModifiedAttributeDict
+from eos.overlay import copyItem, newItem
 from eos.saveddata.booster import Booster as es_Booster
 from eos.saveddata.cargo import Cargo as es_Cargo
 from eos.saveddata.character import Character as saveddata_Character, getCharacter
 from eos.saveddata.citadel import Citadel as es_Citadel
-from eos.saveddata.damagePattern import DamagePattern as es_DamagePattern
+from eos.saveddata.damagePattern import DamagePattern as es_DamagePattern, getTankMatrix
 from eos.saveddata.drone import Drone as es_Drone
 from eos.saveddata.fighter import Fighter as es_Fighter
 from eos.saveddata.fit import Fit as es_Fit, getFit, getBoosterFits, getFitList, getFitsWithShip
 from eos.saveddata.fit import countAllFits, countFitsWithShip, searchFits
+from eos.saveddata.fitStats import getFitStats, getStats
 from eos.saveddata.implant import Implant as es_Implant
 from eos.saveddata.module import Module as es_Module
 from eos.saveddata.module import Slot as Slot, Module as Module, State as State
 from eos.saveddata.ship import Ship as es_Ship
+from eos.snapshot import ItemView
 from gui_service.damagePattern import DamagePattern as s_DamagePattern
 
 logger = logging.getLogger(__name__)
@@ -66,6 +73,13 @@ class Fit(object):
         self.character = saveddata_Character.getAll5()
         self.booster = False
         self.dirtyFitIDs = set()
+        # Number of times each fit was recalculated, lets views cache data
+        # derived from calculated attributes, see getRecalcCount()
+        self.recalcCounts = {}
+
+        # Fits are calculated lean, 'Affected by' data is recorded only when
+        # something asks for it, see calculateAfflictions()
+        ModifiedAttributeDict.AFFLICTIONS = False
 
         serviceFittingDefaultOptions = {
             "useGlobalCharacter": False,
@@ -246,6 +260,166 @@ class Fit(object):
             fit.inited = True
         return fit
 
+    def getFitStats(self, fitID):
+        """
+        Get stats of fit. They're taken from persistent cache if fit didn't change
+        since they were stored, so the fit doesn't have to be calculated
+        """
+        fit = self.getFit(fitID, basic=True)
+        if fit is None:
+            return None
+
+        return getFitStats(fit, lambda fit: self.getFit(fit.ID))
+
+    def whatIf(self, fitID, changes):
+        """
+        Get stats fit would have with given changes applied. Changes are made on
+        copy-on-write overlay of the fit (see es_Fit.overlay), neither the fit nor
+        database are touched. Changes are tuples of:
+            ("module", position, itemID) - replace module at position
+            ("charge", position, chargeID) - change charge, None unloads it
+            ("state", position, state) - change state of module
+            ("drone", itemID, amount) - add drones
+        Returns None if any of the changes can't be applied
+        """
+        fit = self.getFit(fitID)
+        if fit is None:
+            return None
+
+        # Fitting checks are done against fit as it is calculated now
+        modules = {}
+        drones = []
+        for change in changes:
+            if not self.__applyChange(fit, modules, drones, change):
+                return None
+
+        return self.__calculateOverlay(fit, modules, drones)
+
+    def rankModules(self, fitID, position, itemIDs, stat):
+        """
+        Evaluate candidate modules for position of fit, returns (itemID, stats)
+        pairs of those which fit there, the best first. Stat is name of a stat with
+        single value (e.g. totalDPS, maxSpeed), or function getting the value to
+        rank by from stats. Returns None if there's no module at position
+        """
+        fit = self.getFit(fitID)
+        if fit is None or not 0 <= position < len(fit.modules):
+            return None
+
+        if callable(stat):
+            key = stat
+        else:
+            if isinstance(getattr(fit, stat), dict):
+                raise ValueError("Stat %s has no single value, rank by function of stats instead" % stat)
+            key = lambda stats: stats[stat]
+
+        # Fitting checks are done against fit as it is calculated now, then each
+        # module which fits is calculated on its own overlay
+        reference = self.__makeReference(fit, {}, position)
+        candidates = []
+        for itemID in itemIDs:
+            mod = self.__fitModule(reference, itemID)
+            if mod is not None:
+                candidates.append((itemID, mod))
+
+        results = [(itemID, self.__calculateOverlay(fit, {position: mod}, ())) for itemID, mod in candidates]
+        results.sort(key=lambda result: key(result[1]), reverse=True)
+        return results
+
+    @staticmethod
+    def __makeReference(fit, modules, position):
+        """Overlay of fit with modules replaced and position emptied, for fitting checks"""
+        modules = dict(modules)
+        slot = fit.modules[position].slot
+        modules[position] = newItem(es_Module, None, dummySlot=slot, state=State.ONLINE)
+        reference = fit.overlay(modules)
+        # Reference isn't calculated, its ship answers with attributes of the fit
+        reference.ship = ItemView(fit.ship)
+        return reference
+
+    @staticmethod
+    def __fitModule(reference, itemID):
+        """Module with given item, if it fits into empty position of reference overlay"""
+        item = getItem(itemID, eager=("attributes", "group.category"))
+        try:
+            mod = newItem(es_Module, item, dummySlot=None, state=State.ONLINE)
+        except ValueError:
+            return None
+
+        if not mod.fits(reference):
+            return None
+
+        if mod.isValidState(State.ACTIVE):
+            mod.state = State.ACTIVE
+        return mod
+
+    def __applyChange(self, fit, modules, drones, change):
+        """Add change to modules replaced ({position: module}) and drones added to fit"""
+        kind = change[0]
+        if kind in ("module", "charge", "state") and not 0 <= change[1] < len(fit.modules):
+            return False
+
+        if kind == "module":
+            mod = self.__fitModule(self.__makeReference(fit, modules, change[1]), change[2])
+            if mod is None:
+                return False
+            modules[change[1]] = mod
+        elif kind in ("charge", "state"):
+            mod = self.__getChangedModule(fit, modules, change[1])
+            if kind == "charge":
+                charge = getItem(change[2]) if change[2] else None
+                if mod.isEmpty or not mod.isValidCharge(charge):
+                    return False
+                mod.charge = charge
+            else:
+                if mod.isEmpty or not mod.isValidState(change[2]):
+                    return False
+                mod.state = change[2]
+            modules[change[1]] = mod
+        elif kind == "drone":
+            item = getItem(change[1], eager=("attributes", "group.category"))
+            if item.category.name != "Drone":
+                return False
+            drone = newItem(es_Drone, item, amount=change[2], amountActive=0)
+            if not drone.fits(fit):
+                return False
+            drones.append(drone)
+        else:
+            raise ValueError("Unknown what-if change: %s" % kind)
+
+        return True
+
+    @staticmethod
+    def __getChangedModule(fit, modules, position):
+        if position in modules:
+            return modules[position]
+        return copyItem(fit.modules[position])
+
+    def __calculateOverlay(self, fit, modules, drones):
+        """Stats of calculated overlay of fit"""
+        overlay = self.__makeOverlay(fit, modules, drones)
+
+        # Check states of all modules, same as when fit itself is changed
+        modules = dict(modules)
+        changed = False
+        for position, mod in enumerate(overlay.modules):
+            if not mod.canHaveState(mod.state):
+                mod = modules[position] = self.__getChangedModule(fit, modules, position)
+                mod.state = State.ONLINE
+                changed = True
+
+        # If any state was changed, calculate overlay again
+        if changed:
+            overlay = self.__makeOverlay(fit, modules, drones)
+
+        return getStats(overlay)
+
+    @staticmethod
+    def __makeOverlay(fit, modules, drones):
+        overlay = fit.overlay(modules, addedDrones=drones)
+        overlay.calculateModifiedAttributes()
+        return overlay
+
     def searchFits(self, name):
         results = searchFits(name)
         fits = []
@@ -393,7 +567,7 @@ class Fit(object):
                 projectionInfo.active = not projectionInfo.active
 
         eds_queries.commit()
-        self.recalc(fit)
+        self.recalc(fit, changed=None if isinstance(thing, es_Fit) else [thing])
 
     def toggleCommandFit(self, fitID, thing):
         fit = getFit(fitID)
@@ -420,7 +594,7 @@ class Fit(object):
         fighter.amountActive = amount
 
         eds_queries.commit()
-        self.recalc(fit)
+        self.recalc(fit, changed=[fighter])
 
     def removeProjected(self, fitID, thing):
         fit = getFit(fitID)
@@ -799,7 +973,7 @@ class Fit(object):
             d.amountActive = d.amount
 
         eds_queries.commit()
-        self.recalc(fit)
+        self.recalc(fit, changed=[d])
         return True
 
     def toggleFighter(self, fitID, i):
@@ -808,7 +982,7 @@ class Fit(object):
         f.active = not f.active
 
         eds_queries.commit()
-        self.recalc(fit)
+        self.recalc(fit, changed=[f])
         return True
 
     def toggleImplant(self, fitID, i):
@@ -817,7 +991,7 @@ class Fit(object):
         implant.active = not implant.active
 
         eds_queries.commit()
-        self.recalc(fit)
+        self.recalc(fit, changed=[implant])
         return True
 
     def toggleImplantSource(self, fitID, source):
@@ -834,14 +1008,15 @@ class Fit(object):
         booster.active = not booster.active
 
         eds_queries.commit()
-        self.recalc(fit)
+        self.recalc(fit, changed=[booster])
         return True
 
     def toggleFighterAbility(self, fitID, ability):
         fit = getFit(fitID)
         ability.active = not ability.active
         eds_queries.commit()
-        self.recalc(fit)
+        fighters = [f for f in chain(fit.fighters, fit.projectedFighters) if any(a is ability for a in f.abilities)]
+        self.recalc(fit, changed=fighters)
 
     def changeChar(self, fitID, charID):
         if fitID is None or charID is None:
@@ -870,6 +1045,57 @@ class Fit(object):
 
         self.recalc(fit)
 
+    def getChargeMatrix(self, fitID, mod, charges=None):
+        """
+        Stats of module with each of the charges loaded (all valid ones by default),
+        as list of eos.chargeMatrix.ChargeStats. They're calculated on overlays of
+        the fit, the fit itself is left as it is
+        """
+        fit = self.getFit(fitID)
+        if fit is None:
+            return None
+
+        return getChargeMatrix(fit, mod, charges)
+
+    def getRecalcCount(self, fitID):
+        """Number of times fit was recalculated, changes whenever its attributes may have"""
+        return self.recalcCounts.get(fitID, 0)
+
+    def getDpsAgainst(self, fitID, profiles):
+        """Total DPS of fit against each of the target resists (None for no resists)"""
+        fit = self.getFit(fitID)
+        if fit is None:
+            return None
+
+        return fit.getDpsAgainst(profiles)
+
+    def getNeutThresholds(self, fitIDs, cycleTime, capNeed, signatureResolution=None, maxAmount=64, processes=None):
+        """
+        Number of neutralizers draining capNeed every cycleTime ms it takes to make
+        each of the fits cap unstable, 0 for fits which are unstable already and None
+        for fits which last even with maxAmount of them. Fits are swept in parallel.
+        None if any of the fits doesn't exist
+        """
+        points = []
+        for fitID in fitIDs:
+            fit = self.getFit(fitID)
+            if fit is None:
+                return None
+            points.append(fit.getNeutPoint(cycleTime, capNeed, signatureResolution, maxAmount))
+
+        return capSim.sweep(points, processes)
+
+    def getTankMatrix(self, fitID, patterns=None):
+        """
+        Tank of fit against each of the damage patterns (all stored ones by default),
+        as list of eos.saveddata.damagePattern.TankStats
+        """
+        fit = self.getFit(fitID)
+        if fit is None:
+            return None
+
+        return getTankMatrix(fit, patterns)
+
     def getTargetResists(self, fitID):
         if fitID is None:
             return
@@ -932,24 +1158,24 @@ class Fit(object):
         self.recalc(fit)
 
     def checkStates(self, fit, base):
-        changed = False
+        changed = []
         for mod in fit.modules:
             if mod != base:
                 if not mod.canHaveState(mod.state):
                     mod.state = State.ONLINE
-                    changed = True
+                    changed.append(mod)
         for mod in fit.projectedModules:
             if not mod.canHaveState(mod.state, fit):
                 mod.state = State.OFFLINE
-                changed = True
+                changed.append(mod)
         for drone in fit.projectedDrones:
             if drone.amountActive > 0 and not drone.canBeApplied(fit):
                 drone.amountActive = 0
-                changed = True
+                changed.append(drone)
 
         # If any state was changed, recalculate attributes again
         if changed:
-            self.recalc(fit)
+            self.recalc(fit, changed=changed)
 
     def toggleModulesState(self, fitID, base, modules, click):
         proposedState = self.__getProposedState(base, click)
@@ -964,7 +1190,7 @@ class Fit(object):
         fit = getFit(fitID)
 
         # As some items may affect state-limiting attributes of the ship, calculate new attributes first
-        self.recalc(fit)
+        self.recalc(fit, changed=[base] + list(modules))
         # Then, check states of all modules and change where needed. This will recalc if needed
         self.checkStates(fit, base)
 
@@ -1019,10 +1245,27 @@ class Fit(object):
         eds_queries.commit()
         self.recalc(fit)
 
-    def recalc(self, fit, withBoosters=True):
+    def calculateAfflictions(self, fitID):
+        fit = self.getFit(fitID)
+        if fit is not None:
+            fit.calculateAfflictions()
+
+    def recalc(self, fit, withBoosters=True, changed=None):
+        """
+        Recalculate fit. When only state of some items was changed, pass them
+        as changed to recalculate just the attributes depending on them
+        """
         logger.debug("=" * 10 + "recalc" + "=" * 10)
+        self.recalcCounts[fit.ID] = self.recalcCounts.get(fit.ID, 0) + 1
         if fit.factorReload is not self.serviceFittingOptions["useGlobalForceReload"]:
             fit.factorReload = self.serviceFittingOptions["useGlobalForceReload"]
-        fit.clear()
+            changed = None
+
+        if changed:
+            fit.recalculate(changed)
+        else:
+            fit.clear()
+            fit.calculateModifiedAttributes(withBoosters=False)
 
-        fit.calculateModifiedAttributes(withBoosters=False)
+        # Views read calculated attributes many times per refresh
+        fit.freeze()
@@ -0,0 +1,92 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+import logging
+import threading
+
+import wx
+
+from eos.optimizer import optimize
+from eos.saveddata.character import getCharacter
+from gui_service.market import Market
+
+logger = logging.getLogger(__name__)
+
+
+class OptimizerThread(threading.Thread):
+    def __init__(self, kwargs, callback, doneCallback):
+        threading.Thread.__init__(self, name="Optimizer")
+        self.daemon = True
+        self.kwargs = kwargs
+        self.callback = callback
+        self.doneCallback = doneCallback
+
+    def run(self):
+        best = None
+        try:
+            best = optimize(callback=lambda score, modules: wx.CallAfter(self.callback, score, modules), **self.kwargs)
+        except Exception:
+            logger.exception("Optimizer failed")
+        finally:
+            if self.doneCallback is not None:
+                wx.CallAfter(self.doneCallback, best)
+
+
+class Optimizer(object):
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = Optimizer()
+
+        return cls.instance
+
+    def getCandidates(self, itemIDs=(), marketGroupIDs=()):
+        """IDs of given items with all their variations, and of items in given market groups"""
+        sMkt = Market.getInstance()
+        items = set(sMkt.getVariationsByItems([sMkt.getItem(itemID) for itemID in itemIDs]))
+        for marketGroupID in marketGroupIDs:
+            items.update(sMkt.getItemsByMarketGroup(sMkt.getMarketGroup(marketGroupID)))
+
+        return sorted(item.ID for item in items if sMkt.getPublicityByItem(item))
+
+    def optimize(self, shipID, charID, candidateIDs, objective, callback, doneCallback=None, fixedIDs=(),
+                 capStable=False, timeBudget=60, jobs=None):
+        """
+        Search for the best modules for ship in background. Objective is ("dps", {"distance": km}),
+        ("ehp", {}) or ("cap", {}); capStable requires solutions to be cap stable. Every improving
+        solution is passed to callback as (score, [(itemID, chargeID), ...]), doneCallback gets the
+        best one when search is over
+        """
+        char = getCharacter(charID)
+        skills = dict((skill.itemID, skill.level) for skill in char.skills if skill.level is not None)
+        kwargs = {
+            "shipID": shipID,
+            "skills": skills,
+            "candidateIDs": list(candidateIDs),
+            "objectiveSpec": objective,
+            "fixedIDs": tuple(fixedIDs),
+            "capStable": capStable,
+            "timeBudget": timeBudget,
+            "jobs": jobs,
+        }
+        thread = OptimizerThread(kwargs, callback, doneCallback)
+        thread.start()
+        return thread
@@ -18,11 +18,13 @@
 # along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
 # ==============================================================================
 
+import multiprocessing
 import re
 import sys
 from optparse import OptionParser, BadOptionError, AmbiguousOptionError
 
 import config
+from eos import effectRegistry
 from eos.db.sqlAlchemy import sqlAlchemy
 
 
@@ -101,6 +103,10 @@ if not hasattr(sys, 'frozen'):
 
 
 if __name__ == "__main__":
+    # Frozen builds start worker processes of capacitor sweeps and fit optimizer
+    # from this executable, they have to stop here
+    multiprocessing.freeze_support()
+
     # Configure paths
     if options.rootsavedata is True:
         config.saveInRoot = True
@@ -132,6 +138,9 @@ if __name__ == "__main__":
 
     sqlAlchemy.saveddata_meta.create_all()
 
+    # Load effect handlers in background, so that opening first fits doesn't wait for them
+    effectRegistry.warmUp(config.savePath, config.gamedata_version)
+
     pyfa = wx.App(False)
     MainFrame(options.title)
     pyfa.MainLoop()
@@ -0,0 +1,98 @@
+"""Capacitor simulator tests."""
+
+import os
+import random
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+from eos import capSim  # noqa: E402
+
+
+def makeSim(modules, capacity, recharge, reload=True, analytical=False):
+    sim = capSim.CapSimulator()
+    sim.init(modules)
+    sim.capacitorCapacity = capacity
+    sim.capacitorRecharge = recharge
+    sim.stagger = True
+    sim.reload = reload
+    sim.analytical = analytical
+    return sim
+
+
+def randomSetups(count, seed=2):
+    rand = random.Random(seed)
+    for _ in xrange(count):
+        capacity = rand.choice([400.0, 1500.0, 5000.0])
+        recharge = rand.choice([150000.0, 300000.0, 600000.0])
+        modules = []
+        for _ in xrange(rand.randint(1, 5)):
+            duration = rand.choice([2000, 3750, 4500, 5000, 10000])
+            capNeed = rand.uniform(5, 1.5 * capacity * duration / recharge)
+            modules.append((duration, capNeed, rand.choice([0, 0, 8, 10]), False))
+        yield modules, capacity, recharge, rand.random() < 0.7
+
+
+def test_analytical_matches_simulation():
+    compared = 0
+    for modules, capacity, recharge, reload in randomSetups(150):
+        analytical = makeSim(modules, capacity, recharge, reload, analytical=True)
+        analytical.run()
+        simulated = makeSim(modules, capacity, recharge, reload)
+        simulated.run()
+
+        assert (analytical.cap_stable_low > 0) == (simulated.cap_stable_low > 0)
+        # Only clearly stable setups are cut short
+        if analytical.clearly_stable():
+            compared += 1
+            assert analytical.cap_stable_low == pytest.approx(simulated.cap_stable_low, abs=1e-4 * capacity)
+            assert analytical.cap_stable_high == pytest.approx(simulated.cap_stable_high, abs=1e-4 * capacity)
+        else:
+            assert analytical.t == simulated.t
+
+    assert compared > 50
+
+
+def test_unstable_setup_not_clearly_stable():
+    sim = makeSim([(5000, 100.0, 0, False)], 1000.0, 200000.0, analytical=True)
+    assert not sim.clearly_stable()
+    sim.run()
+    assert sim.cap_stable_low == 0
+
+
+def bruteThreshold(sim, drain, maxAmount):
+    for amount in xrange(maxAmount + 1):
+        sim.incoming = {drain: amount} if amount else {}
+        if not capSim.is_stable(sim):
+            return amount
+    return None
+
+
+def test_find_threshold_matches_brute_force():
+    rand = random.Random(5)
+    found = set()
+    for modules, capacity, recharge, reload in randomSetups(40, seed=3):
+        drain = (rand.choice([6000, 12000, 24000]), rand.uniform(5.0, 0.05 * capacity), 0, False)
+        maxAmount = rand.choice([5, 16, 40])
+        sim = makeSim(modules, capacity, recharge, reload)
+        threshold = capSim.find_threshold(sim, drain, maxAmount)
+        assert sim.incoming == {}
+        assert threshold == bruteThreshold(sim, drain, maxAmount)
+        found.add(threshold if threshold in (0, None) else "some")
+
+    # Unstable, never unstable and in between were all covered
+    assert found == {0, None, "some"}
+
+
+def test_sweep_in_pool_matches_serial():
+    points = []
+    for modules, capacity, recharge, reload in randomSetups(6, seed=4):
+        points.append((makeSim(modules, capacity, recharge, reload), (12000, 0.02 * capacity, 0, False), 32))
+
+    assert capSim.sweep(points, processes=2) == capSim.sweep(points, processes=1)
@@ -0,0 +1,95 @@
+"""Capacitor graph tests."""
+
+import heapq
+import os
+import sys
+from math import sqrt, exp
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos import capSim  # noqa: E402
+from eos.graph.capacitor import FitCapacitorGraph  # noqa: E402
+
+CAPACITY = 2000.0
+RECHARGE = 300000.0
+
+
+def makeSim(modules):
+    sim = capSim.CapSimulator()
+    sim.capacitorCapacity = CAPACITY
+    sim.capacitorRecharge = RECHARGE
+    sim.stagger = True
+    sim.init(modules)
+    return sim
+
+
+class FakeFit(object):
+    def __init__(self, modules):
+        self.modules = modules
+
+    def getCapSimulator(self, drains=None):
+        return makeSim(self.modules)
+
+
+def simulate(modules, times):
+    """Capacitor at given times, simulated all the way without replaying periods"""
+    sim = makeSim(modules)
+    sim.reset()
+    state = sim.state
+    tau = RECHARGE / 5.0
+
+    def recharge(cap, t):
+        return ((1.0 + (sqrt(cap / CAPACITY) - 1.0) * exp(-t / tau)) ** 2) * CAPACITY
+
+    cap = CAPACITY
+    t_last = 0
+    values = []
+    times = iter(times)
+    t = next(times)
+    while t is not None:
+        activation = heapq.heappop(state)
+        while t is not None and t < activation[0]:
+            values.append(recharge(cap, t - t_last))
+            t = next(times, None)
+        cap = min(recharge(cap, activation[0] - t_last) - activation[2], CAPACITY)
+        t_last = activation[0]
+        activation[0] += activation[1]
+        heapq.heappush(state, activation)
+
+    return values
+
+
+@pytest.mark.parametrize("modules", [
+    # Staggered, period isn't a multiple of graph resolution
+    [(10000, 40.0, 0, False)] * 3,
+    [(4500, 50.0, 0, False)],
+])
+def test_replayed_period_does_not_drift(modules):
+    graph = FitCapacitorGraph(FakeFit(modules))
+    times = range(0, 3000000, 1000)
+    expected = simulate(modules, times)
+    values = [graph.calcCapacitor({"time": t / 1000.0}) for t in times]
+
+    assert graph.sim.steady_state
+    assert len(graph.samples) < len(times) / 2
+    assert max(abs(value - reference) for value, reference in zip(values, expected)) < 5
+
+
+def test_samples_interpolated():
+    graph = FitCapacitorGraph(FakeFit([(4500, 50.0, 0, False)]))
+    first, second = graph.calcCapacitor({"time": 1}), graph.calcCapacitor({"time": 2})
+
+    assert graph.calcCapacitor({"time": 1.25}) == pytest.approx(first + (second - first) * 0.25)
+
+
+def test_no_modules():
+    graph = FitCapacitorGraph(FakeFit([]))
+    assert graph.calcCapacitor({"time": 100}) == CAPACITY
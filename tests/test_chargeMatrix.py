@@ -0,0 +1,176 @@
+"""Charge matrix tests."""
+
+import os
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos import modifiedAttributeDict  # noqa: E402
+from eos.chargeMatrix import getChargeMatrix  # noqa: E402
+from eos.effectHandlerHelpers import HandledList  # noqa: E402
+from eos.modifiedAttributeDict import ModifiedAttributeDict  # noqa: E402
+from eos.saveddata.fit import Fit, ImplantLocation  # noqa: E402
+from eos.saveddata.module import Hardpoint, State  # noqa: E402
+
+ATTRIBUTES = ("damageMultiplier", "speed", "maxRange", "falloff", "trackingSpeed", "damage", "rangeMultiplier")
+
+
+class FakeItem(object):
+    def __init__(self, ID, attributes):
+        self.ID = ID
+        self.attributes = attributes
+
+
+class FakeModule(object):
+    """Module running effect(fit, module) on normal run time"""
+    hardpoint = Hardpoint.NONE
+
+    def __init__(self, item, effect=None, charge=None):
+        self.item = item
+        self.effect = effect
+        self.state = State.ACTIVE
+        self.charge = charge
+        self.build()
+
+    def build(self):
+        self.itemModifiedAttributes = ModifiedAttributeDict()
+        self.itemModifiedAttributes.original = dict(self.item.attributes)
+        self.chargeModifiedAttributes = ModifiedAttributeDict()
+        self.chargeModifiedAttributes.original = dict(self.charge.attributes) if self.charge is not None else {}
+
+    def calculateModifiedAttributes(self, fit, runTime, forceProjected=False, gang=False):
+        if runTime == "normal" and self.effect is not None and not forceProjected:
+            self.effect(fit, self)
+
+    def getModifiedItemAttr(self, key):
+        return self.itemModifiedAttributes.get(key)
+
+    def getModifiedChargeAttr(self, key):
+        return self.chargeModifiedAttributes.get(key)
+
+    def clear(self):
+        self.itemModifiedAttributes.clear()
+        self.chargeModifiedAttributes.clear()
+
+    def clearStats(self):
+        pass
+
+
+class FakeShip(FakeModule):
+    def __init__(self, item, parent=None):
+        FakeModule.__init__(self, item)
+        self.parent = parent
+
+
+class FakeWeapon(FakeModule):
+    hardpoint = Hardpoint.TURRET
+
+    @property
+    def charge(self):
+        return self.__charge
+
+    @charge.setter
+    def charge(self, charge):
+        self.__charge = charge
+        if "itemModifiedAttributes" in vars(self):
+            self.build()
+
+    def isValidState(self, state):
+        return True
+
+    def damageStats(self, targetResists=None):
+        volley = self.getModifiedItemAttr("damageMultiplier") * self.getModifiedChargeAttr("damage")
+        return volley / (self.getModifiedItemAttr("speed") / 1000.0), volley
+
+    @property
+    def maxRange(self):
+        return self.getModifiedItemAttr("maxRange") * self.getModifiedChargeAttr("rangeMultiplier")
+
+    @property
+    def falloff(self):
+        return self.getModifiedItemAttr("falloff")
+
+
+def damageAmplifier(fit, mod):
+    for weapon in fit.modules:
+        if weapon.hardpoint == Hardpoint.TURRET:
+            weapon.itemModifiedAttributes.multiply("damageMultiplier", 1.1, stackingPenalties=True)
+
+
+def chargeBooster(fit, mod):
+    mod.chargeModifiedAttributes.multiply("damage", 1.25)
+
+
+def makeCharge(ID, damage, rangeMultiplier):
+    return FakeItem(ID, {"damage": damage, "rangeMultiplier": rangeMultiplier})
+
+
+CHARGES = [makeCharge(1, 10.0, 1.0), makeCharge(2, 14.0, 0.5), makeCharge(3, 6.0, 1.6)]
+
+
+def makeFit(charge):
+    fit = Fit.__new__(Fit)
+    fit.ID = 1
+    fit.name = "Test"
+    fit.implantLocation = ImplantLocation.FIT
+    fit.projectedOnto = {}
+    fit.boostedOnto = {}
+    fit._Fit__ship = FakeShip(FakeItem(100, {}))
+    fit._Fit__mode = None
+    fit._Fit__character = FakeModule(FakeItem(200, {}))
+    fit._Fit__damagePattern = None
+    fit._Fit__targetResists = None
+    fit.extraAttributes = fit.ship.itemModifiedAttributes
+    for name in ("modules", "drones", "fighters", "cargo", "implants", "boosters",
+                 "projectedModules", "projectedDrones", "projectedFighters"):
+        setattr(fit, "_Fit__" + name, HandledList())
+    fit._Fit__projectedFits = {}
+    fit._Fit__commandFits = {}
+    fit.build()
+
+    weaponItem = FakeItem(300, {"damageMultiplier": 2.0, "speed": 4000.0, "maxRange": 10000.0, "falloff": 5000.0,
+                                "trackingSpeed": 0.05})
+    for mod in (FakeWeapon(weaponItem, chargeBooster, charge), FakeWeapon(weaponItem, chargeBooster, charge),
+                FakeModule(FakeItem(400, {}), damageAmplifier)):
+        mod.position = len(fit.modules)
+        fit.modules.append(mod)
+    return fit
+
+
+@pytest.fixture(autouse=True)
+def leanCalculation(monkeypatch):
+    monkeypatch.setattr(ModifiedAttributeDict, "AFFLICTIONS", False)
+    # Attributes are not capped and have no defaults, no gamedata is needed
+    for key in ATTRIBUTES:
+        monkeypatch.setitem(modifiedAttributeDict.cappingAttrKeyCache, key, None)
+        monkeypatch.setitem(modifiedAttributeDict.defaultValuesCache, key, 0.0)
+
+
+def test_matrix_matches_loaded_charges():
+    fit = makeFit(CHARGES[0])
+    fit.calculateModifiedAttributes()
+    weapon = fit.modules[0]
+    before = weapon.damageStats(), weapon.maxRange
+
+    matrix = getChargeMatrix(fit, weapon, CHARGES)
+
+    # Fit itself is left as it was calculated
+    assert (weapon.damageStats(), weapon.maxRange) == before
+    assert len(fit.modules) == 3
+    assert [stats.charge for stats in matrix] == CHARGES
+    for charge, stats in zip(CHARGES, matrix):
+        loaded = makeFit(charge)
+        loaded.calculateModifiedAttributes()
+        reference = loaded.modules[0]
+        assert stats.module is not weapon
+        assert (stats.dps, stats.volley) == pytest.approx(reference.damageStats(), rel=1e-12)
+        assert stats.optimal == pytest.approx(reference.maxRange, rel=1e-12)
+        assert (stats.falloff, stats.tracking) == (5000.0, 0.05)
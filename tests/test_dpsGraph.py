@@ -0,0 +1,133 @@
+"""DPS graph tests."""
+
+import os
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+numpy = pytest.importorskip("numpy")
+
+from eos.graph.fitDps import FitDpsGraph  # noqa: E402
+from eos.saveddata.module import Hardpoint, State  # noqa: E402
+
+
+class FakeItem(object):
+    def __init__(self, effects):
+        self.effects = dict((effect, None) for effect in effects)
+
+
+class FakeModule(object):
+    def __init__(self, hardpoint, attrs, charge=None, effects=(), dps=0, maxRange=0, falloff=1):
+        self.hardpoint = hardpoint
+        self.attrs = attrs
+        self.charge = charge or {}
+        self.item = FakeItem(effects)
+        self.dps = dps
+        self.maxRange = maxRange
+        self.falloff = falloff
+        self.state = State.ACTIVE
+        self.isEmpty = False
+
+    def getModifiedItemAttr(self, key):
+        return self.attrs.get(key)
+
+    def getModifiedChargeAttr(self, key):
+        return self.charge.get(key)
+
+    def damageStats(self, targetResists=None):
+        return self.dps, 0
+
+
+class FakeFighter(object):
+    def __init__(self, attrs, dps):
+        self.attrs = attrs
+        self.abilities = [FakeAbility(self, dps)]
+
+    def getModifiedItemAttr(self, key):
+        return self.attrs.get(key)
+
+
+class FakeAbility(object):
+    attrPrefix = "fighterAbilityMissiles"
+    dealsDamage = True
+    active = True
+
+    def __init__(self, fighter, dps):
+        self.fighter = fighter
+        self.dps = dps
+
+    def damageStats(self, targetResists=None):
+        return self.dps, 0
+
+
+class FakeFit(object):
+    targetResists = None
+
+    def __init__(self):
+        self.extraAttributes = {"droneControlRange": 60000}
+        self.modules = [
+            FakeModule(Hardpoint.TURRET, {"trackingSpeed": 0.05, "optimalSigRadius": 40000},
+                       dps=300, maxRange=15000, falloff=10000),
+            FakeModule(Hardpoint.MISSILE, {},
+                       {"aoeCloudSize": 140, "aoeVelocity": 100, "aoeDamageReductionFactor": 0.682},
+                       dps=250, maxRange=50000),
+            FakeModule(Hardpoint.NONE, {"speedFactor": -60, "maxRange": 10000, "falloffEffectiveness": 0},
+                       effects=["remoteWebifierFalloff"], maxRange=10000),
+            FakeModule(Hardpoint.NONE, {"speedFactor": -50, "maxRange": 14000, "falloffEffectiveness": 5000},
+                       effects=["remoteWebifierFalloff"], maxRange=14000, falloff=5000),
+            FakeModule(Hardpoint.NONE, {"signatureRadiusBonus": 30},
+                       effects=["remoteTargetPaintFalloff"], maxRange=20000, falloff=15000),
+        ]
+        self.drones = [
+            FakeModule(Hardpoint.NONE, {"maxVelocity": 0, "trackingSpeed": 0.03, "optimalSigRadius": 25000},
+                       dps=80, maxRange=30000, falloff=10000),
+            FakeModule(Hardpoint.NONE, {"maxVelocity": 2000}, dps=60),
+        ]
+        self.fighters = [FakeFighter({"fighterAbilityMissilesExplosionRadius": 1000,
+                                      "fighterAbilityMissilesExplosionVelocity": 150,
+                                      "fighterAbilityMissilesReductionFactor": 1.5,
+                                      "fighterAbilityMissilesReductionSensitivity": 5.5}, 400)]
+
+
+@pytest.mark.parametrize("data", [
+    {"distance": "1-70", "velocity": 300, "angle": 90, "signatureRadius": 150},
+    {"distance": 10, "velocity": "0-1000", "angle": 45, "signatureRadius": ""},
+    {"distance": "0.5-30", "velocity": 200, "angle": "10-90", "signatureRadius": "40-400"},
+    {"distance": "5;20-40", "velocity": 100, "angle": 30, "signatureRadius": "20-600"},
+])
+def test_columns_match_points(data):
+    graph = FitDpsGraph(FakeFit(), data)
+    points = list(graph.getIterator())
+    columns, values = graph.getArrays()
+
+    assert len(values) == len(points)
+    for i, (point, value) in enumerate(points):
+        # Webs and painters are applied onto point in place, the rest is as sampled
+        for name in ("distance", "angle"):
+            assert columns[name][i] == point[name]
+        assert values[i] == pytest.approx(value, rel=1e-12)
+
+
+@pytest.mark.parametrize("distance, budget", [("0-70", 50), ("0-70", 8), ("12-25.001", 20)])
+def test_adaptive_points_sample_both_sides_of_breakpoints(distance, budget):
+    graph = FitDpsGraph(FakeFit(), {"distance": distance, "velocity": 300, "angle": 90, "signatureRadius": 150})
+    xs, ys = graph.getAdaptivePoints("distance", budget)
+
+    start, end = map(float, distance.split("-"))
+    breakpoints = [breakpoint for breakpoint in graph.getBreakpoints("distance") if start < breakpoint < end]
+    assert breakpoints
+    minWidth = (end - start) / (budget * 20.0)
+    for breakpoint in breakpoints:
+        assert breakpoint in xs
+        assert min(x for x in xs if x > breakpoint) <= breakpoint + minWidth
+
+    assert len(xs) <= max(budget, 2 * len(breakpoints) + 3)
+    for x, y in zip(xs, ys):
+        assert y == pytest.approx(graph.calcDps({"distance": x, "velocity": 300, "angle": 90, "signatureRadius": 150}))
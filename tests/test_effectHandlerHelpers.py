@@ -0,0 +1,124 @@
+"""Effect target selector tests."""
+
+import os
+import random
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos import gamedata  # noqa: E402
+from eos.effectHandlerHelpers import ChargeGroup, ChargeSkill, HandledList  # noqa: E402
+from eos.effectHandlerHelpers import ItemCategory, ItemGroup, ItemSkill  # noqa: E402
+
+SKILLS = {"Gunnery": 3300, "Missile Launcher Operation": 3319, "Navigation": 3449}
+GROUPS = [(53, "Energy Weapon", 7, "Module"), (510, "Missile Launcher Heavy", 7, "Module"),
+          (46, "Propulsion Module", 7, "Module"), (100, "Combat Drone", 18, "Drone")]
+CHARGE_GROUPS = [(86, "Frequency Crystal", 8, "Charge"), (385, "Heavy Missile", 8, "Charge")]
+
+
+class FakeCategory(object):
+    def __init__(self, ID, name):
+        self.ID = ID
+        self.name = name
+
+
+class FakeGroup(object):
+    def __init__(self, ID, name, categoryID, categoryName):
+        self.ID = ID
+        self.name = name
+        self.category = FakeCategory(categoryID, categoryName)
+
+
+class FakeItem(object):
+    def __init__(self, group, skillIDs):
+        self.group = FakeGroup(*group)
+        self.requiredSkillIDs = skillIDs
+
+
+class FakeElement(object):
+    def __init__(self, item, charge=None):
+        self.item = item
+        self.charge = charge
+        self.increased = []
+
+    def increaseItemAttr(self, *args):
+        self.increased.append(args)
+
+
+def requires(thing, skill):
+    return thing is not None and SKILLS[skill] in thing.requiredSkillIDs
+
+
+def randomElements(count, seed=1):
+    rand = random.Random(seed)
+    elements = []
+    for _ in xrange(count):
+        item = FakeItem(rand.choice(GROUPS), rand.sample(SKILLS.values(), rand.randint(0, 2)))
+        charge = None
+        if rand.random() < 0.5:
+            charge = FakeItem(rand.choice(CHARGE_GROUPS), rand.sample(SKILLS.values(), rand.randint(0, 1)))
+        elements.append(FakeElement(item, charge))
+    return elements
+
+
+@pytest.fixture(autouse=True)
+def skillNames(monkeypatch):
+    monkeypatch.setattr(gamedata, "requiredSkillsLoaded", True)
+    for name, skillID in SKILLS.iteritems():
+        monkeypatch.setitem(gamedata.skillNameMap, name, skillID)
+
+
+# Selectors, with equivalent plain filter functions
+SELECTORS = [
+    (ItemSkill("Gunnery"), lambda e: requires(e.item, "Gunnery")),
+    (ItemSkill(SKILLS["Navigation"], "Gunnery"),
+     lambda e: requires(e.item, "Navigation") or requires(e.item, "Gunnery")),
+    (ChargeSkill("Missile Launcher Operation"), lambda e: requires(e.charge, "Missile Launcher Operation")),
+    (ItemGroup("Energy Weapon", "Propulsion Module"),
+     lambda e: e.item.group.name in ("Energy Weapon", "Propulsion Module")),
+    (ItemGroup(510), lambda e: e.item.group.ID == 510),
+    (ChargeGroup("Heavy Missile"), lambda e: e.charge is not None and e.charge.group.name == "Heavy Missile"),
+    (ItemCategory("Drone"), lambda e: e.item.group.category.name == "Drone"),
+    (ItemCategory(7, "Drone"), lambda e: True),
+]
+
+
+@pytest.mark.parametrize("selector, filter", SELECTORS)
+def test_selectors_match_filter_functions(selector, filter):
+    elements = randomElements(60)
+    handled = HandledList(elements)
+    expected = [element for element in elements if filter(element)]
+
+    assert list(handled.select(selector)) == expected
+    assert [element for element in elements if selector(element)] == expected
+
+    handled.filteredItemIncrease(selector, "cpu", 5)
+    assert [element for element in elements if element.increased] == expected
+
+
+def test_index_dropped_on_change():
+    elements = randomElements(10)
+    handled = HandledList(elements)
+    selector = ItemCategory("Drone")
+    before = list(handled.select(selector))
+
+    drone = FakeElement(FakeItem(GROUPS[3], []))
+    handled.append(drone)
+    assert list(handled.select(selector)) == before + [drone]
+
+    del handled[-1]
+    assert list(handled.select(selector)) == before
+
+    # Charges are changed without the list knowing, index is reset by fit
+    charged = handled[0]
+    charged.charge = FakeItem(CHARGE_GROUPS[1], [])
+    handled.resetIndex()
+    assert charged in handled.select(ChargeGroup("Heavy Missile"))
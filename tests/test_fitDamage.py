@@ -0,0 +1,75 @@
+"""DPS against resist profiles tests."""
+
+import os
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos.saveddata.damagePattern import DamagePattern  # noqa: E402
+from eos.saveddata.fit import Fit  # noqa: E402
+from eos.saveddata.targetResists import TargetResists  # noqa: E402
+
+getDpsAgainst = Fit.getDpsAgainst.im_func
+
+
+def makeProfile(cls, em, thermal, kinetic, explosive):
+    # Constructors map the classes, which only works with saveddata set up
+    profile = cls.__new__(cls)
+    profile.emAmount = em
+    profile.thermalAmount = thermal
+    profile.kineticAmount = kinetic
+    profile.explosiveAmount = explosive
+    return profile
+
+
+class Weapon(object):
+    def __init__(self, volleys, cycleTime):
+        self.damagePerType = volleys, cycleTime
+
+
+class Fighter(object):
+    def damageStats(self, targetResists=None):
+        dps = 10.0 * (1 - getattr(targetResists, "kineticAmount", 0))
+        return dps, dps * 5
+
+
+class FakeFit(object):
+    def __init__(self, modules=(), drones=(), fighters=()):
+        self.modules = list(modules)
+        self.drones = list(drones)
+        self.fighters = list(fighters)
+
+
+def volleys(em=0, thermal=0, kinetic=0, explosive=0):
+    return {"em": em, "thermal": thermal, "kinetic": kinetic, "explosive": explosive}
+
+
+def test_dps_against_target_resists():
+    fit = FakeFit(modules=[Weapon(volleys(em=100, thermal=50), 2000),
+                           Weapon(volleys(kinetic=300), 1500),
+                           # Offline or non-weapon module
+                           Weapon(volleys(), None)],
+                  drones=[Weapon(volleys(explosive=40), 4000)],
+                  fighters=[Fighter()])
+    resists = makeProfile(TargetResists, 0.5, 0.25, 0.1, 0.0)
+
+    noResists, againstResists = getDpsAgainst(fit, [None, resists])
+
+    assert noResists == pytest.approx(50 + 25 + 200 + 10 + 10)
+    assert againstResists == pytest.approx(50 * 0.5 + 25 * 0.75 + 200 * 0.9 + 10 + 10 * 0.9)
+
+
+def test_dps_against_rejects_damage_pattern():
+    fit = FakeFit(modules=[Weapon(volleys(em=100), 1000)])
+    pattern = makeProfile(DamagePattern, 25, 25, 25, 25)
+
+    with pytest.raises(TypeError):
+        getDpsAgainst(fit, [None, pattern])
@@ -0,0 +1,211 @@
+"""What-if fit overlay tests."""
+
+import os
+import sys
+from collections import namedtuple
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.orm import mapper  # noqa: E402
+
+from eos import modifiedAttributeDict  # noqa: E402
+from eos.effectHandlerHelpers import HandledList  # noqa: E402
+from eos.modifiedAttributeDict import ModifiedAttributeDict  # noqa: E402
+from eos.overlay import copyItem  # noqa: E402
+from eos.saveddata.fit import Fit, ImplantLocation  # noqa: E402
+from eos.saveddata.module import State  # noqa: E402
+
+ProjectionInfo = namedtuple("ProjectionInfo", ("amount", "active"))
+
+
+class FakeItem(object):
+    def __init__(self, ID, attributes):
+        self.ID = ID
+        self.attributes = attributes
+
+
+class FakeSource(object):
+    """Calculation source running effect(fit, source, projected) on normal run time"""
+
+    def __init__(self, item, effect=None, state=State.ACTIVE):
+        self.item = item
+        self.effect = effect
+        self.state = state
+        self.build()
+
+    def build(self):
+        self.itemModifiedAttributes = ModifiedAttributeDict()
+        self.itemModifiedAttributes.original = dict(self.item.attributes)
+
+    def calculateModifiedAttributes(self, fit, runTime, forceProjected=False, gang=False):
+        if runTime == "normal" and self.effect is not None:
+            self.effect(fit, self, forceProjected)
+
+    def getModifiedItemAttr(self, key):
+        return self.itemModifiedAttributes.get(key)
+
+    def clear(self):
+        self.itemModifiedAttributes.clear()
+
+    def clearStats(self):
+        pass
+
+    def values(self):
+        attrs = self.itemModifiedAttributes
+        return dict((key, attrs[key]) for key in attrs.original)
+
+
+class FakeShip(FakeSource):
+    def __init__(self, item, parent=None):
+        FakeSource.__init__(self, item)
+        self.parent = parent
+
+
+def speedModule(fit, mod, projected):
+    if not projected and mod.state >= State.ACTIVE:
+        fit.ship.itemModifiedAttributes.multiply("maxVelocity", 1.5)
+
+
+def webModule(fit, mod, projected):
+    if projected and mod.state >= State.ACTIVE:
+        fit.ship.itemModifiedAttributes.multiply("maxVelocity", 0.5, stackingPenalties=True)
+
+
+def speedReader(fit, mod, projected):
+    if not projected:
+        mod.itemModifiedAttributes.increase("range", fit.ship.getModifiedItemAttr("maxVelocity") * 10)
+
+
+EFFECTS = {1: speedModule, 2: webModule, 3: speedReader}
+
+
+def makeModule(itemID, state=State.ACTIVE):
+    return FakeSource(FakeItem(itemID, {"range": 1000.0}), EFFECTS[itemID], state)
+
+
+def makeFit(ID, modules):
+    fit = Fit.__new__(Fit)
+    fit.ID = ID
+    fit.name = "Test"
+    fit.implantLocation = ImplantLocation.FIT
+    fit.projectedOnto = {}
+    fit.boostedOnto = {}
+    fit._Fit__ship = FakeShip(FakeItem(100, {"maxVelocity": 200.0}))
+    fit._Fit__mode = None
+    fit._Fit__character = FakeSource(FakeItem(200, {}))
+    fit._Fit__damagePattern = None
+    fit._Fit__targetResists = None
+    fit.extraAttributes = fit.ship.itemModifiedAttributes
+    for name in ("modules", "drones", "fighters", "cargo", "implants", "boosters",
+                 "projectedModules", "projectedDrones", "projectedFighters"):
+        setattr(fit, "_Fit__" + name, HandledList())
+    fit._Fit__projectedFits = {}
+    fit._Fit__commandFits = {}
+    fit.build()
+    for position, mod in enumerate(modules):
+        mod.position = position
+        fit.modules.append(mod)
+    return fit
+
+
+def fitValues(fit):
+    return [fit.ship.values()] + [mod.values() for mod in fit.modules]
+
+
+def projectWebs(fit, amount):
+    projector = makeFit(2, [makeModule(2)])
+    projector.projectedOnto[fit.ID] = ProjectionInfo(amount, True)
+    fit._Fit__projectedFits[projector.ID] = projector
+    return projector
+
+
+@pytest.fixture(autouse=True)
+def leanCalculation(monkeypatch):
+    monkeypatch.setattr(ModifiedAttributeDict, "AFFLICTIONS", False)
+    # Attributes are not capped and have no defaults, no gamedata is needed
+    for key in ("maxVelocity", "range"):
+        monkeypatch.setitem(modifiedAttributeDict.cappingAttrKeyCache, key, None)
+        monkeypatch.setitem(modifiedAttributeDict.defaultValuesCache, key, 0.0)
+
+
+@pytest.mark.parametrize("webs", [0, 2])
+def test_overlay_leaves_fit_alone(webs):
+    fit = makeFit(1, [makeModule(1), makeModule(3)])
+    if webs:
+        projectWebs(fit, webs)
+    fit.calculateModifiedAttributes()
+    before = fitValues(fit)
+    dicts = [thing.itemModifiedAttributes for thing in [fit.ship] + list(fit.modules)]
+
+    # Speed module is switched off on the overlay
+    changed = copyItem(fit.modules[0])
+    changed.state = State.ONLINE
+    overlay = fit.overlay({0: changed})
+    overlay.calculateModifiedAttributes()
+
+    assert fitValues(fit) == before
+    assert [thing.itemModifiedAttributes for thing in [fit.ship] + list(fit.modules)] == dicts
+    assert not set(map(id, overlay.modules)) & set(map(id, list(fit.modules) + [changed]))
+
+    reference = makeFit(1, [makeModule(1, State.ONLINE), makeModule(3)])
+    if webs:
+        projectWebs(reference, webs)
+    reference.calculateModifiedAttributes()
+    assert fitValues(overlay) == fitValues(reference)
+
+
+def test_overlay_carries_projected_fits():
+    fit = makeFit(1, [makeModule(1), makeModule(3)])
+    projector = projectWebs(fit, 1)
+    fit.calculateModifiedAttributes()
+
+    overlay = fit.overlay()
+    assert overlay.projectedFits == [projector]
+    overlay.calculateModifiedAttributes()
+    assert fitValues(overlay) == fitValues(fit)
+    assert overlay.ship.getModifiedItemAttr("maxVelocity") == 150.0
+
+
+def test_added_modules_are_calculated_on_overlay():
+    fit = makeFit(1, [makeModule(1)])
+    fit.calculateModifiedAttributes()
+
+    overlay = fit.overlay(addedModules=[makeModule(3), makeModule(3)])
+    overlay.calculateModifiedAttributes()
+    assert len(fit.modules) == 1
+    assert [mod.getModifiedItemAttr("range") for mod in overlay.modules[1:]] == [4000.0, 4000.0]
+
+
+class MappedThing(object):
+    def __init__(self, name):
+        self.name = name
+        self.build()
+
+    def build(self):
+        self.built = True
+
+
+def test_copies_of_mapped_things_are_plain():
+    table = sqlalchemy.Table("overlayTest", sqlalchemy.MetaData(),
+                             sqlalchemy.Column("ID", sqlalchemy.Integer, primary_key=True),
+                             sqlalchemy.Column("name", sqlalchemy.String))
+    mapper(MappedThing, table)
+    thing = MappedThing("original")
+    thing.built = False
+
+    copy = copyItem(thing)
+    copy.name = "copy"
+    assert isinstance(copy, MappedThing)
+    assert copy.built
+    assert "_sa_instance_state" not in vars(copy)
+    with pytest.raises(sqlalchemy.exc.NoInspectionAvailable):
+        sqlalchemy.inspect(copy)
+    assert (thing.name, copy.name) == ("original", "copy")
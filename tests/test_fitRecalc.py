@@ -0,0 +1,166 @@
+"""Incremental fit recalculation tests."""
+
+import os
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos import modifiedAttributeDict  # noqa: E402
+from eos.effectHandlerHelpers import HandledList  # noqa: E402
+from eos.modifiedAttributeDict import ModifiedAttributeDict  # noqa: E402
+from eos.saveddata.fit import Fit, ImplantLocation  # noqa: E402
+from eos.saveddata.module import State  # noqa: E402
+
+
+class FakeSource(object):
+    """Calculation source running effect(fit, source) on normal run time"""
+
+    def __init__(self, attributes, effect=None, state=State.ACTIVE):
+        self.effect = effect
+        self.state = state
+        self.itemModifiedAttributes = ModifiedAttributeDict()
+        self.itemModifiedAttributes.original = dict(attributes)
+
+    def calculateModifiedAttributes(self, fit, runTime, forceProjected=False, gang=False):
+        if runTime == "normal" and self.effect is not None:
+            self.effect(fit, self)
+
+    def getModifiedItemAttr(self, key):
+        return self.itemModifiedAttributes.get(key)
+
+    def clear(self):
+        self.itemModifiedAttributes.clear()
+
+    def clearStats(self):
+        pass
+
+    def values(self):
+        attrs = self.itemModifiedAttributes
+        return dict((key, attrs[key]) for key in attrs.original)
+
+
+def speedModule(fit, mod):
+    if mod.state >= State.ACTIVE:
+        fit.ship.itemModifiedAttributes.multiply("maxVelocity", 1.5)
+
+
+def cpuModule(fit, mod):
+    if mod.state >= State.ONLINE:
+        fit.ship.itemModifiedAttributes.increase("cpuOutput", 20)
+
+
+def speedReader(fit, mod):
+    mod.itemModifiedAttributes.increase("range", fit.ship.getModifiedItemAttr("maxVelocity") * 10)
+
+
+def speedLimiter(fit, mod):
+    if mod.state >= State.ACTIVE:
+        fit.ship.itemModifiedAttributes.force("speedLimit", 250.0)
+
+
+def makeFit(states, effects=(speedModule, cpuModule, speedReader)):
+    """Fit of fake ship and modules, by default speed, CPU and speed reading ones"""
+    fit = Fit.__new__(Fit)
+    fit.ID = 1
+    fit.name = "Test"
+    fit.implantLocation = ImplantLocation.FIT
+    fit.projectedOnto = {}
+    fit._Fit__ship = FakeSource({"maxVelocity": 200.0, "cpuOutput": 300.0})
+    fit._Fit__mode = None
+    fit._Fit__character = FakeSource({})
+    fit.extraAttributes = fit.ship.itemModifiedAttributes
+    for name in ("modules", "drones", "fighters", "cargo", "implants", "boosters",
+                 "projectedModules", "projectedDrones", "projectedFighters"):
+        setattr(fit, "_Fit__" + name, HandledList())
+    fit._Fit__projectedFits = {}
+    fit._Fit__commandFits = {}
+    fit.build()
+
+    for effect, state in zip(effects, states):
+        fit.modules.append(FakeSource({"range": 1000.0}, effect, state))
+    return fit
+
+
+def fitValues(fit):
+    return [fit.ship.values()] + [mod.values() for mod in fit.modules]
+
+
+@pytest.fixture(autouse=True)
+def leanCalculation(monkeypatch):
+    monkeypatch.setattr(ModifiedAttributeDict, "AFFLICTIONS", False)
+    # Attributes are not capped and have no defaults, no gamedata is needed
+    for key in ("maxVelocity", "cpuOutput", "range"):
+        monkeypatch.setitem(modifiedAttributeDict.cappingAttrKeyCache, key, None)
+        monkeypatch.setitem(modifiedAttributeDict.defaultValuesCache, key, 0.0)
+
+
+@pytest.fixture
+def speedLimit(monkeypatch):
+    # Speed is capped by attribute the ship doesn't have
+    monkeypatch.setitem(modifiedAttributeDict.cappingAttrKeyCache, "maxVelocity", "speedLimit")
+    monkeypatch.setitem(modifiedAttributeDict.cappingAttrKeyCache, "speedLimit", None)
+    monkeypatch.setitem(modifiedAttributeDict.defaultValuesCache, "speedLimit", 10000.0)
+
+
+def test_plain_calculation_is_not_tracked():
+    fit = makeFit([State.ACTIVE, State.ONLINE, State.ONLINE])
+    fit.calculateModifiedAttributes()
+    assert fit._Fit__tracker is None
+
+
+def test_incremental_recalculation_matches_full():
+    fit = makeFit([State.ACTIVE, State.ONLINE, State.ONLINE])
+    fit.calculateModifiedAttributes()
+
+    clears = []
+    fullClear = fit.clear
+    fit.clear = lambda *args: clears.append(args) or fullClear(*args)
+
+    # First toggle is calculated in full, with dependencies being recorded
+    speed, cpu, reader = fit.modules
+    speed.state = State.ONLINE
+    fit.recalculate([speed])
+    assert len(clears) == 1
+    assert fit._Fit__tracker is not None
+
+    # Speed module starting to modify speed the reader already read falls back
+    # to full calculation, the others are recalculated incrementally
+    steps = ((cpu, State.OFFLINE, False), (speed, State.ACTIVE, True), (cpu, State.ONLINE, False),
+             (speed, State.ONLINE, False), (reader, State.OFFLINE, False), (speed, State.ACTIVE, True))
+    for mod, state, full in steps:
+        del clears[:]
+        mod.state = state
+        fit.recalculate([mod])
+        assert len(clears) == int(full)
+
+        reference = makeFit([m.state for m in fit.modules])
+        reference.calculateModifiedAttributes()
+        assert fitValues(fit) == fitValues(reference)
+
+    assert reader.getModifiedItemAttr("range") == 4000.0
+
+
+def test_new_cap_resets_cached_values(speedLimit):
+    fit = makeFit([State.ACTIVE, State.ACTIVE], (speedModule, speedLimiter))
+    fit.calculateModifiedAttributes()
+    speed, limiter = fit.modules
+    limiter.state = State.ONLINE
+    fit.recalculate([limiter])
+    assert fit.ship.getModifiedItemAttr("maxVelocity") == 300.0
+
+    # Limiter starts writing cap of speed, which is calculated already
+    clears = []
+    fullClear = fit.clear
+    fit.clear = lambda *args: clears.append(args) or fullClear(*args)
+    limiter.state = State.ACTIVE
+    fit.recalculate([limiter])
+    assert not clears
+    assert fit.ship.getModifiedItemAttr("maxVelocity") == 250.0
@@ -0,0 +1,79 @@
+"""Fit stats cache tests."""
+
+import os
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from eos.db.migrations import upgrade20  # noqa: E402
+from eos.db.saveddata.mapper import FitStats  # noqa: E402
+from eos.db.sqlAlchemy import sqlAlchemy  # noqa: E402
+from eos.saveddata import fitStats  # noqa: E402
+
+
+@pytest.fixture
+def session(monkeypatch):
+    engine = sqlalchemy.create_engine("sqlite://")
+    upgrade20.upgrade(engine)
+    # Migration may run on database which has the table already
+    upgrade20.upgrade(engine)
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    monkeypatch.setattr(sqlAlchemy, "saveddata_session", session, raising=False)
+    return session
+
+
+def test_store_and_get(session):
+    fitStats.storeStats("a", {"totalDPS": 100.0})
+    assert fitStats.getCachedStats("a") == {"totalDPS": 100.0}
+    assert fitStats.getCachedStats("b") is None
+    assert fitStats.clearFitStats() == 1
+    assert fitStats.getCachedStats("a") is None
+
+
+def test_eviction_removes_overflow_only(session, monkeypatch):
+    monkeypatch.setattr(fitStats, "maxEntries", 3)
+    # All entries stored within the same second
+    monkeypatch.setattr(fitStats.time, "time", lambda: 1000)
+    for fingerprint in "abc":
+        fitStats.storeStats(fingerprint, {})
+    fitStats.storeStats("d", {})
+
+    remaining = set(row.fingerprint for row in session.query(FitStats))
+    assert len(remaining) == 3
+    assert "d" in remaining
+
+
+def test_eviction_least_recently_used(session, monkeypatch):
+    monkeypatch.setattr(fitStats, "maxEntries", 2)
+    clock = [1000]
+    monkeypatch.setattr(fitStats.time, "time", lambda: clock[0])
+    for fingerprint in "ab":
+        fitStats.storeStats(fingerprint, {})
+        clock[0] += 1
+    fitStats.getCachedStats("a")
+    clock[0] += 1
+    fitStats.storeStats("c", {})
+
+    assert set(row.fingerprint for row in session.query(FitStats)) == {"a", "c"}
+
+
+def test_store_leaves_main_session_alone(session):
+    # Pending change made elsewhere, e.g. to a fit being edited
+    session.add(FitStats(fingerprint="pending", stats="{}", time=0))
+    fitStats.storeStats("a", {})
+    fitStats.clearFitStats()
+    fitStats.storeStats("b", {})
+
+    stored = [row[0] for row in session.get_bind().execute("SELECT fingerprint FROM fitStats")]
+    assert stored == ["b"]
+    assert len(session.new) == 1
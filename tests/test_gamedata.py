@@ -0,0 +1,58 @@
+"""Effect dispatch tests."""
+
+import os
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos.gamedata import Effect, EffectInfo, Item  # noqa: E402
+
+
+def makeEffect(name):
+    effect = Effect()
+    effect.info = EffectInfo()
+    effect.info.name = name
+    effect.init()
+    return effect
+
+
+def makeItem(*effects):
+    item = Item()
+    item.init()
+    for effect in effects:
+        item.effects.set(effect)
+    return item
+
+
+def test_getEffects_dispatch():
+    passive = makeEffect("armorrepairamountbonussubcap")
+    early = makeEffect("systemarmorhp")
+    missing = makeEffect("notanimplementedeffect")
+    item = makeItem(passive, early, missing)
+
+    assert item.getEffects("normal", "passive") == (passive,)
+    assert item.getEffects("normal") == (passive,)
+    assert item.getEffects("early") == (early,)
+    assert item.getEffects("normal", "active") == ()
+
+
+def test_getEffects_activeByDefault_toggled():
+    effect = makeEffect("armorrepairamountbonussubcap")
+    item = makeItem(effect)
+    assert item.getEffects("normal", "passive") == (effect,)
+
+    # Table is built by now, toggling effect has to be seen anyway
+    effect.activeByDefault = False
+    assert item.getEffects("normal", "passive") == ()
+    assert item.getEffects("normal", "passive", includeInactive=True) == (effect,)
+
+    effect.activeByDefault = True
+    assert item.getEffects("normal", "passive") == (effect,)
@@ -0,0 +1,99 @@
+"""Modified attribute calculation tests."""
+
+import os
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos import modifiedAttributeDict  # noqa: E402
+from eos.modifiedAttributeDict import ModifiedAttributeDict  # noqa: E402
+from eos.saveddata.fit import Fit  # noqa: E402
+
+ATTRIBUTES = {"maxVelocity": 200.0, "signatureRadius": 40.0, "scanResolution": 500.0, "cpuOutput": 300.0}
+
+
+class FakeFit(object):
+    """Fit running single source, as seen by modified attribute dicts"""
+
+    def getOrigin(self):
+        return None
+
+    def getModifier(self):
+        return "source"
+
+
+class FakeShip(object):
+    def getModifiedItemAttr(self, key):
+        return {"signatureRadius": 40.0, "energyWarfareResistance": 0.5}.get(key)
+
+
+def projectedEffect(attrs):
+    attrs.increase("cpuOutput", 25)
+    attrs.increase("cpuOutput", 5, position="post")
+    attrs.multiply("maxVelocity", 0.5, stackingPenalties=True)
+    attrs.boost("signatureRadius", 30, stackingPenalties=True, penaltyGroup="painter")
+    attrs.multiply("scanResolution", 0.9)
+
+
+def calculated(amount, multiplicity):
+    attrs = ModifiedAttributeDict(FakeFit())
+    attrs.original = dict(ATTRIBUTES)
+    ModifiedAttributeDict.multiplicity = multiplicity
+    try:
+        for _ in xrange(amount):
+            projectedEffect(attrs)
+    finally:
+        ModifiedAttributeDict.multiplicity = 1
+    return attrs
+
+
+@pytest.fixture(autouse=True)
+def noGamedata(monkeypatch):
+    # Attributes are not capped and have no defaults, no gamedata is needed
+    for key in ATTRIBUTES:
+        monkeypatch.setitem(modifiedAttributeDict.cappingAttrKeyCache, key, None)
+        monkeypatch.setitem(modifiedAttributeDict.defaultValuesCache, key, 0.0)
+
+
+@pytest.mark.parametrize("amount", [1, 2, 5])
+def test_multiplicity_matches_repeated_runs(amount):
+    repeated = calculated(amount, 1)
+    shared = calculated(1, amount)
+
+    for key in ATTRIBUTES:
+        assert shared[key] == pytest.approx(repeated[key], rel=1e-12)
+        # Each source is listed in 'Affected by', as if run separately
+        afflictions = [sorted(entries) for entries in shared.getAfflictions(key).values()]
+        assert afflictions == [sorted(entries) for entries in repeated.getAfflictions(key).values()]
+
+
+def makeFit():
+    fit = Fit.__new__(Fit)
+    fit._Fit__ship = FakeShip()
+    fit.build()
+    fit.ecmProjectedStr = 1
+    return fit
+
+
+@pytest.mark.parametrize("amount", [1, 3])
+def test_jams_and_drains_follow_multiplicity(monkeypatch, amount):
+    repeated = makeFit()
+    for _ in xrange(amount):
+        repeated.addJam(0.8)
+        repeated.addDrain(FakeShip(), 12000, 300)
+
+    shared = makeFit()
+    monkeypatch.setattr(ModifiedAttributeDict, "multiplicity", amount)
+    shared.addJam(0.8)
+    shared.addDrain(FakeShip(), 12000, 300)
+
+    assert shared.ecmProjectedStr == pytest.approx(repeated.ecmProjectedStr, rel=1e-12)
+    assert shared._Fit__extraDrains == repeated._Fit__extraDrains == [(12000, 150.0, 0)] * amount
@@ -0,0 +1,173 @@
+"""Fit optimizer search tests."""
+
+import os
+import random
+import sys
+from itertools import combinations_with_replacement, product
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos import optimizer  # noqa: E402
+from eos.saveddata.module import Hardpoint, Slot  # noqa: E402
+
+
+def randomProblem(seed):
+    """Hull and candidates whose gains add up, so the search bound is exact"""
+    rand = random.Random(seed)
+    hull = {"cpuOutput": 300.0, "powerOutput": 1000.0, "upgradeCapacity": 400.0, "turrets": 2, "launchers": 1,
+            "slots": {Slot.HIGH: 3, Slot.MED: 2, Slot.LOW: 2, Slot.RIG: 2}, "score": 100.0}
+    candidates = []
+    for itemID in xrange(12):
+        slot = rand.choice(optimizer.searchSlots)
+        hardpoint = rand.choice((Hardpoint.TURRET, Hardpoint.MISSILE, Hardpoint.NONE)) if slot == Slot.HIGH \
+            else Hardpoint.NONE
+        candidates.append({
+            "itemID": itemID,
+            "chargeID": None,
+            "slot": slot,
+            "hardpoint": hardpoint,
+            "groupID": rand.randint(1, 4),
+            "maxGroupFitted": rand.choice((None, 1)),
+            "cpu": rand.uniform(0, 120),
+            "power": rand.uniform(0, 400),
+            "upgradeCost": rand.uniform(50, 200) if slot == Slot.RIG else 0,
+            # Some modules raise outputs of the hull
+            "cpuOutput": hull["cpuOutput"] * rand.choice((1, 1, 1.1)),
+            "powerOutput": hull["powerOutput"] * rand.choice((1, 1, 1.15)),
+            "score": hull["score"] + rand.uniform(1, 30),
+        })
+    gains = [candidate["score"] - hull["score"] for candidate in candidates]
+    return hull, candidates, gains
+
+
+def evaluate(hull, candidates, gains, assignment):
+    """Score and feasibility of assignment, as workers would report them"""
+    chosen = [candidates[c] for c in assignment if c is not None]
+    groups = {}
+    for candidate in chosen:
+        groups[candidate["groupID"]] = groups.get(candidate["groupID"], 0) + 1
+        if candidate["maxGroupFitted"] and groups[candidate["groupID"]] > candidate["maxGroupFitted"]:
+            return None, False
+
+    def total(key):
+        return sum(candidate[key] for candidate in chosen)
+
+    def output(key):
+        return hull[key] + sum(max(0, candidate[key] - hull[key]) for candidate in chosen)
+
+    feasible = (total("cpu") <= output("cpuOutput") + optimizer.epsilon and
+                total("power") <= output("powerOutput") + optimizer.epsilon and
+                total("upgradeCost") <= hull["upgradeCapacity"] + optimizer.epsilon and
+                sum(c["hardpoint"] == Hardpoint.TURRET for c in chosen) <= hull["turrets"] and
+                sum(c["hardpoint"] == Hardpoint.MISSILE for c in chosen) <= hull["launchers"])
+    return hull["score"] + sum(gains[c] for c in assignment if c is not None), feasible
+
+
+def bruteForce(hull, candidates, gains):
+    perSlot = []
+    for slot in optimizer.searchSlots:
+        options = [c for c in xrange(len(candidates)) if candidates[c]["slot"] == slot] + [None]
+        perSlot.append(list(combinations_with_replacement(options, hull["slots"][slot])))
+
+    best = None
+    for parts in product(*perSlot):
+        score, feasible = evaluate(hull, candidates, gains, sum(parts, ()))
+        if feasible and (best is None or score > best):
+            best = score
+    return best
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_search_finds_optimum_of_additive_gains(seed):
+    hull, candidates, gains = randomProblem(seed)
+    search = optimizer.Search(hull, candidates, gains)
+
+    best = None
+    evaluated = 0
+    for assignment in search.iterAssignments():
+        assert len(assignment) == len(search.positions)
+        evaluated += 1
+        score, feasible = evaluate(hull, candidates, gains, assignment)
+        if feasible and (best is None or score > best):
+            best = search.bestScore = score
+
+    assert best == pytest.approx(bruteForce(hull, candidates, gains))
+    assert evaluated > 0
+
+
+def test_greedy_assignment_fills_matching_slots():
+    hull, candidates, gains = randomProblem(3)
+    search = optimizer.Search(hull, candidates, gains)
+    assignment = optimizer.getGreedyAssignment(search)
+
+    assert len(assignment) == sum(hull["slots"].values())
+    assert any(c is not None for c in assignment)
+    for p, c in enumerate(assignment):
+        if c is not None:
+            assert candidates[c]["slot"] == search.positions[p]
+
+
+def test_fixed_items_must_exist(monkeypatch):
+    monkeypatch.setattr(optimizer, "getItem", lambda itemID: None)
+    # Checked before any worker is started
+    monkeypatch.setattr(optimizer.multiprocessing, "Pool", None)
+    with pytest.raises(ValueError):
+        optimizer.optimize(1, {}, [], ("dps", {}), fixedIDs=[2488])
+
+
+class StuckPool(object):
+    """Pool whose workers never finish"""
+
+    def __init__(self):
+        self.timeouts = []
+        self.terminated = False
+
+    def apply_async(self, func, args=()):
+        return FinishedResult({"score": 0.0})
+
+    def map_async(self, func, iterable):
+        return StuckResult(self)
+
+    def close(self):
+        pass
+
+    def terminate(self):
+        self.terminated = True
+
+    def join(self):
+        pass
+
+
+class FinishedResult(object):
+    def __init__(self, value):
+        self.value = value
+
+    def get(self, timeout=None):
+        return self.value
+
+
+class StuckResult(object):
+    def __init__(self, pool):
+        self.pool = pool
+
+    def get(self, timeout=None):
+        self.pool.timeouts.append(timeout)
+        raise optimizer.multiprocessing.TimeoutError()
+
+
+def test_profiling_bounded_by_deadline(monkeypatch):
+    pool = StuckPool()
+    monkeypatch.setattr(optimizer.multiprocessing, "Pool", lambda *args: pool)
+
+    assert optimizer.optimize(1, {}, [2488, 2456], ("dps", {}), timeBudget=5) is None
+    assert pool.terminated
+    assert len(pool.timeouts) == 1
+    assert 0 <= pool.timeouts[0] <= 5
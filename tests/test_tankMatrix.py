@@ -0,0 +1,86 @@
+"""Tank matrix tests."""
+
+import os
+import random
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+
+from eos.saveddata.damagePattern import DamagePattern, getTankMatrix  # noqa: E402
+
+
+class FakeShip(object):
+    def __init__(self, attrs):
+        self.attrs = attrs
+
+    def getModifiedItemAttr(self, key):
+        return self.attrs.get(key)
+
+
+class FakeFit(object):
+    """Calculated fit, as seen by tank calculations"""
+
+    def __init__(self, rand):
+        attrs = {"shieldCapacity": rand.uniform(1000, 9000), "armorHP": rand.uniform(1000, 9000),
+                 "hp": rand.uniform(1000, 9000)}
+        for prefix in ("shield", "armor", ""):
+            for damageType in DamagePattern.DAMAGE_TYPES:
+                attrName = "%s%sDamageResonance" % (prefix, damageType.capitalize())
+                attrs[attrName[0].lower() + attrName[1:]] = rand.uniform(0.1, 1)
+        self.ship = FakeShip(attrs)
+        self.shieldRecharge = rand.uniform(10, 80)
+        self.extraAttributes = dict(("%sRepair" % type, rand.uniform(0, 300)) for type in ("shield", "armor", "hull"))
+        self.sustainableTank = dict((key, value * rand.random()) for key, value in self.extraAttributes.iteritems())
+        self.sustainableTank["passiveShield"] = self.shieldRecharge
+
+    def calculateShieldRecharge(self):
+        return self.shieldRecharge
+
+    @property
+    def hp(self):
+        return {"shield": self.ship.getModifiedItemAttr("shieldCapacity"),
+                "armor": self.ship.getModifiedItemAttr("armorHP"),
+                "hull": self.ship.getModifiedItemAttr("hp")}
+
+    @property
+    def tank(self):
+        tank = dict(self.extraAttributes)
+        tank["passiveShield"] = self.shieldRecharge
+        return tank
+
+
+def makePattern(amounts):
+    # Constructor needs mapped class, amounts are all the pattern needs here
+    pattern = DamagePattern.__new__(DamagePattern)
+    pattern.emAmount, pattern.thermalAmount, pattern.kineticAmount, pattern.explosiveAmount = amounts
+    return pattern
+
+
+def assertLayersEqual(actual, expected):
+    assert sorted(actual) == sorted(expected)
+    for key, value in expected.iteritems():
+        assert actual[key] == pytest.approx(value, rel=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_tank_matrix_matches_effectivify(seed):
+    rand = random.Random(seed)
+    fit = FakeFit(rand)
+    patterns = [makePattern((25, 25, 25, 25)), makePattern((0, 0, 0, 0)), makePattern((0, 0, 100, 0))]
+    patterns.extend(makePattern([rand.choice((0, rand.randint(1, 100))) for _ in xrange(4)]) for _ in xrange(10))
+
+    matrix = getTankMatrix(fit, patterns)
+
+    assert [stats.pattern for stats in matrix] == patterns
+    for pattern, stats in zip(patterns, matrix):
+        assertLayersEqual(stats.ehp, pattern.calculateEhp(fit))
+        assertLayersEqual(stats.effectiveTank, pattern.calculateEffectiveTank(fit, fit.extraAttributes))
+        assertLayersEqual(stats.effectiveSustainableTank, pattern.calculateEffectiveTank(fit, fit.sustainableTank))
@@ -0,0 +1,132 @@
+"""Vectorized attribute calculation tests."""
+
+import os
+import random
+import sys
+
+import pytest
+
+if sys.version_info[0] > 2:
+    pytest.skip("eos runs on Python 2", allow_module_level=True)
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..')))
+
+pytest.importorskip("sqlalchemy")
+numpy = pytest.importorskip("numpy")
+
+from eos import modifiedAttributeDict, vectorDogma  # noqa: E402
+from eos.modifiedAttributeDict import ModifiedAttributeDict  # noqa: E402
+
+KEYS = ("maxVelocity", "signatureRadius", "cpuOutput", "maxRange", "speedLimit", "missing")
+
+
+class FakeAttribute(object):
+    def __init__(self, value):
+        self.value = value
+
+
+def randomDict(rand, original):
+    attrs = ModifiedAttributeDict()
+    attrs.original = dict((key, FakeAttribute(value)) for key, value in original.iteritems())
+    for key in KEYS:
+        if rand.random() < 0.2:
+            continue
+        if rand.random() < 0.1:
+            attrs[key] = rand.uniform(1, 500)
+        if rand.random() < 0.1:
+            attrs.preAssign(key, rand.uniform(1, 500))
+        if rand.random() < 0.05:
+            attrs.force(key, rand.uniform(1, 500))
+        for _ in xrange(rand.randint(0, 2)):
+            attrs.increase(key, rand.uniform(-20, 50), position=rand.choice(("pre", "post")))
+        for _ in xrange(rand.randint(0, 2)):
+            attrs.multiply(key, rand.uniform(0.8, 1.3))
+        # Long stacks run beyond the penalty coefficient table
+        for _ in xrange(rand.choice((0, 0, 1, 3, 40))):
+            attrs.multiplicity = rand.randint(1, 3)
+            attrs.multiply(key, rand.choice((1, rand.uniform(0.5, 2))), stackingPenalties=True,
+                           penaltyGroup=rand.choice(("default", "postPerc")))
+            attrs.multiplicity = 1
+    return attrs
+
+
+def randomVariants(rand, nItems, nVariants):
+    originals = []
+    for _ in xrange(nItems):
+        original = {"maxVelocity": rand.uniform(100, 300), "signatureRadius": rand.uniform(30, 400),
+                    "cpuOutput": rand.uniform(100, 900), "maxRange": rand.uniform(1000, 50000)}
+        # Some items come with their own speed limit
+        if rand.random() < 0.5:
+            original["speedLimit"] = rand.uniform(150, 250)
+        originals.append(original)
+    return [[randomDict(rand, original) for original in originals] for _ in xrange(nVariants)]
+
+
+@pytest.fixture(autouse=True)
+def leanCalculation(monkeypatch):
+    monkeypatch.setattr(ModifiedAttributeDict, "AFFLICTIONS", False)
+    # Speed is capped by speed limit, which defaults to 200 when item doesn't
+    # have its own; no gamedata is needed
+    for key in KEYS:
+        monkeypatch.setitem(modifiedAttributeDict.cappingAttrKeyCache, key, None)
+        monkeypatch.setitem(modifiedAttributeDict.defaultValuesCache, key, 0.0)
+    monkeypatch.setitem(modifiedAttributeDict.cappingAttrKeyCache, "maxVelocity", "speedLimit")
+    monkeypatch.setitem(modifiedAttributeDict.defaultValuesCache, "speedLimit", 200.0)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_values_match_regular_calculation(seed):
+    rand = random.Random(seed)
+    variants = randomVariants(rand, 4, 25)
+
+    values = vectorDogma.evaluate(variants, KEYS)
+
+    assert values.shape == (4, len(KEYS), 25)
+    for v, attrDicts in enumerate(variants):
+        for i, attrDict in enumerate(attrDicts):
+            for k, key in enumerate(KEYS):
+                expected = attrDict[key]
+                if expected is None:
+                    assert numpy.isnan(values[i, k, v])
+                else:
+                    assert values[i, k, v] == pytest.approx(expected, rel=1e-12)
+    assert vectorDogma.crossCheck(variants, KEYS, values) == []
+
+
+def test_cross_check_reports_mismatches():
+    variants = randomVariants(random.Random(1), 2, 3)
+    values = vectorDogma.evaluate(variants, KEYS)
+    values[1, 0, 2] += 1
+
+    mismatches = vectorDogma.crossCheck(variants, KEYS, values)
+    assert [mismatch[:3] for mismatch in mismatches] == [(1, "maxVelocity", 2)]
+
+
+def test_variants_have_same_items():
+    variants = randomVariants(random.Random(2), 3, 2)
+    variants[1].pop()
+    with pytest.raises(ValueError):
+        vectorDogma.evaluate(variants, KEYS)
+
+
+class FakeThing(object):
+    def __init__(self, itemAttrs, chargeAttrs=None):
+        self.itemModifiedAttributes = itemAttrs
+        self.chargeModifiedAttributes = chargeAttrs
+
+
+class FakeFit(object):
+    def __init__(self, attrDicts):
+        self.ship = FakeThing(attrDicts[0])
+        self.modules = [FakeThing(attrDicts[1], attrDicts[2])]
+        self.drones = [FakeThing(attrDicts[3], attrDicts[4])]
+        self.fighters = []
+
+
+def test_fits_are_evaluated_by_position():
+    variants = randomVariants(random.Random(3), 5, 4)
+    fits = [FakeFit(attrDicts) for attrDicts in variants]
+
+    values = vectorDogma.evaluateFits(fits, KEYS)
+    numpy.testing.assert_array_equal(values, vectorDogma.evaluate(variants, KEYS))